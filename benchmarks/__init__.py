@@ -0,0 +1,18 @@
+"""性能基准
+
+``gsuid_core`` 热路径的离线微基准与压测，每个脚本独立可运行、不依赖启动中的 Core：
+
+- :mod:`benchmarks.bench_ann` : 本地向量检索 IVF + int8 索引在合成百万级语料上的 recall@k 与延迟
+- :mod:`benchmarks.bench_event_fork` : 分发视图 ``deepcopy`` vs ``Event.fork`` 的耗时与分配
+- :mod:`benchmarks.bench_i18n_logging` : 关闭 trace 时分发路径上 ``t()`` / ``lt()`` 日志调用的开销
+- :mod:`benchmarks.bench_image_tools` : 绘图基础函数逐像素/重复解码的旧实现 vs 查表 + 素材缓存的新实现
+- :mod:`benchmarks.loadgen` : 进程内假适配器 + 开环泊松负载，输出各触发器延迟分位的 JSON 报告
+
+运行方式::
+
+    python -m benchmarks.bench_ann --n 1000000
+    python -m benchmarks.bench_event_fork
+    python -m benchmarks.bench_i18n_logging
+    python -m benchmarks.bench_image_tools --rounds 20
+    python -m benchmarks.loadgen --rate 200 --duration 20 --out report.json
+"""
@@ -0,0 +1,127 @@
+"""本地向量检索基准：``IVFIndex``（IVF + int8）在不同 ``nprobe`` 下的 recall@k 与延迟。
+
+合成语料为高斯混合（模拟嵌入向量的簇结构）。基线是 float32 全量矩阵乘，相当于本地嵌入式
+Qdrant 暴力扫描的下界（后者还要逐点做 Python payload 过滤）。两组场景：
+
+- 不带过滤：扫 ``--nprobe`` 列表，输出每档的召回与 p50/p99 延迟；
+- 带 ``scope_key`` 预过滤：每次查询限定 ``--query-scopes`` 个 scope（语料共 ``--scopes`` 个）。
+
+用法::
+
+    python -m benchmarks.bench_ann [--n 1000000] [--dim 384] [--queries 200] [--k 10]
+"""
+
+import time
+import argparse
+from typing import List, Callable, Optional, Sequence
+
+import numpy as np
+
+from gsuid_core.ai_core.rag.local_ann import OVERSAMPLE, IVFIndex
+
+
+def _corpus(n: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    # 句向量的内在维度远低于嵌入维度：在低维潜空间里做高斯混合，再随机投影到 dim 维并加少量噪声
+    rng = np.random.default_rng(0)
+    latent = 32
+    centers = rng.normal(size=(clusters, latent)).astype(np.float32)
+    projection = rng.normal(size=(latent, dim)).astype(np.float32) / np.sqrt(latent)
+    rng = np.random.default_rng(seed)
+    out = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, 65536):
+        end = min(n, start + 65536)
+        z = centers[rng.integers(0, clusters, end - start)]
+        z += 0.5 * rng.standard_normal((end - start, latent), dtype=np.float32)
+        out[start:end] = z @ projection + 0.05 * rng.standard_normal((end - start, dim), dtype=np.float32)
+    out /= np.linalg.norm(out, axis=1, keepdims=True)
+    return out
+
+
+def _exact(vectors: np.ndarray, q: np.ndarray, k: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    if rows is None:
+        scores = vectors @ q
+        return np.argpartition(-scores, k)[:k]
+    scores = vectors[rows] @ q
+    return rows[np.argpartition(-scores, min(k, len(rows) - 1))[:k]]
+
+
+def _rerank(index: IVFIndex, vectors: np.ndarray, q: np.ndarray, k: int, **kwargs) -> List[object]:
+    """与 LocalAnnQdrantClient 相同：取 ``k * OVERSAMPLE`` 个候选，按原始向量精确重排。"""
+    rows = np.asarray([point_id for point_id, _ in index.search(q, k * OVERSAMPLE, **kwargs)], dtype=np.int64)
+    if not len(rows):
+        return []
+    return rows[np.argsort(-(vectors[rows] @ q))[:k]].tolist()
+
+
+def _timeit(func: Callable[[int], object], queries: int) -> List[float]:
+    func(0)
+    costs = []
+    for i in range(queries):
+        start = time.perf_counter()
+        func(i)
+        costs.append((time.perf_counter() - start) * 1000)
+    return costs
+
+
+def _recall(search: Callable[[int], Sequence[object]], truth: List[set], k: int) -> float:
+    return float(np.mean([len(set(search(i)) & t) / min(k, len(t)) for i, t in enumerate(truth) if t]))
+
+
+def _report(name: str, costs: Sequence[float], recall: Optional[float] = None) -> None:
+    p50, p99 = np.percentile(costs, [50, 99])
+    rec = f"recall {recall:.3f}" if recall is not None else "recall 1.000"
+    print(f"{name:<26} {rec}   p50 {p50:>8.2f} ms   p99 {p99:>8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=2048)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", default="4,8,16,32,64")
+    parser.add_argument("--scopes", type=int, default=2000)
+    parser.add_argument("--query-scopes", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = _corpus(args.n, args.dim, args.clusters, seed=1)
+    queries = _corpus(args.queries, args.dim, args.clusters, seed=2)
+    scope_of = rng.integers(0, args.scopes, args.n)
+    scopes = [f"group:{s}" for s in scope_of.tolist()]
+
+    start = time.perf_counter()
+    index = IVFIndex.build(range(args.n), vectors, scopes)
+    print(
+        f"build n={args.n} dim={args.dim}: {time.perf_counter() - start:.1f} s, "
+        f"{index.nlist} lists, int8 codes {index._codes[: args.n].nbytes / 2**20:.0f} MiB "
+        f"(float32 {vectors.nbytes / 2**20:.0f} MiB)"
+    )
+
+    truth = [set(_exact(vectors, q, args.k).tolist()) for q in queries]
+    _report("brute force float32", _timeit(lambda i: _exact(vectors, queries[i], args.k), args.queries))
+    for nprobe in [int(x) for x in args.nprobe.split(",")]:
+
+        def _search(i: int, nprobe: int = nprobe) -> List[object]:
+            return _rerank(index, vectors, queries[i], args.k, nprobe=nprobe)
+
+        _report(f"ivf-int8 nprobe={nprobe}", _timeit(_search, args.queries), _recall(_search, truth, args.k))
+
+    # scope 预过滤：真值为限定 scope 内的精确 top-k
+    picked = [rng.choice(args.scopes, args.query_scopes, replace=False) for _ in range(args.queries)]
+    names = [[f"group:{s}" for s in p.tolist()] for p in picked]
+
+    def _brute_scoped(i: int) -> np.ndarray:
+        return _exact(vectors, queries[i], args.k, np.flatnonzero(np.isin(scope_of, picked[i])))
+
+    def _scoped(i: int) -> List[object]:
+        return _rerank(index, vectors, queries[i], args.k, scopes=names[i])
+
+    scoped_truth = [set(_brute_scoped(i).tolist()) for i in range(args.queries)]
+    _report("brute force + filter", _timeit(_brute_scoped, args.queries))
+    _report("ivf-int8 scope prefilter", _timeit(_scoped, args.queries), _recall(_scoped, scoped_truth, args.k))
+
+
+if __name__ == "__main__":
+    main()
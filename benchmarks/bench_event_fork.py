@@ -0,0 +1,95 @@
+"""分发视图微基准：``deepcopy(event)`` vs ``event.fork()``。
+
+模拟一条带大 content（多图 + 合并转发）的消息命中多个触发器，
+统计每次分发的耗时与 tracemalloc 记录的新分配字节数。
+
+用法::
+
+    python -m benchmarks.bench_event_fork [--rounds 2000] [--images 20] [--nodes 200]
+"""
+
+import time
+import asyncio
+import argparse
+import tracemalloc
+from copy import deepcopy
+from uuid import uuid4
+from typing import Callable
+
+from gsuid_core.models import Event, Message
+from gsuid_core.trigger import Trigger
+
+
+async def _noop(bot, ev): ...
+
+
+def _make_event(images: int, nodes: int) -> Event:
+    blob = "base64://" + "A" * 64 * 1024
+    content = [Message("text", "gs查询 10001")]
+    content += [Message("image", blob) for _ in range(images)]
+    node = [Message("text", f"转发第{i}条") for i in range(nodes)]
+    content.append(Message("node", node))
+    ev = Event("onebot", "123", "msg", "group", "999", "456", {"nickname": "bench"}, 6)
+    ev.raw_text = ev.text = "gs查询 10001"
+    ev.content = content
+    ev.image_list = [blob] * images
+    ev.node = node
+    return ev
+
+
+def _run(name: str, ev: Event, trigger: Trigger, make_view: Callable[[Event], Event], rounds: int) -> None:
+    loop = asyncio.new_event_loop()
+
+    def dispatch() -> None:
+        _event = make_view(ev)
+        loop.run_until_complete(trigger.get_command(_event))
+
+    for _ in range(50):
+        dispatch()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        dispatch()
+    cost = (time.perf_counter() - start) / rounds * 1e6
+
+    # 单次分发的瞬时分配量：每轮重置峰值，取「峰值 - 分发前占用」
+    tracemalloc.start()
+    samples = []
+    for _ in range(200):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        dispatch()
+        _, peak = tracemalloc.get_traced_memory()
+        samples.append(peak - base)
+    tracemalloc.stop()
+    loop.close()
+    allocated = sum(samples) / len(samples)
+
+    print(f"{name:<10} {cost:>10.2f} us/dispatch  {allocated / 1024:>10.1f} KiB allocated/dispatch")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--nodes", type=int, default=200)
+    args = parser.parse_args()
+
+    ev = _make_event(args.images, args.nodes)
+    trigger = Trigger("command", "查询", _noop, "gs")
+    print(f"content={len(ev.content)} 段, images={args.images}, nodes={args.nodes}")
+
+    def by_deepcopy(e: Event) -> Event:
+        _event = deepcopy(e)
+        _event.task_id = str(uuid4())
+        return _event
+
+    def by_fork(e: Event) -> Event:
+        return e.fork(task_id=str(uuid4()))
+
+    _run("deepcopy", ev, trigger, by_deepcopy, args.rounds)
+    _run("fork", ev, trigger, by_fork, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
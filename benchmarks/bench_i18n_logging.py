@@ -0,0 +1,115 @@
+"""分发路径日志微基准：关闭 trace 时 ``logger.trace(t(...))`` 的每次调用开销。
+
+对比三种写法（均为 INFO 级别输出、网页控制台缓冲收集 DEBUG 的默认配置）：
+
+- legacy : 旧行为——GsCore logger 放行全部级别，collect handler 跑完整处理器链，``t()`` 每次查表
+- eager  : 入口级别过滤，但 ``t()`` 仍在调用点立即查表、format、装配 emoji
+- lazy   : 入口级别过滤 + ``lt()``，被过滤的日志只剩一次对象构造
+
+另单独对比 ``t()`` 旧实现与按 (lang, key) 缓存模板后的耗时，并先核对全部词条输出一致。
+
+用法::
+
+    python -m benchmarks.bench_i18n_logging [--rounds 20000]
+"""
+
+import time
+import logging
+import argparse
+from typing import Dict, Callable, Optional
+
+from gsuid_core import i18n, logger as gs_logger
+from gsuid_core.i18n import t, lt, ensure_log_emoji
+
+# handler.handle_event / Bot 执行一条命令时必经的 trace 日志
+DISPATCH_CALLS = (
+    ("log.handler.same_msg_cd", {"user_id": "10001"}),
+    ("log.handler.cmd_on_message", {}),
+    ("log.bot.exec_start", {"func_name": "plugin.handler.<locals>.send_help"}),
+)
+
+
+def legacy_t(key: str, /, lang: Optional[str] = None, **params: object) -> str:
+    use_lang = lang if (lang and lang in i18n._catalogs) else i18n.get_lang()
+    if use_lang in i18n._catalogs:
+        catalog = i18n._catalogs[use_lang]
+        aliases = i18n._bare_aliases.get(use_lang, {})
+    else:
+        catalog = {}
+        aliases = {}
+    template = i18n._lookup_template(catalog, aliases, key)
+    text = template.format(**params) if params else template
+    return ensure_log_emoji(key, text)
+
+
+def _timeit(func: Callable[[], object], rounds: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def _report(name: str, results: Dict[str, float]) -> None:
+    base = next(iter(results.values()))
+    cols = "   ".join(f"{label} {us:>8.2f} us (x{base / us:>5.1f})" for label, us in results.items())
+    print(f"{name:<12} {cols}")
+
+
+def _dispatch(translate: Callable[..., object]) -> Callable[[], None]:
+    trace = gs_logger.logger.trace
+
+    def _run() -> None:
+        for key, params in DISPATCH_CALLS:
+            trace(translate(key, **params))
+
+    return _run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    for lang, catalog in i18n._catalogs.items():
+        for key in catalog:
+            params = {name: "x" for name in i18n.re.findall(r"(?<!\{)\{([A-Za-z_]\w*)\}", catalog[key])}
+            try:
+                expected = legacy_t(key, lang=lang, **params)
+            except (KeyError, IndexError, ValueError):
+                continue
+            assert t(key, lang=lang, **params) == expected, f"{lang}: {key}"
+
+    key, params = DISPATCH_CALLS[0]
+    _report(
+        "t()",
+        {
+            "legacy": _timeit(lambda: legacy_t(key, **params), args.rounds),
+            "cached": _timeit(lambda: t(key, **params), args.rounds),
+        },
+    )
+
+    app_logger = logging.getLogger("GsCore")
+    collect = next(h for h in app_logger.handlers if isinstance(h, gs_logger.CollectLogHandler))
+    level, collect_level = app_logger.level, collect.level
+    assert not app_logger.isEnabledFor(5), "需在 log.level / log.history_level 均高于 TRACE 的配置下运行"
+
+    app_logger.setLevel(5)
+    collect.setLevel(5)
+    try:
+        legacy = _timeit(_dispatch(legacy_t), args.rounds // 10)
+    finally:
+        app_logger.setLevel(level)
+        collect.setLevel(collect_level)
+    _report(
+        "dispatch",
+        {
+            "legacy": legacy,
+            "eager": _timeit(_dispatch(t), args.rounds),
+            "lazy": _timeit(_dispatch(lt), args.rounds),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""绘图基础函数微基准：逐像素/每次重新解码的旧实现 vs 查表 + 素材缓存的新实现。
+
+每个函数先核对新旧输出一致，再分别统计单次调用耗时。
+
+用法::
+
+    python -m benchmarks.bench_image_tools [--rounds 20] [--size 600]
+"""
+
+import time
+import random
+import asyncio
+import argparse
+from typing import Tuple, Callable, Optional
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from gsuid_core.utils.image import image_tools
+from gsuid_core.utils.image.image_tools import (
+    BG_PATH,
+    TEXT_PATH,
+    CustomizeImage,
+    tint_image,
+    get_color_bg,
+    crop_center_img,
+    shift_image_hue,
+    draw_pic_with_ring,
+)
+
+
+def legacy_shift_image_hue(img: Image.Image, angle: int = 30) -> Image.Image:
+    alpha = img.getchannel("A")
+    img = img.convert("HSV")
+    pixels = img.load()
+    assert pixels is not None
+    for y in range(img.height):
+        for x in range(img.width):
+            h, s, v = pixels[x, y]  # type: ignore
+            pixels[x, y] = ((h + angle) % 360, s, v)  # type: ignore
+    img = img.convert("RGBA")
+    img.putalpha(alpha)
+    return img
+
+
+def legacy_tint_image(input_image: Image.Image, color: Tuple[int, int, int]) -> Image.Image:
+    _, _, _, alpha = input_image.convert("RGBA").split()
+    r, g, b, _ = Image.new("RGBA", input_image.size, color).split()
+    return Image.merge("RGBA", (r, g, b, alpha))
+
+
+def legacy_draw_pic_with_ring(pic: Image.Image, size: int) -> Image.Image:
+    ring_pic = Image.open(TEXT_PATH / "ring.png")
+    mask_pic = Image.open(TEXT_PATH / "mask.png")
+    img = Image.new("RGBA", (size, size))
+    resize_pic = crop_center_img(pic, size, size).convert("RGBA")
+    img.paste(resize_pic, (0, 0), mask_pic.resize((size, size)))
+    ring = ring_pic.resize((size, size))
+    img.paste(ring, (0, 0), ring)
+    return img
+
+
+def legacy_get_color_bg(w: int, h: int, color: Tuple[int, int, int]) -> Image.Image:
+    path = random.choice(list(BG_PATH.iterdir()))
+    img = crop_center_img(Image.open(path).convert("RGBA"), w, h)
+    color_mask = Image.new("RGBA", (w, h), color)
+    img.paste(color_mask, (0, 0), Image.open(TEXT_PATH / "bg_mask.png").resize((w, h)))
+    return img
+
+
+def _timeit(func: Callable[[], object], rounds: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def _report(name: str, old: Callable[[], object], new: Callable[[], object], rounds: int, max_diff: Optional[int]):
+    if max_diff is not None:
+        diff = np.abs(np.asarray(old(), dtype=np.int16) - np.asarray(new(), dtype=np.int16)).max()
+        assert diff <= max_diff, f"{name}: 输出差异 {diff}"
+    old_ms = _timeit(old, rounds)
+    new_ms = _timeit(new, rounds)
+    print(f"{name:<22} old {old_ms:>9.2f} ms   new {new_ms:>9.2f} ms   x{old_ms / new_ms:>7.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--size", type=int, default=600)
+    args = parser.parse_args()
+
+    size = args.size
+    rng = np.random.default_rng(0)
+    pic = Image.fromarray(rng.integers(0, 256, (size, size, 4), dtype=np.uint8))
+    color = (120, 80, 200)
+    bg = sorted(Path(BG_PATH).iterdir())[0]
+    loop = asyncio.new_event_loop()
+
+    _report(
+        "shift_image_hue",
+        lambda: legacy_shift_image_hue(pic),
+        lambda: loop.run_until_complete(shift_image_hue(pic)),
+        max(1, args.rounds // 10),
+        0,
+    )
+    _report("tint_image", lambda: legacy_tint_image(pic, color), lambda: tint_image(pic, color), args.rounds, 0)
+    _report(
+        "draw_pic_with_ring",
+        lambda: legacy_draw_pic_with_ring(pic, 300),
+        lambda: loop.run_until_complete(draw_pic_with_ring(pic, 300)),
+        args.rounds,
+        0,
+    )
+
+    # 固定背景图，只比较解码/缩放/遮罩的开销
+    image_tools._dir_files[BG_PATH] = (bg.parent.stat().st_mtime_ns, [bg])
+    _report(
+        "get_color_bg",
+        lambda: legacy_get_color_bg(850, 1900, color),
+        lambda: loop.run_until_complete(get_color_bg(850, 1900, BG_PATH, color=color)),
+        args.rounds,
+        0,
+    )
+    _report(
+        "CustomizeImage.get_image",
+        lambda: crop_center_img(Image.open(random.choice(list(BG_PATH.iterdir()))).convert("RGBA"), 850, 1900),
+        lambda: CustomizeImage(BG_PATH).get_image(None, 850, 1900),
+        args.rounds,
+        None,
+    )
+    loop.close()
+    print(image_tools.asset_cache_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""进程内压测：假适配器 + 开环泊松到达 + 按 msg_id 关联回复。
+
+与 ``gsuid_core/benchmark.py``（连接已启动的 Core、按 FIFO 猜测回复归属）不同，
+这里在同一进程里拉起真实的分发链路，不需要启动 Core：
+
+- :class:`FakeAdapter` 扮演适配器一侧的 WebSocket，收下 Core 发出的每一帧，
+  按 ``msg_id`` 关联到对应的请求；
+- 消息经 :class:`~gsuid_core.receive_pipeline.ReceivePipeline` → ``handle_event`` →
+  ``_Bot._process`` → 发送调度，与 WS 连接上的路径一致；
+- 负载由 ``benchmarks/plugins/LoadGen`` 提供触发器，按 ``--mix`` 权重混合
+  command / keyword / regex / nomatch / image 五类消息，分散到 N 个用户、M 个群；
+- 到达过程为开环泊松（不等回复），延迟从「计划到达时刻」起算，避免协同遗漏；
+- 报告输出为 JSON：各类负载的 p50/p95/p99、吞吐、事件循环延迟与 RSS，
+  ``--compare`` 可与上一次的报告逐项对比。
+
+用法::
+
+    python -m benchmarks.loadgen --rate 200 --duration 20 --users 500 --groups 50 \\
+        --mix command=4,keyword=2,regex=2,nomatch=1,image=1 --out report.json
+    python -m benchmarks.loadgen --compare report.json
+
+数据库：压测用户不会写进生产库。默认在临时目录建一个 SQLite 库、结束后删除；
+``--db PATH`` 可指定一个独立的 SQLite 文件（保留，便于事后查看）。
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import asyncio
+import logging
+import argparse
+import tempfile
+import importlib
+from typing import Any, Dict, List, Tuple, Optional
+from pathlib import Path
+from collections import defaultdict
+
+import psutil
+from msgspec import json as msgjson
+from starlette.websockets import WebSocketState
+
+from gsuid_core.models import Message, MessageSend, MessageReceive
+
+BOT_ID = "loadgen"
+BOT_SELF_ID = "10000"
+KINDS = ("command", "keyword", "regex", "nomatch", "image")
+
+
+class FakeAdapter:
+    """适配器一侧的 WebSocket 替身：记录 Core 发出的帧并按 ``msg_id`` 关联回复。"""
+
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self) -> None:
+        # msg_id -> (负载类型, 计划到达时刻)
+        self.pending: Dict[str, Tuple[str, float]] = {}
+        self.latency: Dict[str, List[float]] = defaultdict(list)
+        self.frames = 0
+        self.bytes = 0
+        self.last_reply_at = 0.0
+
+    def expect(self, msg_id: str, kind: str, scheduled_at: float) -> None:
+        self.pending[msg_id] = (kind, scheduled_at)
+
+    async def send_bytes(self, data: bytes) -> None:
+        now = time.perf_counter()
+        self.frames += 1
+        self.bytes += len(data)
+        send = msgjson.decode(data, type=MessageSend)
+        # 一条请求可能回复多帧，只以首帧计延迟；日志帧等没有 msg_id 的帧直接忽略
+        entry = self.pending.pop(send.msg_id, None)
+        if entry is None:
+            return
+        kind, scheduled_at = entry
+        self.latency[kind].append((now - scheduled_at) * 1000)
+        self.last_reply_at = now
+
+
+class LoopMonitor:
+    """定时 sleep 测量事件循环延迟（实际唤醒 - 期望唤醒），顺带采样 RSS 峰值。"""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.lag: List[float] = []
+        self.process = psutil.Process()
+        self.rss_start = self.rss_peak = self.process.memory_info().rss
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        tick = 0
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag.append(max(0.0, time.perf_counter() - expected) * 1000)
+            tick += 1
+            if tick % 10 == 0:
+                self.rss_peak = max(self.rss_peak, self.process.memory_info().rss)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    # nearest-rank
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return round(ordered[idx], 3)
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": _percentile(values, 50),
+        "p95_ms": _percentile(values, 95),
+        "p99_ms": _percentile(values, 99),
+        "max_ms": round(max(values), 3) if values else 0.0,
+    }
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(f"unknown workload {kind!r}, expected one of {', '.join(KINDS)}")
+        mix[kind] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("empty workload mix")
+    return mix
+
+
+class Workload:
+    """按权重与用户/群分布生成 ``MessageReceive``；同一 seed 产生同一序列。"""
+
+    def __init__(self, mix: Dict[str, float], users: int, groups: int, images: int, image_kb: int, seed: int):
+        self.rng = random.Random(seed)
+        self.kinds = list(mix)
+        self.weights = [mix[k] for k in self.kinds]
+        self.users = users
+        self.groups = groups
+        self.images = images
+        self.image_blob = "base64://" + "A" * (image_kb * 1024 * 4 // 3)
+        self.seq = 0
+
+    def next(self) -> Tuple[str, MessageReceive]:
+        rng = self.rng
+        self.seq += 1
+        kind = rng.choices(self.kinds, self.weights)[0]
+        if kind == "command":
+            content = [Message("text", f"lg查询 {rng.randint(100000000, 999999999)}")]
+        elif kind == "keyword":
+            content = [Message("text", f"今天的 lg关键词 {rng.randint(0, 99)} 号")]
+        elif kind == "regex":
+            content = [Message("text", f"lg练度{rng.randint(1, 90)}")]
+        elif kind == "image":
+            content = [Message("text", "lg识图")]
+            content += [Message("image", self.image_blob) for _ in range(self.images)]
+        else:
+            content = [Message("text", f"随便聊聊 {rng.random():.6f}")]
+
+        user = rng.randrange(self.users)
+        group = rng.randrange(self.groups) if self.groups else None
+        msg = MessageReceive(
+            bot_id=BOT_ID,
+            bot_self_id=BOT_SELF_ID,
+            msg_id=f"lg-{self.seq}",
+            user_type="group" if group is not None else "direct",
+            group_id=f"lg-g{group}" if group is not None else None,
+            user_id=f"lg-u{user}",
+            sender={"nickname": f"压测用户{user}"},
+            user_pm=6,
+            content=content,
+        )
+        return kind, msg
+
+
+def use_scratch_database(path: Optional[str]) -> Path:
+    """在 ``init_database`` 之前把数据库改指向独立的 SQLite 文件（不论配置是哪种库），返回该文件路径。"""
+    from gsuid_core.utils.database import base_models
+
+    db_path = Path(path) if path else Path(tempfile.mkdtemp(prefix="gscore-loadgen-")) / "loadgen.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    base_models._db_type = "sqlite"
+    base_models.sync_url = "sqlite:///"
+    base_models.base_url = "sqlite+aiosqlite:///"
+    base_models.db_url = str(db_path)
+    return db_path
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from gsuid_core.utils.database import base_models
+
+    # 与 core.py 相同的顺序：startup 模块在导入时绑定 engine，必须在 init_database 之后导入
+    await base_models.init_database()
+    from gsuid_core.bot import _Bot
+    from gsuid_core.handler import handle_event
+    from gsuid_core.receive_pipeline import ReceivePipeline
+    from gsuid_core.utils.database.startup import ensure_core_database_tables
+    from gsuid_core.utils.database.user_write_behind import user_write_behind
+
+    await ensure_core_database_tables()
+    importlib.import_module("benchmarks.plugins.LoadGen")
+
+    adapter = FakeAdapter()
+    bot = _Bot(BOT_ID, adapter)  # type: ignore
+    bot.start_send_worker()
+    stop = asyncio.Event()
+    process_task = asyncio.create_task(bot._process(stop))
+    pipeline = ReceivePipeline(
+        BOT_ID,
+        lambda msg: handle_event(bot, msg),
+        workers=args.workers,
+        capacity=args.queue_size,
+        policy=args.policy,
+    )
+    pipeline.start()
+
+    # 预热：首批消息会触发惰性导入、建连、配置加载等一次性开销，不计入结果
+    warmup = Workload(args.mix, args.users, args.groups, args.images, args.image_kb, args.seed - 1)
+    for _ in range(args.warmup):
+        _, msg = warmup.next()
+        msg.msg_id = f"warmup-{msg.msg_id}"
+        await pipeline.submit(msg)
+    while pipeline.depth or bot.queue.qsize() or bot._sender.depth:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.2)
+    adapter.frames = adapter.bytes = 0
+    pipeline.received = pipeline.dispatched = 0
+
+    workload = Workload(args.mix, args.users, args.groups, args.images, args.image_kb, args.seed)
+    rng = random.Random(args.seed + 1)
+    sent: Dict[str, int] = defaultdict(int)
+    monitor = LoopMonitor()
+    monitor.start()
+
+    # 开环：到达时刻预先由指数分布间隔决定，与 Core 是否已回复无关
+    start = time.perf_counter()
+    scheduled = start
+    while True:
+        scheduled += rng.expovariate(args.rate)
+        if scheduled - start > args.duration:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        kind, msg = workload.next()
+        sent[kind] += 1
+        if kind != "nomatch":
+            adapter.expect(msg.msg_id, kind, scheduled)
+        await pipeline.submit(msg)
+    offered_end = time.perf_counter()
+
+    deadline = offered_end + args.timeout
+    while (adapter.pending or pipeline.depth) and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+    end = time.perf_counter()
+
+    await monitor.stop()
+    rss_end = monitor.process.memory_info().rss
+    await pipeline.stop()
+    stop.set()
+    await process_task
+    await bot.stop_send_worker()
+    await user_write_behind.close()
+    await base_models.engine.dispose()  # type: ignore[union-attr]
+
+    timeouts: Dict[str, int] = defaultdict(int)
+    for kind, _ in adapter.pending.values():
+        timeouts[kind] += 1
+
+    triggers: Dict[str, Dict[str, Any]] = {}
+    for kind in args.mix:
+        values = adapter.latency.get(kind, [])
+        triggers[kind] = {
+            "sent": sent[kind],
+            "replied": len(values),
+            "timeouts": timeouts[kind],
+            **_summary(values),
+        }
+
+    total_sent = sum(sent.values())
+    replied = sum(len(v) for v in adapter.latency.values())
+    offered = offered_end - start
+    busy = (adapter.last_reply_at or end) - start
+    return {
+        "config": {
+            "rate": args.rate,
+            "duration": args.duration,
+            "users": args.users,
+            "groups": args.groups,
+            "mix": args.mix,
+            "images": args.images,
+            "image_kb": args.image_kb,
+            "workers": args.workers,
+            "queue_size": args.queue_size,
+            "policy": args.policy,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "sent": total_sent,
+        "replied": replied,
+        "timeouts": sum(timeouts.values()),
+        "throughput": {
+            "offered_rps": round(total_sent / offered, 2) if offered else 0.0,
+            "dispatched_rps": round(pipeline.dispatched / (end - start), 2),
+            "reply_rps": round(replied / busy, 2) if busy > 0 else 0.0,
+        },
+        "triggers": triggers,
+        "loop_lag_ms": _summary(monitor.lag),
+        "rss_mb": {
+            "start": round(monitor.rss_start / 2**20, 1),
+            "peak": round(max(monitor.rss_peak, rss_end) / 2**20, 1),
+            "end": round(rss_end / 2**20, 1),
+        },
+        "outbound": {"frames": adapter.frames, "bytes": adapter.bytes},
+        "pipeline": pipeline.stats(),
+        "sender": bot._sender.stats(),
+    }
+
+
+def _quiet_logging(level: str) -> None:
+    """控制台日志改走 stderr、控制台与文件日志提高级别：stdout 只留 JSON 报告，日志 IO 也不干扰结果。"""
+    import gsuid_core.logger  # noqa: F401  导入即按配置装好 handler
+
+    for handler in logging.getLogger().handlers:
+        handler.setLevel(level)
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(sys.stderr)
+
+
+def compare(base: Dict[str, Any], cur: Dict[str, Any]) -> List[str]:
+    """逐项列出两份报告的延迟与吞吐差异（正数 = 变慢 / 变少）。"""
+    lines = []
+    for kind, now in cur["triggers"].items():
+        old = base.get("triggers", {}).get(kind)
+        if not old:
+            continue
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if old[key]:
+                lines.append(
+                    f"{kind:<8} {key:<7} {old[key]:>10.2f} -> {now[key]:>10.2f}  ({now[key] / old[key] - 1:+.1%})"
+                )
+    for key, now in cur["throughput"].items():
+        old = base.get("throughput", {}).get(key)
+        if old:
+            lines.append(f"{'total':<8} {key:<14} {old:>10.2f} -> {now:>10.2f}  ({now / old - 1:+.1%})")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=100.0, help="平均到达速率（条/秒）")
+    parser.add_argument("--duration", type=float, default=10.0, help="发压时长（秒）")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--groups", type=int, default=20, help="0 = 全部走私聊")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("command=4,keyword=2,regex=2,nomatch=1,image=1"))
+    parser.add_argument("--images", type=int, default=4, help="image 负载每条消息的图片数")
+    parser.add_argument("--image-kb", type=int, default=256, help="image 负载单张图片大小")
+    parser.add_argument("--workers", type=int, default=4, help="接收管线分发协程数")
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--policy", choices=("block", "drop", "oldest"), default="block")
+    parser.add_argument("--timeout", type=float, default=30.0, help="发压结束后等待剩余回复的上限（秒）")
+    parser.add_argument("--warmup", type=int, default=50, help="正式发压前的预热消息数（不计入结果）")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING", help="压测期间的日志级别，避免日志 IO 干扰结果")
+    parser.add_argument("--db", help="压测用的独立 SQLite 文件（默认建在临时目录、结束后删除）")
+    parser.add_argument("--out", help="报告写入路径（默认输出到 stdout）")
+    parser.add_argument("--compare", help="与之前的报告对比")
+    args = parser.parse_args()
+
+    _quiet_logging(args.log_level.upper())
+    db_path = use_scratch_database(args.db)
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        if not args.db:
+            shutil.rmtree(db_path.parent, ignore_errors=True)
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            base = json.load(f)
+        print("\n".join(compare(base, report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
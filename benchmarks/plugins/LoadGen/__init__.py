@@ -0,0 +1,44 @@
+"""压测专用插件：为 :mod:`benchmarks.loadgen` 的每类负载提供一个确定的触发器。
+
+放在 ``plugins/<插件名>/`` 目录下，``SV`` 按真实插件的规则推导出插件名 ``LoadGen``。
+"""
+
+from io import BytesIO
+
+from PIL import Image
+
+from gsuid_core.sv import SV
+from gsuid_core.bot import Bot
+from gsuid_core.models import Event
+from gsuid_core.segment import MessageSegment
+
+sv_loadgen = SV("LoadGen")
+
+
+def _reply_image() -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (512, 512), (64, 128, 192)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+REPLY_IMAGE = _reply_image()
+
+
+@sv_loadgen.on_command("lg查询")
+async def lg_command(bot: Bot, ev: Event):
+    await bot.send(f"查询结果: {ev.text}")
+
+
+@sv_loadgen.on_keyword("lg关键词")
+async def lg_keyword(bot: Bot, ev: Event):
+    await bot.send("命中关键词")
+
+
+@sv_loadgen.on_regex(r"^lg练度(?P<level>\d+)$")
+async def lg_regex(bot: Bot, ev: Event):
+    await bot.send(f"练度 {ev.regex_dict.get('level')}")
+
+
+@sv_loadgen.on_fullmatch("lg识图")
+async def lg_image(bot: Bot, ev: Event):
+    await bot.send([MessageSegment.text(f"收到 {len(ev.image_list)} 张图"), MessageSegment.image(REPLY_IMAGE)])
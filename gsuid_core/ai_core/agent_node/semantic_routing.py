@@ -12,7 +12,7 @@ match_keywords + 所辖工具 covers`` 组装检索文本并嵌入缓存，查
 import asyncio
 from typing import Dict, List, Tuple
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 from .models import AgentNode
@@ -105,7 +105,7 @@ async def sync_agent_nodes() -> int:
         _NODE_VECTORS[node.node_id] = list(vec)
         _NODE_TEXT_FINGERPRINTS[node.node_id] = build_node_retrieval_text(node)
         embedded += 1
-    logger.debug(t("log.ai.agentnode_semantic_cache_updated", p0=embedded, p1=len(pending)))
+    logger.debug(lt("log.ai.agentnode_semantic_cache_updated", p0=embedded, p1=len(pending)))
     return embedded
 
 
@@ -12,7 +12,7 @@ AI 会话对象由 AISessionRegistry 管理，消息历史由通用 message_hist
 import time
 from typing import Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 
@@ -65,7 +65,7 @@ async def _maybe_refresh_stable_prompt(session: GsCoreAIAgent, event: Event, per
     session.system_prompt_built_at = time.time()
 
     session.system_prompt = await build_session_system_prompt(event, persona_name)
-    logger.debug(t("log.ai.ai_router_stable_prefix_ttl_ok", p0=session.session_id))
+    logger.debug(lt("log.ai.ai_router_stable_prefix_ttl_ok", p0=session.session_id))
 
 
 def _check_persona_changed(session: GsCoreAIAgent, persona_name: str) -> bool:
@@ -189,7 +189,7 @@ async def _get_or_create_ai_session(
     # update_session_access，新建路径这里不再重复刷新访问时间。
 
     logger.debug(
-        t(
+        lt(
             "log.ai.ai_router_created_session_id_create",
             session_id=session_id,
             persona_name=persona_name,
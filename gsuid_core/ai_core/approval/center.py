@@ -19,7 +19,7 @@ import secrets
 from typing import Any, Dict, List, Tuple, Callable, Optional, Awaitable
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 
@@ -59,7 +59,7 @@ _TOOL_GRANT_TTL = 600.0
 def register_approval_category(name: str, on_resolve: ResolveHandler, ttl_seconds: int = 1800) -> None:
     """注册一个审批领域（同名后写覆盖）。"""
     _CATEGORIES[name] = ApprovalCategory(name=name, on_resolve=on_resolve, ttl_seconds=ttl_seconds)
-    logger.debug(t("log.ai.approval_registered_domain_name", name=name, ttl_seconds=ttl_seconds))
+    logger.debug(lt("log.ai.approval_registered_domain_name", name=name, ttl_seconds=ttl_seconds))
 
 
 def is_master(user_id: str) -> bool:
@@ -92,7 +92,7 @@ def is_full_access(user_id: str, ev: Optional[Event] = None) -> bool:
         try:
             verdict = _FULL_ACCESS_RESOLVER(str(user_id), ev)
         except Exception as e:  # noqa: BLE001
-            logger.debug(t("log.ai.approval_full_access_resolver_fail", e=e))
+            logger.debug(lt("log.ai.approval_full_access_resolver_fail", e=e))
             verdict = None
         if verdict is not None:
             return verdict
@@ -343,7 +343,7 @@ async def tool_call_gate(ev: Optional[Event], tool_name: str, tier: str, args_re
     后台链路的权限由各自 check_func 承担。
     """
     if ev is None:
-        logger.debug(t("log.ai.approval_name_ev_context_policy", tool_name=tool_name))
+        logger.debug(lt("log.ai.approval_name_ev_context_policy", tool_name=tool_name))
         return None
     operator = str(ev.user_id)
     if tier == "user" and is_full_access(operator, ev):
@@ -18,7 +18,7 @@ from typing import Any, Dict, List, Tuple, Optional
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core import approval as approval_center
@@ -262,7 +262,7 @@ async def ask_user(
             else:
                 resp = await bot.receive_resp(question, timeout=timeout)
     except Exception as e:
-        logger.debug(t("log.ai.approval_ask_user_waiting", e=e))
+        logger.debug(lt("log.ai.approval_ask_user_waiting", e=e))
         resp = None
     answer = "" if resp is None else (resp.raw_text if resp.raw_text else resp.text)
     await _log_question_safe(ev, question, answer or default_choice, answered=resp is not None)
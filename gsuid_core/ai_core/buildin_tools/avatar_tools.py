@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, Optional
 import httpx
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.models import ToolContext
@@ -66,7 +66,7 @@ async def _resolve_avatar_image(ev: Event, target_user_id: Optional[str]) -> "Op
         try:
             return await get_qq_avatar(target)
         except (httpx.HTTPError, OSError) as e:
-            logger.debug(t("log.ai.buildintools_get_user_avatar_fail_3", e=e))
+            logger.debug(lt("log.ai.buildintools_get_user_avatar_fail_3", e=e))
             return None
     return None
 
@@ -14,7 +14,7 @@ from pathlib import Path
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -595,4 +595,4 @@ async def _register_workspace_changes(workspace: Path, before_snapshot: dict) ->
     except ImportError:
         return
     except Exception as e:
-        logger.debug(t("log.ai.buildintools_workspace_change_registration", e=e))
+        logger.debug(lt("log.ai.buildintools_workspace_change_registration", e=e))
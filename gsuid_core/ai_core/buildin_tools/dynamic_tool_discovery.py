@@ -10,7 +10,7 @@ from dataclasses import replace
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -87,7 +87,7 @@ async def _capability_agent_lines(need: str, *, limit: int = 5) -> list[str]:
         for node_id, _score in await semantic_match_nodes(need_s, limit=limit):
             _push(node_id)
     except Exception as e:
-        logger.debug(t("log.ai.find_tools_semantic_route_fail", e=e))
+        logger.debug(lt("log.ai.find_tools_semantic_route_fail", e=e))
     # 3) 注册表弱匹配补全（保留原有 token 子串逻辑，覆盖节点自述里的词）
     blob = need_s.lower()
     for node in list_nodes():
@@ -193,7 +193,7 @@ async def find_tools(
             try:
                 tool_def = await tool.prepare_tool_def(run_ctx)
             except Exception as e:
-                logger.debug(t("log.ai.find_tools_prepare_treated_unavailable_fail", p0=tool.name, e=e))
+                logger.debug(lt("log.ai.find_tools_prepare_treated_unavailable_fail", p0=tool.name, e=e))
                 tool_def = None
             (loaded_names if tool_def else hidden_names).append(tool.name)
 
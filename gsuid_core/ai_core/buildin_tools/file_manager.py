@@ -13,7 +13,7 @@ from pathlib import Path
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -187,7 +187,7 @@ async def _register_single_workspace_file(path: Path) -> None:
     except ImportError:
         return
     except Exception as e:
-        logger.debug(t("log.ai.buildintools_workspace_file_artifact_fail", e=e))
+        logger.debug(lt("log.ai.buildintools_workspace_file_artifact_fail", e=e))
 
 
 def _resolve_exec_cwd(fallback: Path) -> Path:
@@ -353,7 +353,7 @@ async def execute_file(
                             parent_task_id=None,
                         )
             except Exception as e:
-                logger.debug(t("log.ai.buildintools_execute_file_workspace_fail", e=e))
+                logger.debug(lt("log.ai.buildintools_execute_file_workspace_fail", e=e))
 
         result_parts = []
         if stdout:
@@ -15,7 +15,7 @@ from pathlib import Path
 import httpx
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.segment import MessageSegment
 from gsuid_core.ai_core.models import ToolContext
@@ -327,7 +327,7 @@ def _ensure_opaque_image_bytes(
         im = Image.open(BytesIO(data))
         im.load()
     except (OSError, UnidentifiedImageError, ValueError) as e:
-        logger.debug(t("log.htmlrender.opaque_flatten_skip", e=e))
+        logger.debug(lt("log.htmlrender.opaque_flatten_skip", e=e))
         return data
 
     # RGB/L 无 alpha；GIF 多为动图，不压平
@@ -396,7 +396,7 @@ async def _try_send_image(ctx: RunContext[ToolContext], image_bytes: bytes) -> b
         await bot.send(MessageSegment.image(image_bytes))
         return True
     except Exception as e:
-        logger.debug(t("log.htmlrender.auto_send_fallback", e=e))
+        logger.debug(lt("log.htmlrender.auto_send_fallback", e=e))
         return False
 
 
@@ -808,7 +808,7 @@ def _shrink_raster_if_needed(data: bytes, *, max_side: int, max_bytes: int) -> b
             return _shrink_raster_if_needed(out, max_side=max(128, max_side // 2), max_bytes=max_bytes)
         return out
     except Exception as e:
-        logger.debug(t("log.ai.embed_image_for_html_shrink_skip", e=e))
+        logger.debug(lt("log.ai.embed_image_for_html_shrink_skip", e=e))
         return data
 
 
@@ -29,7 +29,7 @@ from typing import Literal
 import httpx
 from pydantic_ai import ImageUrl, RunContext, ToolReturn, BinaryContent
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -219,7 +219,7 @@ def _current_task_level(parent_session_id: str | None) -> Literal["high", "low"]
             if sess is not None:
                 return sess.task_level
     except Exception as e:  # noqa: BLE001
-        logger.debug(t("log.buildin.image_reader_task_level_fail", error=str(e)))
+        logger.debug(lt("log.buildin.image_reader_task_level_fail", error=str(e)))
     return "high"
 
 
@@ -236,7 +236,7 @@ def _current_model_supports_image(parent_session_id: str | None) -> bool:
         support: object = get_model_config_for_task(task_level).get_config("model_support").data
         return isinstance(support, (list, str)) and "image" in support
     except Exception as e:  # noqa: BLE001 - 判定失败按「不支持」处理，退回文字转述更安全
-        logger.debug(t("log.buildin.image_reader_support_fail", error=str(e)))
+        logger.debug(lt("log.buildin.image_reader_support_fail", error=str(e)))
         return False
 
 
@@ -251,7 +251,7 @@ def _current_provider(parent_session_id: str | None) -> str:
         task_level = _current_task_level(parent_session_id)
         return parse_provider_config_name(get_config_name_for_task(task_level))[0]
     except Exception as e:  # noqa: BLE001
-        logger.debug(t("log.buildin.image_reader_provider_fail", error=str(e)))
+        logger.debug(lt("log.buildin.image_reader_provider_fail", error=str(e)))
         return "openai"
 
 
@@ -19,7 +19,7 @@ from pathlib import Path
 from pydantic_ai import RunContext
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Message
 from gsuid_core.segment import MessageSegment
@@ -101,7 +101,7 @@ async def _resolve_kanban_artifact(res_id: str) -> Optional[Union[bytes, str]]:
     if art.payload_path:
         p = Path(art.payload_path)
         if not p.exists():
-            logger.debug(t("log.ai.buildintools_kanban_artifact_res", res_id=res_id, p0=art.payload_path))
+            logger.debug(lt("log.ai.buildintools_kanban_artifact_res", res_id=res_id, p0=art.payload_path))
             return None
         data = p.read_bytes()
         # 以魔数为准：只有真图返回 bytes（mime 标 image/* 内容却是 md 时也拒）
@@ -266,7 +266,7 @@ async def send_message_by_ai(
                 if kanban_payload is None:
                     # 兜底：仍可能是用户上传时被框架登记成 RM 但前缀写成 res_ 的情况
                     logger.debug(
-                        t(
+                        lt(
                             "log.ai.buildintools_kanban_artifact_parsing_fail",
                             image_id=image_id,
                         )
@@ -306,9 +306,9 @@ async def send_message_by_ai(
                     )
             else:
                 try:
-                    logger.debug(t("log.ai.buildintools_calling_rm_get_2", image_id=image_id))
+                    logger.debug(lt("log.ai.buildintools_calling_rm_get_2", image_id=image_id))
                     img_data = await RM.get(image_id)
-                    logger.debug(t("log.ai.buildintools_rm_get_succeeded_ok_2", p0=type(img_data)))
+                    logger.debug(lt("log.ai.buildintools_rm_get_succeeded_ok_2", p0=type(img_data)))
                     media_parts.append(MessageSegment.image(img_data))
                 except ValueError as e:
                     logger.warning(t("log.ai.buildintools_rm_get_image_id", image_id=image_id, e=e))
@@ -320,9 +320,9 @@ async def send_message_by_ai(
 
         if video_id:
             try:
-                logger.debug(t("log.ai.buildintools_calling_rm_get_3", video_id=video_id))
+                logger.debug(lt("log.ai.buildintools_calling_rm_get_3", video_id=video_id))
                 video_data = await RM.get(video_id)
-                logger.debug(t("log.ai.buildintools_rm_get_succeeded_ok_3", p0=type(video_data)))
+                logger.debug(lt("log.ai.buildintools_rm_get_succeeded_ok_3", p0=type(video_data)))
                 media_parts.append(MessageSegment.video(video_data))
             except ValueError as e:
                 logger.warning(t("log.ai.buildintools_rm_get_video_id", video_id=video_id, e=e))
@@ -333,9 +333,9 @@ async def send_message_by_ai(
 
         if audio_id:
             try:
-                logger.debug(t("log.ai.buildintools_calling_rm_get", audio_id=audio_id))
+                logger.debug(lt("log.ai.buildintools_calling_rm_get", audio_id=audio_id))
                 audio_data = await RM.get(audio_id)
-                logger.debug(t("log.ai.buildintools_rm_get_succeeded_ok", p0=type(audio_data)))
+                logger.debug(lt("log.ai.buildintools_rm_get_succeeded_ok", p0=type(audio_data)))
                 media_parts.append(MessageSegment.record(audio_data))
             except ValueError as e:
                 logger.warning(t("log.ai.buildintools_rm_get_audio_id", audio_id=audio_id, e=e))
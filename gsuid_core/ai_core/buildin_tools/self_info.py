@@ -9,7 +9,7 @@ from typing import Literal
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -73,7 +73,7 @@ async def get_self_persona_info(
         try:
             data = image_path.read_bytes()
             resource_id = RM.register(data)
-            logger.debug(t("log.ai.selfinfo_standee_registered_rm_register", resource_id=resource_id))
+            logger.debug(lt("log.ai.selfinfo_standee_registered_rm_register", resource_id=resource_id))
             return f"{resource_id}（立绘图片，可直接作为 image_id 传给 edit_image）"
         except Exception as e:
             logger.error(t("log.ai.selfinfo_register_standee_rm", e=e))
@@ -86,7 +86,7 @@ async def get_self_persona_info(
         try:
             data = avatar_path.read_bytes()
             resource_id = RM.register(data)
-            logger.debug(t("log.ai.selfinfo_avatar_registered_rm_register", resource_id=resource_id))
+            logger.debug(lt("log.ai.selfinfo_avatar_registered_rm_register", resource_id=resource_id))
             return f"{resource_id}（头像图片，可直接作为 image_id 传给 edit_image）"
         except Exception as e:
             logger.error(t("log.ai.selfinfo_register_avatar_rm", e=e))
@@ -99,7 +99,7 @@ async def get_self_persona_info(
         try:
             data = audio_path.read_bytes()
             resource_id = RM.register(data)
-            logger.debug(t("log.ai.selfinfo_audio_registered_rm_register", resource_id=resource_id))
+            logger.debug(lt("log.ai.selfinfo_audio_registered_rm_register", resource_id=resource_id))
             return f"{resource_id}（音频文件）"
         except Exception as e:
             logger.error(t("log.ai.selfinfo_register_audio_rm", e=e))
@@ -23,7 +23,7 @@ import time
 from typing import Any, Dict, List, Optional
 from dataclasses import field, asdict, dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.agent_node import AgentNode, list_nodes, register_agent_node
 
@@ -192,7 +192,7 @@ def get_recent_evaluation(
             best, best_score = r, score
     if best is not None and best_score >= fuzzy_min_overlap:
         logger.debug(
-            t(
+            lt(
                 "log.ai.kanban_evaluator_fuzzy_match_hit",
                 best_score=best_score,
                 owner_user_id=owner_user_id,
@@ -13,7 +13,7 @@ from sklearn.pipeline import Pipeline, FeatureUnion
 from sklearn.linear_model import LogisticRegression
 from sklearn.feature_extraction.text import TfidfVectorizer
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.data_store import get_res_path
 
@@ -983,7 +983,7 @@ class IntentService:
                         )
                         return {"text": text, "intent": "问答", "conf": round(hits[0].score, 4), "reason": "VectorHit"}
                 except Exception as e:
-                    logger.trace(t("log.ai.vector_fallback_retrieval", e=e))
+                    logger.trace(lt("log.ai.vector_fallback_retrieval", e=e))
 
         return result
 
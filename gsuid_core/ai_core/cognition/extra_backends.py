@@ -10,7 +10,7 @@ import json
 from typing import Dict, List, Tuple
 from datetime import datetime
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.cognition.types import CogKind, CogScope, CognitiveHit
 
@@ -45,7 +45,7 @@ async def search_history(query: str, *, scope: CogScope, limit: int) -> _Backend
             limit=limit,
         )
     except Exception as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="history", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="history", e=e))
         return _EMPTY
     ids: List[str] = []
     hits: Dict[str, CognitiveHit] = {}
@@ -109,7 +109,7 @@ async def search_records(query: str, *, scope: CogScope, limit: int) -> _Backend
                     )
                     ids.append(hid)
     except Exception as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="record", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="record", e=e))
         return _EMPTY
     return ids[:limit], hits
 
@@ -121,7 +121,7 @@ async def search_images_backend(query: str, *, scope: CogScope, limit: int) -> _
 
         points = await search_images(query=query, limit=limit)
     except Exception as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="image", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="image", e=e))
         return _EMPTY
     ids: List[str] = []
     hits: Dict[str, CognitiveHit] = {}
@@ -163,7 +163,7 @@ async def search_memes_backend(query: str, *, scope: CogScope, limit: int) -> _B
             score_threshold=threshold,
         )
     except Exception as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="meme", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="meme", e=e))
         return _EMPTY
     ids: List[str] = []
     hits: Dict[str, CognitiveHit] = {}
@@ -196,7 +196,7 @@ async def search_meme_knowledge_backend(query: str, *, scope: CogScope, limit: i
             limit=limit,
         )
     except Exception as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="meme_knowledge", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="meme_knowledge", e=e))
         return _EMPTY
     ids: List[str] = []
     hits: Dict[str, CognitiveHit] = {}
@@ -228,7 +228,7 @@ async def search_outbound(query: str, *, scope: CogScope, limit: int) -> _Backen
     try:
         rows = await OutboundAudit.search_recent(group_id=gid, query=query, limit=limit)
     except (OperationalError, ProgrammingError) as e:
-        logger.debug(t("log.ai.cognition_backend_fail", backend="outbound", e=e))
+        logger.debug(lt("log.ai.cognition_backend_fail", backend="outbound", e=e))
         return _EMPTY
     ids: List[str] = []
     hits: Dict[str, CognitiveHit] = {}
@@ -17,7 +17,7 @@ import asyncio
 from typing import Set, Dict, List, Tuple, FrozenSet
 from dataclasses import replace
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.cognition.types import (
     WORK_KINDS,
@@ -133,7 +133,7 @@ async def search_cognition(
             merged[hid] = replace(hit, high_confidence=hit.score >= backend_floor)
 
     if not merged:
-        logger.debug(t("log.ai.cognition_empty", q=query[:40]))
+        logger.debug(lt("log.ai.cognition_empty", q=query[:40]))
         return []
 
     from gsuid_core.ai_core.planning.tool_output_protocol import rrf_fuse
@@ -146,7 +146,7 @@ async def search_cognition(
         final = [replace(h, high_confidence=True) if i < _ALWAYS_SHOWN_TOP else h for i, h in enumerate(ordered)]
     else:
         final = ordered
-    logger.debug(t("log.ai.cognition_hits", n=len(final), backends=",".join(labels)))
+    logger.debug(lt("log.ai.cognition_hits", n=len(final), backends=",".join(labels)))
     return final
 
 
@@ -334,7 +334,7 @@ async def _search_fileos(query: str, *, scope: CogScope, limit: int) -> _Backend
                 hybrid_ids.append(rid)
                 hybrid_meta[rid] = h
     except Exception as e:
-        logger.debug(t("log.ai.tool_output_hybrid_search_skip", e=e))
+        logger.debug(lt("log.ai.tool_output_hybrid_search_skip", e=e))
 
     sql_rows = await AIToolOutputRecord.search(
         owner_user_id=scope.user_id,
@@ -417,7 +417,7 @@ async def _search_artifacts(query: str, *, scope: CogScope, limit: int) -> _Back
                 hybrid_ids.append(rid)
                 hybrid_meta[rid] = h
     except Exception as e:
-        logger.debug(t("log.ai.tool_output_hybrid_search_skip", e=e))
+        logger.debug(lt("log.ai.tool_output_hybrid_search_skip", e=e))
 
     fused = rrf_fuse([hybrid_ids, sql_ids], limit=limit) if hybrid_ids else sql_ids[:limit]
     ids: List[str] = []
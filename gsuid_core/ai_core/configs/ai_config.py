@@ -76,6 +76,20 @@ AI_CONFIG: Dict[str, GSC] = {
         "local",
         options=["local", "openai"],
     ),
+    "embedding_cache_memory_mb": GsIntConfig(
+        "嵌入缓存内存上限(MB)",
+        "相同文本（人设片段、实体名、重复提问等）的嵌入向量在内存中按 LRU 缓存的上限, "
+        "设为 0 关闭内存缓存。改动需重启 core 生效。",
+        32,
+        options=[0, 16, 32, 64, 128, 256],
+    ),
+    "embedding_cache_disk_mb": GsIntConfig(
+        "嵌入缓存磁盘上限(MB)",
+        "嵌入向量落盘缓存(ai_core/embedding_cache.db)的上限, 重启后仍可命中; "
+        "设为 0 关闭磁盘缓存。改动需重启 core 生效。",
+        256,
+        options=[0, 64, 128, 256, 512, 1024],
+    ),
     "rerank_provider": GsStrConfig(
         title="Rerank模型服务提供方",
         desc="指定 Rerank 模型提供方。local 使用本地 fastembed 模型；openai 使用 OpenAI兼容 rerank API 的远程服务",
@@ -92,6 +106,13 @@ AI_CONFIG: Dict[str, GSC] = {
         data="local",
         options=["local", "remote"],
     ),
+    "qdrant_local_ann": GsBoolConfig(
+        "本地向量库 ANN 加速",
+        "仅对本地嵌入式 Qdrant 生效: dense 检索改走内存中的 IVF + int8 量化近邻索引(按 scope 预过滤), "
+        "候选再按原始向量精确重算余弦分; 索引在首次查询时后台构建, 占用约 向量数×维度 字节内存。"
+        "关闭则回到逐条暴力扫描。改动需重启 core 生效",
+        True,
+    ),
     "websearch_provider": GsStrConfig(
         "网络搜索服务提供方（主用）",
         "指定网络搜索的主用提供方。未配置或主用无 Key 时走 AnySearch 匿名额度。"
@@ -1062,10 +1083,10 @@ MEMORY_CONFIG: Dict[str, GSC] = {
         False,
     ),
     "enable_recollection_path": GsBoolConfig(
-        "启用回忆环(仅 remote Qdrant)",
+        "启用回忆环(需 remote Qdrant 或本地 ANN)",
         "回忆环是零 LLM 的 KMeans+α-mix 多轮向量深检索, 作为 System-2 关闭时的增召回替代。"
-        "仅在'启用熟悉度路由'开启、路由判低熟悉、System-2 未触发、且 qdrant_provider=remote 时生效"
-        "(本地嵌入式 Qdrant 是 O(N) 暴力扫, 多轮回忆会成倍放大检索成本, 故强制 remote)",
+        "仅在'启用熟悉度路由'开启、路由判低熟悉、System-2 未触发、且 qdrant_provider=remote "
+        "或开启了'本地向量库 ANN 加速'时生效(暴力扫描的本地 Qdrant 是 O(N), 多轮回忆会成倍放大检索成本)",
         False,
     ),
     "familiarity_theta_high": GsFloatConfig(
@@ -31,7 +31,7 @@ from dataclasses import dataclass
 
 from pydantic_ai.models.openai import OpenAIChatModelSettings
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 from .models import PROVIDER_CONFIG_SEPARATOR
@@ -223,7 +223,7 @@ def resolve_attribution_settings(
         return None
 
     logger.debug(
-        t(
+        lt(
             "log.ai.attribution_forwarded",
             config_name=config_name,
             mode=forward_mode,
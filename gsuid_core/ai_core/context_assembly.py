@@ -18,7 +18,7 @@ import asyncio
 from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.kits.base import join_named_blocks
@@ -68,7 +68,7 @@ async def build_stable_context(event: Event, persona_name: str = "") -> str:
     results = await asyncio.gather(_self_model_block(), _group_profile_block(), return_exceptions=True)
     for name, r in zip(("self_model 稳定块", "群画像稳定块"), results):
         if isinstance(r, BaseException):
-            logger.debug(t("log.ai.contextassembly_name_injection", name=name, r=r))
+            logger.debug(lt("log.ai.contextassembly_name_injection", name=name, r=r))
         elif r:
             parts.append(r)
 
@@ -374,8 +374,12 @@ class AIKnowledgeChunk(SQLModel, table=True):
     - **持久性**：向量库丢失后可从本表全量重嵌（见 ``rag/knowledge.reconcile_manual_knowledge``）。
     - **分页**：列表/检索走 SQL 原生 offset/limit（治 P5）。
     - **文档维度**：``doc_id`` 把一篇长文切出的多个分片聚合，支持整篇删除/导出（治 P3）。
+    - **清单**：本表同时是知识集合的本地清单（来源 → 内容哈希 → 向量点），启动同步只比对清单，
+      列表/关键词检索也只读本表，不再为元数据 scroll 向量库。
 
-    插件知识（``source="plugin"``）的真值源是插件代码 + ``_ENTITIES``，不入本表。
+    插件知识（``source="plugin"``）的真值源仍是插件代码 + ``_ENTITIES``：其行仅作清单
+    （``doc_id`` = 插件名），在 Qdrant 写入确认后由 ``rag/knowledge.sync_knowledge`` 同一事务落盘，
+    不参与手动知识的导出/对账。
     """
 
     __table_args__ = {"extend_existing": True}
@@ -470,10 +474,12 @@ class AIKnowledgeChunk(SQLModel, table=True):
         doc_id: Optional[str] = None,
         offset: int = 0,
         limit: int = 20,
+        keyword: Optional[str] = None,
     ) -> tuple[Sequence["AIKnowledgeChunk"], int]:
-        """SQL 原生分页（治 P5 的 O(n) scroll）。``source="all"`` 不限来源。"""
+        """SQL 原生分页（治 P5 的 O(n) scroll）。``source="all"`` 不限来源；
+        ``keyword`` 对标题/正文/标签做子串匹配。"""
         await cls.ensure_table()
-        from sqlalchemy import func
+        from sqlalchemy import or_, func
 
         from gsuid_core.utils.database.base_models import async_maker
 
@@ -482,6 +488,14 @@ class AIKnowledgeChunk(SQLModel, table=True):
             conds.append(cls.source == source)
         if doc_id:
             conds.append(cls.doc_id == doc_id)
+        if keyword:
+            conds.append(
+                or_(
+                    col(cls.title).contains(keyword, autoescape=True),
+                    col(cls.content).contains(keyword, autoescape=True),
+                    col(cls.tags).contains(keyword, autoescape=True),
+                )
+            )
 
         async with async_maker() as session:
             count_stmt = select(func.count()).select_from(cls)
@@ -490,7 +504,9 @@ class AIKnowledgeChunk(SQLModel, table=True):
                 count_stmt = count_stmt.where(c)
                 list_stmt = list_stmt.where(c)
             total = (await session.execute(count_stmt)).scalar() or 0
-            list_stmt = list_stmt.order_by(col(cls.doc_id), col(cls.chunk_index)).offset(offset).limit(limit)
+            list_stmt = (
+                list_stmt.order_by(col(cls.doc_id), col(cls.chunk_index), col(cls.id)).offset(offset).limit(limit)
+            )
             rows = list((await session.execute(list_stmt)).scalars().all())
             return rows, int(total)
 
@@ -518,6 +534,41 @@ class AIKnowledgeChunk(SQLModel, table=True):
                 stmt = stmt.where(cls.source == source)
             return {row[0] for row in (await session.execute(stmt)).all()}
 
+    @classmethod
+    async def manifest(cls, source: str) -> Dict[str, tuple[str, str]]:
+        """取某来源的清单 ``{逻辑ID: (content_hash, qdrant_id)}``（只读三列，不取正文）。"""
+        await cls.ensure_table()
+        from gsuid_core.utils.database.base_models import async_maker
+
+        async with async_maker() as session:
+            stmt = select(cls.id, cls.content_hash, cls.qdrant_id).where(cls.source == source)
+            return {row[0]: (row[1], row[2]) for row in (await session.execute(stmt)).all()}
+
+    @classmethod
+    async def apply_manifest(
+        cls,
+        upserts: List["AIKnowledgeChunk"],
+        delete_ids: List[str],
+        clear_source: Optional[str] = None,
+    ) -> None:
+        """在**同一事务**内更新清单：先删（``clear_source`` 整类 / ``delete_ids`` / 将覆盖的行），再批量插入。
+
+        比逐行 ``merge`` 少一次按主键 SELECT，万级插件知识的清单重建也只需几条语句。
+        """
+        if not upserts and not delete_ids and not clear_source:
+            return
+        await cls.ensure_table()
+        from gsuid_core.utils.database.base_models import async_maker
+
+        stale = list(dict.fromkeys([r.id for r in upserts] + list(delete_ids)))
+        async with async_maker() as session:
+            if clear_source:
+                await session.execute(delete(cls).where(col(cls.source) == clear_source))
+            for i in range(0, len(stale), 500):
+                await session.execute(delete(cls).where(col(cls.id).in_(stale[i : i + 500])))
+            session.add_all(upserts)
+            await session.commit()
+
     @classmethod
     async def delete_ids(cls, ids: List[str]) -> int:
         if not ids:
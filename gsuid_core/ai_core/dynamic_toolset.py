@@ -38,7 +38,7 @@ from pydantic_ai.tools import RunContext
 from pydantic_ai.toolsets.abstract import ToolsetTool, AbstractToolset
 from pydantic_ai.toolsets.function import FunctionToolsetTool
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import find_tool_base
@@ -80,7 +80,7 @@ class RetrievableToolset(AbstractToolset[ToolContext]):
             try:
                 tool_def = await tool.prepare_tool_def(run_context)
             except Exception as e:
-                logger.debug(t("log.ai.toolset_name_prepare_skipping", name=name, e=e))
+                logger.debug(lt("log.ai.toolset_name_prepare_skipping", name=name, e=e))
                 continue
             if not tool_def:
                 # 工具自身的 prepare/visible_when 判定本步不暴露（Phase 3 条件隐藏）。
@@ -99,7 +99,7 @@ class RetrievableToolset(AbstractToolset[ToolContext]):
                 timeout=tool_def.timeout,
             )
         if out:
-            logger.debug(t("log.ai.toolset_step_dynamically_exposed", p0=len(out), p1=list(out)))
+            logger.debug(lt("log.ai.toolset_step_dynamically_exposed", p0=len(out), p1=list(out)))
         return out
 
     async def call_tool(
@@ -25,7 +25,7 @@ from dataclasses import dataclass
 import gsuid_core.ai_core.meme.startup  # noqa: F401
 import gsuid_core.ai_core.buildin_tools.meme_tools  # noqa: F401
 from gsuid_core.bot import Bot, _Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.hooks import HookDecision, AgentHookPoint, AgentHookContext, fire_hooks
@@ -108,7 +108,7 @@ async def handle_ai_chat(
         soft_triggered: 是否为免唤醒续聊软触发
     """
     if not ai_config.get_config("enable").data:
-        logger.debug(t("log.ai.gscore_service_enabled_skipping"))
+        logger.debug(lt("log.ai.gscore_service_enabled_skipping"))
         return
     if not await _wait_core_ready():
         return
@@ -4,7 +4,7 @@ import time
 from typing import List, Optional
 from datetime import datetime
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.config import core_config
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.utils import is_silence_marker, extract_json_from_text
@@ -169,7 +169,7 @@ async def _get_group_summary_for_heartbeat(group_id: str) -> str:
                     "可能是玩笑/文案/反讽，引用前先判断真实性，不要把文案当真实事件。）"
                 )
     except Exception as e:
-        logger.debug(t("log.ai.heartbeat_get_group_summary", e=e))
+        logger.debug(lt("log.ai.heartbeat_get_group_summary", e=e))
 
     return ""
 
@@ -258,7 +258,7 @@ async def _build_zone_section(
     try:
         scores = await UserFavorability.get_scores_for(list(names), bot_id)
     except Exception as e:
-        logger.debug(t("log.ai.heartbeat_zone_summary_degraded", e=e))
+        logger.debug(lt("log.ai.heartbeat_zone_summary_degraded", e=e))
         return ""
 
     now = now_ts if now_ts is not None else time.time()
@@ -317,7 +317,7 @@ async def run_heartbeat(
         交给 ``emit_proactive_message`` 挂到主 session 的 ``linked_agents`` 上。
     """
     if not history:
-        logger.debug(t("log.ai.heartbeat_history_skipping"))
+        logger.debug(lt("log.ai.heartbeat_history_skipping"))
         return None
 
     if not persona_name:
@@ -415,12 +415,12 @@ async def run_heartbeat(
         decision_logger.close()
 
     if not result:
-        logger.debug(t("log.ai.heartbeat_decision_stage_nothing_skip"))
+        logger.debug(lt("log.ai.heartbeat_decision_stage_nothing_skip"))
         return None
 
     # 模型输出 <SILENCE> 或 <end_turn> 表示选择不发言，直接跳过
     if is_silence_marker(result.strip()):
-        logger.debug(t("log.ai.heartbeat_output_silence_remaining"))
+        logger.debug(lt("log.ai.heartbeat_output_silence_remaining"))
         return None
 
     try:
@@ -444,7 +444,7 @@ async def run_heartbeat(
     context_hook = decision["context_hook"] if "context_hook" in decision else ""
 
     logger.debug(
-        t("log.heartbeat.speak_mood_context_hook_ok", should_speak=should_speak, mood=mood, context_hook=context_hook)
+        lt("log.heartbeat.speak_mood_context_hook_ok", should_speak=should_speak, mood=mood, context_hook=context_hook)
     )
 
     try:
@@ -457,14 +457,14 @@ async def run_heartbeat(
         logger.warning(t("log.ai.heartbeat_record_decision_statistics", e=e))
 
     if not should_speak:
-        logger.debug(t("log.ai.heartbeat_remaining_silent_mood", mood=mood, event=event))
+        logger.debug(lt("log.ai.heartbeat_remaining_silent_mood", mood=mood, event=event))
         return None
 
     # 可回应钩子门（4.11）：决定开口却给不出具体话头/由头 → 视为无的放矢的梦呓，
     # 降级沉默（结构判定：context_hook 是决策 JSON 的必填项，空即无钩子）。
     _hook = context_hook if isinstance(context_hook, str) else ""
     if not _hook.strip():
-        logger.debug(t("log.ai.heartbeat_no_hook_silent", mood=mood))
+        logger.debug(lt("log.ai.heartbeat_no_hook_silent", mood=mood))
         return None
 
     logger.info(t("log.ai.heartbeat_decided_interject_mood", mood=mood, event=event))
@@ -502,7 +502,7 @@ async def run_heartbeat(
         output_logger.close()
 
     if not result or not result.strip():
-        logger.debug(t("log.ai.heartbeat_generation_stage_nothing"))
+        logger.debug(lt("log.ai.heartbeat_generation_stage_nothing"))
         return None
 
     message: str = _strip_message_quotes(result)
@@ -578,7 +578,7 @@ async def run_reactive_gate(
     raw = event.raw_text if event.raw_text else (event.text or "")
     pre = _reactive_gate_rule_prefilter(raw, persona_name or "")
     if pre is not None:
-        logger.debug(t("log.ai.reactivegate_pre_rule_filter", pre=pre))
+        logger.debug(lt("log.ai.reactivegate_pre_rule_filter", pre=pre))
         return pre
     try:
         persona_content = await load_persona(persona_name)
@@ -621,7 +621,7 @@ async def run_reactive_gate(
         # agent.run 默认返回 str，但签名是 Union[str, Any]（output_type 时返模型实例）；
         # 本门未指定 output_type，用 isinstance 守卫而非依赖隐式 AttributeError 兜底。
         if not isinstance(result, str):
-            logger.debug(t("log.ai.reactivegate_non_str_defaulting", p0=type(result).__name__))
+            logger.debug(lt("log.ai.reactivegate_non_str_defaulting", p0=type(result).__name__))
             return False
         if not result or is_silence_marker(result.strip()):
             return False
@@ -629,17 +629,17 @@ async def run_reactive_gate(
         try:
             decision = extract_json_from_text(result)
         except (json.JSONDecodeError, ValueError) as e:
-            logger.debug(t("log.ai.reactivegate_parse_decision_json_fail", e=e, p0=repr(result[:80])))
+            logger.debug(lt("log.ai.reactivegate_parse_decision_json_fail", e=e, p0=repr(result[:80])))
             return False
         if isinstance(decision, list):
             decision = next((item for item in decision if isinstance(item, dict)), None)
         if not isinstance(decision, dict) or "should_speak" not in decision:
-            logger.debug(t("log.heartbeat.reactive_decision_missing"))
+            logger.debug(lt("log.heartbeat.reactive_decision_missing"))
             return False
         should = bool(decision["should_speak"])
         reason = decision["reason"] if "reason" in decision else None
-        logger.debug(t("log.heartbeat.reactive_decision", should=should, reason=reason))
+        logger.debug(lt("log.heartbeat.reactive_decision", should=should, reason=reason))
         return should
     except Exception as e:
-        logger.debug(t("log.heartbeat.reactive_gate_error", e=e))
+        logger.debug(lt("log.heartbeat.reactive_gate_error", e=e))
         return True
@@ -15,7 +15,7 @@ import asyncio
 from typing import Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 
 # 延迟导入避免循环依赖
 from gsuid_core.logger import logger
@@ -62,7 +62,7 @@ class HeartbeatInspector:
 
             # 检查是否启用了定时巡检模式
             if "定时巡检" not in ai_mode:
-                logger.debug(t("log.ai.heartbeat_persona_name_enabled", persona_name=persona_name))
+                logger.debug(lt("log.ai.heartbeat_persona_name_enabled", persona_name=persona_name))
                 return False
 
             job_id = f"ai_heartbeat_inspector_{persona_name}"
@@ -151,7 +151,7 @@ class HeartbeatInspector:
         sessions = self._history_manager.list_sessions()
 
         if not sessions:
-            logger.debug(t("log.ai.heartbeat_persona_name_active_skip", persona_name=persona_name))
+            logger.debug(lt("log.ai.heartbeat_persona_name_active_skip", persona_name=persona_name))
             return
 
         logger.info(t("log.ai.heartbeat_persona_name_found", persona_name=persona_name, p0=len(sessions)))
@@ -167,7 +167,7 @@ class HeartbeatInspector:
             should_check, skip_reason = self._pre_check_session(session_key)
             if not should_check:
                 logger.debug(
-                    t(
+                    lt(
                         "log.ai.heartbeat_skipping_session_key_skip",
                         session_key=session_key,
                         skip_reason=skip_reason,
@@ -290,7 +290,7 @@ class HeartbeatInspector:
         from gsuid_core.buildin_plugins.core_command.core_ai_control.state import is_scope_banned
 
         if is_scope_banned(event.session_id):
-            logger.debug(t("log.ai.heartbeat_session_muted_skipping", p0=event.session_id))
+            logger.debug(lt("log.ai.heartbeat_session_muted_skipping", p0=event.session_id))
             return
 
         # 1. 获取历史记录（使用 history 模块的全部消息，不再限制时间窗口）
@@ -318,7 +318,7 @@ class HeartbeatInspector:
         session_id: str = event.session_id
         session_persona_name: Optional[str] = persona_config_manager.get_persona_for_session(session_id)
         if not session_persona_name:
-            logger.debug(t("log.ai.heartbeat_session_event_persona", event=event))
+            logger.debug(lt("log.ai.heartbeat_session_event_persona", event=event))
             return
 
         # 4. 决策阶段 (隐形 Sub-Agent)
@@ -334,7 +334,7 @@ class HeartbeatInspector:
             extra_context=merge_ctx,
         )
         if not meta:
-            logger.debug(t("log.ai.heartbeat_session_event_generated_send", event=event))
+            logger.debug(lt("log.ai.heartbeat_session_event_generated_send", event=event))
             return
         mood, message, generator_log_files = meta
 
@@ -9,7 +9,7 @@
 import asyncio
 from typing import Optional, Awaitable
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.hooks.models import HookFn, HookDecision, AgentHookResult, AgentHookContext, HookCapabilityError
 from gsuid_core.ai_core.hooks.points import STABLE_CONTEXT_ONLY, AgentHookPoint
@@ -52,7 +52,7 @@ async def fire_hooks(
     regs = [r for r in hooks_for(point) if r.matches(ctx)]
     if not regs:
         return HookDecision.CONTINUE
-    logger.debug(t("log.agent.hooks_fire_point", point=point.name, n=len(regs)))
+    logger.debug(lt("log.agent.hooks_fire_point", point=point.name, n=len(regs)))
 
     for reg in regs:
         ctx.current_kit_id = reg.kit_id
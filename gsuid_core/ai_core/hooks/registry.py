@@ -7,7 +7,7 @@
 import inspect
 from typing import Dict, List, Tuple, Callable, Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.hooks.models import HookFn, HookRegistration
 from gsuid_core.ai_core.hooks.points import WIRED_POINTS, AgentHookPoint, spec_for
@@ -66,7 +66,7 @@ def on_agent_hook(
         bucket = _REGISTRY.setdefault(point, [])
         bucket.append(reg)
         bucket.sort(key=lambda r: (r.priority, r.order))
-        logger.debug(t("log.agent.hooks_registered_point", point=point.name, owner=reg.label))
+        logger.debug(lt("log.agent.hooks_registered_point", point=point.name, owner=reg.label))
         return func
 
     return decorator
@@ -111,7 +111,7 @@ def drop_hooks_for_kit(kit_id: str) -> int:
         removed += len(regs) - len(keep)
         _REGISTRY[point] = keep
     if removed:
-        logger.debug(t("log.agent.hooks_dropped_kit", kit=kit_id, n=removed))
+        logger.debug(lt("log.agent.hooks_dropped_kit", kit=kit_id, n=removed))
     return removed
 
 
@@ -19,7 +19,7 @@ from typing import Literal, Optional
 
 from pydantic_ai.messages import ImageUrl
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.mcp.utils import (
     get_mcp_tool_id,
@@ -216,13 +216,13 @@ async def understand_image(
     cache_key = _img_cache_key(image_url)
     cached = _understand_cache_get(cache_key)
     if cached:
-        logger.debug(t("log.ai.imgund_hit_image_understanding_skip"))
+        logger.debug(lt("log.ai.imgund_hit_image_understanding_skip"))
         return cached
 
     # 优先：当前模型原生支持图片时，直接走大模型多模态，无需配置转述模型(MCP)
     native_model = _resolve_native_image_model(task_level)
     if native_model is not None:
-        logger.debug(t("log.ai.imgund_natively_supports_images"))
+        logger.debug(lt("log.ai.imgund_natively_supports_images"))
         desc = await _understand_image_native(
             image_url,
             prompt,
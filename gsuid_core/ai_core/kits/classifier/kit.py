@@ -4,7 +4,7 @@
 下游按「无意图」走（不是按闲聊走）。
 """
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.hooks import AgentHookPoint, AgentHookContext, on_agent_hook
 from gsuid_core.ai_core.kits.base import AgentKit
@@ -25,7 +25,7 @@ class ClassifierKit(AgentKit):
             prior_user_turns=list(prior),
             prev_turn_used_tools=prev_tools,
         )
-        logger.debug(t("log.ai.gscore_intent_recognition_result", res=res))
+        logger.debug(lt("log.ai.gscore_intent_recognition_result", res=res))
         intent = str(res["intent"]) if "intent" in res else ""
         if intent:
             ctx.set_intent(intent)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import List
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.hooks import AgentHookPoint, AgentHookContext, on_agent_hook
 from gsuid_core.ai_core.kits.base import AgentKit
@@ -92,7 +92,7 @@ async def _persist_decision(bot_self_id: str, decision: str) -> None:
             message_type="private_msg",
         )
     except Exception as e:
-        logger.debug(t("log.ai.decision_distill_observe_fail", e=e))
+        logger.debug(lt("log.ai.decision_distill_observe_fail", e=e))
 
 
 def _rule_summary(item: _Pending) -> str:
@@ -136,7 +136,7 @@ async def _llm_summaries(batch: List[_Pending]) -> List[str]:
                 agent._session_logger.close()
         return _parse_distill_json(str(raw or ""), len(batch))
     except Exception as e:
-        logger.debug(t("log.ai.decision_distill_llm_fail", e=e))
+        logger.debug(lt("log.ai.decision_distill_llm_fail", e=e))
         return []
 
 
@@ -14,7 +14,7 @@
 import re
 from typing import TYPE_CHECKING, Set, List
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.hooks import AgentHookPoint, AgentHookContext, on_agent_hook
@@ -77,7 +77,7 @@ def relevant_preference_contexts(query: str) -> List[str]:
                 if name and name.lower() in low:
                     matched.add(name)
     except Exception as e:
-        logger.debug(t("log.ai.memory_compute_preference_related_fail", e=e))
+        logger.debug(lt("log.ai.memory_compute_preference_related_fail", e=e))
     return list(matched)
 
 
@@ -201,7 +201,7 @@ class MemoryKit(AgentKit):
         if not ai_config.get_config("enable_memory").data or not memory_config.enable_retrieval:
             return
         if not should_retrieve(ctx.query, ctx.intent or "", ctx.user_id):
-            logger.debug(t("log.ai.memory_skip_hit_small_talk_gate"))
+            logger.debug(lt("log.ai.memory_skip_hit_small_talk_gate"))
             return
 
         # 偏好注入是**能力域过滤**不是整轮开关：闲聊轮传空 list（检索侧只留
@@ -223,7 +223,7 @@ class MemoryKit(AgentKit):
         )
         if text.strip():
             ctx.stash_retrieved("memory", text.strip())
-            logger.debug(t("log.ai.memory_retrieved_context_characters", p0=len(text)))
+            logger.debug(lt("log.ai.memory_retrieved_context_characters", p0=len(text)))
             from gsuid_core.ai_core.statistics import statistics_manager
 
             statistics_manager.record_memory_retrieval()
@@ -247,7 +247,7 @@ class MemoryKit(AgentKit):
         intent = ctx.intent or ""
         anaphora = bool(_FORCE_RETRIEVE_RE.search(ctx.query))
         if intent not in ("问答", "工具") and not anaphora:
-            logger.debug(t("log.ai.cognition_prefetch_skip", reason=f"intent={intent or '-'} 且无回指"))
+            logger.debug(lt("log.ai.cognition_prefetch_skip", reason=f"intent={intent or '-'} 且无回指"))
             return
 
         from gsuid_core.ai_core.cognition import ALL_KINDS, search_cognition
@@ -303,7 +303,7 @@ class MemoryKit(AgentKit):
                 limit=2,
             )
         except Exception as e:
-            logger.debug(t("log.ai.meme_preinject_skip", e=e))
+            logger.debug(lt("log.ai.meme_preinject_skip", e=e))
             return ""
         if not rows:
             return ""
@@ -6,7 +6,7 @@
 
 from typing import Dict, List, Tuple, Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.kits.base import OFF, AgentKit, slot_of, is_known_slot
 
@@ -23,7 +23,7 @@ def register_agent_kit(kit: AgentKit) -> AgentKit:
     if not is_known_slot(kit.slot):
         raise KitSlotError(f"未知槽名 {kit.slot!r}（须在 KIT_SLOTS 内）")
     if kit.kit_id in _KITS and _KITS[kit.kit_id] is not kit:
-        logger.debug(t("log.agent.kits_overwrite_registration", kit=kit.kit_id))
+        logger.debug(lt("log.agent.kits_overwrite_registration", kit=kit.kit_id))
     _KITS[kit.kit_id] = kit
     return kit
 
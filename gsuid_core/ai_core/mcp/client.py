@@ -18,7 +18,7 @@ from fastmcp import Client
 from fastmcp.client.transports import SSETransport, StdioTransport, StreamableHttpTransport
 
 from mcp.types import TextContent, ImageContent, ResourceLink, EmbeddedResource
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.mcp.transport import (
     MCP_TRANSPORT_SSE,
@@ -120,13 +120,13 @@ class MCPClient:
         transport_type = self._resolve_transport()
 
         if transport_type == MCP_TRANSPORT_SSE:
-            logger.debug(t("log.mcp.sse_transport_url", p0=self.name, p1=self.url))
+            logger.debug(lt("log.mcp.sse_transport_url", p0=self.name, p1=self.url))
             return SSETransport(
                 url=self.url,
                 headers=self.headers if self.headers else None,
             )
         if transport_type == MCP_TRANSPORT_STREAMABLE_HTTP:
-            logger.debug(t("log.mcp.streamable_http_transport_url", p0=self.name, p1=self.url))
+            logger.debug(lt("log.mcp.streamable_http_transport_url", p0=self.name, p1=self.url))
             return StreamableHttpTransport(
                 url=self.url,
                 headers=self.headers if self.headers else None,
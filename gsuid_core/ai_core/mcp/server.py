@@ -37,7 +37,7 @@ from fastmcp.server.auth import AccessToken, AuthProvider
 from pydantic_ai.models.test import TestModel
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.server import on_core_shutdown
@@ -547,7 +547,7 @@ def _create_mcp_server(auth: Optional[BearerTokenAuth] = None) -> FastMCP:
             )
             registered_count += 1
             logger.debug(
-                t(
+                lt(
                     "log.mcp.mcp_server_name_ai_tool_register",
                     tool_name=export_name,
                     category=category,
@@ -722,7 +722,7 @@ async def _shutdown_mcp_server() -> None:
         try:
             await _mcp_lifespan_cm.__aexit__(None, None, None)
         except Exception as e:
-            logger.debug(t("log.mcp.mcp_server_lifespan_exit_fail", e=e))
+            logger.debug(lt("log.mcp.mcp_server_lifespan_exit_fail", e=e))
         _mcp_lifespan_cm = None
 
     if _mcp_mount_path is not None:
@@ -16,7 +16,7 @@ from typing import Any, Dict, List, Optional
 from pydantic_ai import RunContext
 from pydantic_ai.tools import Tool
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_shutdown
 from gsuid_core.ai_core.models import ToolBase, ToolContext
@@ -221,7 +221,7 @@ def _register_mcp_tool(
     # 检查是否已注册
     tool_registry = _get_tool_registry()
     if MCP_CATEGORY in tool_registry and registered_name in tool_registry[MCP_CATEGORY]:
-        logger.debug(t("log.mcp.registered_skipping_name", registered_name=registered_name))
+        logger.debug(lt("log.mcp.registered_skipping_name", registered_name=registered_name))
         return
 
     # 创建包装函数
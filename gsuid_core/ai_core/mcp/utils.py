@@ -29,7 +29,7 @@ from typing import Any, Optional
 
 import aiofiles
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.mcp.client import MCPToolResult
 from gsuid_core.ai_core.mcp.mcp_tool_caller import call_mcp_tool
@@ -272,7 +272,7 @@ async def save_binary_to_tempfile(
         await f.write(data)
 
     if log_prefix:
-        logger.debug(t("log.mcp.log_prefix_temp_path_save", log_prefix=log_prefix, temp_path=temp_path))
+        logger.debug(lt("log.mcp.log_prefix_temp_path_save", log_prefix=log_prefix, temp_path=temp_path))
 
     return temp_path
 
@@ -305,7 +305,7 @@ def cleanup_tempfile(path: str, log_prefix: str = "") -> None:
     try:
         os.unlink(path)
         if log_prefix:
-            logger.debug(t("log.mcp.log_prefix_path_delete", log_prefix=log_prefix, path=path))
+            logger.debug(lt("log.mcp.log_prefix_path_delete", log_prefix=log_prefix, path=path))
     except OSError as e:
         if log_prefix:
             logger.warning(t("log.mcp.log_prefix_delete_fail", log_prefix=log_prefix, e=e))
@@ -8,7 +8,7 @@ import shutil
 import asyncio
 from datetime import date
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.meme.library import compute_meme_id, get_memes_base_path
 from gsuid_core.ai_core.meme.database_model import AiMemeRecord
@@ -48,17 +48,17 @@ class MemeFilter:
         # 0. 内容级去重（群聊中重复表情包非常多，尽早跳过）
         meme_id = compute_meme_id(image_data)
         if meme_id in cls._rejected_ids:
-            logger.debug(t("log.meme.image_previously_rejected_skipping", meme_id=meme_id))
+            logger.debug(lt("log.meme.image_previously_rejected_skipping", meme_id=meme_id))
             return False
         if await AiMemeRecord.exists_by_meme_id(meme_id):
-            logger.debug(t("log.meme.image_exists_skipping", meme_id=meme_id))
+            logger.debug(lt("log.meme.image_exists_skipping", meme_id=meme_id))
             return False
 
         # 1. MIME 类型检查
         from gsuid_core.ai_core.meme.config import MEME_ALLOWED_MIME
 
         if file_mime not in MEME_ALLOWED_MIME:
-            logger.debug(t("log.meme.mime_type_mismatch_file", file_mime=file_mime))
+            logger.debug(lt("log.meme.mime_type_mismatch_file", file_mime=file_mime))
             return False
 
         # 2. 文件大小检查
@@ -66,12 +66,12 @@ class MemeFilter:
 
         max_bytes = MEME_MAX_FILE_KB * 1024
         if len(image_data) > max_bytes:
-            logger.debug(t("log.meme.file_large_max_bytes", p0=len(image_data), max_bytes=max_bytes))
+            logger.debug(lt("log.meme.file_large_max_bytes", p0=len(image_data), max_bytes=max_bytes))
             return False
 
         # 3. 最大尺寸检查（表情包不应该太大）
         if width > 512 or height > 512:
-            logger.debug(t("log.meme.dimensions_large_width", width=width, height=height))
+            logger.debug(lt("log.meme.dimensions_large_width", width=width, height=height))
             return False
 
         # 4. 最小尺寸检查
@@ -81,7 +81,7 @@ class MemeFilter:
         min_height = MEME_MIN_HEIGHT
         if width < min_width or height < min_height:
             logger.debug(
-                t(
+                lt(
                     "log.meme.dimensions_small_width_height",
                     width=width,
                     height=height,
@@ -110,7 +110,7 @@ class MemeFilter:
             today_count = group_counts.get(today_str, 0)
             if today_count >= daily_limit:
                 logger.debug(
-                    t(
+                    lt(
                         "log.meme.group_source_reached_today",
                         source_group=source_group,
                         today_count=today_count,
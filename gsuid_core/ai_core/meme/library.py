@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 
 from qdrant_client.models import Vector, Condition, SparseVector
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.pool import to_thread
 from gsuid_core.logger import logger
 from gsuid_core.data_store import get_res_path
@@ -110,7 +110,7 @@ class MemeLibrary:
 
         # 检查是否已存在
         if await AiMemeRecord.exists_by_meme_id(meme_id):
-            logger.debug(t("log.meme.skip_image_id_meme", meme_id=meme_id))
+            logger.debug(lt("log.meme.skip_image_id_meme", meme_id=meme_id))
             return None
 
         # 确定文件扩展名
@@ -654,7 +654,7 @@ async def _ensure_meme_collection() -> None:
                         )
                     except Exception as e:
                         # 索引已存在或后端不支持，幂等场景下属预期
-                        logger.debug(t("log.meme.payload_field_name", field_name=field_name, e=e))
+                        logger.debug(lt("log.meme.payload_field_name", field_name=field_name, e=e))
                 return
 
     if MEME_COLLECTION_NAME not in existing or should_reindex:
@@ -12,7 +12,7 @@ from collections import OrderedDict
 import httpx
 from PIL import Image
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.pool import to_thread
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
@@ -65,10 +65,10 @@ async def _download_image(url: str) -> Optional[tuple[bytes, str]]:
         (图片数据, MIME 类型) 或 None
     """
     async with httpx.AsyncClient(timeout=30.0) as client:
-        logger.debug(t("log.meme.image_download_url_2", url=url))
+        logger.debug(lt("log.meme.image_download_url_2", url=url))
         response = await client.get(url)
         if response.status_code != 200:
-            logger.debug(t("log.meme.image_download_url", url=url))
+            logger.debug(lt("log.meme.image_download_url", url=url))
             return None
 
         content_type = response.headers.get("content-type", "")
@@ -126,12 +126,12 @@ async def observe_message_for_memes(
     if not ev.group_id:
         return
 
-    logger.trace(t("log.meme.msg_observed_message_group_user", p0=ev.group_id, p1=ev.user_id))
+    logger.trace(lt("log.meme.msg_observed_message_group_user", p0=ev.group_id, p1=ev.user_id))
 
     # 提取图片 URL
     image_urls = _extract_image_urls(ev)
     if not image_urls:
-        logger.trace(t("log.meme.image_url_found_skipping"))
+        logger.trace(lt("log.meme.image_url_found_skipping"))
         return
 
     # 限制每次最多处理 5 张图片
@@ -161,7 +161,7 @@ async def _process_image(
     # URL 去重检查
     async with _processed_lock:
         if url in _processed_urls:
-            logger.debug(t("log.meme.url_processed_skipping", url=url))
+            logger.debug(lt("log.meme.url_processed_skipping", url=url))
             return
         _mark_url_processed(url)
 
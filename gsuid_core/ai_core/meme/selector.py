@@ -9,7 +9,7 @@ import time
 import random
 from typing import Dict, List, Tuple, Optional, Sequence
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.meme.config import meme_config
 from gsuid_core.ai_core.meme.library import MemeLibrary
@@ -86,7 +86,7 @@ async def pick(
     """
     # 冷却检查
     if _is_on_cooldown(session_id):
-        logger.debug(t("log.meme.session_id_cooling_skipping", session_id=session_id))
+        logger.debug(lt("log.meme.session_id_cooling_skipping", session_id=session_id))
         return None, PICK_COOLDOWN
 
     # 排除最近已发的图片
@@ -120,7 +120,7 @@ async def pick(
                 return record, PICK_OK
             # 检索无可用结果 → 不降级到随机，继续检查下一个 folder
             logger.debug(
-                t(
+                lt(
                     "log.meme.available_search_results_folder",
                     folder=folder,
                     query_text=repr(query_text),
@@ -143,7 +143,7 @@ async def pick(
             return record, PICK_OK
 
     logger.debug(
-        t(
+        lt(
             "log.meme.matching_found_mood",
             mood=mood,
             scene=scene,
@@ -17,7 +17,7 @@ from typing import Optional
 from PIL import Image
 from pydantic_ai.messages import ImageUrl
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.pool import to_thread
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.utils import extract_json_from_text
@@ -143,7 +143,7 @@ async def enqueue_tag(meme_id: str) -> None:
         logger.warning(t("log.meme.tagging_queue_full_dropping", p0=_tag_queue.maxsize, meme_id=meme_id))
         return
     await _tag_queue.put(meme_id)
-    logger.debug(t("log.meme.added_tagging_queue", meme_id=meme_id))
+    logger.debug(lt("log.meme.added_tagging_queue", meme_id=meme_id))
 
 
 async def _tag_worker_loop() -> None:
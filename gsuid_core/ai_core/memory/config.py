@@ -170,6 +170,16 @@ class MemoryConfig:
 
         return ai_config.get_config("qdrant_provider").data
 
+    @property
+    def vector_search_indexed(self) -> bool:
+        """dense 检索是否走索引（remote Qdrant，或本地嵌入式 + qdrant_local_ann）。
+
+        回忆环以此为前置：只有暴力扫描的本地模式下，多轮回忆才会成倍放大检索成本。
+        """
+        from gsuid_core.ai_core.configs.ai_config import ai_config
+
+        return self.qdrant_provider == "remote" or bool(ai_config.get_config("qdrant_local_ann").data)
+
     # ====== RF-Mem 熟悉度路由 + 回忆环（已上 MEMORY_CONFIG，WebConsole 可调） ======
     @property
     def enable_familiarity_routing(self) -> bool:
@@ -180,8 +190,8 @@ class MemoryConfig:
     @property
     def enable_recollection_path(self) -> bool:
         """回忆环（System-1.5，零 LLM 的 KMeans+α-mix 向量深检索）开关。
-        仅在 enable_familiarity_routing 开启、System-2 实际未触发、且 qdrant_provider=remote
-        时才生效（本地嵌入式 Qdrant 是 O(N) 暴力扫，多轮回忆会成倍放大检索墙）。"""
+        仅在 enable_familiarity_routing 开启、System-2 实际未触发、且 dense 检索走索引
+        （vector_search_indexed）时才生效（暴力扫描的本地 Qdrant 下多轮回忆会成倍放大检索墙）。"""
         return mrc.get_config("enable_recollection_path").data
 
     @property
@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 from sqlmodel import col, select
 from sqlalchemy.exc import OperationalError
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.ai_core.memory.config import memory_config
 from gsuid_core.ai_core.memory.vector.ops import search_edges, upsert_edge_vectors_batch
 from gsuid_core.utils.database.base_models import async_maker
@@ -132,7 +132,7 @@ async def extract_and_upsert_edges(
         # §6 残句拦截（摄入侧）：悬空谓语结尾的 fact（"用户X提到"）零信息量，
         # 不入库——与注入侧同判据，源头止血。
         if _DANGLING_FACT_RE.search(fact):
-            logger.debug(t("log.memory.ingestion_blocked_sentence_fragment", fact=fact))
+            logger.debug(lt("log.memory.ingestion_blocked_sentence_fragment", fact=fact))
             continue
         source_id = entity_name_to_id[source_name] if source_name in entity_name_to_id else None
         target_id = entity_name_to_id[target_name] if target_name in entity_name_to_id else None
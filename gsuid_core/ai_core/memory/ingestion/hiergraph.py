@@ -14,7 +14,7 @@ from sqlmodel import Field, SQLModel, col, select
 from sqlalchemy import Text, Column, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.memory.config import memory_config
 from gsuid_core.utils.database.base_models import async_maker, with_session
@@ -197,7 +197,7 @@ class HierarchicalGraphBuilder:
         min_entities = memory_config.hiergraph_min_entities
         if total_entities < min_entities:
             logger.debug(
-                t(
+                lt(
                     "log.memory.hier_scope_entity_total_entities",
                     p0=self.scope_key,
                     total_entities=total_entities,
@@ -263,7 +263,7 @@ class HierarchicalGraphBuilder:
             # 如果上层节点数太少，没有必要再抽象
             if len(prev_layer) < self._min_children() * 2:
                 # 节点数刚好够一个 category，直接 break 而不是让 LLM 硬凑
-                logger.debug(t("log.memory.hier_layer_nodes_stopping_upward", layer=layer, p0=len(prev_layer)))
+                logger.debug(lt("log.memory.hier_layer_nodes_stopping_upward", layer=layer, p0=len(prev_layer)))
                 break
 
             existing_upper = await self._get_categories_by_layer(layer)
@@ -335,7 +335,7 @@ class HierarchicalGraphBuilder:
         if should_regen_summary:
             await self._update_group_summary_cache(valid_prev_layer)
         else:
-            logger.debug(t("log.memory.hier_scope_group_summary_skip", p0=self.scope_key))
+            logger.debug(lt("log.memory.hier_scope_group_summary_skip", p0=self.scope_key))
         logger.info(t("log.memory.hier_incremental_rebuild", p0=time.time() - total_start))
 
         # #3 backlog 续清：本轮达单轮上限说明仍有未归类实体，结束后再调度一次重建。
@@ -19,7 +19,7 @@ from typing import Optional
 from collections import deque
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 # 独立的多模态摄入队列（与文本 observation_queue 物理隔离）
@@ -110,7 +110,7 @@ def submit_image_observation(
             _multimodal_queue.put_nowait(record)
             submitted += 1
         except asyncio.QueueFull:
-            logger.debug(t("log.memory.multimodal_queue_full_discarding"))
+            logger.debug(lt("log.memory.multimodal_queue_full_discarding"))
             break
     return submitted
 
@@ -165,7 +165,7 @@ class ImageUnderstandWorker:
                     prompt="简要描述这张图片的核心内容，若含文字/数字请一并转述。",
                 )
             except Exception as e:
-                logger.debug(t("log.memory.multimodal_image_understanding_ignore", e=e))
+                logger.debug(lt("log.memory.multimodal_image_understanding_ignore", e=e))
                 return
 
             desc = (desc or "").strip()
@@ -186,7 +186,7 @@ class ImageUnderstandWorker:
                     message_type=record.message_type,
                 )
             except Exception as e:
-                logger.debug(t("log.memory.multimodal_enqueue_paraphrase_record", e=e))
+                logger.debug(lt("log.memory.multimodal_enqueue_paraphrase_record", e=e))
 
 
 _worker: Optional[ImageUnderstandWorker] = None
@@ -21,7 +21,7 @@ from datetime import datetime, timezone
 from collections import deque
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.memory.config import memory_config
 
@@ -336,19 +336,19 @@ def _gate(
         return None
     # 命令回显检测（bot 侧报错回显）
     if _COMMAND_ECHO_RE.search(stripped):
-        logger.trace(t("log.memory.observer_command_echo_filter", p0=stripped[:30]))
+        logger.trace(lt("log.memory.observer_command_echo_filter", p0=stripped[:30]))
         return None
     # 用户命令 / typo 命令检测（用户侧指令原文）：不进记忆抽取，避免废弃指令噪声污染召回
     if _looks_like_command(stripped):
-        logger.trace(t("log.memory.observer_user_command_typo", p0=stripped[:30]))
+        logger.trace(lt("log.memory.observer_user_command_typo", p0=stripped[:30]))
         return None
     # 注入特征检测
     if _INJECTION_RE.search(stripped):
-        logger.trace(t("log.memory.observer_injection_signature_filter_inject", p0=stripped[:30]))
+        logger.trace(lt("log.memory.observer_injection_signature_filter_inject", p0=stripped[:30]))
         return None
     # 复读 / 刷屏检测
     if _is_repeat(scope_key, stripped):
-        logger.trace(t("log.memory.observer_repetition_filter_matched", p0=stripped[:30]))
+        logger.trace(lt("log.memory.observer_repetition_filter_matched", p0=stripped[:30]))
         return None
     # 重要性分级（不再因 len < 5 直接丢弃，改由分级后置校验）
     return _classify_value_tier(stripped, memory_config.extraction_value_gate)
@@ -460,7 +460,7 @@ async def observe(
                 worker.request_priority_flush(scope_key)
         except (ImportError, AttributeError, RuntimeError) as e:
             # worker 未启动 / API 变更 / 事件循环未就绪
-            logger.debug(t("log.memory.trigger_immediate_flush_correction", e=e))
+            logger.debug(lt("log.memory.trigger_immediate_flush_correction", e=e))
 
 
 def get_observation_queue() -> sync_queue.Queue:
@@ -739,11 +739,9 @@ async def dual_route_retrieve(
     is_recollection_route = False
     probe_vec: Optional[list[float]] = None
     # P1：仅当探针结论会被消费时才发探针——System-2 开（可被熟悉度抑制）或回忆环可用
-    # （enable_recollection_path + remote Qdrant）。两者皆无时探针白跑一次 embedding+dense、
+    # （enable_recollection_path + 索引化 dense 检索）。两者皆无时探针白跑一次 embedding+dense、
     # 改变不了任何分支，直接短路省成本。
-    _probe_can_act = enable_system2 or (
-        memory_config.enable_recollection_path and memory_config.qdrant_provider == "remote"
-    )
+    _probe_can_act = enable_system2 or (memory_config.enable_recollection_path and memory_config.vector_search_indexed)
     if memory_config.enable_familiarity_routing and scope_keys and _probe_can_act:
         from .familiarity import ROUTE_RECOLLECTION, probe_and_route
 
@@ -843,16 +841,16 @@ async def dual_route_retrieve(
     all_edges: list[Edge] = _merge_edges(s1.edges if s1 else [], s2_edges)
     all_categories: list[Category] = _merge_categories([], s2_categories)
 
-    # RF-Mem 回忆环（默认关，且仅 remote Qdrant）：当路由判为低熟悉、System-2 未实际触发
+    # RF-Mem 回忆环（默认关，且需 dense 检索走索引）：当路由判为低熟悉、System-2 未实际触发
     # 时，用零 LLM 的 KMeans+α-mix 向量回忆补召回，并把召回的 Episode 链**关系投影**成链上
-    # 精准 Edge 事实（与 System-1 独立 Edge 检索取并集、不替代）。本地嵌入式 Qdrant 下回忆
-    # 会成倍放大 O(N) 暴力扫，故强绑 qdrant_provider=remote。
+    # 精准 Edge 事实（与 System-1 独立 Edge 检索取并集、不替代）。暴力扫描的本地 Qdrant 下回忆
+    # 会成倍放大 O(N) 扫描，故要求 remote 或本地 ANN 索引（vector_search_indexed）。
     if (
         memory_config.enable_familiarity_routing
         and memory_config.enable_recollection_path
         and is_recollection_route
         and not effective_enable_system2
-        and memory_config.qdrant_provider == "remote"
+        and memory_config.vector_search_indexed
         and scope_keys
     ):
         try:
@@ -17,7 +17,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 if TYPE_CHECKING:
@@ -166,8 +166,9 @@ async def recollection_search(
     （α-mix 引入 query 残差防语义漂移）→ 保留至多 B 个分支做 beam；累积去重命中，凑够
     top_k 或到轮上限即停。返回按余弦分降序的 Episode 列表（与 _hybrid_search_episodes 同形）。
 
-    仅应在 ``qdrant_provider=remote`` 时调用（本地嵌入式 Qdrant 是 O(N) 暴力扫，多轮会成倍
-    放大检索成本，见评估 §4.3）——该前置由调用方 dual_route 守住。
+    仅应在 dense 检索走索引（remote Qdrant 或本地 ANN，``memory_config.vector_search_indexed``）时
+    调用（暴力扫描的本地 Qdrant 是 O(N)，多轮会成倍放大检索成本，见评估 §4.3）——该前置由调用方
+    dual_route 守住。
 
     ``query_vector``：探针已算好的 query dense 向量，传入则复用、省一次嵌入。
     """
@@ -318,7 +319,7 @@ async def probe_and_route(
         tau=memory_config.familiarity_tau,
     )
     logger.debug(
-        t(
+        lt(
             "log.memory.rf_mem_route_probe_routing",
             route=route,
             p0=signal.mean_score,
@@ -6,7 +6,7 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_shutdown
 from gsuid_core.ai_core.configs.ai_config import ai_config
@@ -42,7 +42,7 @@ async def init_memory_system():
         from gsuid_core.ai_core.rag.base import client
 
         if client is None:
-            logger.debug(t("log.memory.rag_disabled_skipping_2"))
+            logger.debug(lt("log.memory.rag_disabled_skipping_2"))
             return
 
     logger.info(t("log.memory.memory_start_initializing_system"))
@@ -19,7 +19,7 @@ from qdrant_client.models import (
     FieldCondition,
 )
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.rag.base import _get_sparse_model, embed_texts_with_backoff
 from gsuid_core.ai_core.rag.hybrid import hybrid_query
@@ -99,7 +99,7 @@ def _embed_batch(texts: list[str]) -> list[list[float]]:
 
 
 async def _embed_async(text: str) -> list[float]:
-    """异步单条嵌入（直接使用 provider 的异步接口）"""
+    """异步单条嵌入（经 EmbeddingService 与并发的单条请求合批，并命中向量缓存）"""
     from gsuid_core.ai_core.rag.base import embedding_provider
 
     if embedding_provider is None:
@@ -931,13 +931,13 @@ async def probe_episode_scores(
                 )
                 scores.extend(p.score for p in cold_resp.points)
             except Exception as e:
-                logger.debug(t("log.memory.qdrant_familiarity_probe_fallback_fail", e=e))
+                logger.debug(lt("log.memory.qdrant_familiarity_probe_fallback_fail", e=e))
 
         # 合并后按降序取前 k（两集各自已是降序，merge 后统一截断）
         scores.sort(reverse=True)
         return scores[:k]
     except Exception as e:
-        logger.debug(t("log.memory.qdrant_familiarity_probe_query", e=e))
+        logger.debug(lt("log.memory.qdrant_familiarity_probe_query", e=e))
         return []
 
 
@@ -990,7 +990,7 @@ async def dense_search_episodes_with_vectors(
             with_vectors=["dense"],
         )
     except Exception as e:
-        logger.debug(t("log.memory.qdrant_recall_loop_dense_fail", e=e))
+        logger.debug(lt("log.memory.qdrant_recall_loop_dense_fail", e=e))
         return []
 
     out: list[CandidatePoint] = []
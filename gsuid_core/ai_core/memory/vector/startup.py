@@ -6,7 +6,7 @@
 
 from typing import Any
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 from .collections import (
@@ -41,7 +41,7 @@ async def ensure_memory_collections():
     )
 
     if client is None:
-        logger.debug(t("log.memory.rag_disabled_skipping"))
+        logger.debug(lt("log.memory.rag_disabled_skipping"))
         return
 
     try:
@@ -195,7 +195,7 @@ async def ensure_memory_collections():
                 # `scope_key` 时会返回 400。ensure_payload_indexes 幂等（已存在则跳过），
                 # 远程失败会抛 RuntimeError 让 Hybrid 检索不陷入反复 400。
                 await ensure_payload_indexes(name, ["scope_key"])
-                logger.debug(t("log.memory.qdrant_collection_exists_configured", name=name))
+                logger.debug(lt("log.memory.qdrant_collection_exists_configured", name=name))
         except Exception as e:
             # RuntimeError 多为 ensure_payload_indexes / force_recreate_collection 在远程
             # Qdrant 上抛出的"运维配置异常"（索引创建失败/权限/网络），属阻塞性问题——
@@ -272,7 +272,7 @@ async def _ensure_episode_cold_collection(
             # 同 ensure_memory_collections：已存在的冷集合也要补 KEYWORD 索引，
             # 否则 Hybrid 检索按 scope_key 过滤时被远程 Qdrant 400 拒绝。
             await ensure_payload_indexes(name, ["scope_key"])
-            logger.debug(t("log.memory.qdrant_cold_episode_collection", name=name))
+            logger.debug(lt("log.memory.qdrant_cold_episode_collection", name=name))
     except Exception as e:
         # 与 ensure_memory_collections 一致：RuntimeError 视为运维配置异常，升级为 critical
         if isinstance(e, RuntimeError):
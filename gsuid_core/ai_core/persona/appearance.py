@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.resource import PERSONA_PATH
 
@@ -47,7 +47,7 @@ async def refresh_appearance_card(persona_name: str) -> str:
 
         desc = await understand_image(str(portrait), prompt=_APPEARANCE_PROMPT)
     except Exception as e:
-        logger.debug(t("log.persona.appearance_understand_fail", p0=persona_name, e=e))
+        logger.debug(lt("log.persona.appearance_understand_fail", p0=persona_name, e=e))
         return load_appearance_line(persona_name)
     line = (desc or "").strip().replace("\n", " ")[:100]
     if not line:
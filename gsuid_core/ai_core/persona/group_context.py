@@ -20,7 +20,7 @@ from __future__ import annotations
 import time
 from typing import Dict, Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 # 群聊上下文缓存: {group_id: (context_text, timestamp)}
@@ -86,7 +86,7 @@ async def _get_group_name(group_id: str) -> Optional[str]:
         if group is not None and group.group_name and group.group_name != "1":
             return str(group.group_name)
     except Exception as e:
-        logger.debug(t("log.persona.groupcontext_get_group_name_fail", e=e))
+        logger.debug(lt("log.persona.groupcontext_get_group_name_fail", e=e))
 
     return None
 
@@ -115,7 +115,7 @@ async def _get_group_summary_from_memory(group_id: str) -> Optional[str]:
             return str(meta.group_summary_cache)
 
     except Exception as e:
-        logger.debug(t("log.persona.groupcontext_get_group_profile_fail", e=e))
+        logger.debug(lt("log.persona.groupcontext_get_group_profile_fail", e=e))
 
     return None
 
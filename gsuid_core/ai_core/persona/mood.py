@@ -21,7 +21,7 @@ from enum import Enum
 from typing import Dict, Optional, TypedDict
 from dataclasses import field, dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 
@@ -272,7 +272,7 @@ async def update_mood(
     _mood_states[key] = new_state
 
     logger.debug(
-        t(
+        lt(
             "log.persona.mood_name_group_id",
             persona_name=persona_name,
             group_id=group_id,
@@ -294,7 +294,7 @@ async def reset_mood(persona_name: str, group_id: str) -> None:
     """
     key = _make_mood_key(persona_name, group_id)
     _mood_states.pop(key, None)
-    logger.debug(t("log.persona.mood_persona_name_group_id_reset", persona_name=persona_name, group_id=group_id))
+    logger.debug(lt("log.persona.mood_persona_name_group_id_reset", persona_name=persona_name, group_id=group_id))
 
 
 def get_all_mood_states() -> Dict[str, MoodState]:
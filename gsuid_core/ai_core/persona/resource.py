@@ -15,7 +15,7 @@ import json
 from typing import Dict, Tuple, Optional
 from pathlib import Path
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 from .persona import Persona
@@ -223,7 +223,7 @@ def get_tone_markers(persona_name: Optional[str]) -> Tuple[str, ...]:
             with open(md_path, "r", encoding="utf-8") as f:
                 markers = extract_tone_markers(f.read())
         except OSError as e:
-            logger.debug(t("log.persona.read_md_path", md_path=md_path, e=e))
+            logger.debug(lt("log.persona.read_md_path", md_path=md_path, e=e))
     _tone_marker_cache[persona_name] = markers
     return markers
 
@@ -352,7 +352,7 @@ def migrate_voice_anchor_from_config(persona_name: str) -> bool:
         with open(cfg_path, "r", encoding="utf-8") as f:
             cfg = json.load(f)
     except (OSError, json.JSONDecodeError) as e:
-        logger.debug(t("log.persona.read_cfg_path_skipping", cfg_path=cfg_path, e=e))
+        logger.debug(lt("log.persona.read_cfg_path_skipping", cfg_path=cfg_path, e=e))
         return False
 
     if not isinstance(cfg, dict) or "voice_anchor" not in cfg:
@@ -431,7 +431,7 @@ def _load_voice_anchor_from_disk(persona_name: str) -> str:
             if raw:
                 return raw
         except OSError as e:
-            logger.debug(t("log.persona.read_txt_path", txt_path=txt_path, e=e))
+            logger.debug(lt("log.persona.read_txt_path", txt_path=txt_path, e=e))
 
     # 2. persona.md 正则兜底
     md_path = persona_dir / "persona.md"
@@ -441,7 +441,7 @@ def _load_voice_anchor_from_disk(persona_name: str) -> str:
         with open(md_path, "r", encoding="utf-8") as f:
             md_text = f.read()
     except OSError as e:
-        logger.debug(t("log.persona.read_md_path", md_path=md_path, e=e))
+        logger.debug(lt("log.persona.read_md_path", md_path=md_path, e=e))
         return ""
     return _extract_voice_anchor_from_persona(md_text)
 
@@ -15,7 +15,7 @@ from sqlmodel import col, select, update
 from sqlalchemy import delete
 from sqlalchemy.engine import CursorResult
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.database.base_models import async_maker
 
@@ -903,7 +903,7 @@ async def _distill_root_terminal(
             as_of=datetime.now().strftime("%Y-%m-%d"),
         )
     except Exception as e:
-        logger.debug(t("log.ai.cognition_distill_task_fail", task=root.id, e=e))
+        logger.debug(lt("log.ai.cognition_distill_task_fail", task=root.id, e=e))
 
 
 # 任务级状态操作：暂停 / 恢复 / 终止（webconsole 与主人格句柄都走这里）
@@ -25,7 +25,7 @@ import asyncio
 from typing import List, Tuple, Optional
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.proactive import emit_proactive_message
@@ -265,7 +265,7 @@ async def _build_resume_hint(child: AIAgentTask) -> str:
 
         return await install_resume_hint_for_task(child.id)
     except Exception as e:
-        logger.debug(t("log.ai.kanban_construct_resume_checkpoint_fail", e=e))
+        logger.debug(lt("log.ai.kanban_construct_resume_checkpoint_fail", e=e))
         return ""
 
 
@@ -424,7 +424,7 @@ async def _persona_relay(
             return clean, relay_log_files
         return _sanitize_relay_spoken(_sanitize_for_user(raw_result)), relay_log_files
     except Exception as e:
-        logger.debug(t("log.ai.kanban_persona_rendition_code_fail", e=e))
+        logger.debug(lt("log.ai.kanban_persona_rendition_code_fail", e=e))
         return _sanitize_for_user(raw_result), relay_log_files
     finally:
         # 无论成功 / 异常，关闭转译 SubAgent logger；relay_log_files 在 return 表达式求值后才被 append（list 是引用
@@ -621,7 +621,7 @@ async def _wake_main_agent_for_delivery(task: AIAgentTask, raw_result: str) -> N
             if item is not None:
                 await _wake_main_agent_for_delivery_now(item[0], item[1])
         except Exception as e:
-            logger.debug(t("log.ai.delivery_coalesce_flush_skip", e=e))
+            logger.debug(lt("log.ai.delivery_coalesce_flush_skip", e=e))
             _delivery_flush_tasks.pop(key, None)
             _delivery_pending.pop(key, None)
 
@@ -826,7 +826,7 @@ async def _run_one_task_node(root: AIAgentTask, child: AIAgentTask) -> None:
                 res_handle=output_id or "",
             )
         except Exception as _pe:
-            logger.debug(t("log.ai.persist_subagent_result_skip", e=_pe))
+            logger.debug(lt("log.ai.persist_subagent_result_skip", e=_pe))
 
         # 5) 落终态
         from gsuid_core.ai_core.capability_agents.runner import (
@@ -858,7 +858,7 @@ async def _run_one_task_node(root: AIAgentTask, child: AIAgentTask) -> None:
             await kanban.mark_subtask_completed(fresh, output_artifact_id=output_id)
             if no_broadcast:
                 logger.debug(
-                    t(
+                    lt(
                         "log.ai.kanban_subtask_declared_silence",
                         p0=fresh.display_name,
                         KANBAN_NO_BROADCAST_MARK=KANBAN_NO_BROADCAST_MARK,
@@ -921,7 +921,7 @@ async def execute_ready_tasks(root_task_id: str) -> None:
         return
     if root.recurring_trigger and root.recurring_status == "armed":
         logger.debug(
-            t(
+            lt(
                 "log.ai.kanban_skipping_direct_scheduling_skip",
                 root_task_id=root_task_id,
             )
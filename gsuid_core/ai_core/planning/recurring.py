@@ -42,7 +42,7 @@ if TYPE_CHECKING:
     from .models import AIAgentTask
 
 from gsuid_core.aps import scheduler
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 _JOB_PREFIX = "kanban_recurring_"
@@ -379,7 +379,7 @@ def unschedule_template(template_root_id: str) -> bool:
         scheduler.remove_job(job_id)
         return True
     except Exception as e:
-        logger.debug(t("log.ai.kanban_removing_recurring_job_skip", e=e))
+        logger.debug(lt("log.ai.kanban_removing_recurring_job_skip", e=e))
         return False
 
 
@@ -421,11 +421,11 @@ async def _fire_not_before(subtask_id: str, root_task_id: str) -> None:
 
         sub = await AIAgentTask.get_by_id(subtask_id)
         if sub is None:
-            logger.debug(t("log.ai.kanban_wake_subtask_id_found", subtask_id=subtask_id))
+            logger.debug(lt("log.ai.kanban_wake_subtask_id_found", subtask_id=subtask_id))
             return
         if sub.status != "pending":
             logger.debug(
-                t(
+                lt(
                     "log.ai.kanban_wake_subtask_id_status",
                     subtask_id=subtask_id,
                     p0=sub.status,
@@ -635,7 +635,7 @@ def unschedule_subtask_template(subtask_id: str) -> bool:
         scheduler.remove_job(job_id)
         return True
     except Exception as e:
-        logger.debug(t("log.ai.kanban_removing_recurring_subtask_skip", e=e))
+        logger.debug(lt("log.ai.kanban_removing_recurring_subtask_skip", e=e))
         return False
 
 
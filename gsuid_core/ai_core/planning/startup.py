@@ -14,7 +14,7 @@
 
 from sqlmodel import col, select
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.configs.ai_config import ai_config
 
@@ -113,7 +113,7 @@ async def init_planning() -> None:
         _asyncio.create_task(ensure_tool_output_collection())
         _asyncio.create_task(ensure_artifact_collection())
     except Exception as e:
-        logger.debug(t("log.ai.kanban_register_artifact_ttl_fail", e=e))
+        logger.debug(lt("log.ai.kanban_register_artifact_ttl_fail", e=e))
 
     # 能力节点语义路由缓存：内置/插件/用户节点此时已全部注册，统一重嵌入。
     # 失败仅降级为关键词路由，不阻断启动。
@@ -9,7 +9,7 @@ from typing import Any, Optional
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.memory.scope import scope_key_for_conversation
@@ -419,7 +419,7 @@ async def _index_chunks_safe(
             if attempt < retries:
                 await asyncio.sleep(0.3 * (attempt + 1))
     fileos_metrics.inc_index(False)
-    logger.debug(t("log.ai.tool_output_index_skip_after_retry", e=last_err))
+    logger.debug(lt("log.ai.tool_output_index_skip_after_retry", e=last_err))
 
 
 async def _distill_to_cognition(
@@ -473,6 +473,6 @@ def schedule_persist_tool_return(
                 root_task_id=root_task_id,
             )
         except Exception as e:
-            logger.debug(t("log.ai.tool_output_persist_skip", e=e))
+            logger.debug(lt("log.ai.tool_output_persist_skip", e=e))
 
     asyncio.create_task(_job())
@@ -129,7 +129,7 @@ async def search_tool_outputs(
 
 async def delete_tool_output_index(record_ids: Sequence[str]) -> None:
     """按 payload.id 批量删 Qdrant 点（TTL / 任务硬删后清理悬空向量）。"""
-    from gsuid_core.i18n import t
+    from gsuid_core.i18n import lt
     from gsuid_core.logger import logger
     from gsuid_core.ai_core.rag.base import client
 
@@ -151,4 +151,4 @@ async def delete_tool_output_index(record_ids: Sequence[str]) -> None:
             ),
         )
     except Exception as e:
-        logger.debug(t("log.ai.tool_output_index_delete_skip", e=e))
+        logger.debug(lt("log.ai.tool_output_index_delete_skip", e=e))
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -156,7 +156,7 @@ async def search_fileos_outputs(
                 hybrid_ids.append(rid)
                 hybrid_meta[rid] = h
     except Exception as e:
-        logger.debug(t("log.ai.tool_output_hybrid_search_skip", e=e))
+        logger.debug(lt("log.ai.tool_output_hybrid_search_skip", e=e))
 
     sql_rows = await AIToolOutputRecord.search(
         owner_user_id=owner,
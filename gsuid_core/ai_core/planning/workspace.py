@@ -21,7 +21,7 @@ from datetime import datetime, timedelta
 
 from sqlmodel import col, func, select
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.data_store import AI_CORE_PATH, get_res_path
 from gsuid_core.utils.database.base_models import async_maker
@@ -440,4 +440,4 @@ async def _remember_and_index_artifact(
 
         asyncio.create_task(_index())
     except Exception as e:
-        logger.debug(t("log.ai.cognition_node_sync_fail", kind="artifact", ref=art.id, e=e))
+        logger.debug(lt("log.ai.cognition_node_sync_fail", kind="artifact", ref=art.id, e=e))
@@ -27,7 +27,7 @@ from typing import Any, Dict, List, Literal, Optional
 from pathlib import Path
 
 from gsuid_core.bot import Bot, _Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.utils import send_chat_result
@@ -158,7 +158,7 @@ async def emit_proactive_message(
     # 1) C8 防撞车——仅 Heartbeat 自己受抑制；task / kanban / tool 不在乎上次刚发过什么。
     if suppress_when_heartbeat_recent and dispatcher.should_suppress_heartbeat(target_key):
         logger.debug(
-            t(
+            lt(
                 "log.ai.proactiveemitter_c8_suppressed_source",
                 source=source,
                 target_key=target_key,
@@ -10,6 +10,7 @@
 - base: 抽象基类 EmbeddingProvider 及线程池桥接
 - local: 本地 fastembed 实现 LocalEmbeddingProvider
 - openai: OpenAI 兼容远程实现 OpenAIEmbeddingProvider
+- service: 合批 + 向量缓存包装 EmbeddingService（factory 返回的单例即为它）
 - factory: 全局单例管理 get_embedding_provider / reset_embedding_provider
 
 使用方式:
@@ -28,6 +29,7 @@ from gsuid_core.ai_core.rag.embedding.factory import (
     get_embedding_provider,
     reset_embedding_provider,
 )
+from gsuid_core.ai_core.rag.embedding.service import EmbeddingService
 from gsuid_core.ai_core.rag.embedding.modality import (
     EmbeddingModality,
     parse_modalities,
@@ -39,6 +41,7 @@ __all__ = [
     "EmbeddingProvider",
     "LocalEmbeddingProvider",
     "OpenAIEmbeddingProvider",
+    "EmbeddingService",
     "get_embedding_provider",
     "reset_embedding_provider",
 ]
@@ -64,6 +64,11 @@ class EmbeddingProvider(ABC):
         """返回嵌入向量的维度"""
         ...
 
+    @property
+    def model_id(self) -> str:
+        """向量空间标识：嵌入缓存按它区分不同模型产出的向量。"""
+        return f"{type(self).__name__}:{getattr(self, '_model_name', '')}"
+
     @property
     def supported_modalities(self) -> set["EmbeddingModality"]:
         """对外声明本 provider 支持的模态，默认仅文本。
@@ -2,6 +2,7 @@
 
 根据 ai_config 中的 embedding_provider 配置项构造并缓存对应的 provider 实现，
 支持内置 local/openai 以及插件注册的第三方 provider，并在插件不可用时降级回 local。
+对外返回的单例统一包在 ``EmbeddingService`` 中。
 """
 
 from typing import Union
@@ -11,6 +12,7 @@ from gsuid_core.logger import logger
 from gsuid_core.ai_core.rag.embedding.base import EmbeddingProvider
 from gsuid_core.ai_core.rag.embedding.local import LocalEmbeddingProvider
 from gsuid_core.ai_core.rag.embedding.openai import OpenAIEmbeddingProvider
+from gsuid_core.ai_core.rag.embedding.service import EmbeddingService, get_embedding_cache
 from gsuid_core.ai_core.rag.embedding.modality import (
     EmbeddingModality,
     parse_modalities,
@@ -56,6 +58,9 @@ def get_embedding_provider() -> EmbeddingProvider:
     插件 provider 不可用时（插件被卸载/构造失败）降级回 local 并记录错误，
     避免 RAG 初始化失败导致 AI 核心整体不可用。
 
+    返回的实例外包一层 ``EmbeddingService``（单条请求合批 + 向量缓存），
+    底层 provider 见其 ``inner`` 属性。
+
     Returns:
         EmbeddingProvider 实例
 
@@ -67,6 +72,13 @@ def get_embedding_provider() -> EmbeddingProvider:
     if _provider is not None:
         return _provider
 
+    inner = _build_provider()
+    _provider = EmbeddingService(inner, get_embedding_cache())
+    return _provider
+
+
+def _build_provider() -> EmbeddingProvider:
+    """按配置构造底层 provider（不含合批/缓存包装）"""
     from gsuid_core.ai_core.configs.ai_config import (
         ai_config,
         openai_embedding_config,
@@ -78,7 +90,7 @@ def get_embedding_provider() -> EmbeddingProvider:
     provider_name = ai_config.get_config("embedding_provider").data
 
     if provider_name == "local":
-        _provider = _build_local_provider()
+        provider = _build_local_provider()
     elif provider_name == "openai":
         base_url = openai_embedding_config.get_config("base_url").data
         api_key_list = openai_embedding_config.get_config("api_key").data
@@ -88,7 +100,7 @@ def get_embedding_provider() -> EmbeddingProvider:
         model_name = openai_embedding_config.get_config("embedding_model").data
         dimension = openai_embedding_config.get_config("dimension").data
         modalities = parse_modalities(openai_embedding_config.get_config("embedding_modalities").data)
-        _provider = OpenAIEmbeddingProvider(
+        provider = OpenAIEmbeddingProvider(
             base_url=base_url,
             api_key=api_key,
             model_name=model_name,
@@ -112,10 +124,10 @@ def get_embedding_provider() -> EmbeddingProvider:
                     p0=list_embedding_providers(),
                 )
             )
-            _provider = _build_local_provider()
+            provider = _build_local_provider()
         else:
             try:
-                _provider = entry.factory()
+                provider = entry.factory()
                 logger.info(
                     t(
                         "log.rag.embedding_plugin_provider_name_2",
@@ -132,9 +144,9 @@ def get_embedding_provider() -> EmbeddingProvider:
                         e=e,
                     )
                 )
-                _provider = _build_local_provider()
+                provider = _build_local_provider()
 
-    return _provider
+    return provider
 
 
 def reset_embedding_provider() -> None:
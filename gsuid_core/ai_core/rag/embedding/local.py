@@ -4,6 +4,7 @@ import os
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
+from gsuid_core.metrics import EMBEDDING_SECONDS
 from gsuid_core.ai_core.rag.embedding.base import EmbeddingProvider
 
 # 本地嵌入的 CPU/内存旋钮兜底默认值：刻意与 CPU 核数解耦、取「省内存」低值。
@@ -84,7 +85,9 @@ class LocalEmbeddingProvider(EmbeddingProvider):
 
     def embed_sync(self, texts: list[str]) -> list[list[float]]:
         # 显式限制 batch_size 控制驻留内存峰值（2C2G 关键）；fastembed 内部按此分批。
-        return [[float(x) for x in v] for v in self._model.embed(texts, batch_size=self._batch_size)]
+        with EMBEDDING_SECONDS.time("local"):
+            return [[float(x) for x in v] for v in self._model.embed(texts, batch_size=self._batch_size)]
 
     def embed_single_sync(self, text: str) -> list[float]:
-        return [float(x) for x in next(iter(self._model.embed([text])))]
+        with EMBEDDING_SECONDS.time("local"):
+            return [float(x) for x in next(iter(self._model.embed([text])))]
@@ -7,6 +7,7 @@ import httpx
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
+from gsuid_core.metrics import EMBEDDING_SECONDS
 from gsuid_core.ai_core.rag.embedding.base import EmbeddingProvider
 from gsuid_core.ai_core.rag.embedding.modality import EmbeddingModality
 
@@ -69,6 +70,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
     def dimension(self) -> int:
         return self._dim
 
+    @property
+    def model_id(self) -> str:
+        return f"openai:{self._base_url}:{self._model_name}"
+
     @property
     def supported_modalities(self) -> set["EmbeddingModality"]:
         return set(self._modalities)
@@ -119,7 +124,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "input": texts,
         }
 
-        with httpx.Client(timeout=60.0) as client:
+        with EMBEDDING_SECONDS.time("openai"), httpx.Client(timeout=60.0) as client:
             response = client.post(url, json=payload, headers=headers)
             response.raise_for_status()
             data = response.json()
@@ -149,10 +154,11 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "input": texts,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        with EMBEDDING_SECONDS.time("openai"):
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                response = await client.post(url, json=payload, headers=headers)
+                response.raise_for_status()
+                data = response.json()
 
         sorted_data = sorted(data["data"], key=lambda x: x["index"])
         vectors = [item["embedding"] for item in sorted_data]
@@ -0,0 +1,471 @@
+"""嵌入服务：包在任意 provider 之前的合批与向量缓存
+
+``get_embedding_provider()`` 返回的是 ``EmbeddingService``，对调用方仍是一个
+``EmbeddingProvider``：
+
+- 合批：并发的 ``embed_single`` 在同一事件循环内排队，首条到达后最多等待
+  ``BATCH_WINDOW`` 秒或凑满 ``BATCH_MAX`` 条，合并为一次底层 ``embed()``；
+  同一文本的并发请求只计算一次；
+- 缓存：向量按 (``model_id``, 归一化文本哈希) 缓存，内存 LRU（按字节计）在前，
+  本地 SQLite 在后，重启后常见的人设片段、实体名、重复提问仍能命中；
+- 打点：合批大小 / 排队等待 / 缓存命中见 ``gsuid_core.metrics`` 中的 ``EMBEDDING_*``。
+
+非文本模态直接转交底层 provider，不缓存。
+"""
+
+import time
+import array
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from typing import Set, Dict, List, Tuple, Iterator, Optional, Sequence
+from pathlib import Path
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+
+from gsuid_core.metrics import EMBEDDING_CACHE, EMBEDDING_BATCH_SIZE, EMBEDDING_QUEUE_SECONDS
+from gsuid_core.ai_core.rag.embedding.base import EmbeddingProvider
+from gsuid_core.ai_core.rag.embedding.modality import EmbeddingModality
+
+# 合批窗口（秒）与单批上限
+BATCH_WINDOW = 0.005
+BATCH_MAX = 32
+# 缓存预算的兜底默认值（MB），可在 AI 配置中调整
+_FALLBACK_MEMORY_MB = 32
+_FALLBACK_DISK_MB = 256
+# 磁盘超出预算后淘汰到预算的这个比例
+LOW_WATERMARK = 0.9
+# 单条 SQL 中 IN (...) 的参数个数上限
+_SQL_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    key TEXT PRIMARY KEY,
+    vec BLOB NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vectors_created ON vectors (created);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """NFKC 归一化并折叠空白，仅用于生成缓存键（送去嵌入的仍是原文）。"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def cache_key(model_id: str, text: str) -> str:
+    return hashlib.blake2b(f"{model_id}\n{normalize_text(text)}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array.array("f", vector).tobytes()
+
+
+def _unpack(data: bytes) -> List[float]:
+    return array.array("f", data).tolist()
+
+
+class EmbeddingCache:
+    """内存 LRU + SQLite 的两级向量缓存，线程安全。向量以 float32 存储。
+
+    内存层与磁盘层各用一把锁：事件循环上的内存查询不会等在线程里的 SQLite 读写或淘汰后面。
+    """
+
+    def __init__(self, path: Optional[Path], memory_bytes: int, disk_bytes: int) -> None:
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._disk_used = 0
+        if path is not None and disk_bytes > 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._disk_used = self._db.execute("SELECT COALESCE(SUM(LENGTH(vec)), 0) FROM vectors").fetchone()[0]
+
+    def get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        """先查内存再批量查磁盘；磁盘命中的条目提升进内存。"""
+        found: Dict[str, bytes] = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                data = self._memory.get(key)
+                if data is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = data
+        if not missing or self._db is None:
+            return found
+
+        loaded: Dict[str, bytes] = {}
+        with self._db_lock:
+            if self._db is not None:
+                for chunk in _chunks(missing):
+                    marks = ",".join("?" * len(chunk))
+                    loaded.update(self._db.execute(f"SELECT key, vec FROM vectors WHERE key IN ({marks})", chunk))
+        if loaded:
+            with self._lock:
+                for key, data in loaded.items():
+                    self._remember(key, data)
+            found.update(loaded)
+        return found
+
+    def put_many(self, items: Sequence[Tuple[str, bytes]]) -> None:
+        if not items:
+            return
+        with self._lock:
+            for key, data in items:
+                self._remember(key, data)
+        if self._db is None:
+            return
+
+        latest = dict(items)
+        with self._db_lock:
+            if self._db is None:
+                return
+            # INSERT OR REPLACE 覆盖已有键时，先扣掉被替换行的大小
+            replaced = 0
+            for chunk in _chunks(list(latest)):
+                marks = ",".join("?" * len(chunk))
+                for (size,) in self._db.execute(f"SELECT LENGTH(vec) FROM vectors WHERE key IN ({marks})", chunk):
+                    replaced += size
+            now = time.time()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vec, created) VALUES (?, ?, ?)",
+                [(key, data, now) for key, data in latest.items()],
+            )
+            self._disk_used += sum(map(len, latest.values())) - replaced
+            if self._disk_used > self.disk_bytes:
+                self._evict_disk()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.memory_bytes <= 0:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_used -= len(old)
+        self._memory[key] = data
+        self._memory_used += len(data)
+        while self._memory_used > self.memory_bytes and self._memory:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_used -= len(dropped)
+
+    def _evict_disk(self) -> None:
+        """按写入时间从旧到新删除，直到回落到预算的 ``LOW_WATERMARK``；需持有 ``_db_lock``。
+
+        走 ``created`` 索引只读出要删的行，不对全表求和。
+        """
+        assert self._db is not None
+        excess = self._disk_used - self.disk_bytes * LOW_WATERMARK
+        while excess > 0:
+            rows = self._db.execute(
+                "SELECT key, LENGTH(vec) FROM vectors ORDER BY created LIMIT ?",
+                (_SQL_CHUNK,),
+            ).fetchall()
+            if not rows:
+                self._disk_used = 0
+                return
+            victims = []
+            for key, size in rows:
+                victims.append(key)
+                excess -= size
+                self._disk_used -= size
+                if excess <= 0:
+                    break
+            self._db.execute(f"DELETE FROM vectors WHERE key IN ({','.join('?' * len(victims))})", victims)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_items": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "disk_bytes": self._disk_used,
+            }
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _chunks(keys: List[str]) -> Iterator[List[str]]:
+    for i in range(0, len(keys), _SQL_CHUNK):
+        yield keys[i : i + _SQL_CHUNK]  # noqa: E203
+
+
+class _Batcher:
+    """单个事件循环上的合批队列。"""
+
+    def __init__(self) -> None:
+        self.pending: List[Tuple[str, str, float]] = []
+        self.inflight: Dict[str, "asyncio.Future[List[float]]"] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        # 持有批任务的引用，防止被 GC 回收
+        self.tasks: Set["asyncio.Task[None]"] = set()
+
+
+class EmbeddingService(EmbeddingProvider):
+    """在底层 provider 之前做合批与缓存的包装。"""
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        cache: Optional[EmbeddingCache] = None,
+        window: float = BATCH_WINDOW,
+        max_batch: int = BATCH_MAX,
+    ) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.window = window
+        self.max_batch = max_batch
+        self._batchers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _Batcher]" = WeakKeyDictionary()
+
+    @property
+    def dimension(self) -> int:
+        return self.inner.dimension
+
+    @property
+    def model_id(self) -> str:
+        return self.inner.model_id
+
+    @property
+    def supported_modalities(self) -> set["EmbeddingModality"]:
+        return self.inner.supported_modalities
+
+    # ────────────────── 缓存 ──────────────────
+
+    def _lookup(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        if self.cache is None:
+            return {}
+        dim = self.inner.dimension
+        hits = {}
+        for key, data in self.cache.get_many(keys).items():
+            vector = _unpack(data)
+            # 同名模型换了维度时旧向量作废
+            if not dim or len(vector) == dim:
+                hits[key] = vector
+        return hits
+
+    def _store(self, items: Sequence[Tuple[str, List[float]]]) -> None:
+        if self.cache is not None:
+            self.cache.put_many([(key, _pack(vector)) for key, vector in items])
+
+    def _memory_hit(self, key: str) -> Optional[List[float]]:
+        if self.cache is None:
+            return None
+        data = self.cache.get_memory(key)
+        if data is None:
+            return None
+        vector = _unpack(data)
+        dim = self.inner.dimension
+        return vector if not dim or len(vector) == dim else None
+
+    @staticmethod
+    def _count(hits: int, misses: int) -> None:
+        if hits:
+            EMBEDDING_CACHE.inc("hit", amount=hits)
+        if misses:
+            EMBEDDING_CACHE.inc("miss", amount=misses)
+
+    def _plan(self, texts: Sequence[str]) -> Tuple[List[str], Dict[str, str]]:
+        """返回每条文本的缓存键，以及 {缓存键: 首次出现的原文}（批内去重）。"""
+        model_id = self.inner.model_id
+        keys = [cache_key(model_id, text) for text in texts]
+        unique: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+        return keys, unique
+
+    # ────────────────── 文本：同步 ──────────────────
+
+    def embed_sync(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        keys, unique = self._plan(texts)
+        found = self._lookup(list(unique))
+        misses = [key for key in unique if key not in found]
+        if misses:
+            EMBEDDING_BATCH_SIZE.observe(len(misses), "batch")
+            vectors = self.inner.embed_sync([unique[key] for key in misses])
+            computed = list(zip(misses, vectors))
+            self._store(computed)
+            found.update(computed)
+        self._count(len(texts) - len(misses), len(misses))
+        return [list(found[key]) for key in keys]
+
+    def embed_single_sync(self, text: str) -> list[float]:
+        return self.embed_sync([text])[0]
+
+    # ────────────────── 文本：异步 ──────────────────
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        keys, unique = self._plan(texts)
+        found = {key: vec for key in unique if (vec := self._memory_hit(key)) is not None}
+        if len(found) < len(unique):
+            found.update(await asyncio.to_thread(self._lookup, [key for key in unique if key not in found]))
+        misses = [key for key in unique if key not in found]
+        if misses:
+            EMBEDDING_BATCH_SIZE.observe(len(misses), "batch")
+            vectors = await self.inner.embed([unique[key] for key in misses])
+            computed = list(zip(misses, vectors))
+            await asyncio.to_thread(self._store, computed)
+            found.update(computed)
+        self._count(len(texts) - len(misses), len(misses))
+        return [list(found[key]) for key in keys]
+
+    async def embed_single(self, text: str) -> list[float]:
+        key = cache_key(self.inner.model_id, text)
+        vector = self._memory_hit(key)
+        if vector is not None:
+            self._count(1, 0)
+            return vector
+
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = self._batchers[loop] = _Batcher()
+
+        fut = batcher.inflight.get(key)
+        if fut is None:
+            fut = batcher.inflight[key] = loop.create_future()
+            batcher.pending.append((key, text, time.perf_counter()))
+            if len(batcher.pending) >= self.max_batch:
+                self._flush_now(loop, batcher)
+            elif batcher.timer is None:
+                batcher.timer = loop.call_later(self.window, self._flush_now, loop, batcher)
+        else:
+            # 同一文本已在排队或计算中：搭便车，不额外计算
+            self._count(1, 0)
+        return list(await asyncio.shield(fut))
+
+    def _flush_now(self, loop: asyncio.AbstractEventLoop, batcher: _Batcher) -> None:
+        if batcher.timer is not None:
+            batcher.timer.cancel()
+            batcher.timer = None
+        pending, batcher.pending = batcher.pending, []
+        if pending:
+            task = loop.create_task(self._run_batch(batcher, pending))
+            batcher.tasks.add(task)
+            task.add_done_callback(batcher.tasks.discard)
+
+    async def _run_batch(self, batcher: _Batcher, pending: List[Tuple[str, str, float]]) -> None:
+        now = time.perf_counter()
+        for _, _, enqueued in pending:
+            EMBEDDING_QUEUE_SECONDS.observe(now - enqueued)
+        try:
+            found = await asyncio.to_thread(self._lookup, [key for key, _, _ in pending])
+            misses = [(key, text) for key, text, _ in pending if key not in found]
+            if misses:
+                EMBEDDING_BATCH_SIZE.observe(len(misses), "single")
+                vectors = await self.inner.embed([text for _, text in misses])
+                computed = [(key, vector) for (key, _), vector in zip(misses, vectors)]
+                await asyncio.to_thread(self._store, computed)
+                found.update(computed)
+            self._count(len(pending) - len(misses), len(misses))
+        except BaseException as e:
+            for key, _, _ in pending:
+                fut = batcher.inflight.pop(key, None)
+                if fut is None or fut.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    fut.cancel()
+                else:
+                    fut.set_exception(e)
+                    # 等待方都已取消时避免 "exception was never retrieved"
+                    fut.exception()
+            if not isinstance(e, Exception):
+                raise
+            return
+        for key, _, _ in pending:
+            fut = batcher.inflight.pop(key, None)
+            if fut is not None and not fut.done():
+                fut.set_result(found[key])
+
+    # ────────────────── 非文本模态：直接转交 ──────────────────
+
+    def embed_image_sync(self, images: list[bytes]) -> list[list[float]]:
+        return self.inner.embed_image_sync(images)
+
+    def embed_image_single_sync(self, image: bytes) -> list[float]:
+        return self.inner.embed_image_single_sync(image)
+
+    async def embed_image(self, images: list[bytes]) -> list[list[float]]:
+        return await self.inner.embed_image(images)
+
+    async def embed_image_single(self, image: bytes) -> list[float]:
+        return await self.inner.embed_image_single(image)
+
+    def embed_audio_sync(self, clips: list[bytes]) -> list[list[float]]:
+        return self.inner.embed_audio_sync(clips)
+
+    def embed_audio_single_sync(self, clip: bytes) -> list[float]:
+        return self.inner.embed_audio_single_sync(clip)
+
+    async def embed_audio(self, clips: list[bytes]) -> list[list[float]]:
+        return await self.inner.embed_audio(clips)
+
+    async def embed_audio_single(self, clip: bytes) -> list[float]:
+        return await self.inner.embed_audio_single(clip)
+
+    def embed_video_sync(self, clips: list[bytes]) -> list[list[float]]:
+        return self.inner.embed_video_sync(clips)
+
+    def embed_video_single_sync(self, clip: bytes) -> list[float]:
+        return self.inner.embed_video_single_sync(clip)
+
+    async def embed_video(self, clips: list[bytes]) -> list[list[float]]:
+        return await self.inner.embed_video(clips)
+
+    async def embed_video_single(self, clip: bytes) -> list[float]:
+        return await self.inner.embed_video_single(clip)
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def _config_mb(key: str, fallback: int) -> int:
+    try:
+        from gsuid_core.ai_core.configs.ai_config import ai_config
+
+        val = int(ai_config.get_config(key).data)
+        return val if val >= 0 else fallback
+    except Exception:
+        return fallback
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """进程内共享的向量缓存；键里带 ``model_id``，切换 provider 后无需清空。"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from gsuid_core.data_store import AI_CORE_PATH
+
+            _cache = EmbeddingCache(
+                AI_CORE_PATH / "embedding_cache.db",
+                _config_mb("embedding_cache_memory_mb", _FALLBACK_MEMORY_MB) * 1024 * 1024,
+                _config_mb("embedding_cache_disk_mb", _FALLBACK_DISK_MB) * 1024 * 1024,
+            )
+        return _cache
+
+
+def embedding_cache_stats() -> Dict[str, int]:
+    return _cache.stats() if _cache is not None else {"memory_items": 0, "memory_bytes": 0, "disk_bytes": 0}
@@ -931,6 +931,83 @@ async def deep_reconcile_manual_knowledge() -> Dict[str, Any]:
     return totals
 
 
+def _plugin_manifest_row(id_str: str, point_id: Union[int, str], payload: Dict[str, Any]) -> AIKnowledgeChunk:
+    """插件知识 / 图片的清单行（``doc_id`` = 插件名；图片无标题，正文即描述文本）。"""
+    tags = _opt_field(payload, "tags") or []
+    plugin = str(_opt_field(payload, "plugin") or "")
+    return AIKnowledgeChunk(
+        id=id_str,
+        doc_id=plugin,
+        chunk_index=0,
+        title=str(_opt_field(payload, "title") or ""),
+        content=str(_opt_field(payload, "content") or ""),
+        tags=json.dumps(tags if isinstance(tags, list) else [], ensure_ascii=False),
+        source="plugin",
+        plugin=plugin,
+        qdrant_id=str(point_id),
+        content_hash=str(_opt_field(payload, "_hash") or ""),
+    )
+
+
+async def _load_plugin_manifest() -> Dict[str, tuple[str, str]]:
+    """取插件知识清单；与 Qdrant 中的插件点不一致时（首次升级 / 向量库重建 / 上次写入中断）从向量库重建。
+
+    先比点数，再按清单中的 qdrant_id 批量 ``retrieve``（不取 payload / 向量）确认每个点都在，
+    能发现「丢了一个点、又多出一个无关点」这类点数不变的漂移。一致时不做全量 scroll。
+    """
+    from gsuid_core.ai_core.rag.base import client
+
+    manifest = await AIKnowledgeChunk.manifest("plugin")
+    if client is None:
+        return manifest
+    plugin_filter = Filter(must=[FieldCondition(key="source", match=MatchValue(value="plugin"))])
+    try:
+        q_count = (await client.count(collection_name=KNOWLEDGE_COLLECTION_NAME, count_filter=plugin_filter)).count
+        if q_count == len(manifest) and await _manifest_points_present(client, manifest):
+            return manifest
+    except Exception as e:
+        logger.debug(i18n_t("log.rag.kb_plugin_manifest_check_fail", e=e))
+        return manifest
+
+    rows: Dict[str, AIKnowledgeChunk] = {}
+    next_offset = None
+    while True:
+        records, next_offset = await client.scroll(
+            collection_name=KNOWLEDGE_COLLECTION_NAME,
+            limit=256,
+            with_payload=True,
+            with_vectors=False,
+            offset=next_offset,
+            scroll_filter=plugin_filter,
+        )
+        for rec in records:
+            id_str = str(_opt_field(rec.payload, "id") or "") if rec.payload else ""
+            if id_str:
+                rows[id_str] = _plugin_manifest_row(id_str, rec.id, dict(rec.payload or {}))
+        if next_offset is None:
+            break
+    await AIKnowledgeChunk.apply_manifest(list(rows.values()), [], clear_source="plugin")
+    logger.info(i18n_t("log.rag.kb_plugin_manifest_rebuilt", p0=len(manifest), p1=len(rows)))
+    return {i: (r.content_hash, r.qdrant_id) for i, r in rows.items()}
+
+
+async def _manifest_points_present(client, manifest: Dict[str, tuple[str, str]]) -> bool:
+    """清单中的每个 qdrant_id 在向量库中都存在时返回 True。"""
+    qids = [qid for _, qid in manifest.values()]
+    batch = 256
+    for i in range(0, len(qids), batch):
+        chunk = qids[i : i + batch]
+        found = await client.retrieve(
+            collection_name=KNOWLEDGE_COLLECTION_NAME,
+            ids=chunk,
+            with_payload=False,
+            with_vectors=False,
+        )
+        if len({str(p.id) for p in found}) < len(set(chunk)):
+            return False
+    return True
+
+
 async def sync_knowledge():
     """同步知识到向量库
 
@@ -940,6 +1017,9 @@ async def sync_knowledge():
 
     注意：此函数仅同步 source="plugin" 的知识（来自插件注册）。
     手动添加的知识 (source="manual") 不会在此同步中被检查、修改或删除。
+
+    比对对象是本地清单（``AIKnowledgeChunk`` 中 source="plugin" 的行），而非 scroll 整个集合；
+    清单在 Qdrant 写入/删除确认后同一事务更新，与向量库点数或点 ID 不符时才回退到一次全量 scroll 重建。
     """
     import gsuid_core.ai_core.rag.base as rag_base
     from gsuid_core.ai_core.rag.base import init_embedding_model, ensure_embedding_dimension
@@ -963,36 +1043,13 @@ async def sync_knowledge():
 
     logger.info(i18n_t("log.rag.kb_knowledge_base_sync"))
 
-    # 1. 获取现有数据（仅插件来源的知识，用于同步检查）
+    # 1. 读取本地清单（仅插件来源的知识：逻辑ID -> (内容哈希, 向量点ID)）
     # 手动添加的知识不会被此同步流程删除
-    existing_knowledge: Dict[str, Dict] = {}
-    next_page_offset = None
-
-    while True:
-        records, next_page_offset = await client.scroll(
-            collection_name=KNOWLEDGE_COLLECTION_NAME,
-            limit=100,
-            with_payload=True,
-            with_vectors=False,
-            offset=next_page_offset,
-        )
-        for record in records:
-            if record.payload is None:
-                continue
-            id_str: Optional[str] = record.payload.get("id")
-            source: Optional[str] = record.payload.get("source")
-            if id_str and source == "plugin":  # 只跟踪插件来源的知识
-                _t = {
-                    "id": record.id,
-                    "hash": record.payload.get("_hash"),
-                }
-                existing_knowledge[id_str] = _t
-
-        if next_page_offset is None:
-            break
+    existing_knowledge = await _load_plugin_manifest()
 
     # 2. 准备新数据：先收集所有需要嵌入的文本，再批量调用远程 embedding，避免几千条知识逐条请求。
     points_to_upsert = []
+    manifest_rows: List[AIKnowledgeChunk] = []
     local_ids = set()
     pending_items: list[tuple[str, dict, str, str, str]] = []
 
@@ -1013,7 +1070,7 @@ async def sync_knowledge():
 
         # 检查是否需要更新
         is_new = id_str not in existing_knowledge
-        is_modified = not is_new and existing_knowledge[id_str]["hash"] != current_hash
+        is_modified = not is_new and existing_knowledge[id_str][0] != current_hash
 
         if is_new or is_modified:
             if "title" in knowledge:
@@ -1058,25 +1115,28 @@ async def sync_knowledge():
             )
         )
         sv = sparse_vectors[i] if i < len(sparse_vectors) else None
-        points_to_upsert.append(_build_named_point(get_point_id(id_str), list(vector), sv, payload))
+        point_id = get_point_id(id_str)
+        points_to_upsert.append(_build_named_point(point_id, list(vector), sv, payload))
+        manifest_rows.append(_plugin_manifest_row(id_str, point_id, payload))
 
-    # 3. 执行更新
+    # 3. 执行更新（写入确认后才落清单：中途失败的条目下次启动仍按"缺失"重嵌）
     if points_to_upsert:
         logger.info(i18n_t("log.rag.kb_writing_knowledge_points", p0=len(points_to_upsert)))
         await _upsert_knowledge_points(points_to_upsert)
 
     # 4. 清理已删除的插件知识（手动添加的知识不会被删除）
+    stale_ids: List[str] = []
     if local_ids:
-        ids_to_delete = [
-            existing_knowledge[id_str]["id"] for id_str in existing_knowledge.keys() if id_str not in local_ids
-        ]
-        if ids_to_delete:
-            logger.info(i18n_t("log.rag.kb_deleting_removed_plugin_delete", p0=len(ids_to_delete)))
+        stale_ids = [id_str for id_str in existing_knowledge if id_str not in local_ids]
+        if stale_ids:
+            logger.info(i18n_t("log.rag.kb_deleting_removed_plugin_delete", p0=len(stale_ids)))
             await client.delete(
                 collection_name=KNOWLEDGE_COLLECTION_NAME,
-                points_selector=ids_to_delete,
+                points_selector=[existing_knowledge[id_str][1] for id_str in stale_ids],
             )
 
+    await AIKnowledgeChunk.apply_manifest(manifest_rows, stale_ids)
+
 
 async def query_knowledge(
     query: str,
@@ -1193,18 +1253,15 @@ async def sync_manual_knowledge():
         logger.info(i18n_t("log.rag.kb_manually_added_knowledge_sync"))
         return
 
-    items: list[tuple] = []
+    rows: List[AIKnowledgeChunk] = []
     for knowledge in manual_entities:
-        id_str = knowledge["id"]
         payload: dict = dict(knowledge)
         payload["source"] = "manual"  # 确保标记为手动来源
-        items.append((get_point_id(id_str), payload, build_knowledge_text(knowledge)))
+        rows.append(_row_from_payload(payload))
 
-    # dense + BM25 稀疏命名向量（与集合结构一致）
-    points_to_upsert = await _compute_knowledge_points(items)
-    if points_to_upsert:
-        logger.info(i18n_t("log.rag.kb_writing_manual_knowledge", p0=len(points_to_upsert)))
-        await _upsert_knowledge_points(points_to_upsert)
+    # 与其它手动知识同路径：先落 SQL 清单，再写 dense + BM25 稀疏命名向量
+    logger.info(i18n_t("log.rag.kb_writing_manual_knowledge", p0=len(rows)))
+    await _embed_and_upsert_chunks(rows)
 
 
 async def add_manual_knowledge_to_db(knowledge: Dict[str, Any]) -> bool:
@@ -1316,11 +1373,32 @@ async def delete_manual_knowledge_from_db(entity_id: str) -> bool:
     return True
 
 
+def _manifest_records(rows: Sequence[AIKnowledgeChunk]) -> List[Dict[str, Any]]:
+    """清单行 → API 输出形状。插件行按注册表还原完整条目（含 entity/path 等扩展字段），与旧 payload 一致。"""
+    plugin_ids = {r.id for r in rows if r.source == "plugin"}
+    registered: Dict[str, Dict[str, Any]] = {}
+    if plugin_ids:
+        for item in _ENTITIES:
+            if item["id"] in plugin_ids:
+                registered[item["id"]] = dict(item)
+    records: List[Dict[str, Any]] = []
+    for r in rows:
+        if r.id in registered:
+            record = registered[r.id]
+            record["source"] = "plugin"
+            record["_hash"] = r.content_hash
+            records.append(record)
+        else:
+            records.append(r.to_dict())
+    return records
+
+
 async def get_manual_knowledge_list(
     offset: int = 0,
     limit: int = 20,
     source_filter: str = "all",
     doc_id: Optional[str] = None,
+    keyword: Optional[str] = None,
 ) -> Dict[str, Any]:
     """获取知识列表（分页）
 
@@ -1328,90 +1406,30 @@ async def get_manual_knowledge_list(
         offset: 起始偏移
         limit: 每页数量
         source_filter: 来源过滤，默认 "all" 表示所有知识，"manual" 只看手动添加的
-        doc_id: 可选，仅列出某篇文档的分片（仅对 manual 生效）
+        doc_id: 可选，仅列出某篇文档的分片（插件知识的 doc_id 为插件名）
+        keyword: 可选，按标题/正文/标签子串过滤
 
     Returns:
         包含知识列表和总数的字典
 
     Note:
-        ``source_filter="manual"`` 走 **SQL 真值源**的原生 offset/limit 分页（治 P5：
-        Qdrant local 不支持 offset，旧实现每页都从头 scroll，大库越翻越慢）。
-        ``plugin`` / ``all`` 仍走 Qdrant scroll（插件知识真值在代码/注册表，不入 SQL）。
+        全部来源都走**本地清单**（``AIKnowledgeChunk``）的原生 offset/limit 分页与关键词过滤，
+        不再为元数据 scroll 向量库（Qdrant local 不支持 offset，旧实现每页都从头 scroll，大库越翻越慢）。
     """
-    # manual：SQL 原生分页，O(1) offset
-    if source_filter == "manual":
-        rows, total = await AIKnowledgeChunk.list_page(source="manual", doc_id=doc_id, offset=offset, limit=limit)
-        end_idx = offset + limit
-        return {
-            "list": [r.to_dict() for r in rows],
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-            "next_offset": end_idx if end_idx < total else None,
-        }
-
-    from gsuid_core.ai_core.rag.base import client
-
-    if client is None:
-        logger.warning(i18n_t("log.rag.kb_ai_feature_enabled_unable_3"))
-        return {"list": [], "total": 0}
-
-    # 如果 source_filter 不是 "all"，则按来源过滤
-    count_filter = None
-    scroll_filter = None
-    if source_filter != "all":
-        count_filter = Filter(must=[FieldCondition(key="source", match=MatchValue(value=source_filter))])
-        scroll_filter = Filter(must=[FieldCondition(key="source", match=MatchValue(value=source_filter))])
-
-    # 获取总数
-    total = await client.count(
-        collection_name=KNOWLEDGE_COLLECTION_NAME,
-        count_filter=count_filter,
+    rows, total = await AIKnowledgeChunk.list_page(
+        source=source_filter,
+        doc_id=doc_id,
+        offset=offset,
+        limit=limit,
+        keyword=keyword,
     )
-
-    # Qdrant local 的 scroll API 不支持 offset-based pagination
-    # 需要迭代获取所有记录然后切片
-    # 使用较大的批次大小减少迭代次数
-    batch_size = 100
-    all_records = []
-    current_offset = None
-
-    while len(all_records) < offset + limit:
-        records, next_offset = await client.scroll(
-            collection_name=KNOWLEDGE_COLLECTION_NAME,
-            limit=batch_size,
-            offset=current_offset,
-            with_payload=True,
-            with_vectors=False,
-            scroll_filter=scroll_filter,
-        )
-
-        if not records:
-            break
-
-        for record in records:
-            if record.payload:
-                all_records.append(record.payload)
-
-        if next_offset is None:
-            break
-
-        current_offset = next_offset
-
-    # 计算下一页的 offset
-    start_idx = offset
     end_idx = offset + limit
-    page_records = all_records[start_idx:end_idx]
-
-    # 计算 next_offset（下一个批次开始的偏移量）
-    next_page_offset = end_idx if end_idx < len(all_records) else None
-
     return {
-        "list": page_records,
-        "total": total.count,
+        "list": _manifest_records(rows),
+        "total": total,
         "offset": offset,
         "limit": limit,
-        "next_offset": next_page_offset,
+        "next_offset": end_idx if end_idx < total else None,
     }
 
 
@@ -1424,6 +1442,11 @@ async def get_manual_knowledge_detail(entity_id: str) -> Optional[Dict[str, Any]
     Returns:
         知识详情字典，如果不存在则返回 None
     """
+    row = await AIKnowledgeChunk.get_by_id(entity_id)
+    if row is not None:
+        return _manifest_records([row])[0]
+
+    # 清单未收录（尚未对账回填的旧"仅 Qdrant"条目）才查向量库
     from gsuid_core.ai_core.rag.base import client
 
     if client is None:
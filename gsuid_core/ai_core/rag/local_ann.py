@@ -0,0 +1,750 @@
+"""本地嵌入式 Qdrant 的 ANN 加速层。
+
+本地模式下 ``AsyncQdrantClient(path=...)`` 的每次检索都是 numpy 全量矩阵乘 + 逐点 Python
+payload 过滤（P0-1 本地向量库暴力扫描），``memory_episodes`` 等集合一涨到几十万条，
+``_hybrid_search_impl`` / ``probe_episode_scores`` 首先变慢。本模块提供：
+
+- ``IVFIndex``：倒排（IVF，球面 k-means 粗聚类）+ int8 标量量化的内存索引，支持按
+  ``scope_key`` 预过滤、增量插入 / 删除；命中行少于 ``FLAT_SCAN_ROWS`` 时直接扫这些行；
+- ``LocalAnnQdrantClient``：``AsyncQdrantClient`` 的子类，对调用方保持同一套 collection API。
+  纯 dense 查询与 dense + sparse 的 RRF 融合查询中的 dense 分支改走 ANN 召回候选，
+  再按 Qdrant 中的原始向量**精确重算余弦分**，分值语义（阈值、熟悉度探针）不变；
+  过滤条件超出 ``scope_key`` / ``HasId`` 排除、或索引尚未就绪时原样交给 Qdrant。
+
+索引不单独落盘：Qdrant 本地库本身是向量真值，首次查询某个集合时在后台从中 scroll 重建，
+重建期间的写入会被记录并在切换时重放；增删过多（墓碑/规模膨胀）时同样在后台重建。
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Tuple, Union, Optional, Sequence
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Batch,
+    Filter,
+    Fusion,
+    Distance,
+    MatchAny,
+    Prefetch,
+    MatchValue,
+    FusionQuery,
+    PointStruct,
+    ScoredPoint,
+    PointIdsList,
+    SearchParams,
+    FieldCondition,
+    HasIdCondition,
+)
+from qdrant_client.http.models import QueryResponse
+from qdrant_client.hybrid.fusion import reciprocal_rank_fusion
+
+from gsuid_core.i18n import t
+from gsuid_core.logger import logger
+
+PointId = Union[int, str]
+
+# 少于该点数不训练粗聚类，直接平扫（int8 平扫几千行只需亚毫秒）
+TRAIN_MIN_POINTS = 4096
+# 预过滤后命中行不超过该值时跳过 IVF 直接扫描，保证高选择性 scope 的召回
+FLAT_SCAN_ROWS = 16384
+# 交给精确重排的候选倍数
+OVERSAMPLE = 4
+# 增量写入后的重建阈值：墓碑占比 / 相对训练时的规模膨胀倍数
+REBUILD_TOMBSTONE_RATIO = 0.3
+REBUILD_GROWTH = 4
+_KMEANS_ITERS = 10
+_SCROLL_BATCH = 2048
+_BUILD_CHUNK = 65536
+_EPS = 1e-12
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, _EPS)
+
+
+def _spherical_kmeans(sample: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """余弦空间 k-means：质心每轮归一化，空簇用随机样本重新播种。"""
+    rng = np.random.default_rng(seed)
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERS):
+        assign = _nearest(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.flatnonzero(np.bincount(assign, minlength=nlist) == 0)
+        if len(empty):
+            sums[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+        centroids = _normalize(sums).astype(np.float32)
+    return centroids
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 16384) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk):
+        out[start : start + chunk] = np.argmax(vectors[start : start + chunk] @ centroids.T, axis=1)
+    return out
+
+
+class IVFIndex:
+    """IVF + int8 标量量化的余弦近邻索引（线程安全）。
+
+    ``codes ≈ x / scale``（逐维 ``scale = max|x| / 127``），查询时把 ``scale`` 乘进查询向量，
+    一次 ``codes @ (q * scale)`` 即得近似内积。返回的分数只用于挑候选，精确分由调用方重算。
+    """
+
+    def __init__(self, dim: int, scale: np.ndarray, centroids: Optional[np.ndarray] = None) -> None:
+        self.dim = dim
+        self.nprobe = max(8, len(centroids) // 32) if centroids is not None else 0
+        self._scale = scale.astype(np.float32)
+        self._centroids = centroids
+        self._lock = threading.Lock()
+        self._codes = np.empty((0, dim), dtype=np.int8)
+        self._alive = np.empty(0, dtype=bool)
+        self._size = 0
+        self._ids: List[PointId] = []
+        self._rows: Dict[PointId, int] = {}
+        # scope_key → 行号（含已删除行，查询时按 _alive 剔除），供预过滤按命中量而非全量计算
+        self._scope_rows: Dict[str, List[int]] = {}
+        self._scope_cache: Dict[str, np.ndarray] = {}
+        # 每个倒排簇：构建时的连续行区间 + 之后增量写入的零散行
+        self._spans: List[Tuple[int, int]] = []
+        self._tails: List[List[int]] = []
+        self.trained_points = 0
+        self.tombstones = 0
+
+    @classmethod
+    def build(cls, ids: Sequence[PointId], vectors: np.ndarray, scopes: Sequence[str], seed: int = 0) -> "IVFIndex":
+        vectors = np.asarray(vectors, dtype=np.float32)
+        n, dim = vectors.shape if vectors.ndim == 2 else (0, 0)
+        # 全程按块归一化，不复制整库（百万级 float32 向量本身就是 GB 级）
+        scale = np.full(dim, _EPS, dtype=np.float32)
+        for begin in range(0, n, _BUILD_CHUNK):
+            scale = np.maximum(scale, np.abs(_normalize(vectors[begin : begin + _BUILD_CHUNK])).max(axis=0))
+        centroids = None
+        if n >= TRAIN_MIN_POINTS:
+            nlist = int(min(4096, max(16, round(np.sqrt(n)))))
+            rng = np.random.default_rng(seed)
+            sample = _normalize(vectors[np.sort(rng.choice(n, min(n, nlist * 32), replace=False))])
+            centroids = _spherical_kmeans(sample, nlist, seed)
+        index = cls(dim, scale / 127 if n else np.full(dim, 1 / 127), centroids)
+        index.trained_points = n
+        index._reserve(n)
+        ids, scopes = list(ids), list(scopes)
+        order = np.arange(n)
+        if centroids is not None:
+            # 按簇重排后写入，使每个簇在 codes 中连续：探查时按切片扫描，无需逐行 gather。
+            # 行向量的正缩放不改变 argmax，分簇无需先归一化
+            assign = _nearest(vectors, centroids)
+            order = np.argsort(assign, kind="stable")
+            ends = np.cumsum(np.bincount(assign, minlength=len(centroids))).tolist()
+            index._spans = list(zip([0, *ends[:-1]], ends))
+            index._tails = [[] for _ in ends]
+        for begin in range(0, n, _BUILD_CHUNK):
+            rows = order[begin : begin + _BUILD_CHUNK].tolist()
+            index._append([ids[i] for i in rows], _normalize(vectors[rows]), [scopes[i] for i in rows], assign=False)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nlist(self) -> int:
+        return len(self._spans)
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def needs_rebuild(self) -> bool:
+        alive = len(self._rows)
+        if self.tombstones > REBUILD_TOMBSTONE_RATIO * max(self._size, TRAIN_MIN_POINTS):
+            return True
+        if not self.trained:
+            return alive >= TRAIN_MIN_POINTS
+        return alive > REBUILD_GROWTH * self.trained_points
+
+    def add(self, ids: Sequence[PointId], vectors: Any, scopes: Sequence[str]) -> None:
+        """插入或覆盖一批点（同 id 先删后插）。"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"向量维度不一致: {vectors.shape[1]} != {self.dim}")
+        with self._lock:
+            self._remove(ids)
+            self._append(list(ids), _normalize(vectors), list(scopes))
+
+    def remove(self, ids: Sequence[PointId]) -> None:
+        with self._lock:
+            self._remove(ids)
+
+    def _remove(self, ids: Sequence[PointId]) -> None:
+        for point_id in ids:
+            row = self._rows.pop(point_id, None)
+            if row is not None:
+                self._alive[row] = False
+                self.tombstones += 1
+
+    def _reserve(self, rows: int) -> None:
+        if rows > len(self._codes):
+            capacity = max(rows, 2 * len(self._codes), 1024)
+            self._codes = _grow(self._codes, capacity)
+            self._alive = _grow(self._alive, capacity)
+
+    def _append(self, ids: List[PointId], vectors: np.ndarray, scopes: List[str], assign: bool = True) -> None:
+        n = len(ids)
+        if not n:
+            return
+        start, end = self._size, self._size + n
+        self._reserve(end)
+        self._codes[start:end] = np.clip(np.rint(vectors / self._scale), -127, 127)
+        for row, scope in enumerate(scopes, start):
+            self._scope_rows.setdefault(scope, []).append(row)
+            self._scope_cache.pop(scope, None)
+        self._alive[start:end] = True
+        self._ids.extend(ids)
+        for offset, point_id in enumerate(ids):
+            self._rows[point_id] = start + offset
+        self._size = end
+
+        if assign and self._spans:
+            for row, list_id in enumerate(_nearest(vectors, self._centroids).tolist(), start):
+                self._tails[list_id].append(row)
+
+    def search(
+        self,
+        query: Any,
+        k: int,
+        scopes: Optional[Sequence[str]] = None,
+        exclude: Sequence[PointId] = (),
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[PointId, float]]:
+        """返回近似 top-k ``(id, 近似余弦)``，按分数降序。
+
+        ``scopes`` 非 None 时只在这些 ``scope_key`` 内检索（预过滤，而非召回后再筛）；
+        ``exclude`` 中的 id 不参与排序。预过滤后行数较少时直接扫描，否则按 IVF 由近到远
+        探查至少 ``nprobe`` 个簇，命中不足 ``k`` 时继续向外扩。
+        """
+        q = _normalize(np.asarray(query, dtype=np.float32).reshape(-1))
+        with self._lock:
+            if k <= 0 or not self._rows:
+                return []
+            n = self._size
+            qs = q * self._scale
+            excluded = [self._rows[i] for i in exclude if i in self._rows]
+            mask = self._alive
+            if scopes is not None:
+                parts = [self._scope_array(s) for s in scopes if s in self._scope_rows]
+                if not parts:
+                    return []
+                rows = np.concatenate(parts)
+                rows = rows[self._alive[rows]]
+                if excluded:
+                    rows = rows[~np.isin(rows, excluded)]
+                if not self._spans or len(rows) <= FLAT_SCAN_ROWS:
+                    return self._top(rows, self._codes[rows].astype(np.float32) @ qs, k)
+                mask = np.zeros(n, dtype=bool)
+                mask[rows] = True
+            elif excluded:
+                mask = self._alive[:n].copy()
+                mask[excluded] = False
+            if not self._spans:
+                return self._top(np.arange(n), self._codes[:n].astype(np.float32) @ qs, k, mask[:n])
+
+            # 由近到远探查簇，至少 nprobe 个；命中仍不足 k 时继续向外扩
+            row_parts: List[np.ndarray] = []
+            score_parts: List[np.ndarray] = []
+            found = 0
+            nprobe = nprobe or self.nprobe
+            for probed, list_id in enumerate(np.argsort(-(self._centroids @ q)).tolist(), 1):
+                begin, end = self._spans[list_id]
+                keep = mask[begin:end]
+                rows = np.arange(begin, end)[keep]
+                row_parts.append(rows)
+                score_parts.append((self._codes[begin:end].astype(np.float32) @ qs)[keep])
+                tail = self._tails[list_id]
+                if tail:
+                    extra = np.asarray(tail, dtype=np.int64)
+                    extra = extra[mask[extra]]
+                    row_parts.append(extra)
+                    score_parts.append(self._codes[extra].astype(np.float32) @ qs)
+                    found += len(extra)
+                found += len(rows)
+                if probed >= nprobe and found >= k:
+                    break
+            return self._top(np.concatenate(row_parts), np.concatenate(score_parts), k)
+
+    def _scope_array(self, scope: str) -> np.ndarray:
+        cached = self._scope_cache.get(scope)
+        if cached is None:
+            cached = self._scope_cache[scope] = np.asarray(self._scope_rows[scope], dtype=np.int64)
+        return cached
+
+    def _top(
+        self, rows: np.ndarray, scores: np.ndarray, k: int, keep: Optional[np.ndarray] = None
+    ) -> List[Tuple[PointId, float]]:
+        if keep is not None:
+            rows, scores = rows[keep], scores[keep]
+        if not len(rows):
+            return []
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores)
+        return [(self._ids[row], float(scores[i])) for i, row in zip(order.tolist(), rows[order].tolist())]
+
+
+def _canonical_id(point_id: Any) -> PointId:
+    """与本地 Qdrant 一致的 id 规范化：UUID 字符串统一为带连字符的小写形式。"""
+    if isinstance(point_id, int):
+        return point_id
+    import uuid
+
+    try:
+        return str(uuid.UUID(str(point_id)))
+    except ValueError:
+        return str(point_id)
+
+
+def _conditions(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, list) else [value]
+
+
+def _parse_filter(query_filter: Optional[Filter]) -> Optional[Tuple[Optional[List[str]], List[PointId]]]:
+    """把过滤条件拆成 ``(scope_keys, 排除 id)``；含其它条件时返回 None（交给 Qdrant）。"""
+    if query_filter is None:
+        return None, []
+    if query_filter.should or query_filter.min_should:
+        return None
+    scopes: Optional[set] = None
+    for cond in _conditions(query_filter.must):
+        if not isinstance(cond, FieldCondition) or cond.key != "scope_key":
+            return None
+        if isinstance(cond.match, MatchValue) and isinstance(cond.match.value, str):
+            values = {cond.match.value}
+        elif isinstance(cond.match, MatchAny) and all(isinstance(v, str) for v in cond.match.any):
+            values = {str(v) for v in cond.match.any}
+        else:
+            return None
+        scopes = values if scopes is None else scopes & values
+    excluded: List[PointId] = []
+    for cond in _conditions(query_filter.must_not):
+        if not isinstance(cond, HasIdCondition):
+            return None
+        excluded.extend(_canonical_id(i) for i in cond.has_id)
+    return (sorted(scopes) if scopes is not None else None), excluded
+
+
+def _dense_query(query: Any) -> Optional[np.ndarray]:
+    if isinstance(query, np.ndarray):
+        return query.astype(np.float32) if query.ndim == 1 else None
+    if isinstance(query, list) and query and all(isinstance(x, (int, float)) for x in query):
+        return np.asarray(query, dtype=np.float32)
+    return None
+
+
+def _pick_vector(vector: Any, using: str) -> Optional[Any]:
+    if isinstance(vector, dict):
+        value = vector[using] if using in vector else None
+    else:
+        value = vector if not using else None
+    if isinstance(value, list) and value and isinstance(value[0], (int, float)):
+        return value
+    return None
+
+
+AnnKey = Tuple[str, str]
+
+
+class LocalAnnQdrantClient(AsyncQdrantClient):
+    """带 ANN 加速的本地嵌入式 Qdrant 客户端，接口与 ``AsyncQdrantClient`` 完全一致。"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ann: Dict[AnnKey, IVFIndex] = {}
+        self._ann_builds: Dict[AnnKey, "asyncio.Task[Optional[IVFIndex]]"] = {}
+        self._ann_pending: Dict[AnnKey, List[Tuple[str, Any]]] = {}
+        # 集合 → {向量名: 维度}，仅收录余弦距离的单向量 dense；构建失败的向量名会被移出
+        self._ann_vectors: Dict[str, Dict[str, int]] = {}
+
+    # ---------------- 索引生命周期 ----------------
+    async def build_ann_index(self, collection_name: str, using: Optional[str] = None) -> Optional[IVFIndex]:
+        """从 Qdrant 全量 scroll 重建某个 dense 向量的索引（并发调用复用同一次构建）。"""
+        key = (collection_name, using or "")
+        return await asyncio.shield(self._schedule_build(key))
+
+    def _schedule_build(self, key: AnnKey) -> "asyncio.Task[Optional[IVFIndex]]":
+        task = self._ann_builds.get(key)
+        if task is None:
+            self._ann_pending[key] = []
+            task = asyncio.create_task(self._build(key))
+            self._ann_builds[key] = task
+
+            def _done(finished: "asyncio.Task[Optional[IVFIndex]]") -> None:
+                if self._ann_builds.get(key) is finished:
+                    del self._ann_builds[key]
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _eligible_vectors(self, collection_name: str) -> Dict[str, int]:
+        if collection_name not in self._ann_vectors:
+            params = (await super().get_collection(collection_name)).config.params.vectors
+            named = params if isinstance(params, dict) else {"": params}
+            self._ann_vectors[collection_name] = {
+                name: p.size
+                for name, p in named.items()
+                if p is not None and p.distance == Distance.COSINE and p.multivector_config is None
+            }
+        return self._ann_vectors[collection_name]
+
+    async def _build(self, key: AnnKey) -> Optional[IVFIndex]:
+        collection_name, using = key
+        try:
+            vectors_config = await self._eligible_vectors(collection_name)
+            if using not in vectors_config:
+                self._ann_pending.pop(key, None)
+                return None
+            # 按计数预分配并逐批转成 float32，避免把整库堆成 Python float 列表
+            dim = vectors_config[using]
+            matrix = np.empty(((await super().count(collection_name, exact=True)).count, dim), dtype=np.float32)
+            ids: List[PointId] = []
+            scopes: List[str] = []
+            offset = None
+            while True:
+                records, offset = await super().scroll(
+                    collection_name=collection_name,
+                    limit=_SCROLL_BATCH,
+                    offset=offset,
+                    with_payload=["scope_key"],
+                    with_vectors=[using] if using else True,
+                )
+                batch: List[Any] = []
+                for record in records:
+                    vector = _pick_vector(record.vector, using)
+                    if vector is None:
+                        continue
+                    ids.append(_canonical_id(record.id))
+                    batch.append(vector)
+                    scopes.append(_scope_of(record.payload))
+                if batch:
+                    end = len(ids)
+                    if end > len(matrix):
+                        matrix = _grow(matrix, end)
+                    matrix[end - len(batch) : end] = batch
+                if offset is None:
+                    break
+            matrix = matrix[: len(ids)]
+            index = await asyncio.to_thread(IVFIndex.build, ids, matrix, scopes)
+            # 构建期间到达的增删按序重放（add 覆盖 / remove 幂等，与 scroll 结果重叠也无妨）
+            for op, args in self._ann_pending.pop(key, []):
+                _apply(index, op, args)
+        except Exception as e:
+            self._ann_pending.pop(key, None)
+            # 构建失败的向量不再自动重试，直到集合被重建 / 丢弃索引
+            self._ann_vectors.setdefault(collection_name, {}).pop(using, None)
+            logger.warning(t("log.rag.local_ann_build_fail", collection_name=collection_name, using=using, e=e))
+            return None
+        self._ann[key] = index
+        logger.info(
+            t(
+                "log.rag.local_ann_build_done",
+                collection_name=collection_name,
+                using=using,
+                n=len(index),
+                nlist=index.nlist,
+            )
+        )
+        return index
+
+    def drop_ann_indexes(self, collection_name: Optional[str] = None) -> None:
+        """丢弃索引（集合结构 / payload 批量变化后调用），下次查询时后台重建。"""
+        for key in [k for k in {*self._ann, *self._ann_builds} if collection_name in (None, k[0])]:
+            self._ann.pop(key, None)
+            self._ann_pending.pop(key, None)
+            task = self._ann_builds.pop(key, None)
+            if task is not None:
+                task.cancel()
+        if collection_name is None:
+            self._ann_vectors.clear()
+        else:
+            self._ann_vectors.pop(collection_name, None)
+
+    def _sync(self, collection_name: str, make_args) -> None:
+        """把一次增删同步到该集合的每个索引；正在构建的索引记入待重放队列。
+
+        ``make_args(using)`` 返回 ``[(op, args), ...]``。维度对不上（集合被外部改动）时丢弃该索引。
+        """
+        for key in {k for k in {*self._ann, *self._ann_pending} if k[0] == collection_name}:
+            for op, args in make_args(key[1]):
+                if key in self._ann_pending:
+                    self._ann_pending[key].append((op, args))
+                index = self._ann.get(key)
+                if index is None:
+                    continue
+                try:
+                    _apply(index, op, args)
+                except ValueError:
+                    self._ann.pop(key, None)
+
+    # ---------------- 写路径 ----------------
+    async def upsert(self, collection_name: str, points: Any, *args: Any, **kwargs: Any):
+        result = await super().upsert(collection_name, points, *args, **kwargs)
+        if isinstance(points, Batch) or kwargs.get("update_filter") is not None:
+            self.drop_ann_indexes(collection_name)
+            return result
+        structs = [p for p in points if isinstance(p, PointStruct)]
+
+        def _ops(using: str) -> List[Tuple[str, Any]]:
+            ids, vectors, scopes, missing = [], [], [], []
+            for p in structs:
+                vector = _pick_vector(p.vector, using)
+                if vector is None:
+                    missing.append(_canonical_id(p.id))
+                    continue
+                ids.append(_canonical_id(p.id))
+                vectors.append(vector)
+                scopes.append(_scope_of(p.payload))
+            # upsert 是整点覆盖：新点缺少该向量即视为从该索引删除
+            ops: List[Tuple[str, Any]] = [("remove", missing)] if missing else []
+            if ids:
+                ops.append(("add", (ids, vectors, scopes)))
+            return ops
+
+        self._sync(collection_name, _ops)
+        return result
+
+    async def delete(self, collection_name: str, points_selector: Any, *args: Any, **kwargs: Any):
+        result = await super().delete(collection_name, points_selector, *args, **kwargs)
+        if isinstance(points_selector, PointIdsList):
+            ids = [_canonical_id(i) for i in points_selector.points]
+        elif isinstance(points_selector, list):
+            ids = [_canonical_id(i) for i in points_selector]
+        else:
+            self.drop_ann_indexes(collection_name)
+            return result
+        self._sync(collection_name, lambda _using: [("remove", ids)])
+        return result
+
+    # ---------------- 读路径 ----------------
+    async def query_points(
+        self,
+        collection_name: str,
+        query: Any = None,
+        using: Optional[str] = None,
+        prefetch: Union[Prefetch, List[Prefetch], None] = None,
+        query_filter: Optional[Filter] = None,
+        search_params: Optional[SearchParams] = None,
+        limit: int = 10,
+        offset: Optional[int] = None,
+        with_payload: Any = True,
+        with_vectors: Union[bool, Sequence[str]] = False,
+        score_threshold: Optional[float] = None,
+        **kwargs: Any,
+    ) -> QueryResponse:
+        exact = search_params is not None and bool(search_params.exact)
+        if not exact and kwargs.get("lookup_from") is None:
+            skip = offset or 0
+            points: Optional[List[ScoredPoint]] = None
+            if prefetch is None:
+                points = await self._ann_search(
+                    collection_name,
+                    query,
+                    using,
+                    query_filter,
+                    limit + skip,
+                    score_threshold,
+                    with_payload,
+                    with_vectors,
+                )
+            elif isinstance(query, FusionQuery) and query.fusion == Fusion.RRF and query_filter is None:
+                points = await self._fused_search(
+                    collection_name,
+                    prefetch if isinstance(prefetch, list) else [prefetch],
+                    limit + skip,
+                    score_threshold,
+                    with_payload,
+                    with_vectors,
+                )
+            if points is not None:
+                return QueryResponse(points=points[skip:])
+        return await super().query_points(
+            collection_name,
+            query=query,
+            using=using,
+            prefetch=prefetch,
+            query_filter=query_filter,
+            search_params=search_params,
+            limit=limit,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+            score_threshold=score_threshold,
+            **kwargs,
+        )
+
+    async def _ann_search(
+        self,
+        collection_name: str,
+        query: Any,
+        using: Optional[str],
+        query_filter: Optional[Filter],
+        limit: int,
+        score_threshold: Optional[float],
+        with_payload: Any = False,
+        with_vectors: Any = False,
+    ) -> Optional[List[ScoredPoint]]:
+        """ANN 召回 + 精确重排；不适用（非 dense / 过滤不支持 / 索引未就绪）时返回 None。"""
+        q = _dense_query(query)
+        parsed = _parse_filter(query_filter)
+        if q is None or parsed is None:
+            return None
+        key = (collection_name, using or "")
+        known = self._ann_vectors.get(collection_name)
+        if known is not None and key[1] not in known:
+            return None
+        index = self._ann.get(key)
+        if index is None or index.needs_rebuild:
+            # 首次查询 / 增删过多：后台（重）建，本次仍由旧索引或 Qdrant 暴力扫描应答
+            self._schedule_build(key)
+        if index is None or len(q) != index.dim:
+            return None
+
+        scopes, excluded = parsed
+        candidates = index.search(q, limit * OVERSAMPLE, scopes=scopes, exclude=excluded)
+        if not candidates:
+            return []
+        fetch_vectors: Union[bool, List[str]] = True
+        if key[1] and with_vectors is not True:
+            fetch_vectors = sorted({key[1], *(with_vectors or [])})
+        records = await super().retrieve(
+            collection_name,
+            ids=[point_id for point_id, _ in candidates],
+            with_payload=with_payload,
+            with_vectors=fetch_vectors,
+        )
+        q = _normalize(q)
+        scored: List[ScoredPoint] = []
+        for record in records:
+            vector = _pick_vector(record.vector, key[1])
+            if vector is None:
+                continue
+            score = float(_normalize(np.asarray(vector, dtype=np.float32)) @ q)
+            if score_threshold is not None and score < score_threshold:
+                continue
+            out_vector = None
+            if with_vectors is True:
+                out_vector = record.vector
+            elif with_vectors and isinstance(record.vector, dict):
+                out_vector = {name: v for name, v in record.vector.items() if name in with_vectors}
+            scored.append(
+                ScoredPoint(
+                    id=record.id,
+                    version=0,
+                    score=score,
+                    payload=record.payload if with_payload else None,
+                    vector=out_vector,
+                )
+            )
+        scored.sort(key=lambda p: p.score, reverse=True)
+        return scored[:limit]
+
+    async def _fused_search(
+        self,
+        collection_name: str,
+        prefetch: List[Prefetch],
+        limit: int,
+        score_threshold: Optional[float],
+        with_payload: Any,
+        with_vectors: Any,
+    ) -> Optional[List[ScoredPoint]]:
+        """RRF 融合：dense 分支走 ANN，其余分支（sparse 等）仍由 Qdrant 执行，再用同一融合函数合并。"""
+        if any(p.prefetch for p in prefetch):
+            return None
+        sources: List[List[ScoredPoint]] = []
+        for p in prefetch:
+            branch_limit = p.limit if p.limit is not None else 10
+            if _dense_query(p.query) is not None:
+                points = await self._ann_search(
+                    collection_name, p.query, p.using, p.filter, branch_limit, p.score_threshold
+                )
+                if points is None:
+                    return None
+            else:
+                response = await super().query_points(
+                    collection_name,
+                    query=p.query,
+                    using=p.using,
+                    query_filter=p.filter,
+                    limit=branch_limit,
+                    score_threshold=p.score_threshold,
+                    with_payload=False,
+                )
+                points = response.points
+            sources.append(points)
+        fused = reciprocal_rank_fusion(responses=sources, limit=limit)
+        if score_threshold is not None:
+            fused = [p for p in fused if p.score >= score_threshold]
+        if not fused:
+            return []
+        records = await super().retrieve(
+            collection_name,
+            ids=[p.id for p in fused],
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+        )
+        by_id = {_canonical_id(r.id): r for r in records}
+        return [
+            ScoredPoint(id=r.id, version=0, score=p.score, payload=r.payload, vector=r.vector)
+            for p in fused
+            if (r := by_id.get(_canonical_id(p.id))) is not None
+        ]
+
+
+def _scope_of(payload: Optional[Dict[str, Any]]) -> str:
+    return str(payload["scope_key"]) if payload and "scope_key" in payload else ""
+
+
+def _apply(index: IVFIndex, op: str, args: Any) -> None:
+    if op == "add":
+        index.add(*args)
+    else:
+        index.remove(args)
+
+
+def _invalidating(name: str):
+    async def method(self: LocalAnnQdrantClient, collection_name: str, *args: Any, **kwargs: Any):
+        result = await getattr(AsyncQdrantClient, name)(self, collection_name, *args, **kwargs)
+        self.drop_ann_indexes(collection_name)
+        return result
+
+    method.__name__ = name
+    method.__doc__ = f"同 ``AsyncQdrantClient.{name}``，完成后丢弃该集合的 ANN 索引。"
+    return method
+
+
+# 改写向量 / payload / 集合结构、又无法逐点同步的操作：直接作废索引，下次查询后台重建
+for _name in (
+    "update_vectors",
+    "delete_vectors",
+    "set_payload",
+    "overwrite_payload",
+    "delete_payload",
+    "clear_payload",
+    "batch_update_points",
+    "update_collection",
+    "delete_collection",
+    "create_collection",
+    "recreate_collection",
+):
+    setattr(LocalAnnQdrantClient, _name, _invalidating(_name))
+del _name
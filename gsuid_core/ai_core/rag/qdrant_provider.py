@@ -28,7 +28,7 @@ from qdrant_client.models import (
 )
 from qdrant_client.local.async_qdrant_local import AsyncQdrantLocal
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.data_store import AI_CORE_PATH
 from gsuid_core.ai_core.configs.ai_config import ai_config, qdrant_config
@@ -153,7 +153,7 @@ def build_qdrant_client(provider: str | None = None) -> AsyncQdrantClient:
         url, api_key = get_remote_connection()
         if not url:
             logger.warning(t("log.rag.qdrant_remote_mode_selected_url"))
-            return AsyncQdrantClient(path=str(LOCAL_QDRANT_DB_PATH))
+            return _build_local_client()
         logger.info(t("log.rag.qdrant_remote_service_url", url=url))
         # 默认 5s 在启动高负载窗口会对瞬时调用误报 ReadTimeout，
         # 导致 RAG 步骤判失败、进程"暂不接收 AI 会话"；放宽容忍启动尖峰。
@@ -164,6 +164,15 @@ def build_qdrant_client(provider: str | None = None) -> AsyncQdrantClient:
         return AsyncQdrantClient(url=url, api_key=api_key, timeout=30, **httpx_kw)
 
     logger.info(t("log.rag.qdrant_local_embedded_db", LOCAL_QDRANT_DB_PATH=LOCAL_QDRANT_DB_PATH))
+    return _build_local_client()
+
+
+def _build_local_client() -> AsyncQdrantClient:
+    """本地嵌入式 Qdrant；开启 qdrant_local_ann 时 dense 检索走 ANN 索引（见 rag/local_ann.py）。"""
+    if ai_config.get_config("qdrant_local_ann").data:
+        from gsuid_core.ai_core.rag.local_ann import LocalAnnQdrantClient
+
+        return LocalAnnQdrantClient(path=str(LOCAL_QDRANT_DB_PATH))
     return AsyncQdrantClient(path=str(LOCAL_QDRANT_DB_PATH))
 
 
@@ -261,7 +270,7 @@ async def _copy_collection(source: AsyncQdrantClient, target: AsyncQdrantClient,
         points: list[PointStruct] = []
         for r in records:
             if r.vector is None:
-                logger.debug(t("log.rag.qdrant_collection_name_point_skip", name=name, p0=r.id))
+                logger.debug(lt("log.rag.qdrant_collection_name_point_skip", name=name, p0=r.id))
                 continue
             points.append(PointStruct(id=r.id, vector=_to_input_vector(r.vector), payload=r.payload))
         if points:
@@ -323,6 +332,10 @@ def _release_qdrant_client_memory(client: AsyncQdrantClient) -> None:
     且 client 内部存在引用环，仅靠作用域退出的引用计数无法及时释放。这里清空内部容器，
     配合 gc.collect() 尽快回收内存。远程 client 的内部实现不是 AsyncQdrantLocal，跳过。
     """
+    from gsuid_core.ai_core.rag.local_ann import LocalAnnQdrantClient
+
+    if isinstance(client, LocalAnnQdrantClient):
+        client.drop_ann_indexes()
     inner = client._client
     if isinstance(inner, AsyncQdrantLocal):
         inner.collections.clear()
@@ -411,7 +424,7 @@ async def migrate_qdrant_if_provider_changed() -> None:
         try:
             await source.close()
         except Exception as e:
-            logger.debug(t("log.rag.qdrant_closing_source_client_fail", e=e))
+            logger.debug(lt("log.rag.qdrant_closing_source_client_fail", e=e))
         # close() 不会清空已载入内存的向量/payload，主动断引用 + GC，
         # 避免本地大库迁移完成后内存仍占用到下次重启才释放。
         _release_qdrant_client_memory(source)
@@ -6,7 +6,7 @@ from typing import Any, List, Optional, Protocol
 import httpx
 from qdrant_client.http.models.models import ScoredPoint
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.configs.ai_config import rerank_model_config
 
@@ -158,7 +158,7 @@ async def rerank_results(
 
     reranker = get_reranker()
     if reranker is None:
-        logger.debug(t("log.rag.reranker_feature_enabled_skipping_skip"))
+        logger.debug(lt("log.rag.reranker_feature_enabled_skipping_skip"))
         return results[:top_k]
 
     try:
@@ -176,7 +176,7 @@ async def rerank_results(
                 valid_results.append(r)
 
         if not documents:
-            logger.debug(t("log.rag.reranker_valid_document_content_skip"))
+            logger.debug(lt("log.rag.reranker_valid_document_content_skip"))
             return results[:top_k]
 
         logger.info(t("log.rag.reranker_reranking_results", p0=len(documents)))
@@ -191,7 +191,7 @@ async def rerank_results(
         reranked_results = [r for _, r in scored_results[:top_k]]
 
         logger.info(t("log.rag.reranker_reranking_top_results", p0=len(reranked_results)))
-        logger.debug(t("log.rag.reranker_results_reranking", p0=[r for r in reranked_results]))
+        logger.debug(lt("log.rag.reranker_results_reranking", p0=[r for r in reranked_results]))
 
         return reranked_results
 
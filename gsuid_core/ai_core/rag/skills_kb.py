@@ -29,7 +29,7 @@ import hashlib
 from typing import Dict, List, Optional
 from pathlib import Path
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.rag.chunking import split_text
 
@@ -241,7 +241,7 @@ async def _skill_docs_point_count() -> int:
         )
         return result.count
     except Exception as e:
-        logger.debug(t("log.rag.skillskb_skill_doc_points_fail", e=e))
+        logger.debug(lt("log.rag.skillskb_skill_doc_points_fail", e=e))
         return -1
 
 
@@ -259,7 +259,7 @@ async def sync_skill_docs() -> None:
         logger.warning(t("log.rag.skillskb_skill_documents_found_skip", _SKILLS_ROOT=_SKILLS_ROOT))
         return
     if client is None or embedding_model is None:
-        logger.debug(t("log.rag.skillskb_ready_skipping_skill"))
+        logger.debug(lt("log.rag.skillskb_ready_skipping_skill"))
         return
 
     # 现存 skill_doc 分片：doc_id -> 已存内容哈希（取自分片 tags 里的 _srchash:）
@@ -324,7 +324,7 @@ async def sync_skill_docs() -> None:
         )
     else:
         logger.debug(
-            t(
+            lt(
                 "log.rag.skillskb_skill_documents_date_skip",
                 p0=len(skills),
                 total_files=total_files,
@@ -6,7 +6,7 @@ from pathlib import Path
 from pydantic_ai import RunContext, ToolReturn
 from pydantic_ai.tools import Tool
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.segment import Message
 from gsuid_core.ai_core.utils import handle_tool_result
@@ -357,7 +357,7 @@ def ai_tools(
                     if inspect.isawaitable(res):
                         res = await res
                 except Exception as e:
-                    logger.debug(t("log.register.name_visible_check_errored", _name=_name, e=e))
+                    logger.debug(lt("log.register.name_visible_check_errored", _name=_name, e=e))
                     return tool_def
                 return tool_def if res else None
 
@@ -396,7 +396,7 @@ def ai_tools(
             reg_category = "common"
 
         logger.debug(
-            t(
+            lt(
                 "log.register.reg_category",
                 p0=fn.__name__,
                 reg_category=reg_category,
@@ -427,7 +427,7 @@ def ai_tools(
         # 让"召不回的工具"从隐性变显性（不阻塞注册）。
         if not covers and plugin_name != "core":
             logger.debug(
-                t(
+                lt(
                     "log.register.missing_covers_plugin_name",
                     p0=fn.__name__,
                     plugin_name=hl_plugin(plugin_name),
@@ -488,7 +488,7 @@ def unregister_tool(tool_name: str) -> bool:
             del category_tools[tool_name]
             removed = True
     if removed:
-        logger.debug(t("log.register.unregistered_tool", name=tool_name))
+        logger.debug(lt("log.register.unregistered_tool", name=tool_name))
     return removed
 
 
@@ -680,7 +680,7 @@ def ai_alias(name: str, alias: Union[str, List[str]], scope: str = "global"):
     # 正式名本身不是 _ALIASES 的键（只有别名是），这里一并登记，否则"玄翎秧秧"查不到。
     _index_entity_surfaces(name, alias)
 
-    logger.trace(t("log.ai_registry.aliases_registered", name=name, scope=scope, alias=list(alias)))
+    logger.trace(lt("log.ai_registry.aliases_registered", name=name, scope=scope, alias=list(alias)))
 
 
 def _index_entity_surfaces(name: str, alias: List[str]) -> None:
@@ -774,10 +774,10 @@ def ai_entity(entity: Union[KnowledgePoint, KnowledgeBase]):
         for i, existing in enumerate(_ENTITIES):
             if isinstance(existing, dict) and existing.get("id") == eid:
                 _ENTITIES[i] = entity
-                logger.trace(t("log.ai_registry.entity_registered_plugin", title=entity["title"]))
+                logger.trace(lt("log.ai_registry.entity_registered_plugin", title=entity["title"]))
                 return
     _ENTITIES.append(entity)
-    logger.trace(t("log.ai_registry.entity_registered_plugin", title=entity["title"]))
+    logger.trace(lt("log.ai_registry.entity_registered_plugin", title=entity["title"]))
 
 
 def add_manual_knowledge(entity: ManualKnowledgeBase) -> bool:
@@ -827,7 +827,7 @@ def add_manual_knowledge(entity: ManualKnowledgeBase) -> bool:
     # 确保 source 为 "manual"
     entity["source"] = "manual"
     _MANUAL_ENTITIES.append(entity)
-    logger.trace(t("log.ai_registry.manual_entity", title=entity["title"]))
+    logger.trace(lt("log.ai_registry.manual_entity", title=entity["title"]))
     return True
 
 
@@ -848,7 +848,7 @@ def update_manual_knowledge(entity_id: str, updates: ManualKnowledgeUpdate) -> b
             updates.pop("id", None)
             updates.pop("source", None)
             _MANUAL_ENTITIES[i].update(updates)
-            logger.trace(t("log.ai_registry.manual_entity_updated", entity_id=entity_id))
+            logger.trace(lt("log.ai_registry.manual_entity_updated", entity_id=entity_id))
             return True
     return False
 
@@ -866,7 +866,7 @@ def delete_manual_knowledge(entity_id: str) -> bool:
     for i, existing in enumerate(_MANUAL_ENTITIES):
         if existing["id"] == entity_id:
             _MANUAL_ENTITIES.pop(i)
-            logger.trace(t("log.ai_registry.manual_entity_deleted", entity_id=entity_id))
+            logger.trace(lt("log.ai_registry.manual_entity_deleted", entity_id=entity_id))
             return True
     return False
 
@@ -937,7 +937,7 @@ def ai_image(entity: ImageEntity):
     entity["source"] = "plugin"
     _ENTITIES.append(entity)
     _IMAGE_ENTITIES.append(entity)
-    logger.trace(t("log.ai_registry.image_registered", tags=list(entity["tags"])))
+    logger.trace(lt("log.ai_registry.image_registered", tags=list(entity["tags"])))
 
 
 def get_image_entities() -> List[ImageEntity]:
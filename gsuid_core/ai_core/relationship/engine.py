@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, List, Tuple, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.relationship.view import RelationshipView, view_from_score
 from gsuid_core.ai_core.relationship.zones import Zone, zone_of, is_at_least
@@ -241,7 +241,7 @@ async def settle_turn(
             )
         )
     else:
-        logger.debug(t("log.ai.relationship_settle_noop", user=user_id, reason=reason))
+        logger.debug(lt("log.ai.relationship_settle_noop", user=user_id, reason=reason))
 
     view = view_from_score(new_score, is_master)
     return SettleOutcome(applied, reason, score_before, new_score, view, signals, wrote=True)
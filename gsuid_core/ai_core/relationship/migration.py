@@ -10,7 +10,7 @@
 
 from sqlalchemy.sql import text
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_start_before
 
@@ -49,4 +49,4 @@ async def migrate_user_favorability() -> None:
         # 建索引失败不阻断启动，但必须吵出来：没有唯一约束 = 日预算可能被绕过
         logger.warning(t("log.ai.relationship_unique_index_fail", e=e))
         return
-    logger.debug(t("log.ai.relationship_unique_index_ok"))
+    logger.debug(lt("log.ai.relationship_unique_index_ok"))
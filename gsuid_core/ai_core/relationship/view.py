@@ -10,7 +10,7 @@ CheapGate / Heartbeat / 装配三处会各自引权限模块，又是一次「
 from typing import TYPE_CHECKING, Set, Dict, Optional, Sequence
 from dataclasses import dataclass
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.relationship.zones import Zone, zone_of, zone_voice, render_relationship_line
 
@@ -96,14 +96,14 @@ async def collect_priority_speakers(
     try:
         scores = await UserFavorability.get_scores_for(list(names), bot_id)
     except Exception as e:
-        logger.debug(t("log.ai.relationship_priority_speakers_degraded", e=e))
+        logger.debug(lt("log.ai.relationship_priority_speakers_degraded", e=e))
         return priority
 
     for uid, score in scores.items():
         if zone_of(score) is Zone.CLOSE:
             priority |= names[uid] if uid in names else {uid}
     logger.debug(
-        t(
+        lt(
             "log.ai.relationship_priority_speakers",
             group=group_id or "private",
             n=len(priority),
@@ -129,5 +129,5 @@ async def fetch_relationship(user_id: str, bot_id: str) -> RelationshipView:
         if record is not None:
             score = record.favorability
     except Exception as e:
-        logger.debug(t("log.ai.relationship_fetch_degraded", e=e))
+        logger.debug(lt("log.ai.relationship_fetch_degraded", e=e))
     return view_from_score(score, is_master)
@@ -100,7 +100,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, TypedDict
 from pathlib import Path
 from datetime import datetime
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.resource import (
     AI_SESSION_LOGS_PATH,
@@ -990,7 +990,7 @@ class AISessionLogger:
         self._add_entry("agent_linked", dict(link_record))
         self.updated_at = time.time()
         logger.debug(
-            t(
+            lt(
                 "log.ai.aisessionlogger_agent_type_session",
                 agent_type=agent_type,
                 agent_session_id=agent_session_id,
@@ -1107,7 +1107,7 @@ class AISessionLogger:
         self._last_persisted_at = time.time()
 
         logger.debug(
-            t(
+            lt(
                 "log.ai.aisessionlogger_persisting_log_entries",
                 p0=self._file_path.name,
                 p1=len(self.entries),
@@ -254,7 +254,7 @@ def parse_session_scope(session_id: str) -> tuple[str, str, str]:
 
 async def distill_idle_session(session: "GsCoreAIAgent") -> None:
     """GC 前把 B 轨中段抽成摘要写入记忆；失败只 warning，不挡回收。"""
-    from gsuid_core.i18n import t
+    from gsuid_core.i18n import t, lt
     from gsuid_core.logger import logger
     from gsuid_core.ai_core.utils import _extractive_middle_summary
     from gsuid_core.ai_core.memory.scope import ScopeType, make_scope_key
@@ -296,7 +296,7 @@ async def distill_idle_session(session: "GsCoreAIAgent") -> None:
             message_type="private_msg",
         )
     except Exception as e:
-        logger.debug(t("log.ai.session_gc_observe_fail", e=e))
+        logger.debug(lt("log.ai.session_gc_observe_fail", e=e))
 
 
 # 全局单例实例
@@ -22,7 +22,7 @@ from typing import Optional
 # @on_core_start_before（阻塞阶段），而 core.py 在启动钩子触发前就 import 本模块。
 # 该模块只依赖 server/logger/sqlalchemy.text，不引入重依赖。
 import gsuid_core.ai_core.relationship.migration  # noqa: F401
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_start, on_core_shutdown
 
@@ -219,7 +219,7 @@ async def init_ai_core():
     # 下面的状态判断与 _AI_CORE_INITIALIZING 置位之间不存在 await，asyncio 协作式调度下
     # 是原子的；后到的协程会在首个 await 让出后看到标记并直接退出，从而保证整条初始化串行。
     if _AI_CORE_READY or _AI_CORE_INITIALIZING:
-        logger.debug(t("log.ai.ai_core_init_running_skipping_ok"))
+        logger.debug(lt("log.ai.ai_core_init_running_skipping_ok"))
         return
 
     from gsuid_core.ai_core.configs.ai_config import ai_config
@@ -249,7 +249,7 @@ async def init_ai_core():
         _get_ready_event().set()
         return
 
-    logger.debug(t("log.ai.ai_core_heavy_dependency_import", p0=time.time() - import_start))
+    logger.debug(lt("log.ai.ai_core_heavy_dependency_import", p0=time.time() - import_start))
 
     # 按依赖顺序依次初始化；单步失败不阻断后续。
     # ready 语义：初始化流水线已结束即可接聊（buildin 工具/人设不依赖 RAG 全量同步）。
@@ -319,7 +319,7 @@ async def close_qdrant_client_on_shutdown() -> None:
         rag_base.client = None
         logger.info(t("log.ai.ai_core_closed_qdrant_client"))
     except Exception as e:
-        logger.debug(t("log.ai.ai_core_close_qdrant_client_fail", e=e))
+        logger.debug(lt("log.ai.ai_core_close_qdrant_client_fail", e=e))
 
 
 @on_core_shutdown
@@ -32,7 +32,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic_ai import RunContext
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
@@ -480,4 +480,4 @@ async def _remember_record(
             )
         )
     except Exception as e:
-        logger.debug(t("log.ai.cognition_node_sync_fail", kind="record", ref=rid, e=e))
+        logger.debug(lt("log.ai.cognition_node_sync_fail", kind="record", ref=rid, e=e))
@@ -13,7 +13,7 @@ from sqlmodel import col, and_, delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.engine import CursorResult
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 from .models import AIPersistentState
@@ -81,7 +81,7 @@ async def _fetch(scope: str, state_key: str) -> Optional[AIPersistentState]:
         if record.expire_at is not None and record.expire_at < _now():
             await session.execute(delete(AIPersistentState).where(col(AIPersistentState.id) == record.id))
             await session.commit()
-            logger.debug(t("log.ai.state_expired_cleaned_scope", scope=scope, state_key=state_key))
+            logger.debug(lt("log.ai.state_expired_cleaned_scope", scope=scope, state_key=state_key))
             return None
 
         return record
@@ -144,7 +144,7 @@ async def state_set_value(
                 new_version = record.version
 
         logger.debug(
-            t(
+            lt(
                 "log.ai.state_wrote_scope_key",
                 scope=scope,
                 state_key=state_key,
@@ -187,7 +187,7 @@ async def state_delete_value(scope: str, state_key: str) -> bool:
         await session.execute(delete(AIPersistentState).where(col(AIPersistentState.id) == record.id))
         await session.commit()
 
-    logger.debug(t("log.ai.state_deleted_scope_key", scope=scope, state_key=state_key))
+    logger.debug(lt("log.ai.state_deleted_scope_key", scope=scope, state_key=state_key))
     return True
 
 
@@ -303,7 +303,7 @@ async def state_mutate(
                 # version 已被其他并发写入推进，重试
 
         logger.debug(
-            t(
+            lt(
                 "log.ai.state_mutate_optimistic_lock",
                 p0=attempt + 1,
                 _APPEND_MAX_RETRY=_APPEND_MAX_RETRY,
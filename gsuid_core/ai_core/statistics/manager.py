@@ -14,6 +14,7 @@ from collections import Counter, defaultdict
 from gsuid_core.aps import scheduler
 from gsuid_core.i18n import t as i18n_t
 from gsuid_core.logger import logger
+from gsuid_core.metrics import LLM_SECONDS
 from gsuid_core.ai_core.statistics.models import (
     AIDailyStatistics,
     AIHeartbeatMetrics,
@@ -275,6 +276,7 @@ class StatisticsManager:
     def record_latency(self, latency: float):
         """记录响应延迟"""
         self._bot_state.latencies.add(latency)
+        LLM_SECONDS.observe(latency)
 
     def record_intent(self, intent: str):
         """记录意图"""
@@ -27,7 +27,7 @@
 
 from typing import Set, List, Optional
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.register import get_tools_by_capability_domain
@@ -147,5 +147,5 @@ async def get_state_driven_family_tools(
             seen.add(tb.name)
             out.append(tb.tool)
     if out:
-        logger.debug(t("log.ai.toolstate_state_driven_supplementary_create", domains=domains, p0=len(out)))
+        logger.debug(lt("log.ai.toolstate_state_driven_supplementary_create", domains=domains, p0=len(out)))
     return out
@@ -16,7 +16,7 @@ from pydantic_ai import RunContext
 from pydantic_ai.tools import Tool
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event, Message
 from gsuid_core.ai_core.models import ToolContext
@@ -521,7 +521,7 @@ def _register_trigger_as_ai_tool(
     from gsuid_core.logger import hl_plugin
 
     logger.debug(
-        t(
+        lt(
             "log.ai.trigger_ai_func_name_primary",
             primary_keyword=primary_keyword,
             tool_func_name=tool_func_name,
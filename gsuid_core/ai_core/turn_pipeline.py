@@ -13,7 +13,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from pydantic_ai.messages import UserContent, ModelMessage
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.ai_core.utils import (
@@ -172,7 +172,7 @@ def build_group_history_block(event: Event) -> str:
         include_current_turn=False,
     )
     if block:
-        logger.debug(t("log.ai.gscore_historical", p0=len(selected)))
+        logger.debug(lt("log.ai.gscore_historical", p0=len(selected)))
     return block
 
 
@@ -21,7 +21,7 @@ import aiohttp
 from bs4 import Comment, BeautifulSoup
 from markdownify import markdownify as md
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.configs.ai_config import ai_config, jina_config, web_fetch_config
 
@@ -342,7 +342,7 @@ async def _fetch_via_local(
         )
     )
     if proxy:
-        logger.debug(t("log.ai.webfetch_using_proxy", proxy=proxy[:80]))
+        logger.debug(lt("log.ai.webfetch_using_proxy", proxy=proxy[:80]))
 
     try:
         client_timeout = aiohttp.ClientTimeout(
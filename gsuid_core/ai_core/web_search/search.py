@@ -17,7 +17,7 @@ import itertools
 import threading
 from typing import Any
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.ai_core.mcp.utils import (
     is_mcp_provider,
@@ -168,7 +168,7 @@ def _parse_mcp_search_result(raw_text: str, max_results: int | None = None) -> l
     try:
         data = json.loads(cleaned)
     except json.JSONDecodeError:
-        logger.debug(t("log.ai.websearch_mcp_non_json_return", p0=len(cleaned)))
+        logger.debug(lt("log.ai.websearch_mcp_non_json_return", p0=len(cleaned)))
         return [
             {
                 "title": "",
@@ -178,7 +178,7 @@ def _parse_mcp_search_result(raw_text: str, max_results: int | None = None) -> l
             }
         ]
 
-    logger.debug(t("log.ai.websearch_mcp_structured_return", p0=cleaned[:500]))
+    logger.debug(lt("log.ai.websearch_mcp_structured_return", p0=cleaned[:500]))
 
     results: Any
     if isinstance(data, list):
@@ -7,9 +7,10 @@ from fastapi import WebSocket
 from msgspec import json as msgjson
 from starlette.websockets import WebSocketState
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.models import Event, Message, MessageSend, TaskContext, MessageReceive
+from gsuid_core.metrics import HANDLER_SECONDS, HANDLER_QUEUE_SECONDS
 from gsuid_core.segment import (
     MessageSegment,
     to_markdown,
@@ -26,6 +27,7 @@ from gsuid_core.load_template import (
     button_templates,
 )
 from gsuid_core.message_models import Button, ButtonType
+from gsuid_core.send_scheduler import SendScheduler
 from gsuid_core.ai_core.wall_clock import pause_wall_clock
 from gsuid_core.ai_core.configs.ai_config import ai_config
 from gsuid_core.utils.plugins_config.gs_config import (
@@ -43,6 +45,8 @@ istry: List = bm_config.get_config("TryTemplateForQQ").data
 
 enable_forward: str = sp_config.get_config("EnableForwardMessage").data
 command_semaphore: int = sp_config.get_config("CommandSemaphore").data
+send_concurrency: int = sp_config.get_config("SendConcurrency").data
+send_target_interval: float = sp_config.get_config("SendTargetInterval").data
 
 enable_buttons_platform = isb
 enable_markdown_platform = ism
@@ -119,9 +123,8 @@ class _Bot:
         self.bg_tasks: set[asyncio.Task] = set()
         self.sem = asyncio.Semaphore(command_semaphore)
         self._shutdown_event: Optional[asyncio.Event] = None
-        # 独立发送队列：所有 WebSocket 发送操作通过此队列串行化执行
-        self._send_queue: asyncio.queues.Queue = asyncio.queues.Queue()
-        self._send_task: Optional[asyncio.Task] = None
+        # 出站发送调度：按目标分 lane，同目标按序、跨目标并行
+        self._sender = SendScheduler(self._ws_connected, send_concurrency, send_target_interval)
         # 记录断连时间，用于重连时判断是否复用旧实例（避免内存泄漏）
         self._disconnected_at: Optional[float] = None
         # ── recall_message_id 回执机制 ──
@@ -146,49 +149,15 @@ class _Bot:
         """设置 shutdown 事件，用于优雅关闭"""
         self._shutdown_event = event
 
-    async def _send_worker(self):
-        """独立的发送 worker，从发送队列中取出消息并串行发送。
-
-        保证同一 Bot 的消息按序发送，避免多个任务同时竞争 WebSocket 发送权限。
-        断连时消息放回队列等待重连，不丢失。
-        """
-        while True:
-            try:
-                # 从队列中取出发送任务（协程）
-                coro = await asyncio.wait_for(self._send_queue.get(), timeout=1.0)
-                try:
-                    # 发送前检查 WebSocket 是否仍处于 CONNECTED 状态
-                    if self.bot is not None and self.bot.application_state == WebSocketState.CONNECTED:
-                        await coro
-                        self._send_queue.task_done()
-                    else:
-                        # ws 断了，先 task_done 抵消本次 get，再 put 重新入队
-                        logger.warning(t("log.bot.ws_not_connected_pending"))
-                        self._send_queue.task_done()
-                        await self._send_queue.put(coro)
-                        await asyncio.sleep(2.0)
-                except Exception as e:
-                    logger.exception(t("log.bot.send_task_fail", error=e))
-                    self._send_queue.task_done()
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.exception(t("log.bot.send_worker_fail", error=e))
+    def _ws_connected(self) -> bool:
+        return self.bot is not None and self.bot.application_state == WebSocketState.CONNECTED
 
     def clear_send_queue(self) -> None:
-        """清空发送队列中所有待发送的任务。
+        """清空所有目标 lane 中待发送的任务。
 
-        在 WebSocket 断连或重连前调用，防止旧连接积压的协程
-        被新连接的 worker 取出执行（闭包中捕获的是旧 ws 对象）。
+        在丢弃旧实例前调用，防止旧连接积压的协程泄漏。
         """
-        while not self._send_queue.empty():
-            try:
-                self._send_queue.get_nowait()
-                self._send_queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+        self._sender.clear()
 
     def resolve_recall(self, msg: MessageReceive) -> bool:
         """若 msg 是 recall_message_id 回执则消费它并唤醒对应 future。
@@ -219,21 +188,26 @@ class _Bot:
         return True
 
     def start_send_worker(self):
-        """启动独立的发送 worker。
+        """启动（或在重连后恢复）发送调度。
 
         应该在 WebSocket 连接建立后调用。
         """
-        if self._send_task is None or self._send_task.done():
-            self._send_task = asyncio.create_task(self._send_worker())
-            logger.debug(t("log.bot.send_worker_started", bot_id=self.bot_id))
+        self._sender.start()
+        logger.debug(lt("log.bot.send_worker_started", bot_id=self.bot_id))
 
-    async def _enqueue_send(self, coro):
-        """将发送任务加入发送队列。
+    async def stop_send_worker(self):
+        """断连时挂起发送调度，未发送的消息保留到重连后继续发送。"""
+        await self._sender.stop()
+
+    def _enqueue_send(self, target_type: str, target_id: Optional[str], coro):
+        """将发送任务加入对应目标的发送 lane。
 
         Args:
+            target_type: 目标类型
+            target_id: 目标 ID
             coro: 发送协程
         """
-        await self._send_queue.put(coro)
+        self._sender.submit((target_type, target_id), coro)
 
     async def target_send(
         self,
@@ -250,7 +224,14 @@ class _Bot:
         task_event: Optional[asyncio.Event] = None,
         extra_metadata: Optional[Dict[str, Any]] = None,
         wait_recall: bool = False,
+        delivered: Optional[List[asyncio.Future]] = None,
     ) -> Optional[List[str]]:
+        """向目标发送消息。
+
+        ``delivered``：WS 模式下每个出站帧向其中追加一个 future，该帧真正写入连接后
+        ``set_result(None)``，写入失败 / 连接不在时 ``set_exception``，被取消时 ``cancel``。
+        入队不代表已发出，需要确认投递的调用方（如广播）据此判断。
+        """
         try:
             from gsuid_core.buildin_plugins.core_command.core_ai_control.state import (
                 is_scope_banned,
@@ -265,10 +246,10 @@ class _Bot:
                 target_id=target_id,
             )
             if scope_key and is_scope_banned(scope_key):
-                logger.debug(t("log.bot.scope_muted", scope_key=scope_key))
+                logger.debug(lt("log.bot.scope_muted", scope_key=scope_key))
                 return
         except Exception as e:
-            logger.debug(t("log.bot.mute_check_fail", error=e))
+            logger.debug(lt("log.bot.mute_check_fail", error=e))
 
         # 记录 bot 回复到历史记录
         try:
@@ -362,7 +343,7 @@ class _Bot:
                         metadata=metadata,
                     )
         except Exception as e:
-            logger.debug(t("log.bot.record_history_fail", error=e))
+            logger.debug(lt("log.bot.record_history_fail", error=e))
 
         _message = await convert_message(
             message,
@@ -437,7 +418,7 @@ class _Bot:
 
         try:
             for mr in message_result:
-                logger.trace(t("log.bot.about_to_send"), messages=_truncate_for_log(mr))
+                logger.trace(lt("log.bot.about_to_send"), messages=_truncate_for_log(mr))
                 if at_sender and sender_id:
                     if at_sender_pos == "消息最后":
                         mr.append(MessageSegment.at(sender_id))
@@ -504,22 +485,40 @@ class _Bot:
                     )
                 )
                 body = msgjson.encode(send)
-                # 通过发送队列串行化 WebSocket 发送，避免多任务并发写入
+                # 通过发送 lane 保证同一目标按序发送
                 # 闭包不捕获 ws，执行时动态读取 self.bot，重连后自动使用新 ws
+                _written: Optional[asyncio.Future] = None
+                if delivered is not None and not task_event:
+                    _written = asyncio.get_running_loop().create_future()
+                    delivered.append(_written)
 
-                async def _do_send(body: bytes = body):
-                    if self.bot is not None:
-                        await self.bot.send_bytes(body)
-                    else:
-                        logger.warning(t("log.bot.ws_not_connected_drop"))
+                async def _do_send(body: bytes = body, written: Optional[asyncio.Future] = _written):
+                    try:
+                        if self.bot is not None:
+                            await self.bot.send_bytes(body)
+                        else:
+                            logger.warning(t("log.bot.ws_not_connected_drop"))
+                            if written is not None and not written.done():
+                                written.set_exception(ConnectionError("websocket not connected"))
+                            return
+                    except asyncio.CancelledError:
+                        if written is not None:
+                            written.cancel()
+                        raise
+                    except Exception as e:
+                        if written is not None and not written.done():
+                            written.set_exception(e)
+                        raise
+                    if written is not None and not written.done():
+                        written.set_result(None)
 
                 if task_event:
                     # HTTP 模式：仍走 send_dict
                     self.send_dict[task_id] = send
                     task_event.set()
                 else:
-                    # WS 模式：无论连没连都入队，worker 会等重连
-                    await self._enqueue_send(_do_send())
+                    # WS 模式：无论连没连都入队，发送 lane 会等重连
+                    self._enqueue_send(target_type, target_id, _do_send())
 
             # ── 等待回执（所有帧共享一个超时窗口）──
             if not _recall_futs:
@@ -552,7 +551,7 @@ class _Bot:
                 if self._supports_recall is None and self._recall_timeout_streak >= RECALL_DISABLE_AFTER_TIMEOUTS:
                     self._supports_recall = False
                     logger.debug(
-                        t(
+                        lt(
                             "log.bot.recall_disabled",
                             bot_id=self.bot_id,
                             streak=self._recall_timeout_streak,
@@ -578,7 +577,7 @@ class _Bot:
 
         content 为单个 Message(type="excute_ban_user",
         data={"user_id": str, "group_id": str, "duration": int|str})。
-        duration 在 core 侧校验为 int 或纯数字字符串后再下发；与普通消息共用发送队列，
+        duration 在 core 侧校验为 int 或纯数字字符串后再下发；与普通消息共用同一目标的发送 lane，
         保证与在途消息的相对顺序。
         """
         send = MessageSend(
@@ -616,7 +615,7 @@ class _Bot:
             else:
                 logger.warning(t("log.bot.ws_not_connected_drop"))
 
-        await self._enqueue_send(_do_send())
+        self._enqueue_send(target_type, target_id, _do_send())
 
     async def unsend(
         self,
@@ -630,7 +629,7 @@ class _Bot:
 
         每个 id 单独成包：content 为单个 Message(type="excute_delete_message",
         data={"message_id": "<id>"})。
-        id 在 core 侧 str() 归一；与普通消息共用发送队列，保证与在途消息的相对顺序。
+        id 在 core 侧 str() 归一；与普通消息共用同一目标的发送 lane，保证与在途消息的相对顺序。
         """
         mids = message_id if isinstance(message_id, list) else [message_id]
         for mid in mids:
@@ -650,7 +649,7 @@ class _Bot:
                 else:
                     logger.warning(t("log.bot.ws_not_connected_drop"))
 
-            await self._enqueue_send(_do_send())
+            self._enqueue_send(target_type, target_id, _do_send())
 
     async def wait_task(
         self,
@@ -685,7 +684,7 @@ class _Bot:
             bot_traffic["req"] += 1
             bot_traffic["max_qps"] = max(bot_traffic["max_qps"], bot_traffic["req"])
             func_name = getattr(ctx, "name")
-            logger.trace(t("log.bot.exec_start", func_name=func_name))
+            logger.trace(lt("log.bot.exec_start", func_name=func_name))
             await ctx.coro
         except Exception:
             logger.exception(t("log.bot.exec_fail", func_name=func_name))
@@ -706,23 +705,36 @@ class _Bot:
             bot_traffic["max_time"] = max(bot_traffic["max_time"], total_duration)
             bot_traffic["max_runtime_func"] = func_name
 
+            HANDLER_QUEUE_SECONDS.observe(wait_time)
+            HANDLER_SECONDS.observe(run_duration, func_name)
+
             bot_traffic["req"] -= 1
             self.sem.release()
             self.queue.task_done()
 
     async def _process(self, shutdown_event: Optional[asyncio.Event] = None):
-        """处理队列中的任务，支持通过 shutdown_event 优雅关闭"""
-        while True:
-            # 如果提供了 shutdown_event，检查是否已设置
-            if shutdown_event is not None and shutdown_event.is_set():
-                break
-            try:
-                # 使用 wait_for 添加超时，以便定期检查 shutdown_event
-                ctx: TaskContext = await asyncio.wait_for(self.queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-            await self.sem.acquire()
-            asyncio.create_task(self._safe_run(ctx))
+        """处理队列中的任务，支持通过 shutdown_event 优雅关闭。
+
+        阻塞等待队列，shutdown_event 置位时立即退出，不做定时轮询。
+        """
+        stop = asyncio.ensure_future(shutdown_event.wait()) if shutdown_event is not None else None
+        getter: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if stop is None:
+                    ctx: TaskContext = await self.queue.get()
+                else:
+                    getter = asyncio.ensure_future(self.queue.get())
+                    await asyncio.wait({getter, stop}, return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        break
+                    ctx = getter.result()
+                await self.sem.acquire()
+                asyncio.create_task(self._safe_run(ctx))
+        finally:
+            for fut in (getter, stop):
+                if fut is not None and not fut.done():
+                    fut.cancel()
 
 
 class Bot:
@@ -1028,7 +1040,7 @@ class Bot:
         :param target_id: 会话 id；仅在显式传入 ``target_type`` 时使用。
         """
         if self.ev.task_event is not None:
-            logger.debug(t("log.bot.ban_http_unsupported"))
+            logger.debug(lt("log.bot.ban_http_unsupported"))
             return
         if target_type is None:
             target_type = self.ev.user_type
@@ -1060,7 +1072,7 @@ class Bot:
             return
         if self.ev.task_event is not None:
             # HTTP 模式（/api/send_msg）无 adapter WS 连接，撤回请求无处投递
-            logger.debug(t("log.bot.unsend_http_unsupported"))
+            logger.debug(lt("log.bot.unsend_http_unsupported"))
             return
         if target_type is None:
             target_type = self.ev.user_type
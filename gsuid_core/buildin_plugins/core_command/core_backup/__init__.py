@@ -1,3 +1,5 @@
+import asyncio
+
 from gsuid_core.sv import SV
 from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
@@ -19,6 +21,7 @@ from gsuid_core.utils.backup.backup_files import clean_log, backup_file
 from gsuid_core.utils.database.base_models import DB_PATH
 from gsuid_core.utils.plugins_config.gs_config import log_config, backup_config
 from gsuid_core.utils.database.global_val_models import (
+    CoreDataSketch,
     CoreDataSummary,
     CoreDataAnalysis,
 )
@@ -42,9 +45,9 @@ async def backup_path_files():
     凌晨自动备份`备份管理`中的路径树
     """
     CLEAN_DAY: str = log_config.get_config("ScheduledCleanLogDay").data
-    copy_and_rebase_paths()
+    await asyncio.to_thread(copy_and_rebase_paths)
     logger.success(t("log.core.gscore_path"))
-    remove_old_backups(int(CLEAN_DAY))
+    await asyncio.to_thread(remove_old_backups, int(CLEAN_DAY))
     logger.success(t("log.core.clean_day_delete", CLEAN_DAY=CLEAN_DAY))
 
 
@@ -85,6 +88,7 @@ async def clear_cache():
     await GsCache.delete_all_cache(GsUser)
     await CoreDataSummary.delete_outdate()
     await CoreDataAnalysis.delete_outdate()
+    await CoreDataSketch.delete_outdate()
     logger.success(t("log.core.gscore_cache_cleanup"))
 
 
@@ -1,11 +1,18 @@
 from gsuid_core.server import on_core_shutdown, on_core_start_before
-from gsuid_core.global_val import load_bot_max_qps, save_bot_max_qps, load_all_global_val, save_all_global_val
+from gsuid_core.global_val import (
+    load_bot_max_qps,
+    save_bot_max_qps,
+    load_all_global_val,
+    save_all_global_val,
+    backfill_data_sketches,
+)
 
 
 @on_core_start_before
 async def load_global_val():
     await load_all_global_val()
     await load_bot_max_qps()
+    await backfill_data_sketches()
 
 
 @on_core_shutdown
@@ -76,10 +76,16 @@ CORE_CONFIG: Dict[str, Any] = {
         "level": SelectOption("INFO", ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
         "output": SelectOption(["stdout", "stderr", "file"], ["stdout", "stderr", "file"], multi=True),
         "module": False,
+        # 网页控制台实时日志（及命令追踪）收集的最低级别；低于它且低于 level 的日志直接丢弃
+        "history_level": SelectOption("DEBUG", ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     },
     "enable_empty_start": True,
     "command_start": [],
     "buffered_user_writes": False,
+    # WS 接收管线：每个连接的分发协程数、有界队列容量与队列满时的背压策略
+    "ws_dispatch_workers": 4,
+    "ws_receive_queue_size": 1000,
+    "ws_receive_queue_policy": SelectOption("block", ["block", "drop", "oldest"]),
     "sv": {},
 }
 
@@ -112,8 +118,8 @@ def _collect_selects(node: Dict[str, Any], prefix: str = "") -> Dict[str, Select
 CONFIG_DEFAULT: Dict[str, Any] = _unwrap_defaults(CORE_CONFIG)
 CONFIG_OPTIONS: Dict[str, SelectOption] = _collect_selects(CORE_CONFIG)
 
-STR_CONFIG = Literal["HOST", "PORT", "WS_TOKEN", "REGISTER_CODE", "LANGUAGE"]
-INT_CONFIG = Literal["misfire_grace_time", "web_max_sessions"]
+STR_CONFIG = Literal["HOST", "PORT", "WS_TOKEN", "REGISTER_CODE", "LANGUAGE", "ws_receive_queue_policy"]
+INT_CONFIG = Literal["misfire_grace_time", "web_max_sessions", "ws_dispatch_workers", "ws_receive_queue_size"]
 LIST_CONFIG = Literal["superusers", "masters", "command_start", "TRUSTED_IPS", "framework_aliases"]
 DICT_CONFIG = Literal["sv", "log"]
 BOOL_CONFIG = Literal["enable_empty_start", "ENABLE_HTTP", "buffered_user_writes"]
@@ -67,7 +67,7 @@ async def main():
 
     start_time = time.time()
 
-    from gsuid_core.i18n import t
+    from gsuid_core.i18n import t, lt
     from gsuid_core.logger import logger
     from gsuid_core.ai_core.configs.ai_config import ai_config
     from gsuid_core.utils.database.base_models import init_database
@@ -92,6 +92,7 @@ async def main():
     from gsuid_core.config import core_config
     from gsuid_core.models import MessageReceive
     from gsuid_core.handler import handle_event
+    from gsuid_core.receive_pipeline import ReceivePipeline, register_pipeline, unregister_pipeline
     from gsuid_core.security_manager import sec_manager
     from gsuid_core.utils.database.startup import (  # noqa: F401
         trans_adapter as ta,
@@ -106,6 +107,9 @@ async def main():
     PORT = int(core_config.get_config("PORT"))
     ENABLE_HTTP = core_config.get_config("ENABLE_HTTP")
     WS_SECRET_TOKEN = core_config.get_config("WS_TOKEN") or ""
+    WS_DISPATCH_WORKERS = core_config.get_config("ws_dispatch_workers")
+    WS_RECEIVE_QUEUE_SIZE = core_config.get_config("ws_receive_queue_size")
+    WS_RECEIVE_QUEUE_POLICY = core_config.get_config("ws_receive_queue_policy")
 
     if HOST == "all" or HOST == "none" or HOST == "dual" or not HOST:
         HOST = None
@@ -150,8 +154,18 @@ async def main():
             else:
                 sec_manager.record_success(client_host)
 
+        # 收帧与分发解耦：同一会话按序、不同会话并行，队列满时按策略背压
+        pipeline = ReceivePipeline(
+            bot_id,
+            lambda msg: handle_event(bot, msg),
+            workers=WS_DISPATCH_WORKERS,
+            capacity=WS_RECEIVE_QUEUE_SIZE,
+            policy=WS_RECEIVE_QUEUE_POLICY,  # type: ignore
+        )
         try:
             bot = await gss.connect(websocket, bot_id)
+            pipeline.start()
+            register_pipeline(pipeline)
 
             async def start():
                 try:
@@ -163,7 +177,7 @@ async def main():
                             # 优先拦截 recall_message_id 回执，避免其进入正常消息管道
                             if bot.resolve_recall(msg):
                                 continue
-                            await handle_event(bot, msg)
+                            await pipeline.submit(msg)
                         except asyncio.TimeoutError:
                             continue
                         except WebSocketDisconnect:
@@ -171,7 +185,7 @@ async def main():
                         except (ConnectionResetError, ConnectionAbortedError):
                             # Windows ProactorEventLoop: 客户端异常断开时抛出
                             # [WinError 995] 由于线程退出或应用程序请求，已中止 I/O 操作
-                            logger.debug(t("log.core.gscore_websocket_connection_reset", bot_id=bot_id))
+                            logger.debug(lt("log.core.gscore_websocket_connection_reset", bot_id=bot_id))
                             break
                 except CancelledError:
                     pass
@@ -204,6 +218,8 @@ async def main():
                 if isinstance(_r, BaseException) and not isinstance(_r, CancelledError):
                     raise _r
         finally:
+            await pipeline.stop()
+            unregister_pipeline(pipeline)
             await gss.disconnect(bot_id)
 
     if ENABLE_HTTP:
@@ -251,7 +267,7 @@ async def main():
             loop.add_signal_handler(sig, set_shutdown_event)
     except NotImplementedError:
         # Windows 不支持 add_signal_handler，仅依赖 uvicorn 的信号处理
-        logger.debug(t("log.core.no_signal_handler"))
+        logger.debug(lt("log.core.no_signal_handler"))
 
     server = uvicorn.Server(config)
     end_time = time.time()
@@ -300,7 +316,7 @@ async def main():
                 )
             )
     except Exception as e:
-        logger.debug(t("log.core.ai_stats_fail", error=e))
+        logger.debug(lt("log.core.ai_stats_fail", error=e))
 
     await server.serve()
 
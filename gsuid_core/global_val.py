@@ -2,19 +2,22 @@ import json
 import asyncio
 import datetime
 from copy import deepcopy
-from typing import Set, Dict, List, Tuple, Optional, Sequence, TypedDict
+from typing import Set, Dict, List, Tuple, Iterator, Optional, Sequence, TypedDict
 from pathlib import Path
+from itertools import islice
 
 import aiofiles
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.data_store import get_res_path
+from gsuid_core.utils.sketch import TopK, HyperLogLog
 from gsuid_core.utils.database.global_val_models import (
     CountVal,
     DataType,
     BotTraffic,
     CoreTraffic,
+    CoreDataSketch,
     CoreDataSummary,
     CoreDataAnalysis,
 )
@@ -22,6 +25,11 @@ from gsuid_core.utils.database.global_val_models import (
 global_val_path = get_res_path(["GsCore", "global"])
 global_backup_path = get_res_path(["GsCore", "global_backup"])
 
+# 启动时为多少天内缺失的草图补建（覆盖看板 30 日窗口）
+SKETCH_BACKFILL_DAYS = 31
+# 保存时每批写入的明细行数
+ANALYSIS_BATCH_SIZE = 2000
+
 
 class PlatformVal(TypedDict):
     receive: int
@@ -151,6 +159,11 @@ async def get_all_bot_dict() -> Dict[str, List[str]]:
 async def get_global_analysis(
     data: Dict[str, PlatformVal],
 ) -> CountVal:
+    """按调用方传入的每日明细精确计算活跃指标（集合运算）。
+
+    只适合内存中已有的少量天数；跨 30 天的看板指标请用
+    ``CoreDataSummary.calculate_dashboard_metrics``，它合并持久化的每日草图，不需要加载明细。
+    """
     try:
         sorted_days = sorted(data.keys(), reverse=True)
         if not sorted_days:
@@ -219,11 +232,6 @@ async def get_global_analysis(
     past_users = set().union(*user_sets_by_day[1:])
     past_groups = set().union(*group_sets_by_day[1:])
 
-    # 用于计算 DAU/DAG 的用户/群组 (day 1-7)
-    # 对应原代码的 user_list[1:8]
-    dau_users_list = [user for s in user_sets_by_day[1:8] for user in s]
-    dag_groups_list = [group for s in group_sets_by_day[1:8] for group in s]
-
     # --- 开始计算 ---
     # 新用户/群组: 今天出现，但在过去29天未出现
     new_users = todays_users - past_users
@@ -233,12 +241,9 @@ async def get_global_analysis(
     out_users = all_users - recent_7_days_users
     out_groups = all_groups - recent_7_days_groups
 
-    # DAU/DAG
-    day7_user_num = len(dau_users_list)
-    day7_group_num = len(dag_groups_list)
-
-    dau = day7_user_num / 7 if day7_user_num else 0
-    dag = day7_group_num / 7 if day7_group_num else 0
+    # DAU/DAG: day 1-7 每日去重人数之和 / 7（内存数据是精确集合，直接取长度）
+    dau = sum(map(len, user_sets_by_day[1:8])) / 7
+    dag = sum(map(len, group_sets_by_day[1:8])) / 7
 
     # 流失率
     out_user_rate = (len(out_users) / len(all_users)) * 100 if all_users else 0
@@ -263,7 +268,7 @@ async def load_all_global_val():
     today = datetime.date.today()
     logger.info(t("log.global_val.today_start_load", today=today))
     summarys: Optional[Sequence[CoreDataSummary]] = await CoreDataSummary.select_rows(date=today)
-    logger.debug(t("log.global_val.summarys_debug", summarys=summarys))
+    logger.debug(lt("log.global_val.summarys_debug", summarys=summarys))
     if summarys:
         for summary in summarys:
             if summary.bot_id not in bot_val:
@@ -276,7 +281,7 @@ async def load_all_global_val():
             if datas:
                 platform_val = await trans_database_to_val(summary, datas)
                 bot_val[summary.bot_id][summary.bot_self_id] = platform_val
-    logger.debug(t("log.global_val.bot_val_debug", bot_val=bot_val))
+    logger.debug(lt("log.global_val.bot_val_debug", bot_val=bot_val))
     logger.success(t("log.global_val.load_done"))
 
 
@@ -309,7 +314,7 @@ async def save_global_val(bot_id: str, bot_self_id: str, day: int = 0):
         return
 
     local_val = get_platform_val(bot_id, bot_self_id)
-    logger.debug(t("log.global_val.local_val_debug", local_val=local_val))
+    logger.debug(lt("log.global_val.local_val_debug", local_val=local_val))
 
     today = datetime.date.today() - datetime.timedelta(days=day)
     await _save_global_val_to_database(local_val, bot_id, bot_self_id, today)
@@ -321,50 +326,21 @@ async def _save_global_val_to_database(
     bot_self_id: str,
     today_datetime: datetime.date,
 ):
-    insert_datas = []
-    for _g in local_val["group"]:
-        group_data = local_val["group"][_g]
-        for command_name in group_data:
-            command_count = group_data[command_name]
-            insert_datas.append(
-                CoreDataAnalysis(
-                    data_type=DataType.GROUP,
-                    target_id=_g,
-                    command_name=command_name,
-                    command_count=command_count,
-                    date=today_datetime,
-                    bot_id=bot_id,
-                    bot_self_id=bot_self_id,
-                )
-            )
-    for _u in local_val["user"]:
-        user_data = local_val["user"][_u]
-        for command_name in user_data:
-            command_count = user_data[command_name]
-            insert_datas.append(
-                CoreDataAnalysis(
-                    data_type=DataType.USER,
-                    target_id=_u,
-                    command_name=command_name,
-                    command_count=command_count,
-                    date=today_datetime,
-                    bot_id=bot_id,
-                    bot_self_id=bot_self_id,
-                )
-            )
-
-    await CoreDataAnalysis.batch_insert_data_with_update(
-        insert_datas,
-        ["command_count"],
-        [
-            "data_type",
-            "target_id",
-            "date",
-            "command_name",
-            "bot_id",
-            "bot_self_id",
-        ],
-    )
+    # 明细行按批生成并写入，不一次性为全部 (目标, 指令) 构造 ORM 对象
+    rows = _iter_analysis_rows(local_val, bot_id, bot_self_id, today_datetime)
+    while batch := list(islice(rows, ANALYSIS_BATCH_SIZE)):
+        await CoreDataAnalysis.batch_insert_data_with_update(
+            batch,
+            ["command_count"],
+            [
+                "data_type",
+                "target_id",
+                "date",
+                "command_name",
+                "bot_id",
+                "bot_self_id",
+            ],
+        )
 
     insert_summary = []
     insert_summary.append(
@@ -386,6 +362,89 @@ async def _save_global_val_to_database(
         ["date", "bot_id", "bot_self_id"],
     )
 
+    await CoreDataSketch.batch_insert_data_with_update(
+        [build_data_sketch(local_val["user"], local_val["group"], bot_id, bot_self_id, today_datetime)],
+        ["users", "groups", "commands"],
+        ["date", "bot_id", "bot_self_id"],
+    )
+
+
+def _iter_analysis_rows(
+    local_val: PlatformVal,
+    bot_id: str,
+    bot_self_id: str,
+    date: datetime.date,
+) -> Iterator[CoreDataAnalysis]:
+    for data_type, targets in ((DataType.GROUP, local_val["group"]), (DataType.USER, local_val["user"])):
+        for target_id, target_data in list(targets.items()):
+            for command_name, command_count in list(target_data.items()):
+                yield CoreDataAnalysis(
+                    data_type=data_type,
+                    target_id=target_id,
+                    command_name=command_name,
+                    command_count=command_count,
+                    date=date,
+                    bot_id=bot_id,
+                    bot_self_id=bot_self_id,
+                )
+
+
+def build_data_sketch(
+    users: Dict[str, Dict[str, int]],
+    groups: Dict[str, Dict[str, int]],
+    bot_id: str,
+    bot_self_id: str,
+    date: datetime.date,
+) -> CoreDataSketch:
+    """把一天的 用户/群 → {指令: 次数} 压成草图行；指令次数按用户维度汇总，与看板口径一致。"""
+    commands: Dict[str, int] = {}
+    for user_data in users.values():
+        for command_name, command_count in user_data.items():
+            commands[command_name] = commands.get(command_name, 0) + command_count
+
+    return CoreDataSketch(
+        users=HyperLogLog.of(users).to_bytes(),
+        groups=HyperLogLog.of(groups).to_bytes(),
+        commands=TopK.of(commands).to_bytes(),
+        date=date,
+        bot_id=bot_id,
+        bot_self_id=bot_self_id,
+    )
+
+
+async def backfill_data_sketches(days: int = SKETCH_BACKFILL_DAYS):
+    """为最近 ``days`` 天内已有明细、但还没有草图行的 (日期, Bot) 补建草图。
+
+    覆盖升级前写入的数据；之后草图随 ``save_global_val`` 一并写入，不会再缺。
+    """
+    start = datetime.date.today() - datetime.timedelta(days=days)
+    existing = await CoreDataSketch.get_existing_keys(start)
+    summarys: Sequence[CoreDataSummary] = await CoreDataSummary.get_recently_data(start)
+
+    insert_sketches = []
+    for summary in summarys:
+        if (summary.date, summary.bot_id, summary.bot_self_id) in existing:
+            continue
+        datas: Optional[Sequence[CoreDataAnalysis]] = await CoreDataAnalysis.select_rows(
+            date=summary.date,
+            bot_id=summary.bot_id,
+            bot_self_id=summary.bot_self_id,
+        )
+        users: Dict[str, Dict[str, int]] = {}
+        groups: Dict[str, Dict[str, int]] = {}
+        for data in datas or []:
+            target = users if data.data_type == DataType.USER else groups
+            target.setdefault(data.target_id, {})[data.command_name] = data.command_count
+        insert_sketches.append(build_data_sketch(users, groups, summary.bot_id, summary.bot_self_id, summary.date))
+
+    if insert_sketches:
+        await CoreDataSketch.batch_insert_data_with_update(
+            insert_sketches,
+            ["users", "groups", "commands"],
+            ["date", "bot_id", "bot_self_id"],
+        )
+        logger.success(t("log.global_val.sketch_backfill_done", count=len(insert_sketches)))
+
 
 def prepare_models_from_json(
     local_val: PlatformVal,
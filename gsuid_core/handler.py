@@ -1,12 +1,11 @@
 import time
 import asyncio
-from copy import deepcopy
 from uuid import uuid4
 from typing import Dict, List, Tuple, Optional
 
-from gsuid_core.sv import SL, SV
+from gsuid_core.sv import SV
 from gsuid_core.bot import Bot, _Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.config import core_config
 from gsuid_core.logger import logger
 from gsuid_core.models import (
@@ -19,10 +18,10 @@ from gsuid_core.models import (
     format_node_preview,
     normalize_node_items,
 )
-from gsuid_core.server import on_core_shutdown
 from gsuid_core.trigger import Trigger
 from gsuid_core.subscribe import gs_subscribe
 from gsuid_core.global_val import get_platform_val
+from gsuid_core.trigger_index import trigger_index
 from gsuid_core.utils.cooldown import cooldown_tracker
 from gsuid_core.utils.database.models import CoreUser, CoreGroup, Subscribe
 from gsuid_core.utils.resource_manager import RM
@@ -31,6 +30,7 @@ from gsuid_core.utils.plugins_config.gs_config import (
     sp_config,
     log_config,
 )
+from gsuid_core.utils.database.user_write_behind import user_write_behind
 
 # 注意：handle_ai / history / memory / statistics 等 AI 重模块改为在
 # handle_event 内按需懒加载，避免 import handler 时同步拉起 AI ML 栈而阻塞启动。
@@ -76,78 +76,9 @@ def set_handle(is_handle: bool):
     IS_HANDDLE = is_handle
 
 
-# ===== CoreUser / CoreGroup 缓冲写入（参考 XutheringWavesUID 活跃度模式）=====
-# 默认关闭, 走原同步 await 路径; 启用后 60s 批量 flush, 退出时强制 flush.
+# CoreUser / CoreGroup 写后合并队列：默认关闭, 走原同步 await 路径;
+# 启用后消息路径只入队, 由 user_write_behind 定时/定量批量落库, 退出时排空.
 _BUFFERED_USER_WRITES: bool = bool(core_config.get_config("buffered_user_writes"))
-_USER_FLUSH_INTERVAL: float = 60.0
-
-_user_buffer: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str], Optional[str]]] = {}
-_group_buffer: set = set()
-_user_flush_shutdown_event: asyncio.Event = asyncio.Event()
-_user_flush_task: Optional[asyncio.Task] = None
-
-
-async def _flush_user_group_buffer():
-    """把缓冲区中的 CoreUser/CoreGroup 写入批量刷到数据库."""
-    if not _user_buffer and not _group_buffer:
-        return
-    u_pending = dict(_user_buffer)
-    _user_buffer.clear()
-    g_pending = set(_group_buffer)
-    _group_buffer.clear()
-
-    for (rbi, uid), (gid, nick, avatar) in u_pending.items():
-        try:
-            await CoreUser.insert_user(rbi, uid, gid, nick, avatar)
-        except Exception as e:
-            logger.warning(t("log.handler.buffer_coreuser_fail", error=e))
-    for rbi, gid in g_pending:
-        try:
-            await CoreGroup.insert_group(rbi, gid)
-        except Exception as e:
-            logger.warning(t("log.handler.buffer_coregroup_fail", error=e))
-
-
-async def _user_flush_loop():
-    """后台循环 60s 一次刷写, shutdown event 触发立即退出."""
-    while not _user_flush_shutdown_event.is_set():
-        try:
-            await asyncio.wait_for(_user_flush_shutdown_event.wait(), timeout=_USER_FLUSH_INTERVAL)
-            break
-        except asyncio.TimeoutError:
-            pass
-        try:
-            await _flush_user_group_buffer()
-        except Exception as e:
-            logger.warning(t("log.handler.buffer_flush_loop_fail", error=e))
-
-
-def _ensure_flush_task_started():
-    """首次缓冲写入时懒启动后台 flush 任务."""
-    global _user_flush_task
-    if _user_flush_task is None or _user_flush_task.done():
-        try:
-            _user_flush_task = asyncio.get_event_loop().create_task(_user_flush_loop())
-        except RuntimeError:
-            _user_flush_task = None
-
-
-@on_core_shutdown
-async def _flush_user_buffer_on_shutdown():
-    """退出前最后一次刷写, 防止丢数据."""
-    if not _BUFFERED_USER_WRITES:
-        return
-    logger.info(t("log.handler.buffer_stop"))
-    _user_flush_shutdown_event.set()
-    global _user_flush_task
-    if _user_flush_task is not None:
-        try:
-            await asyncio.wait_for(_user_flush_task, timeout=30)
-        except asyncio.TimeoutError:
-            _user_flush_task.cancel()
-    logger.info(t("log.handler.buffer_flushing"))
-    await _flush_user_group_buffer()
-    logger.info(t("log.handler.buffer_flushed"))
 
 
 def _sv_authorized(_sv: SV, event: Event, user_pm: int) -> bool:
@@ -222,29 +153,27 @@ async def handle_meta_event(ws: _Bot, msg: MessageReceive) -> None:
     if event.group_id in black_list or event.user_id in black_list:
         return
 
-    # 4. 鉴权级联 + 仅匹配 meta 触发器
+    # 4. 鉴权级联 + 仅匹配 meta 触发器（索引按事件名直接取候选）
     matched: Dict[Trigger, int] = {}
-    for _sv_name in SL.lst:
-        _sv = SL.lst[_sv_name]
-        if "meta" not in _sv.TL:
-            continue
-        if not _sv_authorized(_sv, event, user_pm):
+    _authorized: Dict[str, bool] = {}
+    for _trigger, _sv in trigger_index.match_meta(event):
+        if _sv.name not in _authorized:
+            _authorized[_sv.name] = _sv_authorized(_sv, event, user_pm)
+        if not _authorized[_sv.name]:
             continue
-        for _trigger in _sv.TL["meta"].values():
-            try:
-                if _trigger.check_command(event):
-                    matched[_trigger] = _sv.priority
-            except Exception:
-                logger.exception(t("log.handler.meta_check_fail", keyword=repr(_trigger.keyword)))
+        try:
+            if _trigger.check_command(event):
+                matched[_trigger] = _sv.priority
+        except Exception:
+            logger.exception(t("log.handler.meta_check_fail", keyword=repr(_trigger.keyword)))
 
     if not matched:
         return
 
-    # 5. 按优先级分发（与命令路径一致：deepcopy → Bot → TaskContext → 入队；支持 block）
+    # 5. 按优先级分发（与命令路径一致：fork → Bot → TaskContext → 入队；支持 block）
     for trigger, _ in sorted(matched.items(), key=lambda x: x[1]):
-        _event = deepcopy(event)
-        _event.task_id = str(uuid4())
-        _event.command = trigger.keyword  # 事件名，便于日志/追踪
+        # 事件名写入 command，便于日志/追踪
+        _event = event.fork(task_id=str(uuid4()), command=trigger.keyword)
         bot = Bot(ws, _event)
         logger.info(t("log.handler.meta_triggered"), meta=[trigger.keyword, event.meta_event_data])
         coro = trigger.func(bot, _event)
@@ -404,17 +333,13 @@ async def handle_event(ws: _Bot, msg: MessageReceive, is_http: bool = False):
         sender_avater = event.sender["avatar"]
 
     if _BUFFERED_USER_WRITES:
-        _key_u = (event.real_bot_id, event.user_id)
-        if _key_u in _user_buffer:
-            _old_gid, _old_nick, _old_avatar = _user_buffer[_key_u]
-            if not sender_nickname:
-                sender_nickname = _old_nick
-            if not sender_avater:
-                sender_avater = _old_avatar
-        _user_buffer[_key_u] = (event.group_id, sender_nickname, sender_avater)
-        if event.group_id:
-            _group_buffer.add((event.real_bot_id, event.group_id))
-        _ensure_flush_task_started()
+        user_write_behind.add(
+            event.real_bot_id,
+            event.user_id,
+            event.group_id,
+            sender_nickname,
+            sender_avater,
+        )
     else:
         await CoreUser.insert_user(
             event.real_bot_id,
@@ -463,7 +388,7 @@ async def handle_event(ws: _Bot, msg: MessageReceive, is_http: bool = False):
         msg.user_id,
         same_user_cd,
     ):
-        logger.trace(t("log.handler.same_msg_cd", user_id=msg.user_id))
+        logger.trace(lt("log.handler.same_msg_cd", user_id=msg.user_id))
         return
 
     is_start = False
@@ -481,38 +406,36 @@ async def handle_event(ws: _Bot, msg: MessageReceive, is_http: bool = False):
             if not is_start:
                 return
 
+    # 候选由预编译索引给出（与 SV → TL → Trigger 遍历同序），仅对候选做鉴权与复核
     valid_event: Dict[Trigger, int] = {}
     if msg.group_id not in black_list and msg.user_id not in black_list:
-        for _sv_name in SL.lst:
-            _sv = SL.lst[_sv_name]
-            if not _sv_authorized(_sv, event, user_pm):
+        _authorized: Dict[str, bool] = {}
+        for _trigger, _sv in trigger_index.match(event):
+            if _sv.name not in _authorized:
+                _authorized[_sv.name] = _sv_authorized(_sv, event, user_pm)
+            if not _authorized[_sv.name]:
                 continue
-
-            _priority = _sv.priority
-            for _trigger_dict in _sv.TL.values():
-                for _trigger in _trigger_dict.values():
-                    try:
-                        if _trigger.check_command(event):
-                            valid_event[_trigger] = _priority
-                    except Exception:
-                        logger.exception(
-                            t(
-                                "log.handler.check_command_fail",
-                                type=_trigger.type,
-                                keyword=repr(_trigger.keyword),
-                            )
-                        )
+            try:
+                if _trigger.check_command(event):
+                    valid_event[_trigger] = _sv.priority
+            except Exception:
+                logger.exception(
+                    t(
+                        "log.handler.check_command_fail",
+                        type=_trigger.type,
+                        keyword=repr(_trigger.keyword),
+                    )
+                )
 
     command_triggers = {t: p for t, p in valid_event.items() if t.type != "message"}
     message_triggers = {t: p for t, p in valid_event.items() if t.type == "message"}
 
     for trigger in message_triggers:
-        _event = deepcopy(event)
+        _event = event.fork(task_id=str(uuid4()))
         message = await trigger.get_command(_event)
-        _event.task_id = str(uuid4())
         bot = Bot(ws, _event)
         await count_data(event, trigger)
-        logger.trace(t("log.handler.cmd_on_message"), command=message)
+        logger.trace(lt("log.handler.cmd_on_message"), command=message)
         coro = trigger.func(bot, message)
         func_name = getattr(coro, "__qualname__", str(coro))
         # on_message 被动监听每条消息必触发，挂 trace 会刷屏 [TraceStart]/[TraceEnd]
@@ -533,9 +456,9 @@ async def handle_event(ws: _Bot, msg: MessageReceive, is_http: bool = False):
         )
 
         for trigger, _ in sorted_event:
-            _event = deepcopy(event)
+            # 每个处理器拿到独立的浅视图，get_command 只改写其上的触发器派生字段
+            _event = event.fork(task_id=str(uuid4()))
             message = await trigger.get_command(_event)
-            _event.task_id = str(uuid4())
 
             if is_http:
                 _event.task_event = asyncio.Event()
@@ -23,7 +23,8 @@
 ``gsuid_core/locales``。框架在插件加载成功后自动扫描 ``locales/`` 目录。
 
 日志 key 约定：``log.<模块>.<语义>``；前导 emoji 由 ``ensure_log_emoji`` 按模块统一装配，
-词条 value 可不写 emoji（若已写则不重复加）。
+词条 value 可不写 emoji（若已写则不重复加）。trace / debug 等常被级别过滤的日志用 ``lt()``，
+文案推迟到日志确实输出时才渲染。
 """
 
 from __future__ import annotations
@@ -31,7 +32,7 @@ from __future__ import annotations
 import re
 import json
 from enum import Enum
-from typing import Set, Dict, List, Tuple, Optional
+from typing import Set, Dict, List, Tuple, Mapping, Optional
 from pathlib import Path
 
 
@@ -54,6 +55,10 @@ _bare_aliases: Dict[str, Dict[str, str]] = {}
 _plugin_keys: Dict[str, Set[str]] = {}
 # plugin_name → locales 根路径（热重载）
 _plugin_locale_roots: Dict[str, Path] = {}
+# (lang, key) → (已装配 emoji 的模板, 是否需在填充后再装配)；catalog 变动即整体失效
+_prepared: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+# 动态 key（缺词条回落 key 本身）也会进缓存，超过上限整体清空，避免无界增长
+PREPARED_CACHE_MAX = 8192
 
 # ── 日志模块 → 统一 emoji（装配层；value 可无前缀）──
 LOG_MODULE_EMOJI: Dict[str, str] = {
@@ -215,6 +220,7 @@ def _build_bare_aliases(catalog: Dict[str, str]) -> Dict[str, str]:
 
 
 def _rebuild_aliases_for_lang(lang: str) -> None:
+    _prepared.clear()
     cat = _catalogs.get(lang)
     if cat is not None:
         _bare_aliases[lang] = _build_bare_aliases(cat)
@@ -260,6 +266,7 @@ def load_catalogs() -> None:
     plugin_snapshot: Dict[str, Path] = dict(_plugin_locale_roots)
     _catalogs.clear()
     _bare_aliases.clear()
+    _prepared.clear()
     _plugin_keys.clear()
     _plugin_locale_roots.clear()
 
@@ -312,26 +319,88 @@ def _lookup_template(catalog: Dict[str, str], aliases: Dict[str, str], key: str)
     return key
 
 
+def _prepare(lang: str, key: str) -> Tuple[str, bool]:
+    """查表并预先装配 emoji，按 (lang, key) 缓存。
+
+    模板以占位符开头时，前导 emoji 取决于填充值，只能留到填充后再判断。
+    """
+    cache_key = (lang, key)
+    prepared = _prepared.get(cache_key)
+    if prepared is not None:
+        return prepared
+    template = _lookup_template(_catalogs.get(lang, {}), _bare_aliases.get(lang, {}), key)
+    if template.startswith("{") and not template.startswith("{{"):
+        prepared = (template, True)
+    else:
+        prepared = (ensure_log_emoji(key, template), False)
+    if len(_prepared) >= PREPARED_CACHE_MAX:
+        _prepared.clear()
+    _prepared[cache_key] = prepared
+    return prepared
+
+
+def _render(key: str, lang: Optional[str], params: Mapping[str, object]) -> str:
+    use_lang = lang if (lang and lang in _catalogs) else get_lang()
+    if use_lang not in _catalogs:
+        use_lang = DEFAULT_LANG
+    template, deferred_emoji = _prepare(use_lang, key)
+    text = template.format(**params) if params else template
+    return ensure_log_emoji(key, text) if deferred_emoji else text
+
+
 def t(key: str, /, lang: Optional[str] = None, **params: object) -> str:
     """按 key 取词条并以具名占位符填充。
 
     - 缺 key 回落 key 本身。
     - ``log.*`` 结果经 ``ensure_log_emoji`` 按模块统一装配前导 emoji。
     - 插件词条经 ``register_plugin_locales`` 合并后与框架同一 ``t()`` 查找。
+    - 查表与 emoji 装配按 (lang, key) 缓存，每次调用只剩一次 ``format``。
     """
-    use_lang = lang if (lang and lang in _catalogs) else get_lang()
-    if use_lang in _catalogs:
-        catalog = _catalogs[use_lang]
-        aliases = _bare_aliases.get(use_lang, {})
-    elif DEFAULT_LANG in _catalogs:
-        catalog = _catalogs[DEFAULT_LANG]
-        aliases = _bare_aliases.get(DEFAULT_LANG, {})
-    else:
-        catalog = {}
-        aliases = {}
-    template = _lookup_template(catalog, aliases, key)
-    text = template.format(**params) if params else template
-    return ensure_log_emoji(key, text)
+    return _render(key, lang, params)
+
+
+class LazyText:
+    """``lt()`` 的返回值：记下 key 与参数，首次 ``str()`` 时才查表、填充、装配 emoji。
+
+    日志链在 handler 侧渲染（``render_lazy_event_processor``），被级别过滤掉的日志
+    从不渲染；渲染结果缓存在实例上，多个 handler 共用一次。
+    """
+
+    __slots__ = ("key", "lang", "params", "_text")
+
+    def __init__(self, key: str, lang: Optional[str], params: Dict[str, object]) -> None:
+        self.key = key
+        self.lang = lang
+        self.params = params
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = _render(self.key, self.lang, self.params)
+            self.params = {}
+        return self._text
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, LazyText)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+def lt(key: str, /, lang: Optional[str] = None, **params: object) -> LazyText:
+    """延迟版 ``t()``：专供 trace / debug 等常被过滤的日志调用。
+
+    参数与 ``t()`` 相同；查表与 ``format`` 推迟到日志确实要输出时才做。
+    """
+    return LazyText(key, lang, params)
 
 
 def _iter_plugin_locale_files(locales_root: Path) -> List[Tuple[str, Path]]:
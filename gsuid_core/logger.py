@@ -6,8 +6,9 @@ import zlib
 import asyncio
 import logging
 import datetime
+import threading
 from copy import deepcopy
-from typing import Any, Set, Dict, List, Deque, Optional, Protocol, Sequence, TypedDict, NotRequired, AsyncGenerator
+from typing import Any, Set, Dict, List, Deque, Optional, Protocol, Sequence, AsyncGenerator
 from pathlib import Path
 from functools import wraps
 from collections import deque
@@ -15,14 +16,13 @@ from dataclasses import dataclass
 from logging.handlers import TimedRotatingFileHandler
 
 import msgspec
-import aiofiles
 import structlog
 from colorama import Fore, Style, init
 from structlog.dev import Column, ConsoleRenderer, KeyValueColumnFormatter
 from structlog.types import EventDict, Processor, WrappedLogger
 from structlog.processors import CallsiteParameter, CallsiteParameterAdder
 
-from gsuid_core.i18n import LOG_MODULE_EMOJI, t, starts_with_emoji
+from gsuid_core.i18n import LOG_MODULE_EMOJI, LazyText, t, lt, starts_with_emoji
 from gsuid_core.config import core_config
 from gsuid_core.models import Event, Message, TraceContext
 from gsuid_core.data_store import get_res_path, error_mark_path
@@ -33,6 +33,8 @@ LOG_HISTORY_MAXLEN = 2000
 LOG_HISTORY_MAX_CHARS = 8_000_000  # 兜底硬顶，正常负载（总量百 KB 量级）不触发
 # SSE 空闲心跳间隔（秒），需小于反向代理的读超时（nginx proxy_read_timeout 默认 60s）
 SSE_KEEPALIVE_SEC = 15
+# 每个 SSE 订阅者的待发送环形缓冲上限；消费跟不上时丢弃最旧的并推送一条缺口提示
+SSE_SUBSCRIBER_BUFFER = 1000
 
 
 @dataclass(slots=True)
@@ -71,6 +73,7 @@ LEVEL_NUM_MAP: Dict[str, int] = {
     "error": 40,
     "critical": 50,
     "fatal": 50,
+    "exception": 40,
 }
 
 
@@ -449,6 +452,24 @@ class TraceCapableBoundLogger(structlog.stdlib.BoundLogger):
         self._proxy_to_logger("success", event, *args, **kwargs)
 
 
+def drop_below_level_processor(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    """structlog 入口按 stdlib logger 的有效级别丢弃日志。
+
+    被过滤的日志不再合并上下文、不再构造 LogRecord，``lt()`` 的延迟文案也就不会被渲染。
+    """
+    if not logger.isEnabledFor(LEVEL_NUM_MAP.get(method_name, logging.INFO)):
+        raise structlog.DropEvent
+    return event_dict
+
+
+def render_lazy_event_processor(_logger: WrappedLogger, _method_name: str, event_dict: EventDict) -> EventDict:
+    """把 ``lt()`` 的延迟文案渲染成 str；挂在 shared 链最前，只有被 handler 接收的日志才会走到。"""
+    event = event_dict.get("event")
+    if isinstance(event, LazyText):
+        event_dict["event"] = str(event)
+    return event_dict
+
+
 def save_error_report_processor(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
     """
     自定义处理器：当日志级别为 error/critical/exception 时，
@@ -943,31 +964,120 @@ def log_to_history(
 
 
 def _history_popleft() -> None:
-    """淘汰最旧一条并同步字符账（左侧淘汰不动 log_seq，read_log 的 oldest 天然兼容）。"""
+    """淘汰最旧一条并同步字符账（左侧淘汰不动 log_seq，回放起点按序号计算天然兼容）。"""
     global log_history_chars
     log_history_chars -= len(log_history.popleft().gevent)
 
 
+class LogSubscriber:
+    """一个 SSE 连接的订阅：日志由写入方主动推入有界环形缓冲，读取方被事件唤醒后批量取走。
+
+    推送可能来自任意线程（线程池里打的日志），跨线程时经 ``call_soon_threadsafe`` 唤醒；
+    缓冲写满时丢弃最旧一条并累计到 ``dropped``，读取方据此向前端补发缺口提示。
+    """
+
+    def __init__(self, levels: Optional[Set[str]], maxlen: int):
+        self.levels = levels
+        self.buffer: Deque[tuple[int, LogRecord]] = deque()
+        self.maxlen = maxlen
+        self.dropped = 0
+        self.loop = asyncio.get_running_loop()
+        self.thread_id = threading.get_ident()
+        self.event = asyncio.Event()
+        self._wake_pending = False
+
+    def push(self, seq: int, record: LogRecord) -> None:
+        if self.levels is not None and record.level.lower() not in self.levels:
+            return
+        if len(self.buffer) >= self.maxlen:
+            self.buffer.popleft()
+            self.dropped += 1
+        self.buffer.append((seq, record))
+        if threading.get_ident() == self.thread_id:
+            self.event.set()
+        elif not self._wake_pending:
+            self._wake_pending = True
+            self.loop.call_soon_threadsafe(self.event.set)
+
+    def drain(self) -> tuple[List[tuple[int, LogRecord]], int]:
+        """取走缓冲中的全部日志与期间丢弃的条数（调用方需持有 _history_lock）。"""
+        self.event.clear()
+        self._wake_pending = False
+        items = list(self.buffer)
+        self.buffer.clear()
+        dropped, self.dropped = self.dropped, 0
+        return items, dropped
+
+
+# 保护 log_history / log_seq / 订阅者集合：日志可能在线程池里产生，订阅时需要与写入互斥，
+# 才能保证「回放缓冲」与「之后推送」之间既不重复也不遗漏
+_history_lock = threading.RLock()
+_log_subscribers: Set[LogSubscriber] = set()
+
+
 def _history_append(record: LogRecord) -> None:
-    """把一条日志压入 SSE 缓冲，并维持条数 / 字符数双上限。
+    """把一条日志压入 SSE 缓冲，维持条数 / 字符数双上限，并推送给所有在线订阅者。
 
-    全程同步无 await，故 log_history / log_history_chars / log_seq 三者对 read_log 永远
-    是一致快照；log_seq 只增不减（read_log 的游标是单调序号，序号回退会让在线连接静默）。
+    log_seq 只增不减（SSE 的 id 是单调序号，序号回退会让断线续传错位）。
+    推送只是往各订阅者的环形缓冲里追加一条，成本与在线连接数成正比、与空闲时长无关。
     """
     global log_seq, log_history_chars
 
-    # deque 写满时先显式 popleft：交给 maxlen 静默淘汰会漏记账，字符数只增不减
-    if len(log_history) == LOG_HISTORY_MAXLEN:
-        _history_popleft()
+    with _history_lock:
+        # deque 写满时先显式 popleft：交给 maxlen 静默淘汰会漏记账，字符数只增不减
+        if len(log_history) == LOG_HISTORY_MAXLEN:
+            _history_popleft()
+
+        log_history.append(record)
+        log_history_chars += len(record.gevent)
+        seq = log_seq
+        log_seq += 1
+
+        # 字符预算兜底（正常负载不触发）。至少保留一条：免得单条就超预算的日志把缓冲淘空，
+        # 那会让控制台回放变空——正是我们要根除的"一片空白"。
+        while log_history_chars > LOG_HISTORY_MAX_CHARS and len(log_history) > 1:
+            _history_popleft()
+
+        for sub in tuple(_log_subscribers):
+            try:
+                sub.push(seq, record)
+            except RuntimeError:
+                # 订阅者所在的事件循环已关闭
+                _log_subscribers.discard(sub)
+
 
-    log_history.append(record)
-    log_history_chars += len(record.gevent)
-    log_seq += 1
+def subscribe_logs(
+    levels: Optional[Set[str]] = None,
+    last_event_id: Optional[str] = None,
+    maxlen: int = SSE_SUBSCRIBER_BUFFER,
+) -> tuple[LogSubscriber, List[tuple[int, LogRecord]]]:
+    """注册一个日志订阅者，同时返回需要先回放的缓冲日志 ``[(序号, 日志), ...]``。
 
-    # 字符预算兜底（正常负载不触发）。至少保留一条：免得单条就超预算的日志把缓冲淘空，
-    # 那会让控制台回放变空——正是我们要根除的"一片空白"。
-    while log_history_chars > LOG_HISTORY_MAX_CHARS and len(log_history) > 1:
-        _history_popleft()
+    回放起点：``last_event_id`` 落在本进程序号区间内时从它之后续传，否则从缓冲最旧一条开始。
+    回放快照与注册在同一把锁内完成，之后产生的日志只会经订阅者缓冲送达。
+    """
+    sub = LogSubscriber(levels, maxlen)
+    with _history_lock:
+        oldest = log_seq - len(log_history)
+        cursor = oldest
+        # 只认落在**本进程**序号区间内的 id：脏值 / core 重启后 log_seq 归零而浏览器仍揣着上个
+        # 进程的大 id，都退回"从最旧回放"——否则重启后控制台永远刷不出已缓冲的启动日志。
+        if last_event_id is not None and last_event_id.isdecimal():
+            lid = int(last_event_id)  # isdecimal 保证非负且 int() 不会抛
+            if lid < log_seq:
+                cursor = max(lid + 1, oldest)
+        backlog = [
+            (seq, record)
+            for seq, record in zip(range(cursor, log_seq), list(log_history)[cursor - oldest :])
+            if levels is None or record.level.lower() in levels
+        ]
+        _log_subscribers.add(sub)
+    return sub, backlog
+
+
+def unsubscribe_logs(sub: LogSubscriber) -> None:
+    with _history_lock:
+        _log_subscribers.discard(sub)
 
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -1015,6 +1125,8 @@ def setup_logging():
     # 从配置读取
     log_config = core_config.get_config("log")
     LEVEL: str = log_config.get("level", "INFO").upper()
+    # 网页控制台实时日志缓冲的最低级别；GsCore logger 只放行 min(LEVEL, HISTORY_LEVEL) 及以上
+    HISTORY_LEVEL: str = log_config.get("history_level", "DEBUG").upper()
     logger_list: List[str] = log_config.get("output", ["stdout", "stderr", "file"])
 
     # 定义所有处理器链共享的基础部分
@@ -1028,6 +1140,7 @@ def setup_logging():
             CallsiteParameter.FUNC_NAME,
         }
     shared_processors: List[Processor] = [
+        render_lazy_event_processor,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         auto_exc_info_processor,
@@ -1076,8 +1189,10 @@ def setup_logging():
     root_logger.handlers = []  # 等效于 loguru.logger.remove()
     root_logger.setLevel(logging.INFO)  # 设置根级别
 
+    # 两端都不要的级别（默认即 TRACE）在 logger 入口就被丢弃，不再跑任何处理器链
+    history_level_num = LEVEL_NUM_MAP.get(HISTORY_LEVEL.lower(), 10)
     my_app_logger = logging.getLogger("GsCore")
-    my_app_logger.setLevel(5)  # TRACE 级别，确保全级别日志都能被收集
+    my_app_logger.setLevel(min(LEVEL_NUM_MAP.get(LEVEL.lower(), 20), history_level_num))
 
     # --- 内存收集 handler（全级别，用于 SSE 实时日志）---
     collect_processors: Sequence[Processor] = shared_processors + [
@@ -1087,7 +1202,7 @@ def setup_logging():
         log_to_history,
         structlog.processors.JSONRenderer(ensure_ascii=False),
     ]
-    collect_handler = CollectLogHandler(level=5)
+    collect_handler = CollectLogHandler(level=history_level_num)
     collect_handler.setFormatter(structlog.stdlib.ProcessorFormatter(processors=collect_processors))
     my_app_logger.addHandler(collect_handler)
 
@@ -1112,6 +1227,7 @@ def setup_logging():
     # --- 最后配置 structlog ---
     structlog.configure(
         processors=[
+            drop_below_level_processor,
             structlog.contextvars.merge_contextvars,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -1160,6 +1276,19 @@ logger: TraceCapableLogger = structlog.get_logger("GsCore")
 trace_collector = _init_trace_collector()
 
 
+def _sse_log_event(ev_id: int, record: LogRecord) -> str:
+    level_str = record.level.lower()
+    log_data = {
+        "level": level_str.upper(),
+        "message": record.gevent,
+        "message_type": "html",
+        "timestamp": record.timestamp,
+        # 来源插件（plugins/buildin_plugins 解析或 SayuCore）；前端渲染为 badge
+        "plugin": record.plugin or _CORE_ORIGIN_LABEL,
+    }
+    return f"id: {ev_id}\ndata: {json.dumps(log_data)}\n\n"
+
+
 async def read_log(
     levels: Optional[List[str]] = None,
     last_event_id: Optional[str] = None,
@@ -1173,57 +1302,43 @@ async def read_log(
         last_event_id: 上次收到的 SSE ``id:``（即 log_seq 序号）。有值则从该序号之后续传，
                避免把整个缓冲重放一遍——前端 allLogsRef 重连时不清空，重放即刷屏重复。
                无值（首次连接 / 刷新）才从缓冲最旧一条回放，好让页面立刻有历史可看。
+
+    新日志由写入方推送到本连接的订阅缓冲，这里只在被唤醒时取走，没有轮询；
+    客户端消费太慢导致缓冲溢出时，推送一条 ``message_type: gap`` 的提示，说明丢了多少条。
     """
     # 将允许的级别统一转为小写 set，便于快速匹配
     allowed_levels: Optional[Set[str]] = set(ld.lower() for ld in levels) if levels else None
-    # 按单调序号推进（非 deque 下标）：deque 有界，写满后左侧淘汰会使下标漂移，用下标会
-    # 在缓冲写满 2000 条后永久错过新日志。cursor 落后到被淘汰区间时跳到最旧可用一条。
-    cursor = log_seq - len(log_history)  # 默认：从当前缓冲最旧一条开始回放
-    # 只认落在**本进程**序号区间内的 id：脏值 / core 重启后 log_seq 归零而浏览器仍揣着上个
-    # 进程的大 id，都退回"从最旧回放"——否则游标被钉死在"只收未来日志"，重启后控制台永远
-    # 刷不出已缓冲的启动日志。断太久、断点已被淘汰的情况由循环里的 oldest 截断兜底。
-    if last_event_id is not None and last_event_id.isdecimal():
-        lid = int(last_event_id)  # isdecimal 保证非负且 int() 不会抛
-        if lid < log_seq:
-            cursor = lid + 1
-
-    last_sent = time.monotonic()
-    while True:
-        # seq/size 必须一起快照后再算下标：本协程会在下面的 yield 处挂起（等客户端收字节），
-        # 挂起期间左侧淘汰会改变 deque 长度而 log_seq 不变（序号必须单调，否则在线读者的
-        # cursor 会永久大于 log_seq 而静默）。快照后 size==0 ⇒ oldest==seq ⇒ cursor 被抬到
-        # seq ⇒ 走等待分支，不会再对空 deque 取下标。
-        seq = log_seq
-        size = len(log_history)
-        oldest = seq - size
-        if cursor < oldest:
-            cursor = oldest  # 落后到已淘汰区间，跳到最旧可用一条
-        if cursor < seq:
-            record = log_history[size - (seq - cursor)]
-            ev_id = cursor  # 这条日志的单调序号，随 SSE id: 回传给浏览器
-            cursor += 1
-            level_str = record.level.lower()
-            if allowed_levels is not None and level_str not in allowed_levels:
-                continue  # 被级别过滤：不产出字节，故意不刷新 last_sent（否则心跳会饿死）
-            log_data = {
-                "level": level_str.upper(),
-                "message": record.gevent,
-                "message_type": "html",
-                "timestamp": record.timestamp,
-                # 来源插件（plugins/buildin_plugins 解析或 SayuCore）；前端渲染为 badge
-                "plugin": getattr(record, "plugin", None) or _CORE_ORIGIN_LABEL,
-            }
-            yield f"id: {ev_id}\ndata: {json.dumps(log_data)}\n\n"
-            last_sent = time.monotonic()
-            continue
+    sub, backlog = subscribe_logs(allowed_levels, last_event_id, SSE_SUBSCRIBER_BUFFER)
+    try:
+        for ev_id, record in backlog:
+            yield _sse_log_event(ev_id, record)
+        del backlog
 
-        await asyncio.sleep(1)
-        # 心跳按"上次流出字节"计时，而非按空闲轮次：级别过滤下日志可以一直在消费却一条都
-        # 不推（如只订阅 ERROR 而满屏 DEBUG），零字节同样会被反代（nginx 默认 60s）掐断。
-        # 以 ":" 开头的是 SSE 注释行，EventSource 会忽略，不进 onmessage。
-        if time.monotonic() - last_sent >= SSE_KEEPALIVE_SEC:
-            yield ": keepalive\n\n"
-            last_sent = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(sub.event.wait(), SSE_KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                # 以 ":" 开头的是 SSE 注释行，EventSource 会忽略，不进 onmessage；
+                # 防止长时间无日志（或全被级别过滤）时被反代（nginx 默认 60s）掐断
+                yield ": keepalive\n\n"
+                continue
+
+            with _history_lock:
+                items, dropped = sub.drain()
+            if dropped:
+                gap = {
+                    "level": "WARNING",
+                    "message": t("log.logger.sse_gap", count=dropped),
+                    "message_type": "gap",
+                    "timestamp": datetime.datetime.now().strftime("%m-%d %H:%M:%S"),
+                    "plugin": _CORE_ORIGIN_LABEL,
+                    "dropped": dropped,
+                }
+                yield f"data: {json.dumps(gap)}\n\n"
+            for ev_id, record in items:
+                yield _sse_log_event(ev_id, record)
+    finally:
+        unsubscribe_logs(sub)
 
 
 async def clean_log() -> None:
@@ -1249,7 +1364,7 @@ async def clean_trace_collector():
             if collector is not None:
                 dropped = collector.reclaim_stale()
                 if dropped:
-                    logger.debug(t("log.logger.trace_scheduled_reclamation_removed_delete", dropped=dropped))
+                    logger.debug(lt("log.logger.trace_scheduled_reclamation_removed_delete", dropped=dropped))
         except Exception as e:
             logger.warning(t("log.logger.tracecollector_exception", e=e))
 
@@ -1266,57 +1381,5 @@ def handle_exceptions(async_function):
     return wrapper
 
 
-class LogEntry(TypedDict):
-    """单条已解析的历史日志条目。
-
-    id / 时间 / 日志等级 / 内容 四个键由 get_parse_logs 解析时必然写入；
-    来源、_date 为可选键，由调用方（如日志 API）按需补充。
-    """
-
-    id: int
-    时间: str
-    日志等级: str
-    内容: object
-    来源: NotRequired[str]
-    _date: NotRequired[str]
-
-
-class HistoryLogData:
-    def __init__(self):
-        self.log_list: Dict[str, List[LogEntry]] = {}
-
-    async def get_parse_logs(self, log_file_path: Path) -> List[LogEntry]:
-        if log_file_path.name in self.log_list:
-            return self.log_list[log_file_path.name]
-
-        log_entries: List[LogEntry] = []
-
-        async with aiofiles.open(log_file_path, "r", encoding="utf-8") as file:
-            lines = await file.readlines()
-
-        current_entry: Optional[LogEntry] = None
-
-        _id = 1
-        for line in lines:
-            ev: Dict[str, str] = json.loads(line.strip())
-
-            if current_entry:
-                log_entries.append(current_entry)
-            current_entry = {
-                "id": _id,
-                "时间": ev["timestamp"],
-                "日志等级": ev["level"].upper(),
-                # '模块': ev['pathname'],
-                "内容": ev["event"],
-            }
-            _id += 1
-
-        if current_entry:
-            log_entries.append(current_entry)
-
-        self.log_list[log_file_path.name] = log_entries
-        return log_entries
-
-
 def get_all_log_path():
     return [file for file in LOG_PATH.iterdir() if file.is_file() and file.suffix == ".log"]
@@ -11,7 +11,7 @@ import importlib
 from types import ModuleType
 from typing import Dict
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 
@@ -37,7 +37,7 @@ def register_meta_plugin(provides: str, module: ModuleType, plugin_name: str) ->
     _PROVIDES_TO_MODULE[provides] = module
     _PLUGIN_TO_PROVIDES[plugin_name] = provides
     _install_aliases(plugin_name, module)
-    logger.debug(t("log.server.meta_plugin_register", plugin_name=plugin_name, provides=provides))
+    logger.debug(lt("log.server.meta_plugin_register", plugin_name=plugin_name, provides=provides))
 
 
 def _install_aliases(plugin_name: str, api_module: ModuleType) -> None:
@@ -62,7 +62,7 @@ def unregister_meta_plugin(plugin_name: str) -> None:
     provides = _PLUGIN_TO_PROVIDES.pop(plugin_name, None)
     if provides is not None:
         _PROVIDES_TO_MODULE.pop(provides, None)
-        logger.debug(t("log.server.meta_plugin_unregister", plugin_name=plugin_name, provides=provides))
+        logger.debug(lt("log.server.meta_plugin_unregister", plugin_name=plugin_name, provides=provides))
 
 
 def require(provides: str) -> ModuleType:
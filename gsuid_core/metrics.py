@@ -0,0 +1,373 @@
+"""进程内运行指标：低开销的直方图 / 计数器，按 Prometheus 文本格式导出。
+
+热路径上的一次观测只做「取本线程分片 → 二分定桶 → 两次自增」，不加锁：
+
+- 每个线程（即每个事件循环 / 线程池 worker）首次观测时登记一份自己的分片，
+  之后只写自己的分片，不存在并发写；线程退出后其分片在下次登记或抓取时并入汇总，不会无限累积；
+- 抓取时把各分片逐桶相加。读与写不同步，单次抓取里 ``_count`` 与各桶之和可能差
+  几个在途观测，下一次抓取即追平，对 Prometheus 的累计计数语义无影响。
+
+各模块直接 import 下面定义好的指标对象打点；``/metrics`` 路由见
+``gsuid_core/webconsole/metrics_api.py``，已有模块的 stats 字典通过 ``register_gauge``
+在抓取时读取。本模块只依赖标准库，任何位置都可以安全 import。
+"""
+
+import math
+import time
+import asyncio
+import weakref
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple, Union, Mapping, Callable, Iterator, Optional, Sequence
+from contextlib import contextmanager
+
+Labels = Tuple[str, ...]
+GaugeValue = Union[float, Mapping[Labels, float]]
+
+# 秒；覆盖 0.5ms 的内存操作到分钟级的 LLM 调用
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+# 事件循环延迟监测的采样间隔（秒）
+LOOP_LAG_INTERVAL = 0.5
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _label_str(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _add_cells(total: Dict[Labels, List[Any]], shard: Dict[Labels, List[Any]]) -> None:
+    for labels, cell in list(shard.items()):
+        acc = total.get(labels)
+        if acc is None:
+            total[labels] = list(cell)
+        else:
+            for i, n in enumerate(cell):
+                acc[i] += n
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        # 各线程的 (线程弱引用, 分片)；登记与回收在锁内，热路径只写本线程分片、不加锁
+        self._shards: List[Tuple["weakref.ref[threading.Thread]", Dict[Labels, List[Any]]]] = []
+        # 已退出线程的分片并入这里，累计值不丢
+        self._retired: Dict[Labels, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> Dict[Labels, List[Any]]:
+        cells: Dict[Labels, List[Any]] = {}
+        self._local.cells = cells
+        with self._lock:
+            self._reap()
+            self._shards.append((weakref.ref(threading.current_thread()), cells))
+        return cells
+
+    def _reap(self) -> None:
+        """把已退出线程的分片并入 ``_retired``（线程已退出，不会再写）；需持有锁。"""
+        alive = []
+        for ref, shard in self._shards:
+            thread = ref()
+            if thread is not None and thread.is_alive():
+                alive.append((ref, shard))
+            else:
+                _add_cells(self._retired, shard)
+        self._shards = alive
+
+    def _merged(self, width: int) -> Dict[Labels, List[Any]]:
+        # 无标签的指标即使尚无观测也输出一组 0，面板不必区分「没数据」与「没打点」
+        merged: Dict[Labels, List[Any]] = {} if self.labelnames else {(): [0] * (width - 1) + [0.0]}
+        with self._lock:
+            self._reap()
+            _add_cells(merged, self._retired)
+            for _, shard in self._shards:
+                _add_cells(merged, shard)
+        return merged
+
+    def clear(self) -> None:
+        with self._lock:
+            self._retired.clear()
+            for _, shard in self._shards:
+                shard.clear()
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._new_shard()
+        cell = cells.get(labels)
+        if cell is None:
+            cells[labels] = [amount]
+        else:
+            cell[0] += amount
+
+    def value(self, *labels: str) -> float:
+        cell = self._merged(1).get(labels)
+        return cell[0] if cell else 0.0
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}_total{_label_str(self.labelnames, labels)} {_fmt(cell[0])}"
+            for labels, cell in sorted(self._merged(1).items())
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, doc, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 分片单元：各桶（末位为 +Inf）的非累计计数 + 观测值之和
+        self._width = len(self.buckets) + 2
+
+    def observe(self, value: float, *labels: str) -> None:
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._new_shard()
+        cell = cells.get(labels)
+        if cell is None:
+            cell = cells[labels] = [0] * (self._width - 1) + [0.0]
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def snapshot(self, *labels: str) -> Tuple[List[int], float]:
+        """返回 (各桶累计计数（末位即总数）, 观测值之和)。"""
+        cell = self._merged(self._width).get(labels)
+        if cell is None:
+            return [0] * (self._width - 1), 0.0
+        cumulative: List[int] = []
+        running = 0
+        for n in cell[:-1]:
+            running += n
+            cumulative.append(running)
+        return cumulative, cell[-1]
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        bounds = self.buckets + (math.inf,)
+        for labels, cell in sorted(self._merged(self._width).items()):
+            running = 0
+            for bound, n in zip(bounds, cell[:-1]):
+                running += n
+                le = _label_str(self.labelnames, labels, f'le="{_fmt(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {running}")
+            label_str = _label_str(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_fmt(cell[-1])}")
+            lines.append(f"{self.name}_count{label_str} {running}")
+        return lines
+
+
+class _Gauge:
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        func: Callable[[], GaugeValue],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.doc = doc
+        self.func = func
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        value = self.func()
+        if not isinstance(value, Mapping):
+            return [f"{self.name} {_fmt(float(value))}"]
+        return [
+            f"{self.name}{_label_str(self.labelnames, labels)} {_fmt(float(v))}" for labels, v in sorted(value.items())
+        ]
+
+
+_registry: Dict[str, Union[_Metric, _Gauge]] = {}
+
+
+def histogram(
+    name: str,
+    doc: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS,
+) -> Histogram:
+    """注册直方图；同名已注册时取回已有对象（沿用已累计的数据）。"""
+    metric = _registry.get(name)
+    if not isinstance(metric, Histogram):
+        metric = _registry[name] = Histogram(name, doc, labelnames, buckets)
+    return metric
+
+
+def counter(name: str, doc: str, labelnames: Sequence[str] = ()) -> Counter:
+    metric = _registry.get(name)
+    if not isinstance(metric, Counter):
+        metric = _registry[name] = Counter(name, doc, labelnames)
+    return metric
+
+
+def register_gauge(
+    name: str,
+    doc: str,
+    func: Callable[[], GaugeValue],
+    labelnames: Sequence[str] = (),
+) -> None:
+    """注册抓取时才求值的 gauge；``func`` 返回单个数值或 {标签值元组: 数值}。"""
+    _registry[name] = _Gauge(name, doc, func, labelnames)
+
+
+def render_metrics() -> str:
+    """按 Prometheus 文本格式（0.0.4）导出全部指标；单个 gauge 求值失败时跳过它。"""
+    out: List[str] = []
+    for name in sorted(_registry):
+        metric = _registry[name]
+        try:
+            lines = metric.render()
+        except Exception:
+            continue
+        out.append(f"# HELP {name} {_escape(metric.doc)}")
+        out.append(f"# TYPE {name} {metric.kind}")
+        out.extend(lines)
+    return "\n".join(out) + "\n"
+
+
+# ── 框架内置指标 ──
+RECEIVE_DISPATCH_SECONDS = histogram(
+    "gscore_receive_dispatch_seconds",
+    "WS 帧入接收队列到开始分发的等待时间",
+    ("pipeline",),
+)
+HANDLER_SECONDS = histogram(
+    "gscore_handler_seconds",
+    "触发器处理函数的执行时间",
+    ("handler",),
+)
+HANDLER_QUEUE_SECONDS = histogram(
+    "gscore_handler_queue_seconds",
+    "触发器任务在 _Bot 执行队列中的等待时间",
+)
+SEND_QUEUE_SECONDS = histogram(
+    "gscore_send_queue_seconds",
+    "出站帧在发送 lane 中的等待时间",
+)
+SEND_SECONDS = histogram(
+    "gscore_send_seconds",
+    "单个出站帧的发送耗时",
+)
+SEND_FAILURES = counter(
+    "gscore_send_failures",
+    "发送失败的出站帧数",
+)
+DB_SESSION_WAIT_SECONDS = histogram(
+    "gscore_db_session_wait_seconds",
+    "with_session 等待 SQLite 并发信号量的时间",
+)
+RENDER_SECONDS = histogram(
+    "gscore_render_seconds",
+    "html_render 在工作池中的渲染耗时（不含缓存命中）",
+)
+ENCODE_SECONDS = histogram(
+    "gscore_image_encode_seconds",
+    "出站图片编码耗时（不含缓存命中）",
+    ("format",),
+)
+EMBEDDING_SECONDS = histogram(
+    "gscore_embedding_seconds",
+    "文本嵌入调用耗时",
+    ("provider",),
+)
+EMBEDDING_BATCH_SIZE = histogram(
+    "gscore_embedding_batch_size",
+    "嵌入服务每次调用底层 provider 的文本条数（single 为合批后的单条请求）",
+    ("path",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+EMBEDDING_QUEUE_SECONDS = histogram(
+    "gscore_embedding_queue_seconds",
+    "单条嵌入请求在合批队列中的等待时间",
+)
+EMBEDDING_CACHE = counter(
+    "gscore_embedding_cache",
+    "嵌入服务缓存查询次数（hit 含同批去重）",
+    ("result",),
+)
+LLM_SECONDS = histogram(
+    "gscore_llm_seconds",
+    "一轮 AI Agent 对话的端到端延迟",
+)
+LOOP_LAG_SECONDS = histogram(
+    "gscore_event_loop_lag_seconds",
+    "事件循环调度延迟（定时唤醒的实际超时量）",
+)
+
+_last_loop_lag = 0.0
+register_gauge("gscore_event_loop_lag_last_seconds", "最近一次采样的事件循环调度延迟", lambda: _last_loop_lag)
+
+
+async def monitor_event_loop_lag(interval: Optional[float] = None) -> None:
+    """按固定间隔 sleep，把实际唤醒时间超出预期的部分记为事件循环延迟。"""
+    global _last_loop_lag
+    loop = asyncio.get_running_loop()
+    while True:
+        step = interval or LOOP_LAG_INTERVAL
+        start = loop.time()
+        await asyncio.sleep(step)
+        _last_loop_lag = max(0.0, loop.time() - start - step)
+        LOOP_LAG_SECONDS.observe(_last_loop_lag)
@@ -3,7 +3,7 @@ import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Literal, Optional, Awaitable
 from dataclasses import dataclass
 
-from msgspec import Struct
+from msgspec import Struct, structs
 
 if TYPE_CHECKING:
     pass
@@ -202,6 +202,15 @@ class Event(MessageReceive):
         """便捷读取 meta 事件数据；非 meta 事件 meta_event_data 为空 dict，返回 default。"""
         return self.meta_event_data.get(key, default)
 
+    def fork(self, **changes: Any) -> "Event":
+        """派生处理器私有视图，替代分发时的 ``deepcopy``。
+
+        只做一次浅拷贝：``command`` / ``text`` / ``regex_group`` / ``task_id`` 等
+        触发器派生的标量字段在视图上各自独立，``content`` / ``image_list`` / ``sender``
+        等容器与原事件共享、不复制。分发后原事件视为只读，处理器如需改容器请先自行拷贝。
+        """
+        return structs.replace(self, **changes)
+
 
 class MessageSend(Struct):
     bot_id: str = "Bot"
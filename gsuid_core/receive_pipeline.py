@@ -0,0 +1,230 @@
+"""WS 连接的并发接收管线。
+
+原先 WS 接收循环里 ``await handle_event(...)`` 是内联执行的：任何一个慢的前置步骤
+（数据库、历史入库、AI 路由）都会卡住同一适配器连接后续的全部帧。
+这里把「收帧」和「分发」拆开：
+
+- 接收循环只做解码与撤回回执拦截，然后 ``submit`` 进有界队列；
+- 队列按会话键分成多条 lane，同一会话严格按到达顺序处理，不同会话由
+  ``workers`` 个分发协程并行处理；
+- 队列满时按 ``policy`` 施加背压：``block`` 暂停收帧（背压传回适配器），
+  ``drop`` 丢弃新帧，``oldest`` 淘汰最早入队且尚未处理的帧；
+- 连接断开时 ``stop`` 先在 ``STOP_DRAIN_TIMEOUT`` 内处理完已接收的帧，超时剩余的计入 ``dropped``。
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+from typing import Any, Dict, Tuple, Literal, Callable, Optional, Awaitable
+from collections import deque
+
+from gsuid_core.i18n import t
+from gsuid_core.logger import logger
+from gsuid_core.models import MessageReceive
+from gsuid_core.metrics import RECEIVE_DISPATCH_SECONDS
+
+QueuePolicy = Literal["block", "drop", "oldest"]
+# 断开时等待已收帧处理完的最长时间（秒），超时后剩余帧计入 dropped 并记录日志
+STOP_DRAIN_TIMEOUT = 10.0
+LaneKey = Tuple[str, str, str]
+
+
+def lane_key(msg: MessageReceive) -> LaneKey:
+    """会话键：群聊按群、私聊按用户，与 ``Event.session_id`` 的粒度一致。"""
+    if msg.user_type == "direct":
+        return (msg.bot_id, msg.bot_self_id, f"private:{msg.user_id}")
+    return (msg.bot_id, msg.bot_self_id, f"group:{msg.group_id or '0'}")
+
+
+class _Item:
+    __slots__ = ("msg", "lane", "done", "enqueued")
+
+    def __init__(self, msg: MessageReceive, lane: LaneKey) -> None:
+        self.msg = msg
+        self.lane = lane
+        self.enqueued = time.perf_counter()
+        # 已被 worker 取走或已被淘汰
+        self.done = False
+
+
+class ReceivePipeline:
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[MessageReceive], Awaitable[Any]],
+        workers: int = 4,
+        capacity: int = 1000,
+        policy: QueuePolicy = "block",
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.capacity = max(1, capacity)
+        self.policy: QueuePolicy = policy
+
+        self._lanes: Dict[LaneKey, deque[_Item]] = {}
+        # 就绪 lane：有待处理帧且当前没有 worker 持有
+        self._ready: asyncio.Queue[LaneKey] = asyncio.Queue()
+        # 全局到达顺序，仅 oldest 策略用来定位最早帧；已处理/已丢弃的条目惰性清理
+        self._fifo: deque[_Item] = deque()
+        self._pending = 0
+        # 正在执行 handler 的帧数；与 _pending 同为 0 时 _idle 置位
+        self._active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._space = asyncio.Condition()
+        self._tasks: list[asyncio.Task] = []
+
+        self.received = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.failed = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = STOP_DRAIN_TIMEOUT) -> None:
+        """停止分发：先在 ``timeout`` 秒内处理完已入队的帧，超时则取消并记录丢弃数。"""
+        if self._tasks and timeout > 0:
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        discarded = self._pending + self._active
+        if discarded:
+            self.dropped += discarded
+            logger.warning(t("log.core.receive_stop_discarded", name=self.name, count=discarded, timeout=timeout))
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._lanes.clear()
+        self._fifo.clear()
+        self._pending = 0
+        self._idle.set()
+
+    async def submit(self, msg: MessageReceive) -> bool:
+        """入队一帧；返回 False 表示按 ``drop`` 策略丢弃了该帧。"""
+        self.received += 1
+        if self._pending >= self.capacity:
+            if self.policy == "drop":
+                self._on_drop(msg)
+                return False
+            elif self.policy == "oldest":
+                self._evict_oldest()
+            else:
+                async with self._space:
+                    await self._space.wait_for(lambda: self._pending < self.capacity)
+
+        key = lane_key(msg)
+        item = _Item(msg, key)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            self._ready.put_nowait(key)
+        lane.append(item)
+        if self.policy == "oldest":
+            self._fifo.append(item)
+            if len(self._fifo) > self.capacity * 2:
+                self._fifo = deque(i for i in self._fifo if not i.done)
+        self._pending += 1
+        self._idle.clear()
+        self.max_depth = max(self.max_depth, self._pending)
+        return True
+
+    def _evict_oldest(self) -> None:
+        while self._fifo:
+            item = self._fifo.popleft()
+            if item.done:
+                continue
+            self._lanes[item.lane].remove(item)
+            item.done = True
+            self._pending -= 1
+            self._on_drop(item.msg)
+            if not self._pending and not self._active:
+                self._idle.set()
+            return
+
+    def _on_drop(self, msg: MessageReceive) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 100 == 0:
+            logger.warning(
+                t(
+                    "log.core.receive_queue_full",
+                    name=self.name,
+                    policy=self.policy,
+                    capacity=self.capacity,
+                    dropped=self.dropped,
+                )
+            )
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes.get(key)
+            # 逐帧处理并在 lane 空时归还：同一 lane 任一时刻只被一个 worker 持有
+            while lane:
+                item = lane.popleft()
+                item.done = True
+                self._pending -= 1
+                RECEIVE_DISPATCH_SECONDS.observe(time.perf_counter() - item.enqueued, self.name)
+                if self.policy == "block":
+                    async with self._space:
+                        self._space.notify_all()
+                self._active += 1
+                try:
+                    await self.handler(item.msg)
+                    self.dispatched += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.failed += 1
+                    logger.exception(t("log.core.receive_dispatch_fail", name=self.name))
+                finally:
+                    self._active -= 1
+            self._lanes.pop(key, None)
+            if not self._pending and not self._active:
+                self._idle.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "policy": self.policy,
+            "depth": self._pending,
+            "lanes": len(self._lanes),
+            "max_depth": self.max_depth,
+            "received": self.received,
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+_PIPELINES: Dict[str, ReceivePipeline] = {}
+
+
+def register_pipeline(pipeline: ReceivePipeline) -> None:
+    _PIPELINES[pipeline.name] = pipeline
+
+
+def unregister_pipeline(pipeline: ReceivePipeline) -> None:
+    if _PIPELINES.get(pipeline.name) is pipeline:
+        _PIPELINES.pop(pipeline.name, None)
+
+
+def get_pipeline(name: str) -> Optional[ReceivePipeline]:
+    return _PIPELINES.get(name)
+
+
+def pipeline_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: p.stats() for name, p in _PIPELINES.items()}
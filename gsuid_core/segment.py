@@ -10,13 +10,14 @@ from pathlib import Path
 import msgspec
 from PIL import Image
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.models import Message
 from gsuid_core.data_store import image_res
 from gsuid_core.global_val import get_global_val
 from gsuid_core.load_template import markdown_templates, markdown_templates_by_bot
 from gsuid_core.message_models import Button, ButtonList
 from gsuid_core.utils.image.convert import text2pic
+from gsuid_core.utils.image.encoder import image_budget, fit_image_bytes, encode_image_sync
 from gsuid_core.utils.image.image_tools import sget
 from gsuid_core.utils.plugins_config.gs_config import (
     bm_config,
@@ -93,10 +94,7 @@ class MessageSegment:
     @staticmethod
     def image(img: Union[str, Image.Image, bytes, Path]) -> Message:
         if isinstance(img, Image.Image):
-            img = img.convert("RGB")
-            result_buffer = BytesIO()
-            img.save(result_buffer, format="PNG", quality=pic_quality, subsampling=0)
-            img = result_buffer.getvalue()
+            img = encode_image_sync(img)
         elif isinstance(img, bytes):
             pass
         elif isinstance(img, Path):
@@ -325,17 +323,24 @@ async def _convert_message_to_image(message: Message, bot_id: str, bot_self_id:
         return []
 
     send_type = send_pic_config.get_config(bot_id, "base64").data
+    max_bytes, allow_webp = image_budget(bot_id)
     image_b64 = None
+    # 已按本平台预算编码过的图片不再二次压缩
+    fitted = False
 
     if message.type == "text" and is_text2pic:
-        image_bytes = await text2pic(message.data)
+        image_bytes = await text2pic(message.data, bot_id=bot_id)
         message = Message(type="image", data=image_bytes)
+        fitted = True
 
     if message.type == "image":
         local_val = await get_global_val(bot_id, bot_self_id)
         local_val["image"] += 1
         img: Union[bytes, str] = message.data  # type: ignore
         if isinstance(img, str) and img.startswith("base64://"):
+            if send_type == "base64" and (not max_bytes or (len(img) - 9) * 3 // 4 <= max_bytes):
+                # 已是目标格式（如广播预转换过的消息），免去解码再编码
+                return [Message(type="image", data=img)]
             image_b64 = img
             image_bytes = b64decode(img[9:])
         elif isinstance(img, str) and img.startswith("link://"):
@@ -357,6 +362,13 @@ async def _convert_message_to_image(message: Message, bot_id: str, bot_self_id:
 
     assert isinstance(image_bytes, bytes)
 
+    if max_bytes and not fitted and len(image_bytes) > max_bytes:
+        # 插件交来的是不知道发送目标时编码的字节（未传 convert_img 的 bot_id）：
+        # 超出该平台的图片大小上限时只能解码后重新编码
+        image_bytes = await fit_image_bytes(image_bytes, max_bytes, allow_webp)
+        image_b64 = None
+        message = Message(type="image", data=image_bytes)
+
     if send_type == "base64":
         return [Message(type="image", data=image_b64)] if image_b64 else [MessageSegment.image(image_bytes)]
 
@@ -454,7 +466,7 @@ async def markdown_to_template_markdown(
                 if _t:
                     t_values = list(_t.values())[-1]
 
-                    logger.debug(t("log.segment.gscore_send_md_template_sending", p0=t_values[0]))
+                    logger.debug(lt("log.segment.gscore_send_md_template_sending", p0=t_values[0]))
                     logger.debug(t_values[1])
 
                     _message.extend(
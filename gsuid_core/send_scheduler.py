@@ -0,0 +1,127 @@
+"""_Bot 出站发送调度：按目标分片的发送 lane。
+
+原先每个 _Bot 只有一个串行发送 worker，所有群/私聊的出站帧排在同一条队列里，
+某个群的一张大图上传慢，就会拖住其他群的文字回复。这里改为：
+
+- 按 ``(target_type, target_id)`` 分 lane，同一目标严格按入队顺序发送
+  （消息、禁言、撤回之间的相对顺序不变）；
+- 不同目标并行发送，总并发受 ``concurrency`` 限制；
+- 同一目标两次发送之间至少间隔 ``target_interval`` 秒；
+- 连接断开时 lane 挂起等待 ``start()``（重连），不轮询、不丢帧。
+"""
+
+import time
+import asyncio
+from typing import Any, Dict, Deque, Tuple, Callable, Optional, Coroutine
+from collections import deque
+
+from gsuid_core.i18n import t
+from gsuid_core.logger import logger
+from gsuid_core.metrics import SEND_SECONDS, SEND_FAILURES, SEND_QUEUE_SECONDS
+
+SendKey = Tuple[str, Optional[str]]
+# 待发送的帧与其入队时刻（perf_counter）
+_Pending = Tuple[Coroutine[Any, Any, Any], float]
+
+
+class SendScheduler:
+    def __init__(
+        self,
+        is_connected: Callable[[], bool],
+        concurrency: int = 8,
+        target_interval: float = 0.0,
+    ) -> None:
+        self.is_connected = is_connected
+        self.concurrency = max(1, concurrency)
+        self.target_interval = target_interval
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._lanes: Dict[SendKey, Deque[_Pending]] = {}
+        self._tasks: Dict[SendKey, asyncio.Task] = {}
+        # 置位 = 连接可用；断连时清除，lane 在此等待重连
+        self._online = asyncio.Event()
+
+        self.sent = 0
+        self.failed = 0
+
+    @property
+    def depth(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def start(self) -> None:
+        """连接（重新）可用：唤醒挂起的 lane，并为断连期间积压的目标补建 lane 任务。"""
+        self._online.set()
+        for key, lane in self._lanes.items():
+            if lane:
+                self._spawn(key)
+
+    async def stop(self) -> None:
+        """断连：取消全部 lane 任务（在途的那一帧随之取消），未发送的帧保留到下次 ``start``。"""
+        self._online.clear()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear(self) -> None:
+        """丢弃全部未发送的帧。"""
+        for lane in self._lanes.values():
+            for coro, _ in lane:
+                coro.close()
+            lane.clear()
+        self._lanes.clear()
+
+    def submit(self, key: SendKey, coro: Coroutine[Any, Any, Any]) -> None:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+        lane.append((coro, time.perf_counter()))
+        self._spawn(key)
+
+    def _spawn(self, key: SendKey) -> None:
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._run_lane(key))
+
+    async def _run_lane(self, key: SendKey) -> None:
+        # 任务被调度前 lane 可能已被 clear()
+        lane = self._lanes.get(key) or deque()
+        try:
+            while lane:
+                if not self._online.is_set():
+                    await self._online.wait()
+                    continue
+                async with self._sem:
+                    if not self.is_connected():
+                        # ws 已失效但 disconnect 尚未走到：挂起全部 lane，等重连后的 start()
+                        logger.warning(t("log.bot.ws_not_connected_pending"))
+                        self._online.clear()
+                        continue
+                    coro, enqueued = lane.popleft()
+                    start = time.perf_counter()
+                    SEND_QUEUE_SECONDS.observe(start - enqueued)
+                    try:
+                        await coro
+                        self.sent += 1
+                    except Exception as e:
+                        self.failed += 1
+                        SEND_FAILURES.inc()
+                        logger.exception(t("log.bot.send_task_fail", error=e))
+                    finally:
+                        SEND_SECONDS.observe(time.perf_counter() - start)
+                # 间隔期间 lane 任务仍然存活，期间新入队的帧由本任务继续发送
+                if self.target_interval > 0:
+                    await asyncio.sleep(self.target_interval)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+            if not lane and self._lanes.get(key) is lane:
+                del self._lanes[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "lanes": len(self._lanes),
+            "active": len(self._tasks),
+            "concurrency": self.concurrency,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
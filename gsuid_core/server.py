@@ -27,7 +27,7 @@ except ImportError:
 
 
 from gsuid_core.bot import _Bot
-from gsuid_core.i18n import t, discover_and_register_plugin_locales
+from gsuid_core.i18n import t, lt, discover_and_register_plugin_locales
 from gsuid_core.config import core_config, plugin_config_store
 from gsuid_core.logger import logger, hl_plugin
 from gsuid_core.gs_logger import GsLogger
@@ -381,8 +381,8 @@ class GsServer:
         if plugin.stem.startswith("_"):
             return f'插件{plugin.name}包含"_", 跳过加载!'
 
-        logger.debug(t("log.server.importing_plugin", stem=hl_plugin(plugin.stem)))
-        logger.trace(t("log.server.plugin_import_separator"))
+        logger.debug(lt("log.server.importing_plugin", stem=hl_plugin(plugin.stem)))
+        logger.trace(lt("log.server.plugin_import_separator"))
         try:
             # 插件一等公民 i18n：在 import 前摄入 plugins/<Name>/locales/
             # 词条不得进入框架 gsuid_core/locales，仅运行时合并。
@@ -390,7 +390,7 @@ class GsServer:
                 n_loc = discover_and_register_plugin_locales(plugin, plugin.stem)
                 if n_loc:
                     logger.debug(
-                        t(
+                        lt(
                             "log.server.plugin_locales_loaded",
                             name=hl_plugin(plugin.stem),
                             count=n_loc,
@@ -456,7 +456,7 @@ class GsServer:
         if module_name in sys.modules:
             module = sys.modules[module_name]
             _module_cache[module_name] = module
-            logger.trace(t("log.server.module_cached", stem=filepath.parent.stem))
+            logger.trace(lt("log.server.module_cached", stem=filepath.parent.stem))
             return module
 
         start_time = time.time()
@@ -488,7 +488,7 @@ class GsServer:
         else:
             name = filepath.parent.stem
             if _type != "full":
-                logger.trace(t("log.server.module_imported", name=hl_plugin(name), duration=duration))
+                logger.trace(lt("log.server.module_imported", name=hl_plugin(name), duration=duration))
         _import_durations.append((name, duration))
 
         _module_cache[module_name] = module
@@ -594,13 +594,8 @@ class GsServer:
             # 若断连超过 5 分钟或 _disconnected_at 异常为 None，丢弃旧实例避免内存泄漏
             if disconnected_at is None or time.time() - disconnected_at > 300:
                 logger.warning(t("log.server.bot_timeout_recreate", bot_id=bot_id))
-                # 先 cancel 旧 send_task，防止孤儿 Task 持续运行
-                if bot._send_task and not bot._send_task.done():
-                    bot._send_task.cancel()
-                    try:
-                        await bot._send_task
-                    except asyncio.CancelledError:
-                        pass
+                # 先停掉旧实例的发送 lane，防止孤儿 Task 持续运行
+                await bot.stop_send_worker()
                 bot.clear_send_queue()  # 丢弃旧实例前清空队列，避免消息泄漏
                 bot = _Bot(bot_id, websocket)
                 bot.start_send_worker()
@@ -617,7 +612,7 @@ class GsServer:
         else:
             # 首次连接：新建 Bot
             bot = _Bot(bot_id, websocket)
-            bot.start_send_worker()  # 启动独立的发送 worker，串行化 WebSocket 写入
+            bot.start_send_worker()  # 启动按目标分 lane 的发送调度
             self.active_bot[bot_id] = bot
             logger.info(t("log.server.bot_first", bot_id=bot_id))
 
@@ -645,7 +640,7 @@ class GsServer:
         """断开 Bot 连接并清理相关资源。
 
         修复要点：
-        1. 取消 _send_task，防止孤儿协程持续占用内存
+        1. 挂起发送 lane，防止孤儿协程持续占用内存
         2. 清理 Bot.instances / mutiply_instances / mutiply_map 中属于该 bot_id 的条目
         3. 保留 Bot 实例在 active_bot 中，以便重连时复用（避免消息丢失）
         """
@@ -671,15 +666,9 @@ class GsServer:
         if bot_id in self.active_bot:
             bot = self.active_bot[bot_id]
 
-            # 1. 取消发送 worker，防止孤儿 Task
-            if bot._send_task and not bot._send_task.done():
-                bot._send_task.cancel()
-                try:
-                    await bot._send_task
-                except asyncio.CancelledError:
-                    pass
-            bot._send_task = None
-            bot.bot = None  # 标记 ws 已断开，send_worker 重启前不会发送
+            # 1. 挂起发送 lane，防止孤儿 Task；未发送的消息保留到重连
+            await bot.stop_send_worker()
+            bot.bot = None  # 标记 ws 已断开，start_send_worker 前不会发送
             bot._disconnected_at = time.time()
 
             # 2. 取消所有后台任务并等待其真正结束
@@ -765,7 +754,7 @@ def check_pyproject(pyproject: Path):
         dependencies = toml_data["project"].get("dependencies", [])
         sp_dep = toml_data["project"].get("gscore_auto_update_dep", [])
         if sp_dep:
-            logger.debug(t("log.server.special_dep_header"))
+            logger.debug(lt("log.server.special_dep_header"))
             logger.debug(sp_dep)
             process_dependencies(sp_dep, update=True)
 
@@ -795,7 +784,7 @@ def check_pyproject(pyproject: Path):
                     dependencies.append(f"{k}{v}")
 
     if dependencies:
-        logger.trace(t("log.server.deps_found", dependencies=dependencies))
+        logger.trace(lt("log.server.deps_found", dependencies=dependencies))
         process_dependencies(dependencies, update=auto_update_dep)
 
 
@@ -835,7 +824,7 @@ def process_dependencies(dependency_list: List[str], update: bool = False):
                     )
                     _pending_update.append(dep_str)
                 else:
-                    logger.trace(t("log.server.dep_satisfied", req_name=req_name, installed_ver=installed_ver))
+                    logger.trace(lt("log.server.dep_satisfied", req_name=req_name, installed_ver=installed_ver))
 
         except Exception as e:
             logger.warning(t("log.server.dep_parse_fail", dep_str=dep_str, error=e))
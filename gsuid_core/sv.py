@@ -8,23 +8,67 @@ from pathlib import Path
 from functools import wraps
 
 from gsuid_core.bot import Bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.config import core_config, plugins_sample, plugin_config_store
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.trigger import Trigger
 
 
+class _VersionedDict(dict):
+    """增删条目时让 SVList.version 自增，供 trigger_index 判定是否需要重建。"""
+
+    def __init__(self, owner: "SVList"):
+        super().__init__()
+        self._owner = owner
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._owner.bump()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._owner.bump()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._owner.bump()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._owner.bump()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._owner.bump()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._owner.bump()
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._owner.bump()
+        return result
+
+
 class SVList:
     def __init__(self):
-        self.lst: Dict[str, SV] = {}
-        self.plugins: Dict[str, Plugins] = {}
+        # 注册 / 触发器 / 开关变化时自增，分发索引据此懒重建
+        self.version: int = 0
+        self.lst: Dict[str, SV] = _VersionedDict(self)
+        self.plugins: Dict[str, Plugins] = _VersionedDict(self)
         self.detail_lst: Dict[Plugins, List[SV]] = {}
 
     @property
     def get_lst(self):
         return self.lst
 
+    def bump(self):
+        self.version += 1
+
 
 SL = SVList()
 config_sv = core_config.get_config("sv")
@@ -135,6 +179,7 @@ class Plugins:
         for var in kwargs:
             setattr(self, var, kwargs[var])
             plugin_config[var] = kwargs[var]
+        SL.bump()
         if is_lazy:
             plugin_config_store.mark_dirty(self.name)
         else:
@@ -172,7 +217,7 @@ class SV:
         white_list: List = [],
     ):
         if not self.is_initialized:
-            logger.trace(t("log.sv.name_module_initializing", name=name))
+            logger.trace(lt("log.sv.name_module_initializing", name=name))
             # sv名称，重复的sv名称将被并入一个sv里
             self.name: str = name
             # sv内包含的触发器
@@ -294,6 +339,7 @@ class SV:
             if name == "测试开关":
                 self.pm = 6
                 self.enabled = False
+                SL.bump()
 
     def set(self, is_lazy: bool = True, **kwargs):
         plugin_sv_config = config_plugins[self.self_plugin_name]["sv"]
@@ -302,6 +348,7 @@ class SV:
         for var in kwargs:
             setattr(self, var, kwargs[var])
             plugin_sv_config[self.name][var] = kwargs[var]
+        SL.bump()
         if is_lazy:
             plugin_config_store.mark_dirty(self.self_plugin_name)
         else:
@@ -368,7 +415,7 @@ class SV:
                                 block,
                                 to_me,
                             )
-                            logger.trace(t("log.sv.type_trigger_pk_load", type=type, _pk=_pk))
+                            logger.trace(lt("log.sv.type_trigger_pk_load", type=type, _pk=_pk))
                     else:
                         self.TL[type][_k] = Trigger(
                             type,
@@ -378,7 +425,8 @@ class SV:
                             block,
                             to_me,
                         )
-                        logger.trace(t("log.sv.type_trigger_k_load", type=type, _k=_k))
+                        logger.trace(lt("log.sv.type_trigger_k_load", type=type, _k=_k))
+            SL.bump()
 
             # 声明 to_ai 时注册为 AI 工具；懒加载 + enable 网关，避免 sv 在 AI 关闭时拉入 pydantic_ai
             if to_ai.strip():
@@ -1,12 +1,46 @@
+"""命令追踪元数据归档。
+
+- ``write_trace_meta`` 只把记录放进队列，由后台写线程按 ``FLUSH_INTERVAL`` 批量追加并 fsync，
+  不在事件循环上做文件 IO；
+- 按天分段：当天写 ``traces/YYYY-MM-DD.jsonl``，跨天后旧分段压缩为 ``.jsonl.gz``
+  （按块写成多个 gzip member，每块可独立解压）；
+- 每个分段配一份紧凑索引 ``<分段文件名>.idx``：定长记录 ``(trace_id 哈希, 块偏移, 块内偏移)``，
+  查单条追踪只需一次 seek；同一 trace_id 多次写入时索引中后出现的记录为准。
+"""
+
+import os
+import gzip
 import json
-from typing import Dict, List, Optional
+import time
+import zlib
+import queue
+import struct
+import hashlib
+import threading
+from typing import Any, Dict, List, Tuple, Union, Iterator, Optional
 from pathlib import Path
 from datetime import datetime, timedelta
+from collections import OrderedDict
 
-from gsuid_core.logger import LOG_PATH, TraceContext
+from gsuid_core.i18n import t
+from gsuid_core.logger import LOG_PATH, TraceContext, logger
 
 TRACE_JSONL_PATH = LOG_PATH / "traces"
 
+# 批量写入间隔（秒），每批写完 fsync 一次
+FLUSH_INTERVAL = 1.0
+# 单批最多记录数，超过则提前写出
+MAX_BATCH = 1000
+# 压缩分段的块大小（解压后字节数）
+BLOCK_SIZE = 64 * 1024
+
+# 常驻内存的分段索引表个数（按最近使用淘汰），以及只缓存去重条数的分段个数
+INDEX_CACHE_SEGMENTS = 8
+COUNT_CACHE_SEGMENTS = 400
+
+# 索引记录：trace_id 的 8 字节哈希 + 块偏移 + 块内偏移；未压缩分段的块偏移即行偏移，块内偏移为 0
+_ENTRY = struct.Struct("<8sQI")
+
 
 def _get_jsonl_path(date_str: str | None = None) -> Path:
     """按日期获取 JSONL 路径，格式：logs/traces/YYYY-MM-DD.jsonl"""
@@ -17,6 +51,413 @@ def _get_jsonl_path(date_str: str | None = None) -> Path:
     return TRACE_JSONL_PATH / f"{date_str}.jsonl"
 
 
+def _gz_path(jsonl_path: Path) -> Path:
+    return jsonl_path.with_name(jsonl_path.name + ".gz")
+
+
+def _idx_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + ".idx")
+
+
+def _segment(date_str: str | None) -> Optional[Path]:
+    """返回某天实际存在的分段文件（压缩优先），都不存在时返回 None。"""
+    jsonl_path = _get_jsonl_path(date_str)
+    gz = _gz_path(jsonl_path)
+    if gz.exists():
+        return gz
+    if jsonl_path.exists():
+        return jsonl_path
+    return None
+
+
+def _key(trace_id: str) -> bytes:
+    return hashlib.blake2b(trace_id.encode("utf-8"), digest_size=8).digest()
+
+
+def _dumps(record: Dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# ---------------- 索引 ----------------
+
+
+class _IndexCache:
+    """分段索引的内存缓存：索引文件只追加，文件变长时只读增量部分。
+
+    完整的哈希表只为最近使用的 ``INDEX_CACHE_SEGMENTS`` 个分段保留；
+    按天计数（日历）只缓存每个分段的去重条数，不常驻整张表。
+    """
+
+    def __init__(self, max_segments: int = INDEX_CACHE_SEGMENTS):
+        self._lock = threading.Lock()
+        self.max_segments = max_segments
+        # {索引路径: (已读字节数, {trace_id 哈希: (块偏移, 块内偏移)}, 索引覆盖到的最大块偏移)}
+        self._cache: "OrderedDict[Path, Tuple[int, Dict[bytes, Tuple[int, int]], int]]" = OrderedDict()
+        # {索引路径: (索引字节数, 去重条数)}
+        self._counts: "OrderedDict[Path, Tuple[int, int]]" = OrderedDict()
+
+    @staticmethod
+    def _size(idx: Path) -> Optional[int]:
+        try:
+            size = idx.stat().st_size
+        except FileNotFoundError:
+            return None
+        return size - size % _ENTRY.size
+
+    def get(self, segment: Path) -> Optional[Tuple[Dict[bytes, Tuple[int, int]], int]]:
+        """返回 ``(索引表, 索引覆盖到的最大块偏移)``，分段没有索引时返回 None。"""
+        idx = _idx_path(segment)
+        size = self._size(idx)
+        if size is None:
+            return None
+        with self._lock:
+            read, table, tail = self._cache.get(idx, (0, {}, 0))
+            if size < read:
+                read, table, tail = 0, {}, 0
+            if size > read:
+                with open(idx, "rb") as f:
+                    f.seek(read)
+                    data = f.read(size - read)
+                table = dict(table)
+                for key, block, pos in _ENTRY.iter_unpack(data):
+                    table[key] = (block, pos)
+                    tail = max(tail, block)
+            self._cache[idx] = (size, table, tail)
+            self._cache.move_to_end(idx)
+            while len(self._cache) > self.max_segments:
+                self._cache.popitem(last=False)
+            return table, tail
+
+    def count(self, segment: Path) -> Optional[int]:
+        """分段索引中不同 trace_id 的个数，分段没有索引时返回 None。"""
+        idx = _idx_path(segment)
+        size = self._size(idx)
+        if size is None:
+            return None
+        with self._lock:
+            cached = self._cache.get(idx)
+            if cached is not None and cached[0] == size:
+                return len(cached[1])
+            counted = self._counts.get(idx)
+            if counted is not None and counted[0] == size:
+                self._counts.move_to_end(idx)
+                return counted[1]
+        with open(idx, "rb") as f:
+            data = f.read(size)
+        count = len({data[i : i + 8] for i in range(0, len(data), _ENTRY.size)})
+        with self._lock:
+            self._counts[idx] = (size, count)
+            self._counts.move_to_end(idx)
+            while len(self._counts) > COUNT_CACHE_SEGMENTS:
+                self._counts.popitem(last=False)
+        return count
+
+    def drop(self, segment: Path) -> None:
+        with self._lock:
+            self._cache.pop(_idx_path(segment), None)
+            self._counts.pop(_idx_path(segment), None)
+
+
+_index_cache = _IndexCache()
+
+
+def _read_member(f, offset: int) -> bytes:
+    """从 ``offset`` 处解压一个 gzip member。"""
+    f.seek(offset)
+    d = zlib.decompressobj(wbits=31)
+    out: List[bytes] = []
+    while not d.eof:
+        chunk = f.read(BLOCK_SIZE)
+        if not chunk:
+            break
+        out.append(d.decompress(chunk))
+    return b"".join(out)
+
+
+def _read_at(segment: Path, block: int, pos: int) -> Optional[Dict]:
+    with open(segment, "rb") as f:
+        if segment.suffix == ".gz":
+            data = _read_member(f, block)
+            line = data[pos : data.find(b"\n", pos)]
+        else:
+            f.seek(block)
+            line = f.readline()
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _iter_members(f) -> Iterator[Tuple[int, bytes]]:
+    """依次解压多 member 的 gzip 文件，产出 ``(member 偏移, 解压内容)``。"""
+    offset = 0
+    pending = b""
+    while True:
+        d = zlib.decompressobj(wbits=31)
+        out: List[bytes] = []
+        fed = 0
+        while not d.eof:
+            chunk = pending or f.read(BLOCK_SIZE)
+            pending = b""
+            if not chunk:
+                break
+            fed += len(chunk)
+            out.append(d.decompress(chunk))
+        if not d.eof:
+            # 读完或末尾 member 不完整
+            return
+        pending = d.unused_data
+        yield offset, b"".join(out)
+        offset += fed - len(pending)
+
+
+def _iter_lines(segment: Path, start: int = 0) -> Iterator[Tuple[int, int, bytes]]:
+    """从块偏移 ``start`` 起遍历分段中的每一行，产出 ``(块偏移, 块内偏移, 行)``。"""
+    with open(segment, "rb") as f:
+        f.seek(start)
+        if segment.suffix == ".gz":
+            for offset, data in _iter_members(f):
+                pos = 0
+                for line in data.splitlines(keepends=True):
+                    yield start + offset, pos, line
+                    pos += len(line)
+        else:
+            offset = start
+            for line in f:
+                yield offset, 0, line
+                offset += len(line)
+
+
+def _iter_records(segment: Path, start: int = 0) -> Iterator[Dict]:
+    for _, _, line in _iter_lines(segment, start):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
+
+def _rebuild_index(segment: Path) -> None:
+    """按分段内容重建索引（旧版无索引的分段、或索引落后于数据时使用）。"""
+    entries = bytearray()
+    for block, pos, line in _iter_lines(segment):
+        try:
+            trace_id = json.loads(line).get("trace_id")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if trace_id:
+            entries += _ENTRY.pack(_key(trace_id), block, pos)
+    tmp = _idx_path(segment).with_name(_idx_path(segment).name + ".tmp")
+    tmp.write_bytes(entries)
+    os.replace(tmp, _idx_path(segment))
+    _index_cache.drop(segment)
+
+
+# ---------------- 后台写入 ----------------
+
+
+class _TraceWriter:
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Union[Tuple[str, Dict], threading.Event, None]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._active_date: Optional[str] = None
+
+    def submit(self, date_str: str, record: Dict) -> None:
+        self._ensure_started()
+        self._queue.put((date_str, record))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """等待已提交的记录全部落盘。"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._thread = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trace-archive", daemon=True)
+                self._thread.start()
+                _register_close()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: List[Tuple[str, Dict]] = []
+            waiters: List[threading.Event] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= MAX_BATCH:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(t("log.logger.trace_archive_write_fail", count=len(batch), e=e))
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, batch: List[Tuple[str, Dict]]) -> None:
+        by_date: Dict[str, List[Dict]] = {}
+        for date_str, record in batch:
+            by_date.setdefault(date_str, []).append(record)
+
+        for date_str, records in by_date.items():
+            path = _get_jsonl_path(date_str)
+            if self._active_date and date_str < self._active_date and _gz_path(path).exists():
+                # 跨零点前提交、轮转后才写出的记录：追加到已压缩的分段
+                _append_gz(_gz_path(path), records)
+                continue
+
+            idx = _idx_path(path)
+            if self._active_date is None or date_str > self._active_date:
+                self._rotate(date_str)
+                # 本进程首次写入该分段：补齐崩溃时留下的半行，并按数据重建索引
+                if path.exists() and path.stat().st_size:
+                    with open(path, "rb+") as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            f.write(b"\n")
+                    _rebuild_index(path)
+
+            entries = bytearray()
+            with open(path, "ab") as f:
+                offset = f.tell()
+                for record in records:
+                    line = _dumps(record)
+                    f.write(line)
+                    entries += _ENTRY.pack(_key(record["trace_id"]), offset, 0)
+                    offset += len(line)
+                f.flush()
+                os.fsync(f.fileno())
+            with open(idx, "ab") as f:
+                f.write(entries)
+
+    def _rotate(self, date_str: str) -> None:
+        """切换到新的一天：把之前各天仍未压缩的分段压缩归档。"""
+        self._active_date = date_str
+        if not TRACE_JSONL_PATH.exists():
+            return
+        for path in sorted(TRACE_JSONL_PATH.glob("*.jsonl")):
+            if path.stem < date_str:
+                try:
+                    compress_segment(path)
+                except Exception as e:
+                    logger.error(t("log.logger.trace_archive_write_fail", count=0, e=e))
+
+
+def _append_gz(gz: Path, records: List[Dict]) -> None:
+    block = bytearray()
+    keys: List[Tuple[bytes, int]] = []
+    for record in records:
+        keys.append((_key(record["trace_id"]), len(block)))
+        block += _dumps(record)
+    with open(gz, "ab") as f:
+        offset = f.tell()
+        f.write(gzip.compress(bytes(block), mtime=0))
+        f.flush()
+        os.fsync(f.fileno())
+    with open(_idx_path(gz), "ab") as f:
+        f.write(b"".join(_ENTRY.pack(key, offset, pos) for key, pos in keys))
+
+
+def compress_segment(path: Path) -> Path:
+    """把未压缩的分段按块压缩为 ``.jsonl.gz`` 并重建索引，完成后删除原文件。"""
+    gz = _gz_path(path)
+    tmp = gz.with_name(gz.name + ".tmp")
+    entries = bytearray()
+    with open(path, "rb") as fin, open(tmp, "wb") as fout:
+        block = bytearray()
+        keys: List[Tuple[bytes, int]] = []
+
+        def _flush_block():
+            offset = fout.tell()
+            fout.write(gzip.compress(bytes(block), mtime=0))
+            for key, pos in keys:
+                entries.extend(_ENTRY.pack(key, offset, pos))
+            block.clear()
+            keys.clear()
+
+        for line in fin:
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            try:
+                trace_id = json.loads(line).get("trace_id")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                trace_id = None
+            if trace_id:
+                keys.append((_key(trace_id), len(block)))
+            block += line
+            if len(block) >= BLOCK_SIZE:
+                _flush_block()
+        if block:
+            _flush_block()
+        fout.flush()
+        os.fsync(fout.fileno())
+
+    idx_tmp = _idx_path(gz).with_name(_idx_path(gz).name + ".tmp")
+    idx_tmp.write_bytes(entries)
+    os.replace(tmp, gz)
+    os.replace(idx_tmp, _idx_path(gz))
+    _index_cache.drop(gz)
+    path.unlink()
+    _idx_path(path).unlink(missing_ok=True)
+    _index_cache.drop(path)
+    return gz
+
+
+_writer = _TraceWriter()
+_close_registered = False
+
+
+def _register_close() -> None:
+    global _close_registered
+    if not _close_registered:
+        # 本模块由 logger 懒加载，不能在模块级依赖 server
+        from gsuid_core.server import on_core_shutdown
+
+        on_core_shutdown(close_trace_archive)
+        _close_registered = True
+
+
+def flush_trace_archive(timeout: float = 5.0) -> bool:
+    """等待排队中的追踪元数据全部写入磁盘。"""
+    return _writer.flush(timeout)
+
+
+def close_trace_archive() -> None:
+    _writer.close()
+
+
 def write_trace_meta(
     trace_id: str,
     meta: TraceContext,
@@ -26,11 +467,9 @@ def write_trace_meta(
 ) -> None:
     """写入追踪元数据到 JSONL（running 或 completed）。
 
-    同 trace_id 可多次写入，以最后一次状态为准。
+    同 trace_id 可多次写入，以最后一次状态为准。只入队不做 IO，由后台线程批量落盘。
     """
-    jsonl_path = _get_jsonl_path()
-
-    record: Dict = {
+    record: Dict[str, Any] = {
         "trace_id": trace_id,
         "command": meta.command,
         "user_id": meta.user_id,
@@ -45,31 +484,59 @@ def write_trace_meta(
     if duration_ms is not None:
         record["duration_ms"] = duration_ms
 
-    with open(jsonl_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    _writer.submit(datetime.now().strftime("%Y-%m-%d"), record)
+
+
+def _today_pending(date_str: str | None) -> bool:
+    from gsuid_core.utils.path_safety import parse_iso_date
+
+    return parse_iso_date(date_str, default_today=True) == datetime.now().strftime("%Y-%m-%d")
 
 
 def get_trace_from_jsonl(trace_id: str, date_str: str | None = None) -> Optional[Dict]:
-    """从 JSONL 倒序扫描查找单个追踪的最新元数据。
+    """按索引定位单个追踪的最新元数据（一次 seek）。
 
-    同一 trace_id 可能有多条记录（running -> completed），取最后一条。
+    同一 trace_id 可能有多条记录（running -> completed），索引中后写入的记录为准。
     """
-    jsonl_path = _get_jsonl_path(date_str)
-    if not jsonl_path.exists():
-        return None
+    if _today_pending(date_str):
+        flush_trace_archive()
+    for _ in range(2):
+        segment = _segment(date_str)
+        if segment is None:
+            return None
+        try:
+            return _lookup(segment, trace_id)
+        except FileNotFoundError:
+            # 分段恰好被压缩归档，重新定位一次
+            continue
+    return None
+
 
+def _lookup(segment: Path, trace_id: str) -> Optional[Dict]:
+    cached = _index_cache.get(segment)
+    if cached is None:
+        # 没有索引的旧分段：顺序扫描
+        return _scan(segment, trace_id)
+
+    table, tail = cached
     result: Optional[Dict] = None
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-                if record.get("trace_id") == trace_id:
-                    result = record
-            except json.JSONDecodeError:
-                continue
+    loc = table.get(_key(trace_id))
+    if loc is not None:
+        result = _read_at(segment, *loc)
+        if result is None or result.get("trace_id") != trace_id:
+            # 哈希冲突：退回顺序扫描
+            return _scan(segment, trace_id)
+
+    # 崩溃时数据可能已落盘而索引未写入：补扫索引覆盖的最后一块之后的数据，后写入的记录为准
+    tail_record = _scan(segment, trace_id, tail)
+    return tail_record or result
+
+
+def _scan(segment: Path, trace_id: str, start: int = 0) -> Optional[Dict]:
+    result: Optional[Dict] = None
+    for record in _iter_records(segment, start):
+        if record.get("trace_id") == trace_id:
+            result = record
     return result
 
 
@@ -78,18 +545,16 @@ def list_traces_from_jsonl(date_str: str | None = None, limit: int = 500) -> Lis
 
     同 trace_id 只保留最新状态记录。
     """
-    jsonl_path = _get_jsonl_path(date_str)
-    if not jsonl_path.exists():
+    if _today_pending(date_str):
+        flush_trace_archive()
+    segment = _segment(date_str)
+    if segment is None:
         return []
 
     seen: Dict[str, Dict] = {}
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    try:
+        for record in _iter_records(segment):
             try:
-                record = json.loads(line)
                 tid = record["trace_id"]
                 seen[tid] = {
                     "trace_id": tid,
@@ -101,8 +566,11 @@ def list_traces_from_jsonl(date_str: str | None = None, limit: int = 500) -> Lis
                     "log_count": record["log_count"],
                     "status": record.get("status", "completed"),
                 }
-            except (json.JSONDecodeError, KeyError):
+            except KeyError:
                 continue
+    except FileNotFoundError:
+        # 分段恰好被压缩归档，重新定位一次
+        return list_traces_from_jsonl(date_str, limit)
 
     records = list(seen.values())
     records.sort(key=lambda x: x["start_time"], reverse=True)
@@ -114,25 +582,20 @@ def count_traces_from_jsonl(date_str: str) -> int:
 
     同一 trace_id 一天内会写多条（running -> completed），按 trace_id 去重计数，
     口径与 ``list_traces_from_jsonl`` 一致，且不受其 ``limit`` 截断影响。
+    直接数索引中不同的 trace_id 哈希，无需解析分段内容。
     文件不存在（当天无任何命令）时返回 0。
     """
-    jsonl_path = _get_jsonl_path(date_str)
-    if not jsonl_path.exists():
+    segment = _segment(date_str)
+    if segment is None:
         return 0
 
-    seen: set[str] = set()
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                tid = json.loads(line).get("trace_id")
-            except json.JSONDecodeError:
-                continue
-            if tid:
-                seen.add(tid)
-    return len(seen)
+    try:
+        count = _index_cache.count(segment)
+        if count is not None:
+            return count
+        return len({r.get("trace_id") for r in _iter_records(segment)} - {None})
+    except FileNotFoundError:
+        return count_traces_from_jsonl(date_str)
 
 
 def daily_trace_counts(days: int = 60) -> List[Dict]:
@@ -142,6 +605,7 @@ def daily_trace_counts(days: int = 60) -> List[Dict]:
     不可点击。今天也计入——running 追踪在 ``start_trace`` 时即写入 JSONL running 标记，
     故当天计数实时可见，无需等命令结束。
     """
+    flush_trace_archive()
     today = datetime.now().date()
     result: List[Dict] = []
     for offset in range(days - 1, -1, -1):
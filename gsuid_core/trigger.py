@@ -1,5 +1,5 @@
 import re
-from typing import Any, Literal, Callable, Awaitable
+from typing import Any, Literal, Callable, Optional, Awaitable
 
 from gsuid_core.bot import Bot
 from gsuid_core.models import Event
@@ -31,6 +31,8 @@ class Trigger:
         self.func: Callable[[Bot, Event], Awaitable[Any]] = func
         self.block = block
         self.to_me = to_me
+        # regex 触发器首次匹配时编译并缓存，避免插件多时挤爆 re 模块的全局缓存
+        self._pattern: Optional[re.Pattern[str]] = None
 
     def check_command(self, ev: Event) -> bool:
         msg = ev.raw_text
@@ -83,7 +85,9 @@ class Trigger:
     def _check_regex(self, pattern: str, msg: str) -> bool:
         if msg.startswith(self.prefix):
             _msg = msg.replace(self.prefix, "", 1)
-            command_list = re.findall(pattern, _msg)
+            if self._pattern is None:
+                self._pattern = re.compile(pattern)
+            command_list = self._pattern.findall(_msg)
             if command_list:
                 return True
         return False
@@ -0,0 +1,235 @@
+"""触发器预编译分发索引。
+
+``handle_event`` 原先对每条消息遍历全部 SV × 全部 Trigger 逐个 ``check_command``，
+插件一多单条消息就是数千次 Python 调用。这里把 ``SL.lst`` 预编译成：
+
+- 前缀 Trie：prefix / command 在沿途节点收集，fullmatch 仅在整串走完的节点收集，
+  regex 按「插件前缀 + 正则锚定字面量前缀」挂在同一棵树上（按字面量前缀分组）；
+- 反向后缀 Trie：suffix 触发器按关键词倒序插入，沿消息尾部倒着走；
+- Aho-Corasick 自动机：全部 keyword 触发器一次扫描；
+- file / meta 按扩展名 / 事件名哈希，message 恒为候选。
+
+索引只负责「缩小候选集」，最终仍由 ``Trigger.check_command`` 复核（to_me、
+prefix 排除 fullmatch 等细节语义不变），匹配代价因此只与消息长度和命中数相关。
+候选按构建时的全局序号排序，与原先 SV → TL → Trigger 的遍历顺序一致，
+保证同优先级下的分发顺序、block 语义与线性扫描完全相同。
+
+``SL.version`` 在 SV/Plugins 注册、触发器增删、开关变化时自增，
+``match`` 发现版本不一致时懒重建。
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+from collections import deque
+
+from gsuid_core.sv import SL, SV
+from gsuid_core.i18n import lt
+from gsuid_core.logger import logger
+from gsuid_core.models import Event
+from gsuid_core.trigger import Trigger
+
+# (全局序号, 触发器, 所属 SV)
+_Entry = Tuple[int, Trigger, SV]
+
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+_REGEX_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+
+def regex_literal_prefix(pattern: str) -> str:
+    """提取 ``^`` 锚定正则的必经字面量前缀；无法安全判定时返回空串。
+
+    含 ``|`` 的模式可能存在多分支，保守放弃；量词 ``* ? {`` 会让前一个字符可选，
+    故同时回退一个字符。
+    """
+    if not pattern.startswith("^") or "|" in pattern:
+        return ""
+    literal: List[str] = []
+    for ch in pattern[1:]:
+        if ch in _REGEX_META:
+            if ch in _REGEX_OPTIONAL_QUANTIFIERS and literal:
+                literal.pop()
+            break
+        literal.append(ch)
+    return "".join(literal)
+
+
+class _TrieNode:
+    __slots__ = ("children", "starts", "exact", "regex")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        # 消息以该节点路径开头即为候选（prefix / command / suffix）
+        self.starts: List[_Entry] = []
+        # 消息恰好等于该节点路径才为候选（fullmatch）
+        self.exact: List[_Entry] = []
+        # 正则字面量前缀落在该节点（regex）
+        self.regex: List[_Entry] = []
+
+
+class _Trie:
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    def node(self, key: str) -> _TrieNode:
+        cur = self.root
+        for ch in key:
+            nxt = cur.children.get(ch)
+            if nxt is None:
+                nxt = cur.children[ch] = _TrieNode()
+            cur = nxt
+        return cur
+
+    def walk(self, text: str, out: List[_Entry]) -> None:
+        """沿 ``text`` 前向行走，收集路径上全部候选。"""
+        cur = self.root
+        out.extend(cur.starts)
+        out.extend(cur.regex)
+        for ch in text:
+            nxt = cur.children.get(ch)
+            if nxt is None:
+                return
+            cur = nxt
+            out.extend(cur.starts)
+            out.extend(cur.regex)
+        out.extend(cur.exact)
+
+
+class _AhoCorasick:
+    """多模式子串匹配；``search`` 返回出现过的模式对应的全部条目。"""
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[_Entry]] = [[]]
+
+    def add(self, word: str, entry: _Entry) -> None:
+        cur = 0
+        for ch in word:
+            nxt = self._goto[cur].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[cur][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            cur = nxt
+        self._out[cur].append(entry)
+
+    def build(self) -> None:
+        queue: deque[int] = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+        while queue:
+            cur = queue.popleft()
+            for ch, nxt in self._goto[cur].items():
+                queue.append(nxt)
+                f = self._fail[cur]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+        # 输出链在查询时沿 fail 指针展开，构建期不合并，避免重复条目
+
+    def search(self, text: str, out: List[_Entry]) -> None:
+        hit: set[int] = set()
+        out.extend(self._out[0])
+        cur = 0
+        goto, fail, outs = self._goto, self._fail, self._out
+        for ch in text:
+            while cur and ch not in goto[cur]:
+                cur = fail[cur]
+            cur = goto[cur].get(ch, 0)
+            state = cur
+            while state and state not in hit:
+                hit.add(state)
+                out.extend(outs[state])
+                state = fail[state]
+
+
+class TriggerIndex:
+    """SL.lst 的预编译视图，见模块文档。"""
+
+    def __init__(self) -> None:
+        self.version: int = -1
+        self._prefix = _Trie()
+        self._suffix = _Trie()
+        self._keyword = _AhoCorasick()
+        self._file: Dict[str, List[_Entry]] = {}
+        self._meta: Dict[str, List[_Entry]] = {}
+        self._message: List[_Entry] = []
+        self.trigger_count: int = 0
+
+    def rebuild(self, sv_lst: Dict[str, SV], version: int) -> None:
+        prefix, suffix, keyword = _Trie(), _Trie(), _AhoCorasick()
+        file: Dict[str, List[_Entry]] = {}
+        meta: Dict[str, List[_Entry]] = {}
+        message: List[_Entry] = []
+
+        order = 0
+        for sv in list(sv_lst.values()):
+            plugins = getattr(sv, "plugins", None)
+            if not getattr(sv, "enabled", True) or (plugins is not None and not plugins.enabled):
+                continue
+            for trigger_dict in sv.TL.values():
+                for trigger in trigger_dict.values():
+                    entry: _Entry = (order, trigger, sv)
+                    order += 1
+                    _type = trigger.type
+                    if _type in ("prefix", "command"):
+                        prefix.node(trigger.prefix + trigger.keyword).starts.append(entry)
+                    elif _type == "fullmatch":
+                        prefix.node(trigger.prefix + trigger.keyword).exact.append(entry)
+                    elif _type == "regex":
+                        key = trigger.prefix + regex_literal_prefix(trigger.keyword)
+                        prefix.node(key).regex.append(entry)
+                    elif _type == "suffix":
+                        suffix.node(trigger.keyword[::-1]).starts.append(entry)
+                    elif _type == "keyword":
+                        keyword.add(trigger.keyword, entry)
+                    elif _type == "file":
+                        file.setdefault(trigger.keyword, []).append(entry)
+                    elif _type == "meta":
+                        meta.setdefault(trigger.keyword, []).append(entry)
+                    else:
+                        message.append(entry)
+        keyword.build()
+
+        self._prefix, self._suffix, self._keyword = prefix, suffix, keyword
+        self._file, self._meta, self._message = file, meta, message
+        self.trigger_count = order
+        self.version = version
+        logger.debug(lt("log.sv.trigger_index_rebuilt", count=order, version=version))
+
+    def _ensure(self) -> None:
+        if self.version != SL.version:
+            self.rebuild(SL.lst, SL.version)
+
+    def match(self, ev: Event) -> List[Tuple[Trigger, SV]]:
+        """返回消息的候选触发器（未做鉴权与 ``check_command`` 复核），按注册顺序排列。"""
+        self._ensure()
+        msg = ev.raw_text
+        out: List[_Entry] = []
+        self._prefix.walk(msg, out)
+        self._suffix.walk(msg[::-1], out)
+        self._keyword.search(msg, out)
+        if ev.file and ev.file_name:
+            out.extend(self._file.get(ev.file_name.split(".")[-1], ()))
+        out.extend(self._message)
+        return _ordered(out)
+
+    def match_meta(self, ev: Event) -> List[Tuple[Trigger, SV]]:
+        """返回 meta 事件的候选触发器，按注册顺序排列。"""
+        self._ensure()
+        if ev.meta_event_type is None:
+            return []
+        return _ordered(list(self._meta.get(ev.meta_event_type, ())))
+
+
+def _ordered(entries: List[_Entry]) -> List[Tuple[Trigger, SV]]:
+    seen: Dict[int, Tuple[Trigger, SV]] = {}
+    for order, trigger, sv in entries:
+        seen[order] = (trigger, sv)
+    return [seen[k] for k in sorted(seen)]
+
+
+trigger_index = TriggerIndex()
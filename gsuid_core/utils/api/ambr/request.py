@@ -12,7 +12,7 @@ import aiofiles
 from PIL import Image
 from httpx import AsyncClient
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 
 from .api import (
@@ -251,7 +251,7 @@ async def _ambr_request(
     data: Optional[AnyDict] = None,
 ) -> Optional[AnyDict]:
     logger.debug(
-        t(
+        lt(
             "log.ambr.ambrrequest_url_method_params",
             url=url,
             method=method,
@@ -13,12 +13,12 @@ from typing import Any, Dict, Tuple, Union, Literal, Optional, overload
 
 import aiohttp
 import certifi
-from aiohttp import TCPConnector
 from async_timeout import timeout
 
 from gsuid_core.bot import Bot, call_bot
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
+from gsuid_core.utils.http_pool import get_session
 from gsuid_core.utils.database.utils import SERVER as RECOGNIZE_SERVER, SR_SERVER, ZZZ_SERVER
 from gsuid_core.utils.database.models import GsUID, GsUser
 from gsuid_core.utils.plugins_config.gs_config import pass_config
@@ -37,6 +37,7 @@ from .tools import (
     get_web_ds_token,
     generate_passport_ds,
 )
+from .device_cache import DeviceProfile, device_cache
 
 _DEAD_CODE = [10035, 5003, 10041, 1034]
 ssl_context = ssl.create_default_context(cafile=certifi.where())
@@ -146,35 +147,44 @@ class BaseMysApi:
         uid = await self.get_uid(uid, game_name)
         return await GsUser.get_user_stoken_by_uid(uid, game_name)
 
+    async def get_device_profile(self, uid: str, game_name: Optional[str] = None) -> DeviceProfile:
+        """主 UID 与设备信息，一次查库后缓存；GsUser/GsUID 有写入即失效（见 ``device_cache``）。"""
+        key = (uid, game_name)
+        profile = device_cache.get(key)
+        if profile is None:
+            version = device_cache.version
+            main_uid = await self.get_uid(uid, game_name)
+            user = await GsUser.select_data_by_uid(main_uid, game_name)
+            profile = DeviceProfile(
+                main_uid,
+                user.device_id if user else None,
+                user.fp if user else None,
+                user.device_info if user else None,
+            )
+            device_cache.put(key, profile, version)
+        return profile
+
     async def get_user_fp(self, uid: str, game_name: Optional[str] = None) -> str:
-        uid = await self.get_uid(uid, game_name)
-        data = await GsUser.get_user_attr_by_uid(
-            uid,
-            "fp",
-            game_name,
-        )
+        profile = await self.get_device_profile(uid, game_name)
+        data = profile.fp
         if data is None:
             seed_id, seed_time = self.get_seed()
             device_id = self.get_device_id()
             data = await self.generate_fake_fp(device_id, seed_id, seed_time)
             await GsUser.update_data_by_uid_without_bot_id(
-                uid,
+                profile.main_uid,
                 game_name,
                 fp=data,
             )
         return data
 
     async def get_user_device_id(self, uid: str, game_name: Optional[str] = None) -> str:
-        uid = await self.get_uid(uid, game_name)
-        data = await GsUser.get_user_attr_by_uid(
-            uid,
-            "device_id",
-            game_name,
-        )
+        profile = await self.get_device_profile(uid, game_name)
+        data = profile.device_id
         if data is None:
             data = self.get_device_id()
             await GsUser.update_data_by_uid_without_bot_id(
-                uid,
+                profile.main_uid,
                 game_name,
                 device_id=data,
             )
@@ -589,10 +599,10 @@ class BaseMysApi:
         if params:
             params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
 
-        logger.debug(t("log.mys.baseurl_base_url", base_url=base_url))
-        logger.debug(t("log.mys.miyoushe_request_url", url=url))
-        logger.debug(t("log.mys.miyoushe_request_params", params=params))
-        logger.debug(t("log.mys.miyoushe_request_data", data=data))
+        logger.debug(lt("log.mys.baseurl_base_url", base_url=base_url))
+        logger.debug(lt("log.mys.miyoushe_request_url", url=url))
+        logger.debug(lt("log.mys.miyoushe_request_params", params=params))
+        logger.debug(lt("log.mys.miyoushe_request_data", data=data))
 
         if not base_url:
             base_url = None
@@ -600,140 +610,132 @@ class BaseMysApi:
             header = copy.deepcopy(self._HEADER)
 
         url = base_url + url if base_url else url
-        async with aiohttp.ClientSession(
-            base_url=None,
-            connector=TCPConnector(
-                ssl_context=ssl_context,
-            ),
-        ) as session:
-            raw_data = {}
-            uid = None
-            if params and "role_id" in params:
-                uid = params["role_id"]
-            elif data and "role_id" in data:
-                uid = data["role_id"]
-            elif params and "uid" in params:
-                uid = params["uid"]
-            elif data and "uid" in data:
-                # 签到等 POST body 常用 uid 字段
-                uid = data["uid"]
-
-            if uid is not None:
-                try:
-                    # game_name=account 表示米游社账号维度，uid 为 mys_id，
-                    # 不能按游戏 UID 列（会拼成 account_uid 导致 AttributeError）
-                    if game_name in _NON_GAME_UID_NAMES:
-                        account_id = str(uid)
-                        header.setdefault(
-                            "x-rpc-device_id",
-                            self.get_overseas_device_id(account_id),
-                        )
-                        header.setdefault(
-                            "x-rpc-device_fp",
-                            self.get_overseas_device_fp(account_id),
+        # 共享连接池：复用 keep-alive 连接与 DNS 缓存，不再每次请求重新握手
+        session = get_session("mys", ssl_context=ssl_context)
+        raw_data = {}
+        uid = None
+        if params and "role_id" in params:
+            uid = params["role_id"]
+        elif data and "role_id" in data:
+            uid = data["role_id"]
+        elif params and "uid" in params:
+            uid = params["uid"]
+        elif data and "uid" in data:
+            # 签到等 POST body 常用 uid 字段
+            uid = data["uid"]
+
+        if uid is not None:
+            try:
+                # game_name=account 表示米游社账号维度，uid 为 mys_id，
+                # 不能按游戏 UID 列（会拼成 account_uid 导致 AttributeError）
+                if game_name in _NON_GAME_UID_NAMES:
+                    account_id = str(uid)
+                    header.setdefault(
+                        "x-rpc-device_id",
+                        self.get_overseas_device_id(account_id),
+                    )
+                    header.setdefault(
+                        "x-rpc-device_fp",
+                        self.get_overseas_device_fp(account_id),
+                    )
+                else:
+                    if "x-rpc-device_fp" not in header or "x-rpc-device_id" not in header:
+                        async with timeout(5):
+                            device_id = await self.get_user_device_id(
+                                uid,
+                                game_name,
+                            )
+                            header["x-rpc-device_fp"] = await self.get_user_fp(
+                                uid,
+                                game_name,
+                            )
+                            if device_id is not None:
+                                header["x-rpc-device_id"] = device_id
+
+                    dfp = (await self.get_device_profile(uid, game_name)).device_info
+                    if dfp is not None:
+                        df = dfp.split("/")
+                        header["User-Agent"] = (
+                            "Mozilla/5.0 (Linux; Android 13; "
+                            f"{df[1]} {df[3]} "
+                            "; wv)AppleWebKit/537.36 (KHTML, like Gecko) "
+                            "Version/4.0 Chrome/104.0.5112.97"
+                            "Mobile Safari/537.36 miHoYoBBS/2"
+                            f"{mys_version}"
                         )
+            except asyncio.TimeoutError:
+                logger.warning(t("log.mys.mhy_request_timeout_obtaining_dfp_fail"))
+
+        logger.debug(header)
+
+        for _ in range(2):
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=header,
+                    params=params,
+                    json=data,
+                    timeout=aiohttp.ClientTimeout(total=time_out),
+                ) as resp:
+                    raw_data = await resp.json()
+            except aiohttp.ClientConnectionError:
+                _bot: Bot = call_bot()
+                await _bot.send(await _bot.t("[mys_request] 请求连接错误..."))
+                continue
+            except Exception as e:
+                _bot = call_bot()
+                await _bot.send(
+                    await _bot.t("[mys_request] 请求错误, 请联系Bot主人检查控制台! 错误信息: {e}", e=str(e))
+                )
+                continue
+
+            logger.debug(raw_data)
+
+            # 判断retcode
+            if "retcode" in raw_data:
+                retcode = raw_data["retcode"]
+            elif "code" in raw_data:
+                retcode = raw_data["code"]
+            else:
+                retcode = 0
+
+            # 做特殊处理
+            if retcode in _DEAD_CODE:
+                if uid:
+                    challenge_key = game_name if game_name in _CHALLENGE_META else "gs"
+                    header.update(_CHALLENGE_META[challenge_key])
+
+                if pass_config.get_config("MysPass").data:
+                    pass_header = copy.deepcopy(header)
+                    ch = await self._upass(pass_header)
+                    if ch == "":
+                        return 114514
                     else:
-                        if "x-rpc-device_fp" not in header or "x-rpc-device_id" not in header:
-                            async with timeout(5):
-                                device_id = await self.get_user_device_id(
-                                    uid,
-                                    game_name,
+                        header["x-rpc-challenge"] = ch
+
+                if "DS" in header:
+                    if isinstance(params, Dict):
+                        q = "&".join(
+                            [
+                                f"{k}={v}"
+                                for k, v in sorted(
+                                    params.items(),
+                                    key=lambda x: x[0],
                                 )
-                                header["x-rpc-device_fp"] = await self.get_user_fp(
-                                    uid,
-                                    game_name,
-                                )
-                                if device_id is not None:
-                                    header["x-rpc-device_id"] = device_id
-
-                        dfp: Optional[str] = await GsUser.get_user_attr_by_uid(
-                            uid,
-                            "device_info",
-                            game_name,
+                            ]
                         )
-                        if dfp is not None:
-                            df = dfp.split("/")
-                            header["User-Agent"] = (
-                                "Mozilla/5.0 (Linux; Android 13; "
-                                f"{df[1]} {df[3]} "
-                                "; wv)AppleWebKit/537.36 (KHTML, like Gecko) "
-                                "Version/4.0 Chrome/104.0.5112.97"
-                                "Mobile Safari/537.36 miHoYoBBS/2"
-                                f"{mys_version}"
-                            )
-                except asyncio.TimeoutError:
-                    logger.warning(t("log.mys.mhy_request_timeout_obtaining_dfp_fail"))
-
-            logger.debug(header)
-
-            for _ in range(2):
-                try:
-                    async with session.request(
-                        method,
-                        url,
-                        headers=header,
-                        params=params,
-                        json=data,
-                        timeout=aiohttp.ClientTimeout(total=time_out),
-                    ) as resp:
-                        raw_data = await resp.json()
-                except aiohttp.ClientConnectionError:
-                    _bot: Bot = call_bot()
-                    await _bot.send(await _bot.t("[mys_request] 请求连接错误..."))
-                    continue
-                except Exception as e:
-                    _bot = call_bot()
-                    await _bot.send(
-                        await _bot.t("[mys_request] 请求错误, 请联系Bot主人检查控制台! 错误信息: {e}", e=str(e))
-                    )
-                    continue
-
-                logger.debug(raw_data)
+                    else:
+                        q = ""
+                    if header.get("x-rpc-app_version") == "1.5.0":
+                        header["DS"] = generate_os_ds()
+                    else:
+                        header["DS"] = get_ds_token(q, data)
 
-                # 判断retcode
-                if "retcode" in raw_data:
-                    retcode = raw_data["retcode"]
-                elif "code" in raw_data:
-                    retcode = raw_data["code"]
-                else:
-                    retcode = 0
-
-                # 做特殊处理
-                if retcode in _DEAD_CODE:
-                    if uid:
-                        challenge_key = game_name if game_name in _CHALLENGE_META else "gs"
-                        header.update(_CHALLENGE_META[challenge_key])
-
-                    if pass_config.get_config("MysPass").data:
-                        pass_header = copy.deepcopy(header)
-                        ch = await self._upass(pass_header)
-                        if ch == "":
-                            return 114514
-                        else:
-                            header["x-rpc-challenge"] = ch
-
-                    if "DS" in header:
-                        if isinstance(params, Dict):
-                            q = "&".join(
-                                [
-                                    f"{k}={v}"
-                                    for k, v in sorted(
-                                        params.items(),
-                                        key=lambda x: x[0],
-                                    )
-                                ]
-                            )
-                        else:
-                            q = ""
-                        if header.get("x-rpc-app_version") == "1.5.0":
-                            header["DS"] = generate_os_ds()
-                        else:
-                            header["DS"] = get_ds_token(q, data)
-
-                    logger.debug(t("log.mys.miyoushe_request_header", header=header))
-                elif retcode != 0:
-                    return retcode
-                else:
-                    return raw_data
+                logger.debug(lt("log.mys.miyoushe_request_header", header=header))
+            elif retcode != 0:
+                return retcode
             else:
-                return -999
+                return raw_data
+        else:
+            return -999
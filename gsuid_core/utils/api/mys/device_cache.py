@@ -0,0 +1,97 @@
+"""米游社请求的设备信息缓存（uid → 主 UID / device_id / fp / device_info）。
+
+``_mys_request`` 每次都要为请求头补设备信息，原先每次请求要查 GsUID 一次、GsUser 三次。
+这里把一次查询的结果按 ``(uid, game_name)`` 缓存在内存里，写入即失效：
+
+- 任何针对 ``GsUser`` / ``GsUID`` 的 ORM 写（``update()`` / ``delete()`` / ``insert()``
+  语句，或 ``session.add`` 后 flush）都会清空缓存，并在该 session 提交/回滚后再清一次，
+  避免并发读在提交前把旧值重新写回缓存；
+- 额外设置 ``TTL`` 兜底，覆盖绕过 ORM 的原生 SQL 写入。
+"""
+
+import time
+from typing import Dict, Tuple, Optional, NamedTuple
+from itertools import chain
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, ORMExecuteState
+
+from gsuid_core.utils.database.models import GsUID, GsUser
+
+_WATCHED = (GsUser, GsUID)
+_DIRTY_KEY = "mys_device_cache_dirty"
+
+DeviceKey = Tuple[str, Optional[str]]
+
+
+class DeviceProfile(NamedTuple):
+    main_uid: str
+    device_id: Optional[str]
+    fp: Optional[str]
+    device_info: Optional[str]
+
+
+class DeviceCache:
+    def __init__(self, ttl: float = 600, max_size: int = 8192) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: "OrderedDict[DeviceKey, Tuple[float, DeviceProfile]]" = OrderedDict()
+        # 每次失效自增；读库前记下，写缓存时不一致则放弃（期间发生过写入）
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: DeviceKey) -> Optional[DeviceProfile]:
+        item = self._data.get(key)
+        if item is None or time.monotonic() - item[0] > self.ttl:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def put(self, key: DeviceKey, profile: DeviceProfile, version: int) -> None:
+        if version != self.version:
+            return
+        self._data[key] = (time.monotonic(), profile)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses, "version": self.version}
+
+
+device_cache = DeviceCache()
+
+
+def _touches_watched(state: ORMExecuteState) -> bool:
+    return any(mapper.class_ in _WATCHED for mapper in state.all_mappers)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_statement(state: ORMExecuteState):
+    if (state.is_update or state.is_delete or state.is_insert) and _touches_watched(state):
+        state.session.info[_DIRTY_KEY] = True
+        device_cache.invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_flush(session: Session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _WATCHED):
+            session.info[_DIRTY_KEY] = True
+            device_cache.invalidate()
+            return
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_on_end(session: Session, *args):
+    if session.info.pop(_DIRTY_KEY, False):
+        device_cache.invalidate()
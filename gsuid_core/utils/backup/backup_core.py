@@ -6,14 +6,17 @@ from datetime import datetime
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
 from gsuid_core.data_store import backup_path, gs_data_path
+from gsuid_core.utils.backup.snapshot import export_zip, create_snapshot, prune_snapshots, verify_snapshot
 from gsuid_core.utils.plugins_config.gs_config import backup_config
 
 
 def copy_and_rebase_paths(_paths_to_copy: Optional[List[Path]] = None, file_id: Optional[str] = None) -> int:
     """
-    将路径列表中的文件/文件夹复制到备份目录，并移除指定的路径前缀。
+    为路径列表中的文件/文件夹创建增量快照（路径记录为相对 gs_data_path 的形式）。
 
-    :param paths_to_copy: 待复制的 Path 对象列表 (List[Path])。
+    :param paths_to_copy: 待备份的 Path 对象列表 (List[Path])。
+    :param file_id: 指定时额外导出 `{file_id}-{日期}.zip` 到备份目录。
+    :return: 0 成功，-1 非法目标路径，-5 创建快照失败，-10 校验或导出失败。
     """
     if _paths_to_copy is None:
         # 获取配置中的路径，并确保它们是相对于gs_data_path的完整路径
@@ -28,74 +31,36 @@ def copy_and_rebase_paths(_paths_to_copy: Optional[List[Path]] = None, file_id:
     else:
         paths_to_copy = _paths_to_copy
 
-    prefix_to_remove = gs_data_path
-
     date_str = datetime.now().strftime("%Y-%m-%d")
-    if file_id is None:
-        file_id = date_str
-    else:
-        file_id = file_id.strip()
-
-    final_backup_dir = backup_path / f"{file_id}-{date_str}"
-
-    if final_backup_dir.exists():
-        logger.warning(t("log.backup.final_backup_dir", final_backup_dir=final_backup_dir))
-        # 确认一下这个目录是否是backup_path开头的
-        if not final_backup_dir.is_relative_to(backup_path):
-            logger.warning(
-                t(
-                    "log.backup.directory_final_dir",
-                    final_backup_dir=final_backup_dir,
-                    backup_path=backup_path,
-                )
-            )
-            return -1
-
-        # 递归删除该目录下的所有文件和子目录
-        shutil.rmtree(final_backup_dir)
 
+    # 增量快照：未变化的文件只记录哈希，数据库经在线备份 API 得到一致副本
     try:
-        final_backup_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(t("log.backup.final_backup_dir_2", final_backup_dir=final_backup_dir))
-
+        snapshot = create_snapshot(paths_to_copy, gs_data_path, file_id.strip() if file_id else None)
     except Exception as e:
-        logger.info(t("log.backup.create_fail", e=e))
+        logger.warning(t("log.backup.create_fail", e=e))
         return -5
 
-    # 4. 遍历并复制路径
-    for src_path in paths_to_copy:
-        try:
-            relative_path = src_path.relative_to(prefix_to_remove)
-
-            dest_path = final_backup_dir / relative_path
-
-            if src_path.is_file():
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_path, dest_path)
-                logger.success(t("log.backup.src_path_dest", src_path=src_path, dest_path=dest_path))
-
-            elif src_path.is_dir():
-                shutil.copytree(src_path, dest_path, dirs_exist_ok=True)
-                logger.success(t("log.backup.src_path_dest_2", src_path=src_path, dest_path=dest_path))
+    if verify_snapshot(snapshot):
+        return -10
 
-            else:
-                logger.success(t("log.backup.src_path_skip", src_path=src_path))
+    # 定时任务只保留快照；手动创建（指定 file_id）时额外导出 zip 供下载
+    if file_id is None:
+        return 0
 
-        except ValueError:
-            logger.warning(
-                t(
-                    "log.backup.src_path_prefix_to_remove_skip",
-                    src_path=src_path,
-                    prefix_to_remove=prefix_to_remove,
-                )
+    final_backup_zip = backup_path / f"{file_id.strip()}-{date_str}.zip"
+    if not final_backup_zip.resolve().is_relative_to(backup_path.resolve()):
+        logger.warning(
+            t(
+                "log.backup.directory_final_dir",
+                final_backup_dir=final_backup_zip,
+                backup_path=backup_path,
             )
-        except Exception as e:
-            logger.warning(t("log.backup.src_path_error", src_path=src_path, e=e))
+        )
+        return -1
 
-    # 最后, 打zip压缩包
     try:
-        shutil.make_archive(str(final_backup_dir), "zip", final_backup_dir)
-        logger.success(t("log.backup.final_backup_dir_zip", final_backup_dir=final_backup_dir))
+        export_zip(snapshot, final_backup_zip)
+        logger.success(t("log.backup.final_backup_dir_zip", final_backup_dir=final_backup_zip.with_suffix("")))
     except Exception as e:
         logger.warning(t("log.backup.compress_directory_fail", e=e))
         return -10
@@ -114,6 +79,8 @@ def remove_old_backups(days: int = 30) -> int:
         logger.warning(t("log.backup.backup_path_skip", backup_path=backup_path))
         return 0
 
+    prune_snapshots(days)
+
     current_time = datetime.now()
     deleted_count = 0
 
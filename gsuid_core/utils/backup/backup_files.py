@@ -1,10 +1,12 @@
 import os
+import asyncio
 import datetime
 from shutil import copyfile
 from pathlib import Path
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import LOG_PATH, logger
+from gsuid_core.utils.backup.snapshot import is_sqlite, sqlite_backup
 from gsuid_core.utils.plugins_config.gs_config import log_config
 
 CLEAN_DAY: str = log_config.get_config("ScheduledCleanLogDay").data
@@ -28,7 +30,7 @@ def _get_filename(file_path: Path, date: str):
 async def backup_file(file_path: Path, backup_path: Path, backup_day: int = 5):
     """📝简单介绍:
 
-        按照日期备份文件，默认最多保留5天
+        按照日期备份文件，默认最多保留5天；SQLite 数据库通过在线备份 API 复制，保证副本一致
 
     🌱参数:
 
@@ -56,7 +58,10 @@ async def backup_file(file_path: Path, backup_path: Path, backup_day: int = 5):
     backup = backup_path / backup_filename
     end_day_backup = backup_path / end_day_filename
 
-    copyfile(str(file_path), backup)
+    if is_sqlite(file_path):
+        await asyncio.to_thread(sqlite_backup, file_path, backup)
+    else:
+        await asyncio.to_thread(copyfile, str(file_path), backup)
 
     if os.path.exists(end_day_backup):
         os.remove(end_day_backup)
@@ -0,0 +1,397 @@
+"""增量快照备份。
+
+- 文件内容按 SHA-256 存入对象库（gzip 流式压缩），内容不变的文件在多次快照间只存一份；
+- 每次快照写一份清单（相对路径 → 哈希/大小/mtime），大小与 mtime 未变的文件直接沿用上次的哈希，不再读取；
+- SQLite 数据库通过在线备份 API 分页复制，每页之间让出锁，得到一致的副本而不会阻塞机器人写入；
+- 支持按天数清理过期快照并回收无引用的对象，以及逐文件校验 / 还原 / 导出为 zip。
+"""
+
+import os
+import gzip
+import time
+import hashlib
+import sqlite3
+import zipfile
+import tempfile
+import threading
+from typing import Set, Dict, List, Tuple, Iterable, Optional
+from pathlib import Path
+from datetime import datetime
+
+import msgspec
+from msgspec import json as msgjson
+
+from gsuid_core.i18n import t
+from gsuid_core.logger import logger
+from gsuid_core.data_store import backup_path, gs_data_path
+
+SNAPSHOT_ROOT = backup_path / "snapshots"
+OBJECT_PATH = SNAPSHOT_ROOT / "objects"
+MANIFEST_PATH = SNAPSHOT_ROOT / "manifests"
+
+CHUNK_SIZE = 1024 * 1024
+COMPRESS_LEVEL = 6
+SQLITE_HEADER = b"SQLite format 3\x00"
+# 在线备份每步复制的页数，以及每步之间让出锁的时长
+SQLITE_PAGES_PER_STEP = 1024
+SQLITE_STEP_SLEEP = 0.005
+# 备份期间源库被反复写入导致重新开始的次数上限，超过后改为一次性复制
+SQLITE_MAX_RESTARTS = 3
+# 由在线备份覆盖的 SQLite 附属文件，不单独备份
+SQLITE_SIDE_SUFFIXES = ("-wal", "-shm", "-journal")
+# 新写入的对象在该时长内不回收，避免与正在进行、尚未写出清单的快照竞争
+GC_GRACE_SECONDS = 3600
+# 进程内串行化快照与清理：清理不会回收正在进行的快照刚复用、尚未写入清单的对象
+_snapshot_lock = threading.Lock()
+
+
+class FileEntry(msgspec.Struct):
+    hash: str
+    size: int
+    mtime_ns: int
+    sqlite: bool = False
+
+
+class Snapshot(msgspec.Struct):
+    id: str
+    created: float
+    files: Dict[str, FileEntry] = {}
+    # 本次新写入对象库的哈希（用于只校验新增内容）
+    new_hashes: List[str] = []
+    new_bytes: int = 0
+    reused: int = 0
+
+
+class _Restarted(Exception):
+    pass
+
+
+def is_sqlite(path: Path) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def sqlite_backup(src: Path, dst: Path) -> None:
+    """用 SQLite 在线备份 API 把 ``src`` 复制为一致的 ``dst``。
+
+    每复制 ``SQLITE_PAGES_PER_STEP`` 页释放一次读锁并短暂休眠，其他连接可以在间隙中写入；
+    源库被写入后备份会从头开始，重来次数过多时改为一次性复制（全程持有读锁）。
+    """
+    dst.unlink(missing_ok=True)
+    source = sqlite3.connect(src, timeout=30)
+    target = sqlite3.connect(dst)
+    try:
+        last = [-1, 0]
+
+        def _progress(status: int, remaining: int, total: int):
+            if 0 <= last[0] < remaining:
+                last[1] += 1
+                if last[1] > SQLITE_MAX_RESTARTS:
+                    raise _Restarted
+            last[0] = remaining
+            time.sleep(SQLITE_STEP_SLEEP)
+
+        try:
+            source.backup(target, pages=SQLITE_PAGES_PER_STEP, progress=_progress)
+        except _Restarted:
+            logger.warning(t("log.backup.sqlite_backup_retry", path=src))
+            source.backup(target, pages=-1)
+    finally:
+        target.close()
+        source.close()
+
+
+def _hash_file(src: Path) -> Tuple[str, int]:
+    sha = hashlib.sha256()
+    size = 0
+    with open(src, "rb") as fin:
+        while chunk := fin.read(CHUNK_SIZE):
+            sha.update(chunk)
+            size += len(chunk)
+    return sha.hexdigest(), size
+
+
+def _touch(obj: Path) -> bool:
+    """对象存在时刷新其 mtime（重新进入清理宽限期）并返回 True。"""
+    try:
+        os.utime(obj)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _store(src: Path) -> Tuple[str, int, bool]:
+    """把 ``src`` 流式压缩写入对象库，返回 ``(哈希, 大小, 是否新写入)``。
+
+    先只计算哈希，对象库中已有时直接复用，不做压缩。
+    """
+    digest, size = _hash_file(src)
+    if _touch(object_path(digest)):
+        return digest, size, False
+
+    OBJECT_PATH.mkdir(parents=True, exist_ok=True)
+    sha = hashlib.sha256()
+    size = 0
+    fd, tmp = tempfile.mkstemp(dir=OBJECT_PATH, suffix=".tmp")
+    try:
+        with open(src, "rb") as fin, os.fdopen(fd, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=COMPRESS_LEVEL, mtime=0) as fout:
+                while chunk := fin.read(CHUNK_SIZE):
+                    sha.update(chunk)
+                    size += len(chunk)
+                    fout.write(chunk)
+        # 文件可能在两次读取之间被改写，以实际压缩写入的内容为准
+        digest = sha.hexdigest()
+        obj = object_path(digest)
+        if _touch(obj):
+            return digest, size, False
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, obj)
+        return digest, size, True
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def object_path(digest: str) -> Path:
+    return OBJECT_PATH / digest[:2] / f"{digest}.gz"
+
+
+def _iter_files(paths: Iterable[Path]):
+    for src in paths:
+        if src.is_file():
+            yield src
+        elif src.is_dir():
+            for root, dirs, files in os.walk(src):
+                root_path = Path(root)
+                # 备份目录本身不参与备份
+                dirs[:] = [d for d in dirs if not (root_path / d).is_relative_to(backup_path)]
+                for name in sorted(files):
+                    yield root_path / name
+
+
+def _manifest_file(snapshot_id: str) -> Path:
+    return MANIFEST_PATH / f"{snapshot_id}.json"
+
+
+def list_snapshots() -> List[Snapshot]:
+    """按创建时间从旧到新返回所有快照。"""
+    if not MANIFEST_PATH.exists():
+        return []
+    snapshots = []
+    for path in MANIFEST_PATH.glob("*.json"):
+        try:
+            snapshots.append(msgjson.decode(path.read_bytes(), type=Snapshot))
+        except (OSError, msgspec.DecodeError):
+            continue
+    return sorted(snapshots, key=lambda s: s.created)
+
+
+def load_snapshot(snapshot_id: str) -> Snapshot:
+    return msgjson.decode(_manifest_file(snapshot_id).read_bytes(), type=Snapshot)
+
+
+def create_snapshot(
+    paths: Iterable[Path],
+    root: Path = gs_data_path,
+    label: Optional[str] = None,
+) -> Snapshot:
+    """为 ``paths``（文件或目录）创建一次增量快照，路径记录为相对 ``root`` 的形式。"""
+    with _snapshot_lock:
+        return _create_snapshot(paths, root, label)
+
+
+def _create_snapshot(paths: Iterable[Path], root: Path, label: Optional[str]) -> Snapshot:
+    start = time.perf_counter()
+    now = datetime.now()
+    snapshot_id = now.strftime("%Y%m%d-%H%M%S-%f")
+    if label:
+        snapshot_id = f"{snapshot_id}-{label}"
+
+    history = list_snapshots()
+    previous = history[-1].files if history else {}
+    snapshot = Snapshot(id=snapshot_id, created=now.timestamp())
+    new_hashes: Set[str] = set()
+
+    for src in _iter_files(paths):
+        if src.name.endswith(SQLITE_SIDE_SUFFIXES):
+            continue
+        try:
+            rel = src.relative_to(root).as_posix()
+        except ValueError:
+            logger.warning(t("log.backup.src_path_prefix_to_remove_skip", src_path=src, prefix_to_remove=root))
+            continue
+        try:
+            stat = src.stat()
+            old = previous.get(rel)
+            if is_sqlite(src):
+                # 数据库总是重新做一致性复制：WAL 模式下主文件的 mtime 不能反映最新写入
+                OBJECT_PATH.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=OBJECT_PATH, suffix=".db.tmp")
+                os.close(fd)
+                try:
+                    sqlite_backup(src, Path(tmp))
+                    digest, size, new = _store(Path(tmp))
+                finally:
+                    os.remove(tmp)
+                entry = FileEntry(digest, size, stat.st_mtime_ns, sqlite=True)
+            elif (
+                old is not None
+                and old.size == stat.st_size
+                and old.mtime_ns == stat.st_mtime_ns
+                and _touch(object_path(old.hash))
+            ):
+                entry, new = old, False
+            else:
+                digest, size, new = _store(src)
+                entry = FileEntry(digest, size, stat.st_mtime_ns)
+        except Exception as e:
+            logger.warning(t("log.backup.src_path_error", src_path=src, e=e))
+            continue
+
+        snapshot.files[rel] = entry
+        if new and entry.hash not in new_hashes:
+            new_hashes.add(entry.hash)
+            snapshot.new_bytes += entry.size
+        elif not new:
+            snapshot.reused += 1
+
+    snapshot.new_hashes = sorted(new_hashes)
+    MANIFEST_PATH.mkdir(parents=True, exist_ok=True)
+    tmp_manifest = _manifest_file(snapshot_id).with_suffix(".tmp")
+    tmp_manifest.write_bytes(msgjson.encode(snapshot))
+    os.replace(tmp_manifest, _manifest_file(snapshot_id))
+
+    logger.success(
+        t(
+            "log.backup.snapshot_done",
+            snapshot_id=snapshot_id,
+            files=len(snapshot.files),
+            new=len(new_hashes),
+            size=round(snapshot.new_bytes / 1024 / 1024, 2),
+            reused=snapshot.reused,
+            cost=round(time.perf_counter() - start, 2),
+        )
+    )
+    return snapshot
+
+
+def _read_object(digest: str, dst) -> str:
+    """解压对象写入 ``dst``（可为 None），返回内容的实际哈希。"""
+    sha = hashlib.sha256()
+    with gzip.open(object_path(digest), "rb") as fin:
+        while chunk := fin.read(CHUNK_SIZE):
+            sha.update(chunk)
+            if dst is not None:
+                dst.write(chunk)
+    return sha.hexdigest()
+
+
+def _sqlite_ok(path: Path) -> bool:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    finally:
+        conn.close()
+
+
+def verify_snapshot(snapshot: Snapshot, full: bool = False) -> List[str]:
+    """还原校验：解压对象核对哈希，数据库副本额外执行 ``PRAGMA integrity_check``。
+
+    默认只校验本次快照新写入的对象（旧对象在写入它的那次快照中已校验过），
+    ``full=True`` 时校验快照引用的全部文件。返回问题列表，为空表示通过。
+    """
+    errors: List[str] = []
+    checked: Set[str] = set()
+    targets = None if full else set(snapshot.new_hashes)
+    for rel, entry in snapshot.files.items():
+        if entry.hash in checked or (targets is not None and entry.hash not in targets):
+            continue
+        checked.add(entry.hash)
+        try:
+            if entry.sqlite:
+                fd, tmp = tempfile.mkstemp(suffix=".db")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        digest = _read_object(entry.hash, f)
+                    if digest == entry.hash and not _sqlite_ok(Path(tmp)):
+                        errors.append(f"{rel}: integrity_check failed")
+                finally:
+                    os.remove(tmp)
+            else:
+                digest = _read_object(entry.hash, None)
+            if digest != entry.hash:
+                errors.append(f"{rel}: hash mismatch")
+        except Exception as e:
+            errors.append(f"{rel}: {e}")
+
+    if errors:
+        logger.error(t("log.backup.snapshot_verify_fail", snapshot_id=snapshot.id, errors=errors[:5]))
+    else:
+        logger.info(t("log.backup.snapshot_verify_ok", snapshot_id=snapshot.id, files=len(checked)))
+    return errors
+
+
+def restore_snapshot(snapshot: Snapshot, target: Path) -> int:
+    """把快照中的文件还原到 ``target`` 目录下，返回还原的文件数。"""
+    count = 0
+    for rel, entry in snapshot.files.items():
+        dest = (target / rel).resolve()
+        if not dest.is_relative_to(target.resolve()):
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, "wb") as f:
+            _read_object(entry.hash, f)
+        count += 1
+    return count
+
+
+def export_zip(snapshot: Snapshot, zip_path: Path) -> Path:
+    """把快照流式导出为 zip（逐文件解压写入，不在磁盘上展开目录树）。"""
+    tmp = zip_path.with_suffix(".zip.tmp")
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as zf:
+        for rel, entry in snapshot.files.items():
+            info = zipfile.ZipInfo(rel, max(time.localtime(entry.mtime_ns / 1e9)[:6], (1980, 1, 1, 0, 0, 0)))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with zf.open(info, "w", force_zip64=entry.size > 0x7FFFFFFF) as dst:
+                _read_object(entry.hash, dst)
+    os.replace(tmp, zip_path)
+    return zip_path
+
+
+def prune_snapshots(days: int) -> int:
+    """删除超过 ``days`` 天的快照（始终保留最新一份），并回收不再被引用的对象。"""
+    with _snapshot_lock:
+        return _prune_snapshots(days)
+
+
+def _prune_snapshots(days: int) -> int:
+    snapshots = list_snapshots()
+    if not snapshots:
+        return 0
+
+    deadline = time.time() - days * 86400
+    removed = 0
+    for snapshot in snapshots[:-1]:
+        if snapshot.created < deadline:
+            _manifest_file(snapshot.id).unlink(missing_ok=True)
+            removed += 1
+
+    referenced = {e.hash for s in list_snapshots() for e in s.files.values()}
+    freed = 0
+    if OBJECT_PATH.exists():
+        for obj in OBJECT_PATH.glob("*/*.gz"):
+            if obj.name[:-3] not in referenced and obj.stat().st_mtime < time.time() - GC_GRACE_SECONDS:
+                obj.unlink(missing_ok=True)
+                freed += 1
+        # 清理中断残留的临时文件
+        for tmp in OBJECT_PATH.glob("*.tmp"):
+            if tmp.stat().st_mtime < deadline:
+                tmp.unlink(missing_ok=True)
+
+    if removed or freed:
+        logger.info(t("log.backup.snapshot_pruned", count=removed, objects=freed))
+    return removed
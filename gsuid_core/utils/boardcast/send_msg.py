@@ -1,49 +1,319 @@
-import random
+"""广播推送。
+
+``send_board_cast_msg`` 把一次广播落成一个可续推的任务：
+
+- 每个 (目标, 消息) 在 ``GsBroadcastTarget`` 里有一行投递状态，原始消息序列化到
+  ``BROADCAST_PATH/<job_id>.msgpack``，进程重启后由 ``resume_broadcast`` 接着推；
+- 按 WS Bot 与平台各自的令牌桶限速，最多 ``BroadcastConcurrency`` 个目标同时发送，
+  同一目标的多条消息依次发送；
+- 同一份消息对同一平台只转换（图片编码/上传）一次，各目标复用转换结果；
+- 发送失败按 ``RETRY_BACKOFF * 2^n`` 秒退避重试，超过 ``BroadcastMaxRetry`` 次记为失败；
+- 每个目标经所有在线 WS Bot 发送，按 (目标, Bot) 记录送达，重试只补发失败的 Bot；
+  送达以 adapter 回执为准，不支持回执的连接以帧写入连接为准——仅入队不算送达。
+"""
+
+import time
+import uuid
 import asyncio
+from typing import Any, Dict, List, Tuple
+
+import msgspec
 
 from gsuid_core.gss import gss
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
+from gsuid_core.models import Message
+from gsuid_core.server import on_core_start
+from gsuid_core.segment import convert_message
+from gsuid_core.shutdown import shutdown_event
+from gsuid_core.data_store import get_res_path
+from gsuid_core.utils.token_bucket import TokenBucket
+from gsuid_core.utils.database.models import GsBroadcastTarget
+from gsuid_core.utils.plugins_config.gs_config import sp_config
 
 from .models import BoardCastMsgDict
 
+BROADCAST_PATH = get_res_path(["GsCore", "broadcast"])
+# 首次重试等待秒数，之后每次翻倍
+RETRY_BACKOFF = 5.0
+# 投递记录保留时长
+KEEP_SECONDS = 7 * 86400
+# 等待出站帧真正写入连接的上限（秒）；超时记为失败、按退避重试
+ACK_TIMEOUT = 60.0
 
-async def send_board_cast_msg(msgs: BoardCastMsgDict):
-    logger.info(t("log.message.push_task_start"))
-    private_msg_list = msgs["private_msg_dict"]
-    group_msg_list = msgs["group_msg_dict"]
-    # 执行私聊推送
-    for qid in private_msg_list:
+_bot_buckets: Dict[str, TokenBucket] = {}
+_platform_buckets: Dict[str, TokenBucket] = {}
+_running: Dict[str, asyncio.Task] = {}
+
+
+def _bucket(buckets: Dict[str, TokenBucket], key: str, rate: float) -> TokenBucket:
+    bucket = buckets.get(key)
+    if bucket is None or bucket.rate != rate:
+        bucket = buckets[key] = TokenBucket(rate)
+    return bucket
+
+
+async def _wait_shutdown(timeout: float) -> bool:
+    """等待 ``timeout`` 秒，期间收到退出信号则提前返回 True。"""
+    try:
+        await asyncio.wait_for(shutdown_event.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+def _encode_payloads(payloads: List[List[Message]]) -> bytes:
+    return msgspec.msgpack.encode(payloads)
+
+
+def _to_message(item: Any) -> Any:
+    if isinstance(item, dict):
+        msg = msgspec.convert(item, Message)
+        if msg.type == "node" and isinstance(msg.data, list):
+            msg.data = [_to_message(i) for i in msg.data]
+        return msg
+    return item
+
+
+def _decode_payloads(data: bytes) -> List[List[Message]]:
+    return [[_to_message(item) for item in payload] for payload in msgspec.msgpack.decode(data)]
+
+
+class _Renderer:
+    """同一份消息按平台只转换一次。"""
+
+    def __init__(self, payloads: List[List[Message]]) -> None:
+        self.payloads = payloads
+        self._cache: Dict[Tuple[int, str], "asyncio.Future[List[Message]]"] = {}
+
+    async def render(self, index: int, bot_id: str) -> List[Message]:
+        key = (index, bot_id)
+        fut = self._cache.get(key)
+        if fut is None:
+            fut = self._cache[key] = asyncio.ensure_future(convert_message(self.payloads[index], bot_id, ""))
         try:
-            for bot_id in gss.active_bot:
-                for single in private_msg_list[qid]:
-                    await gss.active_bot[bot_id].target_send(
-                        single["messages"],
-                        "direct",
-                        qid,
-                        single["bot_id"],
-                        "",
-                        "",
-                    )
+            return await asyncio.shield(fut)
+        except Exception:
+            # 转换失败不缓存，下次重试重新转换
+            self._cache.pop(key, None)
+            raise
+
+
+async def _send_confirmed(bot: Any, record: GsBroadcastTarget, message: List[Message]) -> None:
+    """经一个 WS Bot 发送并确认送达，未确认则抛错。
+
+    adapter 回执（``recall_message_id``）带回消息 ID 即送达；已知会回执的连接没拿到 ID
+    视为平台侧未发出。不回执的连接退而以每一帧写入连接为准。
+    """
+    written: List[asyncio.Future] = []
+    ids = await bot.target_send(
+        message,
+        record.target_type,  # type: ignore
+        record.target_id,
+        record.bot_id,
+        "",
+        "",
+        wait_recall=True,
+        delivered=written,
+    )
+    if not written:
+        # 没有可发送的帧（目标被静音 / 转发消息被配置为不发送）：无需重试
+        return
+    # 回执窗口结束时帧已全部写出，没拿到回执才能说明平台侧未发出；写得晚的帧只能以写入为准
+    written_in_window = all(f.done() for f in written)
+    _, pending = await asyncio.wait(written, timeout=ACK_TIMEOUT)
+    for fut in pending:
+        fut.cancel()
+    if pending:
+        raise TimeoutError("frames not written to the connection")
+    for fut in written:
+        if fut.cancelled():
+            raise ConnectionError("send cancelled by disconnect")
+        fut.result()
+    if not ids and written_in_window and getattr(bot, "_supports_recall", None) is True:
+        raise RuntimeError("no delivery receipt from adapter")
+
+
+async def _deliver(record: GsBroadcastTarget, renderer: _Renderer) -> None:
+    """经全部在线 WS Bot 发送一个目标，已送达的 Bot 记入 ``record.done_bots``；有 Bot 失败则抛错。"""
+    done = {b for b in record.done_bots.split(",") if b}
+    bots = [(ws_bot_id, bot) for ws_bot_id, bot in gss.active_bot.items() if ws_bot_id not in done]
+    if not bots:
+        if done:
+            return
+        raise RuntimeError("no active bot")
+
+    message = await renderer.render(record.payload, record.bot_id)
+    bot_rate: float = sp_config.get_config("BroadcastBotRate").data
+    platform_rate: float = sp_config.get_config("BroadcastPlatformRate").data
+    errors: List[str] = []
+    for ws_bot_id, bot in bots:
+        await _bucket(_bot_buckets, ws_bot_id, bot_rate).acquire()
+        await _bucket(_platform_buckets, record.bot_id, platform_rate).acquire()
+        try:
+            await _send_confirmed(bot, record, message)
         except Exception as e:
-            logger.warning(t("log.message.qid_fail_error", qid=qid, e=e))
-        await asyncio.sleep(0.5)
-    logger.info(t("log.message.push_private_ok"))
+            errors.append(f"{ws_bot_id}: {e!r}")
+            continue
+        done.add(ws_bot_id)
+        record.done_bots = ",".join(sorted(done))
+    if errors:
+        raise RuntimeError("; ".join(errors))
+
 
-    # 执行群聊推送
-    for gid in group_msg_list:
+async def _send_target(records: List[GsBroadcastTarget], renderer: _Renderer, max_retry: int) -> None:
+    for record in records:
+        attempts = record.attempts + 1
         try:
-            for bot_id in gss.active_bot:
-                await gss.active_bot[bot_id].target_send(
-                    group_msg_list[gid]["messages"],
-                    "group",
-                    gid,
-                    group_msg_list[gid]["bot_id"],
-                    "",
-                    "",
-                )
+            await _deliver(record, renderer)
         except Exception as e:
-            logger.warning(t("log.message.gid_fail_error", gid=gid, e=e))
-        await asyncio.sleep(0.5 + random.randint(1, 3))
-    logger.info(t("log.message.push_group_ok"))
+            logger.warning(
+                t(
+                    "log.message.broadcast_target_fail",
+                    target_type=record.target_type,
+                    target_id=record.target_id,
+                    attempts=attempts,
+                    e=e,
+                )
+            )
+            if attempts > max_retry:
+                await GsBroadcastTarget.set_state(
+                    record.id, "failed", attempts, error=str(e), done_bots=record.done_bots
+                )
+            else:
+                next_retry = time.time() + RETRY_BACKOFF * 2 ** (attempts - 1)
+                await GsBroadcastTarget.set_state(record.id, "retry", attempts, next_retry, str(e), record.done_bots)
+            continue
+        await GsBroadcastTarget.set_state(record.id, "done", attempts, done_bots=record.done_bots)
+
+
+async def _run_job(job_id: str, payloads: List[List[Message]]) -> None:
+    started = time.time()
+    renderer = _Renderer(payloads)
+    while not shutdown_event.is_set():
+        records = await GsBroadcastTarget.get_unfinished(job_id)
+        if not records:
+            break
+        now = time.time()
+        due = [r for r in records if r.next_retry <= now]
+        if not due:
+            await _wait_shutdown(min(r.next_retry for r in records) - now)
+            continue
+
+        # 同一目标的多条消息保持顺序
+        targets: Dict[Tuple[str, str], List[GsBroadcastTarget]] = {}
+        for record in due:
+            targets.setdefault((record.target_type, record.target_id), []).append(record)
+
+        sem = asyncio.Semaphore(max(1, sp_config.get_config("BroadcastConcurrency").data))
+        max_retry: int = sp_config.get_config("BroadcastMaxRetry").data
+
+        async def _one(records: List[GsBroadcastTarget]):
+            async with sem:
+                await _send_target(records, renderer, max_retry)
+
+        await asyncio.gather(*(_one(records) for records in targets.values()))
+
+    if not shutdown_event.is_set():
+        states = await GsBroadcastTarget.count_states(job_id)
+        (BROADCAST_PATH / f"{job_id}.msgpack").unlink(missing_ok=True)
+        logger.info(
+            t(
+                "log.message.broadcast_done",
+                job_id=job_id,
+                done=states.get("done", 0),
+                failed=states.get("failed", 0),
+                cost=round(time.time() - started, 2),
+            )
+        )
+
+
+async def _start_job(job_id: str, payloads: List[List[Message]]) -> None:
+    task = _running.get(job_id)
+    if task is None or task.done():
+        task = _running[job_id] = asyncio.create_task(_run_job(job_id, payloads))
+        task.add_done_callback(lambda _: _running.pop(job_id, None))
+    await asyncio.shield(task)
+
+
+async def send_board_cast_msg(msgs: BoardCastMsgDict) -> str:
+    """广播推送 ``msgs``，全部目标处理完（成功或重试耗尽）后返回任务 ID。"""
+    logger.info(t("log.message.push_task_start"))
+    payloads: List[List[Message]] = []
+    payload_index: Dict[int, int] = {}
+
+    def _payload(messages: List[Message]) -> int:
+        # 同一个消息列表对象只保存一份（如向所有群推送同一条公告）
+        key = id(messages)
+        if key not in payload_index:
+            payload_index[key] = len(payloads)
+            payloads.append(messages)
+        return payload_index[key]
+
+    targets: List[Tuple[str, str, str, int]] = []
+    for qid, singles in msgs["private_msg_dict"].items():
+        for single in singles:
+            targets.append(("direct", qid, single["bot_id"], _payload(single["messages"])))
+    for gid, single in msgs["group_msg_dict"].items():
+        targets.append(("group", gid, single["bot_id"], _payload(single["messages"])))
+
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    rows: List[Dict[str, Any]] = [
+        {
+            "job_id": job_id,
+            "seq": seq,
+            "target_type": target_type,
+            "target_id": target_id,
+            "bot_id": bot_id,
+            "payload": payload,
+            "created_at": now,
+        }
+        for seq, (target_type, target_id, bot_id, payload) in enumerate(targets)
+    ]
+    if not rows:
+        logger.info(t("log.message.push_task"))
+        return job_id
+
+    try:
+        (BROADCAST_PATH / f"{job_id}.msgpack").write_bytes(_encode_payloads(payloads))
+    except Exception as e:
+        # 无法序列化的消息照常推送，只是中断后不能续推
+        logger.warning(t("log.message.broadcast_persist_fail", job_id=job_id, e=e))
+    await GsBroadcastTarget.delete_outdate(now - KEEP_SECONDS)
+    await GsBroadcastTarget.add_targets(rows)
+    logger.info(t("log.message.broadcast_job", job_id=job_id, total=len(rows), payloads=len(payloads)))
+
+    await _start_job(job_id, payloads)
     logger.info(t("log.message.push_task"))
+    return job_id
+
+
+async def _resume(job_ids: List[str]):
+    while not gss.active_bot:
+        if await _wait_shutdown(1):
+            return
+    for job_id in job_ids:
+        path = BROADCAST_PATH / f"{job_id}.msgpack"
+        try:
+            payloads = _decode_payloads(path.read_bytes())
+        except Exception as e:
+            logger.warning(t("log.message.broadcast_persist_fail", job_id=job_id, e=e))
+            await GsBroadcastTarget.abandon(job_id, str(e))
+            continue
+        logger.info(t("log.message.broadcast_resume", job_id=job_id))
+        await _start_job(job_id, payloads)
+
+
+@on_core_start
+async def resume_broadcast():
+    """继续因重启中断的广播推送（等到有 Bot 连接后开始）。"""
+    try:
+        job_ids = await GsBroadcastTarget.get_unfinished_jobs()
+    except Exception as e:
+        logger.warning(t("log.message.broadcast_persist_fail", job_id="-", e=e))
+        return
+    if job_ids:
+        task = asyncio.create_task(_resume(job_ids))
+        _running["__resume__"] = task
+        task.add_done_callback(lambda _: _running.pop("__resume__", None))
@@ -1,22 +1,117 @@
+"""``gs_cache``：按参数缓存函数结果。
+
+- 普通返回值放在有上限的内存 LRU（``MEMORY_MAX_ITEMS``）里，条目记绝对过期时间，命中检查 O(1)；
+- 图片结果（``Image`` / ``bytes`` / ``base64://``）写入共享的 ``DiskCache``，受 ``CacheMaxMB`` 限制，
+  命中时按原逻辑返回 ``base64://`` 字符串；
+- 同一 key 的并发调用只执行一次被装饰函数，其余调用等待并共享其结果。
+"""
+
 import json
 import time
 import base64
+import shutil
+import asyncio
 import inspect
-from typing import Dict, List, Tuple, Union
+import threading
+from io import BytesIO
+from typing import Any, Dict, List, Tuple, Optional
 from pathlib import Path
 from functools import wraps
+from collections import OrderedDict
 
-import aiofiles
 from PIL import Image
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
+from gsuid_core.server import on_core_start
 from gsuid_core.data_store import get_res_path
+from gsuid_core.utils.disk_cache import get_disk_cache, consume_exception
 from gsuid_core.utils.image.convert import convert_img, convert_img_sync
 
 IMAGE_CACHE = get_res_path("IMAGE_CACHE")
-
-CACHE: Dict[float, Dict[str, Union[Path, str]]] = {}
+MEMORY_MAX_ITEMS = 4096
+
+# 值为 _ON_DISK 表示结果是图片，实际内容在磁盘缓存里
+_ON_DISK = object()
+_MEMORY: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+# 同步函数按 key 哈希分段加锁，避免锁表无限增长
+_sync_locks = [threading.Lock() for _ in range(64)]
+_stats = {"hits": 0, "misses": 0, "shared": 0}
+
+
+def _make_key(prefix: str, args, kwargs) -> str:
+    file_key = prefix
+    for arg in list(args) + list(kwargs.values()):
+        if isinstance(arg, (str, int, float, bool, Tuple, Path)):
+            file_key += "_" + repr(arg)
+        elif isinstance(arg, Dict):
+            file_key += "_" + str(hash(json.dumps(arg, sort_keys=True)))
+        elif isinstance(arg, List):
+            file_key += "_" + str(hash(json.dumps(arg)))
+    return file_key
+
+
+def _memory_get(file_key: str) -> Tuple[bool, Any]:
+    with _memory_lock:
+        item = _MEMORY.get(file_key)
+        if item is None:
+            return False, None
+        if item[0] <= time.time():
+            del _MEMORY[file_key]
+            return False, None
+        _MEMORY.move_to_end(file_key)
+        return True, item[1]
+
+
+def _memory_put(file_key: str, value: Any, expire_time: float) -> None:
+    with _memory_lock:
+        _MEMORY[file_key] = (time.time() + expire_time, value)
+        _MEMORY.move_to_end(file_key)
+        while len(_MEMORY) > MEMORY_MAX_ITEMS:
+            _MEMORY.popitem(last=False)
+
+
+def _is_image(result: Any) -> bool:
+    return isinstance(result, (Image.Image, bytes)) or (isinstance(result, str) and result.startswith("base64://"))
+
+
+def _image_bytes(result: Any) -> Optional[bytes]:
+    if isinstance(result, Image.Image):
+        buffer = BytesIO()
+        result.save(buffer, format="JPEG" if result.mode in ("RGB", "L") else "PNG")
+        return buffer.getvalue()
+    elif isinstance(result, bytes):
+        return result
+    elif isinstance(result, str) and result.startswith("base64://"):
+        return base64.b64decode(result[9:])
+    return None
+
+
+def _lookup(file_key: str) -> Tuple[bool, Any]:
+    """返回 (是否命中, 值)；图片结果命中时值为磁盘文件路径。"""
+    hit, value = _memory_get(file_key)
+    if hit and value is _ON_DISK:
+        path = get_disk_cache().get_path(f"gs_cache:{file_key}")
+        hit, value = path is not None, path
+    _stats["hits" if hit else "misses"] += 1
+    return hit, value
+
+
+def _store(file_key: str, result: Any, expire_time: float) -> None:
+    img_data = _image_bytes(result)
+    if img_data is not None:
+        get_disk_cache().put_sync(f"gs_cache:{file_key}", img_data, expire_time)
+        _memory_put(file_key, _ON_DISK, expire_time)
+    else:
+        _memory_put(file_key, result, expire_time)
+
+
+def cache_stats() -> Dict[str, Any]:
+    with _memory_lock:
+        memory = len(_MEMORY)
+    return {**_stats, "memory_items": memory, "inflight": len(_inflight), "disk": get_disk_cache().stats()}
 
 
 def gs_cache(expire_time=3600):
@@ -27,149 +122,76 @@ def gs_cache(expire_time=3600):
 
             @wraps(func)
             async def inner_async(*args, **kwargs):
-                time_key = time.time()
-                all_args = list(args) + list(kwargs.values())
-                file_key = func.__name__
-                for arg in all_args:
-                    if isinstance(arg, (str, int, float, bool, Tuple, Path)):
-                        file_key += "_" + repr(arg)
-                    elif isinstance(arg, Dict):
-                        file_key += "_" + str(hash(json.dumps(arg, sort_keys=True)))
-                    elif isinstance(arg, List):
-                        file_key += "_" + str(hash(json.dumps(arg)))
-                    else:
-                        continue
+                file_key = _make_key(func.__name__, args, kwargs)
+                logger.trace(lt("log.cache.start_event", p0=func.__name__))
 
-                if not file_key:
-                    file_key = repr(func.__name__)
+                hit, value = _lookup(file_key)
+                if hit:
+                    logger.trace(lt("log.cache.hit_value", p0=func.__name__, _value=value))
+                    return await convert_img(value) if isinstance(value, Path) else value
 
-                result = _value = None
-                WILL_DELETE = []
-
-                logger.trace(t("log.cache.start_event", p0=func.__name__))
-                logger.trace(CACHE)
-
-                for key in CACHE:
-                    value = CACHE[key]
-                    if time_key - key <= expire_time:
-                        if file_key in value:
-                            _value = value[file_key]
-                            logger.trace(t("log.cache.hit_value", p0=func.__name__, _value=_value))
-                            break
-                    else:
-                        WILL_DELETE.append(key)
+                task = _inflight.get(file_key)
+                if task is not None:
+                    _stats["shared"] += 1
                 else:
-                    result = await func(*args, **kwargs)
+                    # 执行放在缓存自己的任务里，某个调用方被取消不会连带其余等待者
+                    task = _inflight[file_key] = asyncio.create_task(_call(file_key, args, kwargs))
+                    task.add_done_callback(consume_exception)
+                return await asyncio.shield(task)
 
-                if WILL_DELETE:
-                    for key in WILL_DELETE:
-                        if key in CACHE:
-                            del CACHE[key]
-
-                if _value is not None:
-                    if isinstance(_value, Path):
-                        result = await convert_img(_value)
-                    else:
-                        result = _value
-                elif result is not None:
-                    img_data = None
-                    cache_target = IMAGE_CACHE / f"{time_key}_{file_key}.jpg"
-                    if isinstance(result, Image.Image):
-                        result.save(cache_target)
-                    elif isinstance(result, bytes):
-                        img_data = result
-                    elif isinstance(result, str) and result.startswith("base64://"):
-                        img_data = base64.b64decode(result[9:])
-                    else:
-                        cache_target = result
-
-                    if img_data:
-                        async with aiofiles.open(cache_target, "wb") as f:
-                            await f.write(img_data)
-
-                    if time_key not in CACHE:
-                        CACHE[time_key] = {}
-                    if file_key not in CACHE[time_key]:
-                        CACHE[time_key][file_key] = cache_target
-
-                    logger.trace(t("log.cache.entering_event", p0=func.__name__))
-
-                return result
+            async def _call(file_key: str, args, kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                    if result is not None:
+                        if _is_image(result):
+                            await asyncio.to_thread(_store, file_key, result, expire_time)
+                        else:
+                            _memory_put(file_key, result, expire_time)
+                        logger.trace(lt("log.cache.entering_event", p0=func.__name__))
+                    return result
+                finally:
+                    _inflight.pop(file_key, None)
 
             return inner_async
         else:
 
             @wraps(func)
             def inner_sync(*args, **kwargs):
-                time_key = time.time()
-                all_args = list(args) + list(kwargs.values())
-                file_key = ""
-                for arg in all_args:
-                    if isinstance(arg, (str, int, float, bool, Tuple, Path)):
-                        file_key += "_" + repr(arg)
-                    elif isinstance(arg, Dict):
-                        file_key += "_" + str(hash(json.dumps(arg, sort_keys=True)))
-                    elif isinstance(arg, List):
-                        file_key += "_" + str(hash(json.dumps(arg)))
-                    else:
-                        continue
-
+                file_key = _make_key("", args, kwargs)
                 if not file_key:
                     file_key = repr(func.__name__)
-
-                result = _value = None
-                WILL_DELETE = []
-
-                logger.trace(t("log.cache.start_event", p0=func.__name__))
-                logger.trace(CACHE)
-
-                for key in CACHE:
-                    value = CACHE[key]
-                    if time_key - key <= expire_time:
-                        if file_key in value:
-                            _value = value[file_key]
-                            logger.trace(t("log.cache.hit_value", p0=func.__name__, _value=_value))
-                            break
-                    else:
-                        WILL_DELETE.append(key)
-                else:
-                    result = func(*args, **kwargs)
-
-                if WILL_DELETE:
-                    for key in WILL_DELETE:
-                        if key in CACHE:
-                            del CACHE[key]
-
-                if _value is not None:
-                    if isinstance(_value, Path):
-                        result = convert_img_sync(_value)
-                    else:
-                        result = _value
-                elif result is not None:
-                    img_data = None
-                    cache_target = IMAGE_CACHE / f"{time_key}_{file_key}.jpg"
-                    if isinstance(result, Image.Image):
-                        result.save(cache_target)
-                    elif isinstance(result, bytes):
-                        img_data = result
-                    elif isinstance(result, str) and result.startswith("base64://"):
-                        img_data = base64.b64decode(result[9:])
-                    else:
-                        cache_target = result
-
-                    if img_data:
-                        with open(cache_target, "wb") as f:
-                            f.write(img_data)
-
-                    if time_key not in CACHE:
-                        CACHE[time_key] = {}
-                    if file_key not in CACHE[time_key]:
-                        CACHE[time_key][file_key] = cache_target
-
-                    logger.trace(t("log.cache.entering_event", p0=func.__name__))
-
-                return result
+                logger.trace(lt("log.cache.start_event", p0=func.__name__))
+
+                hit, value = _lookup(file_key)
+                if not hit:
+                    # 多线程并发调用同一 key 时只计算一次
+                    with _sync_locks[hash(file_key) % len(_sync_locks)]:
+                        hit, value = _memory_get(file_key)
+                        if hit and value is _ON_DISK:
+                            path = get_disk_cache().get_path(f"gs_cache:{file_key}")
+                            hit, value = path is not None, path
+                        if not hit:
+                            result = func(*args, **kwargs)
+                            if result is not None:
+                                _store(file_key, result, expire_time)
+                                logger.trace(lt("log.cache.entering_event", p0=func.__name__))
+                            return result
+
+                logger.trace(lt("log.cache.hit_value", p0=func.__name__, _value=value))
+                return convert_img_sync(value) if isinstance(value, Path) else value
 
             return inner_sync
 
     return wrapper
+
+
+def _purge_legacy_files() -> None:
+    # 旧版 gs_cache 直接写在 IMAGE_CACHE 根目录、sget 写在 IMAGE_CACHE/sget，从不清理
+    for file in IMAGE_CACHE.glob("*.jpg"):
+        file.unlink(missing_ok=True)
+    shutil.rmtree(IMAGE_CACHE / "sget", ignore_errors=True)
+
+
+@on_core_start
+async def _purge_legacy_cache():
+    await asyncio.to_thread(_purge_legacy_files)
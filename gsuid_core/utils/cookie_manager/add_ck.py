@@ -4,7 +4,7 @@ from http.cookies import SimpleCookie
 
 from PIL import Image, ImageDraw
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.api.mys_api import mys_api
 from gsuid_core.utils.error_reply import UID_HINT
@@ -132,7 +132,7 @@ async def refresh_ck_by_uid_list(
 
 async def deal_ck(bot_id: str, mes: str, user_id: str, mode: str = "PIC"):
     im = await _deal_ck(bot_id, mes, user_id)
-    logger.debug(t("log.cookie.add_ck_im_create", im=im))
+    logger.debug(lt("log.cookie.add_ck_im_create", im=im))
     img, status = await _deal_ck_to_pic(im)
     if mode == "PIC":
         return img, status
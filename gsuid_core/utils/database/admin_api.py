@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Type, Tuple, Optional
 
 from sqlmodel import SQLModel, func, select
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.webconsole.mount_app import GsAdminModel, site
 from gsuid_core.utils.database.base_models import async_maker
@@ -187,7 +187,7 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
     plugin_tables: Dict[str, List[DatabaseTableInfo]] = {}
     table_info_cache: Dict[str, DatabaseTableInfo] = {}
 
-    logger.debug(t("log.db_admin.collect_start"))
+    logger.debug(lt("log.db_admin.collect_start"))
 
     found_admins = []
 
@@ -202,7 +202,7 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
                 if model is not None:
                     found_admins.append(obj)
                     logger.trace(
-                        t(
+                        lt(
                             "log.db_admin.model_found",
                             admin_name=name,
                             model_name=model.__name__,
@@ -214,7 +214,7 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
 
         traceback.print_exc()
 
-    logger.debug(t("log.db_admin.admin_count", count=len(found_admins)))
+    logger.debug(lt("log.db_admin.admin_count", count=len(found_admins)))
 
     # 处理找到的每个 admin
     for admin_cls in found_admins:
@@ -252,7 +252,7 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
         plugin_id, plugin_name = _get_plugin_id_from_model(model_class)
 
         logger.trace(
-            t(
+            lt(
                 "log.db_admin.adding_table_name_page_create",
                 table_name=table_name,
                 page_title=page_title,
@@ -268,14 +268,14 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
     # 也检查 site.plugins_page（用于插件）
     try:
         logger.trace(
-            t(
+            lt(
                 "log.db_admin.plugins_page_start",
                 plugin_count=len(site.plugins_page),
             )
         )
         for plugin_name, admin_list in site.plugins_page.items():
             logger.trace(
-                t(
+                lt(
                     "log.db_admin.plugin_admins",
                     plugin_name=plugin_name,
                     admin_count=len(admin_list),
@@ -310,7 +310,7 @@ def _collect_admin_models() -> Dict[str, List[DatabaseTableInfo]]:
                     table_info_cache[table_name] = table_info
 
                     logger.trace(
-                        t(
+                        lt(
                             "log.db_admin.adding_table_name_page_create",
                             table_name=table_name,
                             page_title=page_title,
@@ -1,3 +1,4 @@
+import time
 import asyncio
 import sqlite3
 from typing import (
@@ -31,6 +32,7 @@ from sqlalchemy.sql.expression import func, null, true
 
 from gsuid_core.i18n import t as i18n_t
 from gsuid_core.logger import logger
+from gsuid_core.metrics import DB_SESSION_WAIT_SECONDS
 from gsuid_core.data_store import get_res_path
 from gsuid_core.utils.plugins_config.gs_config import database_config
 
@@ -226,7 +228,9 @@ def with_session(
         for attempt in range(max_retries):
             try:
                 if sqlite_semaphore:
+                    wait_start = time.perf_counter()
                     async with sqlite_semaphore:
+                        DB_SESSION_WAIT_SECONDS.observe(time.perf_counter() - wait_start)
                         async with async_maker() as session:
                             data = await func(self, session, *args, **kwargs)
                             await session.commit()
@@ -324,6 +328,29 @@ async def get_simple_schema_info(engine: AsyncEngine) -> Dict[str, List[Dict[str
 
 
 # https://github.com/tiangolo/sqlmodel/issues/264
+def insert_ignore(model: Any):
+    """按方言构造「主键/唯一键冲突即跳过」的 INSERT，可配合 ``.values([...])`` 做多行写入。
+
+    SQLite / PostgreSQL 为 ``ON CONFLICT DO NOTHING``，MySQL 为 ``ON DUPLICATE KEY UPDATE id=id``。
+    """
+    if _db_type == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+
+        return insert(model).on_conflict_do_nothing()
+    elif _db_type == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+
+        return insert(model).on_conflict_do_nothing()
+    elif _db_type == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        return insert(model).on_duplicate_key_update(id=model.__table__.c.id)
+    else:
+        from sqlalchemy import insert
+
+        return insert(model)
+
+
 class BaseIDModel(SQLModel):
     id: int = Field(default=None, primary_key=True, title="序号")
 
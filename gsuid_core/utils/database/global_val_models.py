@@ -1,5 +1,5 @@
 import enum
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Set, Dict, List, Tuple, Optional, TypedDict
 from datetime import date as ymddate, datetime, timedelta
 
 from sqlmodel import Field, Index, col, func, delete, select
@@ -7,6 +7,8 @@ from sqlalchemy import UniqueConstraint, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Select
 
+from gsuid_core.utils.sketch import TopK, HyperLogLog, union_count
+
 from .base_models import BaseIDModel, with_session
 
 
@@ -433,157 +435,29 @@ class CoreDataAnalysis(BaseIDModel, table=True):
             out[key] = int(total or 0)
         return out
 
-    @classmethod
-    @with_session
-    async def _get_stats_for_type(
-        cls,
-        session: AsyncSession,
-        data_type: DataType,
-        today: ymddate,
-        thirty_days_ago: ymddate,
-        seven_days_ago: ymddate,
-        bot_id: Optional[str] = None,
-        bot_self_id: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        stats = {}
-
-        # --- DAU/DAG Calculation (This part was correct) ---
-        dau_query = select(
-            col(cls.date),
-            func.count(distinct(col(cls.target_id))).label("daily_count"),
-        )
-        dau_query = dau_query.where(
-            cls.data_type == data_type,
-            cls.date >= thirty_days_ago,
-            cls.date < today,
-        )
-        if bot_id:
-            dau_query = dau_query.where(cls.bot_id == bot_id)
-        if bot_self_id:
-            dau_query = dau_query.where(cls.bot_self_id == bot_self_id)
-
-        daily_active_subquery = dau_query.group_by(col(cls.date)).subquery()
-        avg_daily_query = select(func.avg(daily_active_subquery.c.daily_count))
-        avg_result = await session.execute(avg_daily_query)
-        stats["dau_dag"] = avg_result.scalar_one_or_none() or 0.0
-
-        twenty_nine_days_ago = today - timedelta(days=29)
-
-        past_targets_query = (
-            select(cls.target_id)
-            .where(
-                cls.data_type == data_type,
-                cls.date >= twenty_nine_days_ago,
-                cls.date < today,
-            )
-            .distinct()
-        )
-        if bot_id:
-            past_targets_query = past_targets_query.where(
-                cls.bot_id == bot_id,
-            )
-        if bot_self_id:
-            past_targets_query = past_targets_query.where(cls.bot_self_id == bot_self_id)
-
-        new_targets_query = select(func.count(distinct(col(cls.target_id)))).where(
-            cls.data_type == data_type,
-            cls.date == today,
-            col(cls.target_id).not_in(past_targets_query),  # type: ignore
-        )
-        if bot_id:
-            new_targets_query = new_targets_query.where(cls.bot_id == bot_id)
-        if bot_self_id:
-            new_targets_query = new_targets_query.where(cls.bot_self_id == bot_self_id)
-
-        new_targets_count_result = await session.execute(new_targets_query)
-        stats["new"] = new_targets_count_result.scalar_one()
-
-        # --- OU/OG Calculation (Corrected Logic) ---
-        recent_active_subquery = (
-            select(col(cls.target_id))
-            .where(
-                cls.data_type == data_type,
-                cls.date >= seven_days_ago,
-                cls.date < today,
-            )
-            .distinct()
-        )
-
-        if bot_id:
-            recent_active_subquery = recent_active_subquery.where(cls.bot_id == bot_id)
-        if bot_self_id:
-            recent_active_subquery = recent_active_subquery.where(cls.bot_self_id == bot_self_id)
-
-        out_targets_query = select(func.count(distinct(col(cls.target_id)))).where(
-            cls.data_type == data_type,
-            cls.date >= thirty_days_ago,
-            cls.date < today,
-            col(cls.target_id).not_in(recent_active_subquery),
-        )
-
-        if bot_id:
-            out_targets_query = out_targets_query.where(cls.bot_id == bot_id)
-        if bot_self_id:
-            out_targets_query = out_targets_query.where(cls.bot_self_id == bot_self_id)
-
-        out_targets_result = await session.execute(out_targets_query)
-        out_targets_count = out_targets_result.scalar_one()
-
-        # The denominator query for the rate calculation
-        total_targets_in_30_days_query = select(func.count(distinct(col(cls.target_id)))).where(
-            cls.data_type == data_type,
-            cls.date >= thirty_days_ago,
-            cls.date < today,
-        )
-        if bot_id:
-            total_targets_in_30_days_query = total_targets_in_30_days_query.where(cls.bot_id == bot_id)
-        if bot_self_id:
-            total_targets_in_30_days_query = total_targets_in_30_days_query.where(cls.bot_self_id == bot_self_id)
-
-        total_targets_result = await session.execute(total_targets_in_30_days_query)
-        total_targets_count = total_targets_result.scalar_one()
-
-        stats["mau"] = total_targets_count
-
-        if total_targets_count > 0:
-            stats["stickiness"] = (stats["dau_dag"] / total_targets_count) * 100
-        else:
-            stats["stickiness"] = 0.0
-
-        # Calculate rate
-        out_rate = (out_targets_count / total_targets_count * 100) if total_targets_count > 0 else 0
-        stats["out_rate"] = out_rate
-
-        return stats
-
     @classmethod
     async def calculate_dashboard_metrics(
         cls,
         bot_id: Optional[str] = None,
         bot_self_id: Optional[str] = None,
     ) -> CountVal:
-        today = ymddate.today()
-        thirty_days_ago = today - timedelta(days=30)
-        seven_days_ago = today - timedelta(days=7)
+        """近 30 天活跃指标。
 
-        user_stats = await cls._get_stats_for_type(
-            DataType.USER,
+        由 ``CoreDataSketch`` 的每日草图合并得出：一次查询取回至多 31 行 × Bot 数的
+        草图，不再对明细表做多次 ``COUNT(DISTINCT)`` 扫描。MAU / 新增 / 流失为
+        HyperLogLog 估计值，相对误差约 1.6%。
+        """
+        today = ymddate.today()
+        daily = await CoreDataSketch.get_daily_sketches(
+            today - timedelta(days=30),
             today,
-            thirty_days_ago,
-            seven_days_ago,
             bot_id,
             bot_self_id,
         )
 
+        user_stats = _window_stats({d: v[0] for d, v in daily.items()}, today)
         # 计算群组相关指标
-        group_stats = await cls._get_stats_for_type(
-            DataType.GROUP,
-            today,
-            thirty_days_ago,
-            seven_days_ago,
-            bot_id,
-            bot_self_id,
-        )
+        group_stats = _window_stats({d: v[1] for d, v in daily.items()}, today)
 
         # 格式化并返回最终结果
         result_data: CountVal = {
@@ -602,3 +476,142 @@ class CoreDataAnalysis(BaseIDModel, table=True):
         }
 
         return result_data
+
+
+class CoreDataSketch(BaseIDModel, table=True):
+    """每个 (日期, Bot) 一行：当日活跃用户 / 群聊的 HyperLogLog 与指令 Top-K 摘要。
+
+    与 ``CoreDataSummary`` 同时写入；跨日指标直接合并草图，内存与查询量只随天数增长。
+    """
+
+    __table_args__ = (
+        UniqueConstraint(
+            "date",
+            "bot_id",
+            "bot_self_id",
+            name="record_sketch",
+        ),
+        {"extend_existing": True},
+    )
+
+    users: bytes = Field(title="活跃用户草图", default=b"")
+    groups: bytes = Field(title="活跃群聊草图", default=b"")
+    commands: bytes = Field(title="指令Top-K摘要", default=b"")
+    bot_id: str = Field(title="机器人平台", max_length=64)
+    bot_self_id: str = Field(title="机器人自身ID", max_length=64)
+    date: ymddate = Field(title="日期", index=True)
+
+    @classmethod
+    @with_session
+    async def delete_outdate(
+        cls,
+        session: AsyncSession,
+        days: int = 300,
+    ):
+        """
+        删除过期数据。
+        """
+        today = datetime.now().date()
+        days_ago = today - timedelta(days=days)
+        query = delete(cls).where(cls.date < days_ago)  # type: ignore
+        await session.execute(query)
+        await session.commit()
+
+    @classmethod
+    @with_session
+    async def get_daily_sketches(
+        cls,
+        session: AsyncSession,
+        start_date: ymddate,
+        end_date: ymddate,
+        bot_id: Optional[str] = None,
+        bot_self_id: Optional[str] = None,
+    ) -> Dict[ymddate, Tuple[HyperLogLog, HyperLogLog]]:
+        """按日合并各 Bot 的草图，返回 ``{date: (用户草图, 群聊草图)}``（含首尾两天）。"""
+        query = select(col(cls.date), col(cls.users), col(cls.groups)).where(
+            cls.date >= start_date,
+            cls.date <= end_date,
+        )
+        if bot_id:
+            query = query.where(cls.bot_id == bot_id)
+        if bot_self_id:
+            query = query.where(cls.bot_self_id == bot_self_id)
+
+        out: Dict[ymddate, Tuple[HyperLogLog, HyperLogLog]] = {}
+        for d, users, groups in (await session.execute(query)).all():
+            user_sketch = HyperLogLog.from_bytes(users)
+            group_sketch = HyperLogLog.from_bytes(groups)
+            if d in out:
+                out[d][0].update(user_sketch)
+                out[d][1].update(group_sketch)
+            else:
+                out[d] = (user_sketch, group_sketch)
+        return out
+
+    @classmethod
+    @with_session
+    async def get_top_commands(
+        cls,
+        session: AsyncSession,
+        start_date: ymddate,
+        end_date: ymddate,
+        bot_id: Optional[str] = None,
+        bot_self_id: Optional[str] = None,
+    ) -> TopK:
+        """合并区间内（含首尾）每日的指令 Top-K 摘要。"""
+        query = select(col(cls.commands)).where(
+            cls.date >= start_date,
+            cls.date <= end_date,
+        )
+        if bot_id:
+            query = query.where(cls.bot_id == bot_id)
+        if bot_self_id:
+            query = query.where(cls.bot_self_id == bot_self_id)
+
+        merged = TopK()
+        for data in (await session.execute(query)).scalars().all():
+            merged.update(TopK.from_bytes(data))
+        return merged
+
+    @classmethod
+    @with_session
+    async def get_existing_keys(
+        cls,
+        session: AsyncSession,
+        start_date: ymddate,
+    ) -> Set[Tuple[ymddate, str, str]]:
+        query = select(col(cls.date), col(cls.bot_id), col(cls.bot_self_id)).where(cls.date >= start_date)
+        return {(d, b, s) for d, b, s in (await session.execute(query)).all()}
+
+
+def _window_stats(daily: Dict[ymddate, HyperLogLog], today: ymddate) -> Dict[str, Any]:
+    """以 ``today`` 为基准，从每日草图算出日均活跃、30 日去重、新增与流失率。
+
+    窗口口径与原明细表查询一致：
+    - 日均：``[today-30, today)`` 内有数据的日子的日活均值；
+    - 新增：今天出现、但 ``[today-29, today)`` 未出现，按容斥 ``|T ∪ P| - |P|`` 估计；
+    - 流失：``[today-30, today)`` 出现过、但 ``[today-7, today)`` 未出现。
+    """
+    thirty_days_ago = today - timedelta(days=30)
+    twenty_nine_days_ago = today - timedelta(days=29)
+    seven_days_ago = today - timedelta(days=7)
+
+    month = [s for d, s in daily.items() if thirty_days_ago <= d < today and not s.is_empty()]
+    dau_dag = sum(map(len, month)) / len(month) if month else 0.0
+    mau = len(HyperLogLog.union(month))
+    recent = len(HyperLogLog.union(s for d, s in daily.items() if seven_days_ago <= d < today))
+
+    new = 0
+    todays = daily.get(today)
+    if todays is not None and not todays.is_empty():
+        past = HyperLogLog.union(s for d, s in daily.items() if twenty_nine_days_ago <= d < today)
+        gained = union_count(todays, past) - past.count()
+        new = int(round(min(max(gained, 0.0), todays.count())))
+
+    return {
+        "dau_dag": dau_dag,
+        "mau": mau,
+        "new": new,
+        "stickiness": dau_dag / mau * 100 if mau else 0.0,
+        "out_rate": max(mau - recent, 0) / mau * 100 if mau else 0.0,
+    }
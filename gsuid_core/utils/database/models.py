@@ -1,7 +1,8 @@
-from typing import List, Type, Union, Optional, Sequence
+from typing import Set, Dict, List, Type, Tuple, Union, Optional, Sequence
+from datetime import date as ymddate
 
 from sqlmodel import Field, Index, col, select, update
-from sqlalchemy import Row, UniqueConstraint, or_, func, delete, distinct
+from sqlalchemy import Row, UniqueConstraint, or_, func, delete, insert, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gsuid_core.bot import Bot
@@ -20,8 +21,13 @@ from .base_models import (
     BaseIDModel,
     BaseBotIDModel,
     with_session,
+    insert_ignore,
 )
 
+# 批量写入的分块大小：IN 列表与多行 VALUES 都受方言绑定参数上限约束
+_BATCH_SELECT_SIZE = 500
+_BATCH_INSERT_SIZE = 200
+
 
 class Subscribe(BaseModel, table=True):
     __table_args__ = (
@@ -363,6 +369,72 @@ class CoreUser(BaseBotIDModel, table=True):
 
         return 1
 
+    @classmethod
+    @with_session
+    async def batch_upsert_users_and_groups(
+        cls,
+        session: AsyncSession,
+        users: Sequence[Tuple[str, str, Optional[str], Optional[str], Optional[str]]],
+        groups: Sequence[Tuple[str, str]],
+    ) -> int:
+        """写后队列的一次刷写：用户与群在同一个 session（同一个事务）里落库，返回写入行数。"""
+        rows = await cls.batch_upsert_users(session, users)
+        return rows + await CoreGroup.batch_insert_groups(session, groups)
+
+    @classmethod
+    async def batch_upsert_users(
+        cls,
+        session: AsyncSession,
+        rows: Sequence[Tuple[str, str, Optional[str], Optional[str], Optional[str]]],
+    ) -> int:
+        """写后队列的批量落库，语义同逐条 ``insert_user``；使用调用方传入的 ``session``。
+
+        ``rows`` 为 ``(bot_id, user_id, group_id, user_name, user_icon)``，调用方已按
+        ``(bot_id, user_id, group_id)`` 去重。一次 SELECT 取回已有行，昵称/头像变化的
+        按主键批量 UPDATE，新行走一条多行 ``insert_ignore``（撞 record_coreuser 唯一约束时跳过）。
+        空昵称/头像不覆盖库里已有值。
+        """
+        if not rows:
+            return 0
+
+        existing: Dict[Tuple[str, str, Optional[str]], List[Row]] = {}
+        user_ids = list({row[1] for row in rows})
+        for i in range(0, len(user_ids), _BATCH_SELECT_SIZE):
+            result = await session.execute(
+                select(cls.id, cls.bot_id, cls.user_id, cls.group_id, cls.user_name, cls.user_icon).where(
+                    col(cls.user_id).in_(user_ids[i : i + _BATCH_SELECT_SIZE])
+                )
+            )
+            for found in result.all():
+                existing.setdefault((found.bot_id, found.user_id, found.group_id), []).append(found)
+
+        inserts: List[Dict[str, Optional[str]]] = []
+        updates: List[Dict[str, Union[int, Optional[str]]]] = []
+        for bot_id, user_id, group_id, user_name, user_icon in rows:
+            found_rows = existing.get((bot_id, user_id, group_id))
+            if not found_rows:
+                inserts.append(
+                    {
+                        "bot_id": bot_id,
+                        "user_id": user_id,
+                        "group_id": group_id,
+                        "user_name": user_name or "1",
+                        "user_icon": user_icon or "1",
+                    }
+                )
+                continue
+            for found in found_rows:
+                new_name = user_name or found.user_name
+                new_icon = user_icon or found.user_icon
+                if (new_name, new_icon) != (found.user_name, found.user_icon):
+                    updates.append({"id": found.id, "user_name": new_name, "user_icon": new_icon})
+
+        if updates:
+            await session.execute(update(cls), updates)
+        for i in range(0, len(inserts), _BATCH_INSERT_SIZE):
+            await session.execute(insert_ignore(cls).values(inserts[i : i + _BATCH_INSERT_SIZE]))
+        return len(inserts) + len(updates)
+
 
 class CoreGroup(BaseBotIDModel, table=True):
     __table_args__ = (
@@ -461,6 +533,36 @@ class CoreGroup(BaseBotIDModel, table=True):
             )
         return 1
 
+    @classmethod
+    async def batch_insert_groups(
+        cls,
+        session: AsyncSession,
+        rows: Sequence[Tuple[str, str]],
+    ) -> int:
+        """写后队列的批量落库，语义同逐条 ``insert_group``：仅补齐不存在的 ``(bot_id, group_id)``。
+
+        使用调用方传入的 ``session``。
+        """
+        if not rows:
+            return 0
+
+        existing: Set[Tuple[str, str]] = set()
+        group_ids = list({group_id for _, group_id in rows})
+        for i in range(0, len(group_ids), _BATCH_SELECT_SIZE):
+            result = await session.execute(
+                select(cls.bot_id, cls.group_id).where(col(cls.group_id).in_(group_ids[i : i + _BATCH_SELECT_SIZE]))
+            )
+            existing.update((found.bot_id, found.group_id) for found in result.all())
+
+        inserts = [
+            {"bot_id": bot_id, "group_id": group_id, "group_count": 0, "group_name": "1", "group_icon": "1"}
+            for bot_id, group_id in rows
+            if (bot_id, group_id) not in existing
+        ]
+        for i in range(0, len(inserts), _BATCH_INSERT_SIZE):
+            await session.execute(insert_ignore(cls).values(inserts[i : i + _BATCH_INSERT_SIZE]))
+        return len(inserts)
+
 
 class GsBind(Bind, table=True):
     __table_args__ = {"extend_existing": True}
@@ -664,3 +766,234 @@ class GsUID(BaseIDModel, table=True):
             return 0
         return -1
         return -1
+
+
+class GsSignRecord(BaseIDModel, table=True):
+    """每日自动签到的断点表：一行 = 某天某游戏的一个 UID。
+
+    state: ``pending`` 待签 / ``running`` 签到中 / ``done`` 已完成 / ``failed`` 失败。
+    重启后 ``running`` 视为未完成，重新置为 ``pending``。
+    """
+
+    __table_args__ = (
+        UniqueConstraint(
+            "date",
+            "game_name",
+            "uid",
+            name="record_gssignrecord",
+        ),
+        {"extend_existing": True},
+    )
+
+    date: ymddate = Field(title="日期", index=True)
+    game_name: str = Field(title="游戏名称")
+    uid: str = Field(title="游戏UID")
+    bot_id: str = Field(title="平台")
+    user_id: str = Field(title="账号")
+    push_target: str = Field(title="推送目标", default="on")
+    state: str = Field(title="状态", default="pending")
+    message: Optional[str] = Field(title="签到结果", default=None)
+    updated_at: float = Field(title="更新时间", default=0)
+
+    @classmethod
+    @with_session
+    async def add_run_items(
+        cls,
+        session: AsyncSession,
+        date: ymddate,
+        game_name: str,
+        rows: List[Dict[str, str]],
+    ) -> None:
+        """写入本轮待签 UID，已存在的 (date, game_name, uid) 跳过。
+
+        ``rows`` 每项含 uid / bot_id / user_id / push_target。
+        """
+        values = [{"date": date, "game_name": game_name, "state": "pending", **row} for row in rows]
+        for i in range(0, len(values), _BATCH_INSERT_SIZE):
+            await session.execute(insert_ignore(cls).values(values[i : i + _BATCH_INSERT_SIZE]))
+
+    @classmethod
+    @with_session
+    async def get_run(
+        cls,
+        session: AsyncSession,
+        date: ymddate,
+        game_name: str,
+    ) -> List["GsSignRecord"]:
+        stmt = select(cls).where(cls.date == date, cls.game_name == game_name).order_by(col(cls.id))
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @classmethod
+    @with_session
+    async def reset_state(
+        cls,
+        session: AsyncSession,
+        date: ymddate,
+        game_name: str,
+        states: Sequence[str],
+    ) -> None:
+        """把本轮处于 ``states`` 的记录重新置为 ``pending``。"""
+        await session.execute(
+            update(cls)
+            .where(cls.date == date, cls.game_name == game_name)  # type: ignore
+            .where(col(cls.state).in_(list(states)))
+            .values(state="pending")
+        )
+
+    @classmethod
+    @with_session
+    async def set_state(
+        cls,
+        session: AsyncSession,
+        record_id: int,
+        state: str,
+        updated_at: float,
+        message: Optional[str] = None,
+    ) -> None:
+        values: Dict[str, Union[str, float]] = {"state": state, "updated_at": updated_at}
+        if message is not None:
+            values["message"] = message
+        await session.execute(update(cls).where(col(cls.id) == record_id).values(**values))
+
+    @classmethod
+    @with_session
+    async def count_states(
+        cls,
+        session: AsyncSession,
+        date: ymddate,
+    ) -> Dict[str, Dict[str, int]]:
+        """统计某天各游戏各状态的数量：``{game_name: {state: count}}``。"""
+        stmt = (
+            select(cls.game_name, cls.state, func.count())
+            .where(cls.date == date)
+            .group_by(col(cls.game_name), col(cls.state))
+        )
+        data: Dict[str, Dict[str, int]] = {}
+        for game_name, state, count in (await session.execute(stmt)).all():
+            data.setdefault(game_name, {})[state] = count
+        return data
+
+    @classmethod
+    @with_session
+    async def delete_outdate(
+        cls,
+        session: AsyncSession,
+        before: ymddate,
+    ) -> None:
+        await session.execute(delete(cls).where(col(cls.date) < before))
+
+
+class GsBroadcastTarget(BaseIDModel, table=True):
+    """广播推送的逐目标投递状态，用于中断后续推与失败重试。
+
+    state: ``pending`` 待发送 / ``retry`` 等待重试 / ``done`` 已发送 / ``failed`` 重试耗尽。
+    done_bots: 已确认送达的 WS Bot（逗号分隔），重试时跳过，避免经已成功的 Bot 重复发送。
+    """
+
+    __table_args__ = (
+        Index("ix_gsbroadcasttarget_job_state", "job_id", "state"),
+        {"extend_existing": True},
+    )
+
+    job_id: str = Field(title="广播任务ID")
+    seq: int = Field(title="顺序")
+    target_type: str = Field(title="目标类型")
+    target_id: str = Field(title="目标ID")
+    bot_id: str = Field(title="平台")
+    payload: int = Field(title="消息序号")
+    state: str = Field(title="状态", default="pending")
+    attempts: int = Field(title="尝试次数", default=0)
+    next_retry: float = Field(title="下次重试时间", default=0)
+    error: Optional[str] = Field(title="错误信息", default=None)
+    done_bots: str = Field(title="已送达的WS Bot", default="")
+    created_at: float = Field(title="创建时间", index=True)
+
+    @classmethod
+    @with_session
+    async def add_targets(
+        cls,
+        session: AsyncSession,
+        rows: List[Dict[str, Union[str, int, float]]],
+    ) -> None:
+        for i in range(0, len(rows), _BATCH_INSERT_SIZE):
+            await session.execute(insert(cls).values(rows[i : i + _BATCH_INSERT_SIZE]))
+
+    @classmethod
+    @with_session
+    async def get_unfinished(
+        cls,
+        session: AsyncSession,
+        job_id: str,
+    ) -> List["GsBroadcastTarget"]:
+        stmt = (
+            select(cls)
+            .where(cls.job_id == job_id)
+            .where(col(cls.state).in_(["pending", "retry"]))
+            .order_by(col(cls.seq))
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @classmethod
+    @with_session
+    async def get_unfinished_jobs(
+        cls,
+        session: AsyncSession,
+    ) -> List[str]:
+        stmt = select(distinct(cls.job_id)).where(col(cls.state).in_(["pending", "retry"]))
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @classmethod
+    @with_session
+    async def count_states(
+        cls,
+        session: AsyncSession,
+        job_id: str,
+    ) -> Dict[str, int]:
+        stmt = select(cls.state, func.count()).where(cls.job_id == job_id).group_by(col(cls.state))
+        return {state: count for state, count in (await session.execute(stmt)).all()}
+
+    @classmethod
+    @with_session
+    async def set_state(
+        cls,
+        session: AsyncSession,
+        record_id: int,
+        state: str,
+        attempts: int,
+        next_retry: float = 0,
+        error: Optional[str] = None,
+        done_bots: str = "",
+    ) -> None:
+        await session.execute(
+            update(cls)
+            .where(col(cls.id) == record_id)
+            .values(state=state, attempts=attempts, next_retry=next_retry, error=error, done_bots=done_bots)
+        )
+
+    @classmethod
+    @with_session
+    async def abandon(
+        cls,
+        session: AsyncSession,
+        job_id: str,
+        error: str,
+    ) -> None:
+        """任务无法续推（消息未能保存）时，把剩余目标标记为失败。"""
+        await session.execute(
+            update(cls)
+            .where(cls.job_id == job_id)  # type: ignore
+            .where(col(cls.state).in_(["pending", "retry"]))
+            .values(state="failed", error=error)
+        )
+
+    @classmethod
+    @with_session
+    async def delete_outdate(
+        cls,
+        session: AsyncSession,
+        before: float,
+    ) -> None:
+        await session.execute(delete(cls).where(col(cls.created_at) < before))
@@ -0,0 +1,169 @@
+"""CoreUser / CoreGroup 消息路径的写后合并队列。
+
+``handle_event`` 每条消息都要记录一次用户/群。开启 ``buffered_user_writes`` 后，
+消息路径只把记录放进内存队列：
+
+- 按 ``(bot_id, user_id, group_id)`` 去重，同一键只保留最后一次非空的昵称/头像；
+- 定时（``user_write_flush_interval``）或积压达到 ``user_write_max_pending`` 时刷写；
+- 一次刷写只占用一个 ``with_session``，用户、群各一次 SELECT + 一条多行 INSERT
+  （见 ``CoreUser.batch_upsert_users_and_groups``）；
+- 退出时由 ``on_core_shutdown`` 排空。
+
+``stats()`` 暴露队列深度与刷写耗时计数，并由 ``/metrics`` 导出。
+"""
+
+import time
+import asyncio
+from typing import Set, Dict, Tuple, Union, Optional
+
+from gsuid_core.i18n import t, lt
+from gsuid_core.logger import logger
+from gsuid_core.server import on_core_shutdown
+from gsuid_core.utils.plugins_config.gs_config import database_config
+
+from .models import CoreUser
+
+_UserKey = Tuple[str, str, Optional[str]]
+
+
+class UserWriteBehind:
+    def __init__(self, flush_interval: float, max_pending: int) -> None:
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._users: Dict[_UserKey, Tuple[Optional[str], Optional[str]]] = {}
+        self._groups: Set[Tuple[str, str]] = set()
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        # 计数器
+        self.enqueued: int = 0
+        self.coalesced: int = 0
+        self.flush_count: int = 0
+        self.flush_failures: int = 0
+        self.flushed_rows: int = 0
+        self.last_flush_ms: float = 0.0
+        self.max_flush_ms: float = 0.0
+        self.total_flush_ms: float = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._users) + len(self._groups)
+
+    def add(
+        self,
+        bot_id: str,
+        user_id: str,
+        group_id: Optional[str],
+        user_name: Optional[str],
+        user_icon: Optional[str],
+    ) -> None:
+        """登记一次用户/群出现；不做任何 IO。"""
+        key = (bot_id, user_id, group_id)
+        old = self._users.get(key)
+        if old is not None:
+            self.coalesced += 1
+            user_name = user_name or old[0]
+            user_icon = user_icon or old[1]
+        self._users[key] = (user_name, user_icon)
+        if group_id:
+            self._groups.add((bot_id, group_id))
+        self.enqueued += 1
+
+        if self._task is None or self._task.done():
+            if not self._stopped:
+                self._task = asyncio.get_running_loop().create_task(self._loop())
+        if self.depth >= self.max_pending:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """把当前积压一次性刷进数据库；失败时把未写入的记录合并回队列。"""
+        async with self._flush_lock:
+            if not self._users and not self._groups:
+                return
+            users, self._users = self._users, {}
+            groups, self._groups = self._groups, set()
+
+            start = time.perf_counter()
+            try:
+                rows = await CoreUser.batch_upsert_users_and_groups(
+                    [(*key, name, icon) for key, (name, icon) in users.items()],
+                    list(groups),
+                )
+            except Exception as e:
+                self.flush_failures += 1
+                logger.warning(t("log.database.user_write_flush_fail", count=len(users) + len(groups), error=e))
+                # 期间新到的记录更新鲜，回填时不覆盖
+                for key, value in users.items():
+                    self._users.setdefault(key, value)
+                self._groups |= groups
+                return
+            cost = (time.perf_counter() - start) * 1000
+
+            self.flush_count += 1
+            self.flushed_rows += rows
+            self.last_flush_ms = cost
+            self.total_flush_ms += cost
+            self.max_flush_ms = max(self.max_flush_ms, cost)
+            logger.trace(
+                lt(
+                    "log.database.user_write_flushed",
+                    users=len(users),
+                    groups=len(groups),
+                    rows=rows,
+                    cost=f"{cost:.1f}",
+                )
+            )
+
+    async def _loop(self) -> None:
+        while not self._stopped:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(t("log.database.user_write_loop_fail", error=e))
+
+    async def close(self) -> None:
+        """停止后台刷写并排空队列。"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=30)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+        await self.flush()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "depth": self.depth,
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "flush_count": self.flush_count,
+            "flush_failures": self.flush_failures,
+            "flushed_rows": self.flushed_rows,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "avg_flush_ms": round(self.total_flush_ms / self.flush_count, 3) if self.flush_count else 0.0,
+        }
+
+
+user_write_behind = UserWriteBehind(
+    flush_interval=database_config.get_config("user_write_flush_interval").data,
+    max_pending=database_config.get_config("user_write_max_pending").data,
+)
+
+
+@on_core_shutdown
+async def _drain_user_write_behind():
+    """退出前排空写后队列，防止丢数据。"""
+    if user_write_behind.depth == 0 and user_write_behind._task is None:
+        return
+    logger.info(t("log.database.user_write_draining", depth=user_write_behind.depth))
+    await user_write_behind.close()
+    logger.info(t("log.database.user_write_drained"))
@@ -0,0 +1,289 @@
+"""有字节预算的磁盘缓存（``sget`` 下载与 ``gs_cache`` 图片结果共用）。
+
+- 文件名为 ``sha256(key).bin``，元数据（大小/过期时间/最近访问/命中次数）保存在
+  ``index.msgpack``，启动时读索引即可，不需要遍历目录；索引缺失时才扫描一次目录收编旧文件；
+- 过期时间按条目记录绝对时间戳，命中检查 O(1)；
+- 总大小超过预算时按 LRU 或 LFU 淘汰到预算的 ``LOW_WATERMARK``；
+- ``get_or_fetch`` 对同一 key 做 single-flight：并发未命中只触发一次下载/渲染。
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Dict, Literal, Callable, Optional, Awaitable
+from pathlib import Path
+from collections import OrderedDict
+
+import msgspec
+
+INDEX_NAME = "index.msgpack"
+# 索引落盘的最短间隔（秒），退出时会再保存一次
+INDEX_SAVE_INTERVAL = 5.0
+# 超出预算后淘汰到预算的这个比例，避免每次写入都触发淘汰
+LOW_WATERMARK = 0.9
+
+
+class CacheEntry(msgspec.Struct, array_like=True):
+    size: int
+    expires_at: float
+    last_access: float
+    hits: int = 0
+
+
+def consume_exception(task: "asyncio.Future[object]") -> None:
+    """所有等待者都已取消时，取走共享任务的异常，避免 "exception was never retrieved"。"""
+    if not task.cancelled():
+        task.exception()
+
+
+class DiskCache:
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        policy: Literal["LRU", "LFU"] = "LRU",
+        default_ttl: float = 86400,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.default_ttl = default_ttl
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._index: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # 索引
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> None:
+        index_path = self.path / INDEX_NAME
+        try:
+            data = msgspec.msgpack.decode(index_path.read_bytes(), type=Dict[str, CacheEntry])
+        except FileNotFoundError:
+            data = self._scan_dir()
+            self._dirty = True
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            data = self._scan_dir()
+            self._dirty = True
+
+        # 按最近访问排序，OrderedDict 头部即最久未用
+        for digest, entry in sorted(data.items(), key=lambda item: item[1].last_access):
+            self._index[digest] = entry
+            self.total_bytes += entry.size
+
+    def _scan_dir(self) -> Dict[str, CacheEntry]:
+        """索引缺失/损坏时收编目录里已有的缓存文件（沿用文件 mtime 计算过期）。"""
+        data: Dict[str, CacheEntry] = {}
+        for file in self.path.iterdir():
+            if file.suffix == ".tmp":
+                file.unlink(missing_ok=True)
+            elif file.suffix == ".bin":
+                stat = file.stat()
+                data[file.stem] = CacheEntry(stat.st_size, stat.st_mtime + self.default_ttl, stat.st_mtime)
+        return data
+
+    def save_index(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = msgspec.msgpack.encode(dict(self._index))
+            self._dirty = False
+            self._last_save = time.monotonic()
+        tmp = self.path / f"{INDEX_NAME}.tmp"
+        tmp.write_bytes(payload)
+        os.replace(tmp, self.path / INDEX_NAME)
+
+    def _maybe_save_index(self) -> None:
+        if self._dirty and time.monotonic() - self._last_save >= INDEX_SAVE_INTERVAL:
+            self.save_index()
+
+    # ------------------------------------------------------------------
+    # 读写
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _file(self, digest: str) -> Path:
+        return self.path / f"{digest}.bin"
+
+    def _drop(self, digest: str) -> None:
+        entry = self._index.pop(digest, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+            self._dirty = True
+        self._file(digest).unlink(missing_ok=True)
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """命中且未过期时返回缓存文件路径。"""
+        digest = self.digest(key)
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            now = time.time()
+            if entry.expires_at <= now:
+                self._drop(digest)
+                self.expired += 1
+                self.misses += 1
+                return None
+            entry.last_access = now
+            entry.hits += 1
+            self._index.move_to_end(digest)
+            self._dirty = True
+            self.hits += 1
+            return self._file(digest)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            # 文件被外部删除：按未命中处理
+            with self._lock:
+                self._drop(self.digest(key))
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, key)
+
+    def put_sync(self, key: str, data: bytes, ttl: Optional[float] = None) -> Path:
+        digest = self.digest(key)
+        path = self._file(digest)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+        now = time.time()
+        with self._lock:
+            old = self._index.pop(digest, None)
+            if old is not None:
+                self.total_bytes -= old.size
+            self._index[digest] = CacheEntry(len(data), now + (ttl or self.default_ttl), now)
+            self.total_bytes += len(data)
+            self._dirty = True
+            if self.total_bytes > self.max_bytes:
+                self._evict(keep=digest)
+        self._maybe_save_index()
+        return path
+
+    async def put(self, key: str, data: bytes, ttl: Optional[float] = None) -> Path:
+        return await asyncio.to_thread(self.put_sync, key, data, ttl)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[bytes]],
+        ttl: Optional[float] = None,
+    ) -> bytes:
+        """读缓存，未命中时调用 ``fetch`` 并写入；同一 key 的并发未命中共享一次 ``fetch``。"""
+        task = self._inflight.get(key)
+        if task is None:
+            data = await self.get(key)
+            if data is not None:
+                return data
+            task = self._inflight.get(key)
+        if task is None:
+            # 拉取在缓存自己的任务里进行，某个调用方被取消不会连带其余等待者
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key, fetch, ttl))
+            task.add_done_callback(consume_exception)
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[bytes]], ttl: Optional[float]) -> bytes:
+        try:
+            data = await fetch()
+            await self.put(key, data, ttl)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # 淘汰
+    # ------------------------------------------------------------------
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        target = self.max_bytes * LOW_WATERMARK
+        now = time.time()
+        # 先清掉已过期的
+        for digest in [d for d, e in self._index.items() if e.expires_at <= now and d != keep]:
+            self._drop(digest)
+            self.expired += 1
+        if self.total_bytes <= target:
+            return
+
+        if self.policy == "LFU":
+            victims = sorted(self._index, key=lambda d: (self._index[d].hits, self._index[d].last_access))
+        else:
+            victims = list(self._index)
+        for digest in victims:
+            if self.total_bytes <= target:
+                break
+            if digest == keep:
+                continue
+            self._drop(digest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for digest in list(self._index):
+                self._drop(digest)
+        self.save_index()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "inflight": len(self._inflight),
+            }
+
+
+_disk_cache: Optional[DiskCache] = None
+
+
+def get_disk_cache() -> DiskCache:
+    """进程内共享的缓存实例，首次使用时按 ``CacheMaxMB`` / ``CacheEvictPolicy`` 创建。"""
+    global _disk_cache
+    if _disk_cache is None:
+        from gsuid_core.server import on_core_shutdown
+        from gsuid_core.data_store import get_res_path
+        from gsuid_core.utils.plugins_config.gs_config import sp_config
+
+        _disk_cache = DiskCache(
+            get_res_path(["IMAGE_CACHE", "cache"]),
+            sp_config.get_config("CacheMaxMB").data * 1024 * 1024,
+            sp_config.get_config("CacheEvictPolicy").data,
+            default_ttl=2 * 86400,
+        )
+        # 本模块会被 segment 间接导入，不能在模块级依赖 server；首次使用时再注册退出保存
+        on_core_shutdown(_save_disk_cache_index)
+    return _disk_cache
+
+
+async def _save_disk_cache_index():
+    if _disk_cache is not None:
+        await asyncio.to_thread(_disk_cache.save_index)
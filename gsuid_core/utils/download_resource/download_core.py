@@ -9,7 +9,7 @@ from urllib.parse import unquote
 import httpx
 from bs4 import BeautifulSoup
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 from .download_file import download
@@ -27,13 +27,13 @@ def _sync_check_url(tag: str, url: str):
             response = client.get(url)
             elapsed_time = time.time() - start_time
             if response.status_code == 200 and "Index of /" in response.text:
-                logger.debug(t("log.download.tag_url_elapsed_time", tag=tag, url=url, elapsed_time=elapsed_time))
+                logger.debug(lt("log.download.tag_url_elapsed_time", tag=tag, url=url, elapsed_time=elapsed_time))
                 return tag, url, elapsed_time
             else:
                 logger.info(t("log.download.tag_url_timeout", tag=tag, url=url))
                 return tag, url, float("inf")
     except Exception as e:
-        logger.debug(t("log.download.fail_tag_url_connection_failed", tag=tag, url=url, p0=type(e).__name__))
+        logger.debug(lt("log.download.fail_tag_url_connection_failed", tag=tag, url=url, p0=type(e).__name__))
         return tag, url, float("inf")
 
 
@@ -179,7 +179,7 @@ async def download_atag_file(
     data_list = pre_data.find_all("a")
     size_list = [i for i in content_bs.strings]
 
-    logger.trace(t("log.download.tag_database_endpoint_contains", TAG=TAG, endpoint=endpoint, p0=len(data_list)))
+    logger.trace(lt("log.download.tag_database_endpoint_contains", TAG=TAG, endpoint=endpoint, p0=len(data_list)))
 
     temp_num = 0
     size_temp = 0
@@ -237,7 +237,7 @@ async def download_atag_file(
         TASKS.clear()
 
     if temp_num == 0:
-        logger.trace(t("log.download.tag_endpoint_download", TAG=TAG, endpoint=endpoint))
+        logger.trace(lt("log.download.tag_endpoint_download", TAG=TAG, endpoint=endpoint))
     else:
         logger.success(t("log.download.tag_endpoint_temp_num_download", TAG=TAG, endpoint=endpoint, temp_num=temp_num))
     temp_num = 0
@@ -3,17 +3,32 @@ HTML渲染工具模块
 
 基于 pytakumi 库提供 HTML、Markdown、纯文本到图片的渲染功能。
 对外保持 ``render_*_to_bytes`` 异步接口，内部用共享 Renderer 做字体/缓存复用。
+
+- 渲染结果按「内容 + 全部渲染参数」哈希缓存在内存里，总大小受 ``RenderCacheMB`` 限制；
+- 同样的渲染并发到达时只渲染一次，其余调用共享结果（刷屏的帮助菜单只画一张）；
+- 渲染在固定大小的工作池里执行（``RenderWorkers``），超出的请求排队而不是各开一个线程；
+  ``RenderWorkerMode`` 为 ``process`` 时改用子进程，大图渲染不与事件循环线程争抢 GIL。
 """
 
 from __future__ import annotations
 
+import time
 import asyncio
-from typing import Any, Literal, NoReturn, Optional
+import hashlib
+import functools
+import multiprocessing
+from typing import Any, Dict, Literal, Callable, NoReturn, Optional
 from pathlib import Path
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
+from gsuid_core.metrics import RENDER_SECONDS
+from gsuid_core.utils.disk_cache import consume_exception
 from gsuid_core.utils.fonts.fonts import FONT_ORIGIN_PATH as _FONT_PATH
+from gsuid_core.utils.plugins_config.gs_config import sp_config
 
 try:
     from pytakumi import (
@@ -392,6 +407,157 @@ def _sync_render_text(
     )
 
 
+_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cache_bytes = 0
+_inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+_executor: Optional[Executor] = None
+_executor_mode = ""
+_shutdown_hooked = False
+_stats: Dict[str, float] = {
+    "renders": 0,
+    "hits": 0,
+    "shared": 0,
+    "errors": 0,
+    "waiting": 0,
+    "running": 0,
+    "render_seconds": 0.0,
+    "max_render_seconds": 0.0,
+}
+
+
+def _cache_key(kind: str, content: str, options: Dict[str, Any]) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(kind.encode("utf-8"))
+    h.update(content.encode("utf-8"))
+    h.update(repr(sorted(options.items())).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cache_put(key: str, data: bytes) -> None:
+    global _cache_bytes
+    budget = sp_config.get_config("RenderCacheMB").data * 1024 * 1024
+    if len(data) > budget // 4:
+        # 单张超大图不进缓存，避免把其他结果全部挤掉
+        return
+    _cache[key] = data
+    _cache_bytes += len(data)
+    while _cache_bytes > budget:
+        _, old = _cache.popitem(last=False)
+        _cache_bytes -= len(old)
+
+
+def _get_executor() -> Executor:
+    global _executor, _executor_mode, _shutdown_hooked
+    if _executor is not None:
+        return _executor
+
+    workers = max(1, sp_config.get_config("RenderWorkers").data)
+    mode = sp_config.get_config("RenderWorkerMode").data
+    if mode == "process":
+        # spawn：子进程自己初始化 Renderer/字体，不继承父进程的事件循环与线程
+        _executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        _executor = ThreadPoolExecutor(workers, thread_name_prefix="html_render")
+    _executor_mode = mode
+
+    # 本模块可能早于 server 被导入，首次使用时再注册退出清理；关闭后重建工作池不重复注册
+    if not _shutdown_hooked:
+        from gsuid_core.server import on_core_shutdown
+
+        on_core_shutdown(shutdown_render_pool)
+        _shutdown_hooked = True
+    logger.info(t("log.htmlrender.render_pool_started", mode=mode, workers=workers))
+    return _executor
+
+
+def _get_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _slots.get(loop)
+    if sem is None:
+        sem = _slots[loop] = asyncio.Semaphore(max(1, sp_config.get_config("RenderWorkers").data))
+    return sem
+
+
+async def _run_in_pool(func: Callable[..., bytes], content: str, options: Dict[str, Any]) -> bytes:
+    # 先在事件循环里排队，占到名额再提交，排队长度即 waiting
+    _stats["waiting"] += 1
+    try:
+        await _get_slots().acquire()
+    finally:
+        _stats["waiting"] -= 1
+    _stats["running"] += 1
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(func, content, **options))
+    finally:
+        cost = time.perf_counter() - start
+        _stats["running"] -= 1
+        _stats["renders"] += 1
+        _stats["render_seconds"] += cost
+        _stats["max_render_seconds"] = max(_stats["max_render_seconds"], cost)
+        RENDER_SECONDS.observe(cost)
+        _get_slots().release()
+
+
+async def _render(kind: str, func: Callable[..., bytes], content: str, **options: Any) -> bytes:
+    key = _cache_key(kind, content, options)
+    data = _cache.get(key)
+    if data is not None:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return data
+
+    task = _inflight.get(key)
+    if task is not None:
+        _stats["shared"] += 1
+    else:
+        # 渲染放在模块自己的任务里，某个调用方被取消不会连带其余等待者
+        task = _inflight[key] = asyncio.create_task(_render_shared(key, func, content, options))
+        task.add_done_callback(consume_exception)
+    return await asyncio.shield(task)
+
+
+async def _render_shared(key: str, func: Callable[..., bytes], content: str, options: Dict[str, Any]) -> bytes:
+    try:
+        data = await _run_in_pool(func, content, options)
+    except Exception:
+        _stats["errors"] += 1
+        raise
+    else:
+        _cache_put(key, data)
+        return data
+    finally:
+        _inflight.pop(key, None)
+
+
+def render_stats() -> Dict[str, Any]:
+    """渲染缓存与工作池的运行指标。"""
+    renders = _stats["renders"]
+    return {
+        **_stats,
+        "mode": _executor_mode or sp_config.get_config("RenderWorkerMode").data,
+        "avg_render_seconds": round(_stats["render_seconds"] / renders, 4) if renders else 0.0,
+        "cache_items": len(_cache),
+        "cache_bytes": _cache_bytes,
+        "inflight": len(_inflight),
+    }
+
+
+def clear_render_cache() -> None:
+    global _cache_bytes
+    _cache.clear()
+    _cache_bytes = 0
+
+
+async def shutdown_render_pool() -> None:
+    global _executor, _executor_mode
+    executor, _executor, _executor_mode = _executor, None, ""
+    if executor is not None:
+        await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+
 async def render_html_to_bytes(
     html: str,
     *,
@@ -426,7 +592,8 @@ async def render_html_to_bytes(
     Returns:
         PNG 或 JPEG 格式的图片字节数据
     """
-    return await asyncio.to_thread(
+    return await _render(
+        "html",
         _sync_render_html,
         html,
         max_width=max_width,
@@ -482,7 +649,8 @@ async def render_md_to_bytes(
     if css_path:
         css = await asyncio.to_thread(Path(css_path).read_text, encoding="utf-8")
 
-    return await asyncio.to_thread(
+    return await _render(
+        "md",
         _sync_render_md,
         content,
         css=css,
@@ -525,7 +693,8 @@ async def render_text_to_bytes(
     if css_path:
         css = await asyncio.to_thread(Path(css_path).read_text, encoding="utf-8")
 
-    return await asyncio.to_thread(
+    return await _render(
+        "text",
         _sync_render_text,
         text,
         css=css,
@@ -0,0 +1,98 @@
+"""进程内共享的 aiohttp 连接池。
+
+每次请求都新建 ``ClientSession`` + ``TCPConnector`` 意味着每次都要重新做 DNS 解析、
+TCP 握手与 TLS 握手，签到/便笺刷新这类集中窗口里会放大成数千次握手。
+
+这里按名字维护长期存活的 ``ClientSession``：
+
+- 按事件循环隔离（``ClientSession`` 只能在创建它的循环里使用），循环销毁后自动释放；
+- 连接保持 keep-alive，DNS 结果缓存 ``DNS_CACHE_TTL`` 秒；
+- 单个 host 的并发连接数受 ``HttpLimitPerHost`` 限制，超出的请求排队等待空闲连接；
+- 退出时由 ``on_core_shutdown`` 统一关闭。
+
+调用方拿到的 session 不要 ``async with`` / ``close()``，用完即可。
+"""
+
+import ssl
+import asyncio
+from typing import Any, Dict, Union, Optional
+from weakref import WeakKeyDictionary
+
+from aiohttp import TCPConnector, ClientSession, ClientTimeout
+
+from gsuid_core.server import on_core_shutdown
+from gsuid_core.utils.plugins_config.gs_config import sp_config
+
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+POOL_LIMIT = 100
+
+_SESSIONS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, ClientSession]]" = WeakKeyDictionary()
+
+
+def get_session(
+    name: str = "default",
+    *,
+    ssl_context: Union[ssl.SSLContext, bool] = True,
+    limit: int = POOL_LIMIT,
+    limit_per_host: Optional[int] = None,
+    timeout: Optional[ClientTimeout] = None,
+    trust_env: bool = False,
+) -> ClientSession:
+    """获取当前事件循环下名为 ``name`` 的共享 session，不存在或已关闭时新建。
+
+    连接参数只在首次创建时生效，同名的后续调用直接复用。
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _SESSIONS.get(loop)
+    if sessions is None:
+        sessions = _SESSIONS[loop] = {}
+
+    session = sessions.get(name)
+    if session is None or session.closed:
+        connector = TCPConnector(
+            ssl=ssl_context,
+            limit=limit,
+            limit_per_host=limit_per_host or sp_config.get_config("HttpLimitPerHost").data,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        session = sessions[name] = ClientSession(
+            connector=connector,
+            timeout=timeout or ClientTimeout(total=300),
+            trust_env=trust_env,
+        )
+    return session
+
+
+async def close_sessions() -> None:
+    """关闭当前事件循环下的全部共享 session。"""
+    sessions = _SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        if not session.closed:
+            await session.close()
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """当前事件循环下各共享 session 的连接占用情况。"""
+    try:
+        sessions = _SESSIONS.get(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        return {}
+    stats = {}
+    for name, session in sessions.items():
+        connector = session.connector
+        if connector is None or session.closed:
+            continue
+        stats[name] = {
+            "limit": connector.limit,
+            "limit_per_host": connector.limit_per_host,
+            "acquired": len(connector._acquired),  # type: ignore[attr-defined]
+            "idle": sum(len(conns) for conns in connector._conns.values()),  # type: ignore[attr-defined]
+        }
+    return stats
+
+
+@on_core_shutdown
+async def _close_http_pool():
+    await close_sessions()
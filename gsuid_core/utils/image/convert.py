@@ -1,7 +1,6 @@
 import math
-from io import BytesIO
 from base64 import b64encode
-from typing import Union, overload
+from typing import Tuple, Union, Optional, overload
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -10,6 +9,7 @@ from gsuid_core.i18n import t
 from gsuid_core.pool import to_thread
 from gsuid_core.logger import logger
 from gsuid_core.utils.fonts.fonts import core_font
+from gsuid_core.utils.image.encoder import encode_image, image_budget, encode_image_sync
 from gsuid_core.utils.image.image_tools import draw_center_text_by_line
 from gsuid_core.utils.plugins_config.gs_config import pic_gen_config
 
@@ -20,6 +20,7 @@ pic_quality: int = pic_gen_config.get_config("PicQuality").data
 async def convert_img(
     img: Image.Image,
     is_base64: bool = False,
+    bot_id: Optional[str] = None,
 ) -> bytes: ...
 
 
@@ -27,6 +28,7 @@ async def convert_img(
 async def convert_img(
     img: Image.Image,
     is_base64: bool = True,
+    bot_id: Optional[str] = None,
 ) -> str: ...
 
 
@@ -34,6 +36,7 @@ async def convert_img(
 async def convert_img(
     img: bytes,
     is_base64: bool = False,
+    bot_id: Optional[str] = None,
 ) -> str: ...
 
 
@@ -41,12 +44,14 @@ async def convert_img(
 async def convert_img(
     img: Path,
     is_base64: bool = False,
+    bot_id: Optional[str] = None,
 ) -> str: ...
 
 
 async def convert_img(
     img: Union[Image.Image, str, Path, bytes],
     is_base64: bool = False,
+    bot_id: Optional[str] = None,
 ):
     """
     :说明:
@@ -54,12 +59,22 @@ async def convert_img(
     :参数:
       * img (Image): 图片。
       * is_base64 (bool): 是否转换为base64格式, 不填默认转为bytes。
+      * bot_id (str): 发送目标的 bot_id, 填写后直接按该平台的字节预算与格式编码, 发送时无需再次压缩。
     :返回:
       * res: bytes对象或base64编码图片。
     """
+    if isinstance(img, Image.Image):
+        logger.info(t("log.image.gscore_processing_image"))
+        res = await encode_image(img, *_budget(bot_id))
+        return f"base64://{b64encode(res).decode()}" if is_base64 else res
     return await _convert_img_sync(img, is_base64)
 
 
+def _budget(bot_id: Optional[str]) -> Tuple[int, bool]:
+    # 不知道发送目标时不设预算，由发送时的 fit_image_bytes 兜底
+    return image_budget(bot_id) if bot_id else (0, False)
+
+
 @to_thread
 def _convert_img_sync(
     img: Union[Image.Image, str, Path, bytes],
@@ -68,19 +83,7 @@ def _convert_img_sync(
     logger.info(t("log.image.gscore_processing_image"))
 
     if isinstance(img, Image.Image):
-        if img.format == "GIF":
-            result_buffer = BytesIO()
-            img.save(result_buffer, format="GIF")
-        else:
-            img = img.convert("RGB")
-            result_buffer = BytesIO()
-            img.save(
-                result_buffer,
-                format="JPEG",
-                quality=pic_quality,
-            )
-
-        res = result_buffer.getvalue()
+        res = encode_image_sync(img)
         if is_base64:
             res = "base64://" + b64encode(res).decode()
         return res
@@ -98,23 +101,12 @@ def _convert_img_sync(
 def convert_img_sync(
     img: Union[Image.Image, str, Path, bytes],
     is_base64: bool = False,
+    bot_id: Optional[str] = None,
 ):
     logger.info(t("log.image.gscore_processing_image"))
 
     if isinstance(img, Image.Image):
-        if img.format == "GIF":
-            result_buffer = BytesIO()
-            img.save(result_buffer, format="GIF")
-        else:
-            img = img.convert("RGB")
-            result_buffer = BytesIO()
-            img.save(
-                result_buffer,
-                format="JPEG",
-                quality=pic_quality,
-            )
-
-        res = result_buffer.getvalue()
+        res = encode_image_sync(img, *_budget(bot_id))
         if is_base64:
             res = "base64://" + b64encode(res).decode()
         return res
@@ -187,7 +179,7 @@ def get_height(content: str, size: int) -> int:
     return (line_count + 1) * size
 
 
-async def text2pic(text: str, max_size: int = 800, font_size: int = 24):
+async def text2pic(text: str, max_size: int = 800, font_size: int = 24, bot_id: Optional[str] = None):
     if text.endswith("\n"):
         text = text[:-1]
 
@@ -203,7 +195,7 @@ async def text2pic(text: str, max_size: int = 800, font_size: int = 24):
         True,
     )
     img = img.crop((0, 0, max_size, int(y + 80)))
-    return await convert_img(img)
+    return await convert_img(img, bot_id=bot_id)
 
 
 def number_to_chinese(num):
@@ -0,0 +1,207 @@
+"""出站图片编码。
+
+- 按内容选择格式：色彩少的卡片/文字图用调色板 PNG，照片类用 JPEG（平台允许时用 WebP）；
+- 按平台的 ``PicMaxKB`` / ``PicMaxKBByBot`` 限制字节数，超出时逐步降低质量、再等比缩小；
+- 大画布在进程池中编码，不与事件循环线程争抢 GIL；
+- 编码结果按「像素内容 + 编码参数」哈希缓存，同一张卡片不会重复编码。
+"""
+
+import time
+import asyncio
+import hashlib
+import threading
+from io import BytesIO
+from typing import Any, Dict, Tuple, Optional
+from collections import OrderedDict
+
+from PIL import Image
+
+from gsuid_core.i18n import lt
+from gsuid_core.pool import to_thread, to_process
+from gsuid_core.logger import logger
+from gsuid_core.metrics import ENCODE_SECONDS
+from gsuid_core.utils.plugins_config.gs_config import pic_gen_config
+
+# 像素数超过该值的图片在进程池中编码
+LARGE_PIXELS = 2_000_000
+# 编码结果缓存上限（字节）
+ENCODE_CACHE_BYTES = 64 * 1024 * 1024
+# 缩略图颜色数不超过该值时视为「扁平」图片，用调色板 PNG
+FLAT_COLORS = 64
+# 超出字节预算时质量的下限
+MIN_QUALITY = 40
+
+_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+_stats: Dict[str, Any] = {"hits": 0, "misses": 0, "bytes_in": 0, "bytes_out": 0, "formats": {}}
+
+
+def image_budget(bot_id: Optional[str] = None) -> Tuple[int, bool]:
+    """返回 ``(最大字节数, 是否允许 WebP)``，最大字节数为 0 表示不限制。"""
+    max_kb: int = pic_gen_config.get_config("PicMaxKB").data
+    if bot_id:
+        for item in pic_gen_config.get_config("PicMaxKBByBot").data:
+            name, _, kb = item.partition(":")
+            if name.strip() == bot_id and kb.strip().isdigit():
+                max_kb = int(kb)
+                break
+    allow_webp = bool(bot_id) and bot_id in pic_gen_config.get_config("PicWebPBots").data
+    return max_kb * 1024, allow_webp
+
+
+def _is_flat(img: Image.Image) -> bool:
+    thumb = img.copy()
+    thumb.thumbnail((128, 128), Image.Resampling.NEAREST)
+    return thumb.getcolors(FLAT_COLORS) is not None
+
+
+def _save(img: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = BytesIO()
+    if fmt == "PNG":
+        img.quantize(256, method=Image.Quantize.FASTOCTREE).save(buffer, format="PNG", optimize=True)
+    elif fmt == "WEBP":
+        img.save(buffer, format="WEBP", quality=quality, method=4)
+    else:
+        img.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _encode(img: Image.Image, quality: int, max_bytes: int, allow_webp: bool, adaptive: bool) -> Tuple[bytes, str]:
+    if img.format == "GIF":
+        buffer = BytesIO()
+        img.save(buffer, format="GIF")
+        return buffer.getvalue(), "GIF"
+
+    img = img.convert("RGB")
+    # 关闭自适应时与旧版一致：固定质量的 JPEG
+    lossy = "WEBP" if adaptive and allow_webp else "JPEG"
+    fmt = "PNG" if adaptive and _is_flat(img) else lossy
+    data = _save(img, fmt, quality)
+    if not max_bytes or len(data) <= max_bytes:
+        return data, fmt
+
+    # 超出预算：先降质量，仍超出再按面积比例缩小
+    fmt = lossy
+    q = quality
+    while True:
+        data = _save(img, fmt, q)
+        while len(data) > max_bytes and q > MIN_QUALITY:
+            q = max(MIN_QUALITY, q - 10)
+            data = _save(img, fmt, q)
+        if len(data) <= max_bytes or min(img.size) <= 64:
+            return data, fmt
+        scale = max(0.5, min(0.95, (max_bytes / len(data)) ** 0.5))
+        img = img.resize((max(1, int(img.width * scale)), max(1, int(img.height * scale))), Image.Resampling.LANCZOS)
+
+
+def encode_in_process(img: Image.Image, quality: int, max_bytes: int, allow_webp: bool, adaptive: bool):
+    """进程池入口（需为模块级函数）。"""
+    return _encode(img, quality, max_bytes, allow_webp, adaptive)
+
+
+def _cache_key(img: Image.Image, params: Tuple) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((img.mode, img.size, img.format == "GIF", params)).encode())
+    h.update(img.tobytes())
+    return h.hexdigest()
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    with _cache_lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+        else:
+            _stats["misses"] += 1
+        return data
+
+
+def _cache_put(key: str, img: Image.Image, data: bytes, fmt: str, cost: float) -> None:
+    global _cache_bytes
+    ENCODE_SECONDS.observe(cost, fmt)
+    with _cache_lock:
+        _stats["bytes_in"] += img.width * img.height * len(img.getbands())
+        _stats["bytes_out"] += len(data)
+        _stats["formats"][fmt] = _stats["formats"].get(fmt, 0) + 1
+        if len(data) <= ENCODE_CACHE_BYTES // 4 and key not in _cache:
+            _cache[key] = data
+            _cache_bytes += len(data)
+            while _cache_bytes > ENCODE_CACHE_BYTES:
+                _, old = _cache.popitem(last=False)
+                _cache_bytes -= len(old)
+    logger.debug(
+        lt(
+            "log.image.encoded",
+            fmt=fmt,
+            size=round(len(data) / 1024, 1),
+            w=img.width,
+            h=img.height,
+            cost=round(cost * 1000, 1),
+        )
+    )
+
+
+def _params(max_bytes: int, allow_webp: bool) -> Tuple[int, int, bool, bool]:
+    quality: int = pic_gen_config.get_config("PicQuality").data
+    adaptive: bool = pic_gen_config.get_config("PicAdaptiveEncode").data
+    return quality, max_bytes, allow_webp, adaptive
+
+
+def encode_image_sync(img: Image.Image, max_bytes: int = 0, allow_webp: bool = False) -> bytes:
+    """把 ``img`` 编码为发送用的图片字节（同步版本，在当前线程中编码）。"""
+    params = _params(max_bytes, allow_webp)
+    key = _cache_key(img, params)
+    data = _cache_get(key)
+    if data is None:
+        start = time.perf_counter()
+        data, fmt = _encode(img, *params)
+        _cache_put(key, img, data, fmt, time.perf_counter() - start)
+    return data
+
+
+async def encode_image(img: Image.Image, max_bytes: int = 0, allow_webp: bool = False) -> bytes:
+    """把 ``img`` 编码为发送用的图片字节；大画布在进程池中编码。"""
+    params = _params(max_bytes, allow_webp)
+    key = await asyncio.to_thread(_cache_key, img, params)
+    data = _cache_get(key)
+    if data is not None:
+        return data
+
+    start = time.perf_counter()
+    if img.width * img.height >= LARGE_PIXELS:
+        data, fmt = await to_process(encode_in_process)(img, *params)
+    else:
+        data, fmt = await to_thread(_encode)(img, *params)
+    _cache_put(key, img, data, fmt, time.perf_counter() - start)
+    return data
+
+
+def _open(data: bytes) -> Image.Image:
+    img = Image.open(BytesIO(data))
+    img.load()
+    return img
+
+
+async def fit_image_bytes(data: bytes, max_bytes: int, allow_webp: bool = False) -> bytes:
+    """已编码的图片超过 ``max_bytes`` 时重新编码以满足预算，否则原样返回。"""
+    if not max_bytes or len(data) <= max_bytes:
+        return data
+    try:
+        img = await asyncio.to_thread(_open, data)
+    except OSError:
+        return data
+    if img.format == "GIF":
+        return data
+    return await encode_image(img, max_bytes, allow_webp)
+
+
+def encode_stats() -> Dict[str, Any]:
+    with _cache_lock:
+        return {
+            **_stats,
+            "formats": dict(_stats["formats"]),
+            "cache_items": len(_cache),
+            "cache_bytes": _cache_bytes,
+        }
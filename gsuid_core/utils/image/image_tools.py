@@ -1,30 +1,123 @@
 import io
 import math
+import time
 import base64
 import random
+import asyncio
 import mimetypes
+import threading
 from io import BytesIO
-from typing import List, Tuple, Union, Optional, overload
+from typing import Dict, List, Tuple, Union, Hashable, Iterable, Optional, overload
 from pathlib import Path
+from collections import OrderedDict
 
 import httpx
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-from httpx import get
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.data_store import get_res_path
 from gsuid_core.utils.fonts.fonts import core_font
-from gsuid_core.utils.image.utils import sget
+from gsuid_core.utils.image.utils import sget, fetch, sget_sync
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 BG_PATH = Path(__file__).parents[1] / "default_bg"
+# 解码并缩放好的静态素材/遮罩/背景的缓存上限（按像素数据字节计）
+ASSET_CACHE_BYTES = 256 * 1024 * 1024
+# 背景目录的文件列表缓存 {目录: (目录 mtime, 文件列表)}
+_dir_files: Dict[Path, Tuple[int, List[Path]]] = {}
+
+# 解码后的头像缓存，键为 (来源, 尺寸)，按像素数据字节限额
+AVATAR_TTL = 3600
+AVATAR_CACHE_BYTES = 64 * 1024 * 1024
+# get_avatars 批量获取时的并发下载数
+AVATAR_CONCURRENCY = 16
 
 
 ImageInput = Union[str, Path, bytes, io.BytesIO, Image.Image]
 
 
+def _image_nbytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+class ImageLRU:
+    """按像素数据字节限额的图片 LRU，可选按条目过期；线程安全。
+
+    单张超过上限 1/4 的图片不缓存，避免一张大图挤掉整个缓存。
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items: "OrderedDict[Hashable, Tuple[float, Image.Image]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: Hashable, img: Image.Image, ttl: Optional[float] = None) -> None:
+        size = _image_nbytes(img)
+        if size > self.max_bytes // 4:
+            return
+        expires = math.inf if ttl is None else time.time() + ttl
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= _image_nbytes(old[1])
+            self._items[key] = (expires, img)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, victim) = self._items.popitem(last=False)
+                self.bytes -= _image_nbytes(victim)
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.time():
+                del self._items[key]
+                self.bytes -= _image_nbytes(item[1])
+                return None
+            self._items.move_to_end(key)
+            return item[1]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"items": len(self._items), "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+
+_assets = ImageLRU(ASSET_CACHE_BYTES)
+_avatars = ImageLRU(AVATAR_CACHE_BYTES)
+
+
+def get_asset(path: Path, size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    """读取静态素材并缩放到 ``size``，结果按 (路径, 修改时间, 尺寸) 缓存。
+
+    返回的是缓存中的共享对象，只能用作粘贴源或遮罩，需要修改时请先 ``copy()``。
+    """
+    key = ("asset", path, path.stat().st_mtime_ns, size)
+    img = _assets.get(key)
+    if img is None:
+        img = Image.open(path)
+        img.load()
+        if size is not None and img.size != size:
+            img = img.resize(size)
+        _assets.put(key, img)
+    return img
+
+
+def asset_cache_stats() -> Dict[str, int]:
+    return _assets.stats()
+
+
+def _list_dir(path: Path) -> List[Path]:
+    mtime = path.stat().st_mtime_ns
+    cached = _dir_files.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _dir_files[path] = (mtime, list(path.iterdir()))
+    return cached[1]
+
+
 def image_to_base64(image: ImageInput) -> str:
     """
     内部函数：将各种类型的图片输入转换为 Base64 字符串
@@ -172,20 +265,9 @@ def tint_image(input_image: Image.Image, color: Tuple[int, int, int]):
     :param output_image_path: 输出图片的保存路径
     :param color: 目标颜色，一个RGB元组，例如红色为 (255, 0, 0)
     """
-    _, _, _, alpha = input_image.convert("RGBA").split()
-    color_layer = Image.new("RGBA", input_image.size, color)
-
-    red_channel, green_channel, blue_channel, _ = color_layer.split()
-
-    tinted_img = Image.merge(
-        "RGBA",
-        (
-            red_channel,
-            green_channel,
-            blue_channel,
-            alpha,
-        ),
-    )
+    alpha = input_image.convert("RGBA").getchannel("A")
+    tinted_img = Image.new("RGBA", input_image.size, color)
+    tinted_img.putalpha(alpha)
     return tinted_img
 
 
@@ -195,7 +277,7 @@ def get_font_x(font: ImageFont.FreeTypeFont, text: str):
 
 
 def get_div():
-    return Image.open(TEXT_PATH / "div.png")
+    return get_asset(TEXT_PATH / "div.png").copy()
 
 
 def draw_color_badge(
@@ -225,14 +307,14 @@ def draw_color_badge(
 
 def get_status_icon(status: Union[int, bool]) -> Image.Image:
     if status:
-        img = Image.open(TEXT_PATH / "yes.png")
+        img = get_asset(TEXT_PATH / "yes.png")
     else:
-        img = Image.open(TEXT_PATH / "no.png")
-    return img
+        img = get_asset(TEXT_PATH / "no.png")
+    return img.copy()
 
 
 def get_v4_footer():
-    return Image.open(TEXT_PATH / "footer.png")
+    return get_asset(TEXT_PATH / "footer.png").copy()
 
 
 def add_footer(
@@ -240,14 +322,14 @@ def add_footer(
     w: int = 0,
     footer: Optional[Image.Image] = None,
 ) -> Image.Image:
+    is_default = footer is None
     if footer is None:
-        footer = get_v4_footer()
+        footer = get_asset(TEXT_PATH / "footer.png")
 
     w = img.size[0] if not w else w
     if w != footer.size[0]:
-        footer = footer.resize(
-            (w, int(footer.size[1] * w / footer.size[0])),
-        )
+        size = (w, int(footer.size[1] * w / footer.size[0]))
+        footer = get_asset(TEXT_PATH / "footer.png", size) if is_default else footer.resize(size)
     x, y = (
         int((img.size[0] - footer.size[0]) / 2),
         img.size[1] - footer.size[1] - 10,
@@ -268,6 +350,26 @@ def get_v4_bg(w: int, h: int, is_dark: bool = False, is_blur: bool = False):
     return img
 
 
+def _decode_avatar(content: bytes, size: Optional[int]) -> Image.Image:
+    img = Image.open(BytesIO(content)).convert("RGBA")
+    if size is not None and img.size != (size, size):
+        img = crop_center_img(img, size, size)
+    return img
+
+
+async def _load_avatar(key: Hashable, url: str, size: Optional[int] = None) -> Image.Image:
+    """下载并解码头像，结果按 ``key`` + ``size`` 缓存 ``AVATAR_TTL`` 秒；返回副本，可随意修改。"""
+    key = (key, size)
+    img = _avatars.get(key)
+    if img is not None:
+        return img.copy()
+
+    content = (await sget(url, use_cache=True)).content
+    img = await asyncio.to_thread(_decode_avatar, content, size)
+    _avatars.put(key, img, AVATAR_TTL)
+    return img.copy()
+
+
 async def get_event_avatar(ev: Event, avatar_path: Optional[Path] = None) -> Image.Image:
     img = None
     if ev.bot_id == "onebot" and ev.at:
@@ -277,8 +379,7 @@ async def get_event_avatar(ev: Event, avatar_path: Optional[Path] = None) -> Ima
         avatar_url: str = ev.sender["avatar"]
         if avatar_url.startswith(("http", "https")):
             try:
-                content = (await sget(avatar_url, use_cache=True)).content
-                img = Image.open(BytesIO(content)).convert("RGBA")
+                img = await _load_avatar(("url", avatar_url), avatar_url)
             except (httpx.HTTPError, OSError, TimeoutError):
                 img = None
 
@@ -312,19 +413,11 @@ async def get_avatar_with_ring(
 
 async def shift_image_hue(img: Image.Image, angle: float = 30) -> Image.Image:
     alpha = img.getchannel("A")
-    img = img.convert("HSV")
-
-    pixels = img.load()
-    assert pixels is not None
-    hue_shift = angle
-
-    for y in range(img.height):
-        for x in range(img.width):
-            h, s, v = pixels[x, y]  # type: ignore
-            h = (h + hue_shift) % 360
-            pixels[x, y] = (h, s, v)  # type: ignore
+    h, s, v = img.convert("HSV").split()
 
-    img = img.convert("RGBA")
+    # 查表代替逐像素读写；与旧实现一致：(h + angle) % 360 后超过 255 的色相截断为 255
+    lut = [min(int((i + angle) % 360), 255) for i in range(256)]
+    img = Image.merge("HSV", (h.point(lut), s, v)).convert("RGBA")
     img.putalpha(alpha)
     return img
 
@@ -333,18 +426,21 @@ async def get_pic(url, size: Optional[Tuple[int, int]] = None) -> Image.Image:
     """
     从网络获取图片, 格式化为RGBA格式的指定尺寸
     """
-    async with httpx.AsyncClient(timeout=None) as client:
-        resp = await client.get(url=url)
-        if resp.status_code != 200:
-            if size is None:
-                size = (960, 600)
-            return Image.new("RGBA", size)
-        pic = Image.open(BytesIO(resp.read()))
+    resp = await fetch(url)
+    if resp.status_code != 200:
+        if size is None:
+            size = (960, 600)
+        return Image.new("RGBA", size)
+
+    def _decode() -> Image.Image:
+        pic = Image.open(BytesIO(resp.content))
         pic = pic.convert("RGBA")
         if size is not None:
             pic = pic.resize(size)
         return pic
 
+    return await asyncio.to_thread(_decode)
+
 
 def draw_center_text_by_line(
     img: ImageDraw.ImageDraw,
@@ -489,15 +585,15 @@ def easy_alpha_composite(im: Image.Image, im_paste: Image.Image, pos=(0, 0), dir
 async def get_qq_avatar(
     qid: Optional[Union[int, str]] = None,
     avatar_url: Optional[str] = None,
+    size: Optional[int] = None,
 ) -> Optional[Image.Image]:
+    """获取 QQ 头像，``size`` 不为空时裁剪为 ``size x size``；下载失败返回 None。"""
     if qid:
         avatar_url = f"http://q1.qlogo.cn/g?b=qq&nk={qid}&s=640"
     elif avatar_url is None:
         avatar_url = "https://q1.qlogo.cn/g?b=qq&nk=3399214199&s=640"
     try:
-        resp = await sget(avatar_url, use_cache=True)
-        char_pic = Image.open(BytesIO(resp.content)).convert("RGBA")
-        return char_pic
+        return await _load_avatar(("url", avatar_url), avatar_url, size)
     except (httpx.HTTPError, OSError, TimeoutError) as e:
         logger.warning(t("log.image.url_error_download_fail", url=avatar_url, error=e))
         return None
@@ -507,19 +603,41 @@ async def get_qqgroup_avatar(
     bot_id: Optional[Union[int, str]] = None,
     qid: Optional[Union[int, str]] = None,
     avatar_url: Optional[str] = None,
+    size: Optional[int] = None,
 ) -> Optional[Image.Image]:
     if not qid or not bot_id:
         return None
     avatar_url = f"https://q.qlogo.cn/qqapp/{bot_id}/{qid}/100"
     try:
-        resp = await sget(avatar_url, use_cache=True)
-        char_pic = Image.open(BytesIO(resp.content)).convert("RGBA")
-        return char_pic
+        return await _load_avatar(("url", avatar_url), avatar_url, size)
     except (httpx.HTTPError, OSError, TimeoutError) as e:
         logger.warning(t("log.image.url_error_download_fail_2", url=avatar_url, error=e))
         return None
 
 
+async def get_avatars(
+    user_ids: Iterable[Union[int, str]],
+    bot_id: str = "onebot",
+    bot_self_id: str = "",
+    size: Optional[int] = None,
+) -> List[Optional[Image.Image]]:
+    """批量获取头像（如排行榜），并发下载、命中缓存的直接返回；顺序与 ``user_ids`` 一致。
+
+    onebot 取 QQ 头像，qqgroup 取 QQ 群机器人头像，其它平台返回 None。
+    """
+    sem = asyncio.Semaphore(AVATAR_CONCURRENCY)
+
+    async def _one(user_id: Union[int, str]) -> Optional[Image.Image]:
+        async with sem:
+            if bot_id == "onebot":
+                return await get_qq_avatar(user_id, size=size)
+            if bot_id == "qqgroup":
+                return await get_qqgroup_avatar(bot_self_id, user_id, size=size)
+            return None
+
+    return list(await asyncio.gather(*(_one(user_id) for user_id in user_ids)))
+
+
 async def draw_pic_with_ring(
     pic: Image.Image,
     size: int,
@@ -538,12 +656,10 @@ async def draw_pic_with_ring(
     :返回:
       * img: `Image.Image`: 图片对象
     """
-    ring_pic = Image.open(TEXT_PATH / "ring.png")
-    mask_pic = Image.open(TEXT_PATH / "mask.png")
     img = Image.new("RGBA", (size, size))
     resize_pic = crop_center_img(pic, size, size)
     resize_pic = resize_pic.convert("RGBA")
-    mask = mask_pic.resize((size, size))
+    mask = get_asset(TEXT_PATH / "mask.png", (size, size))
     if bg_color:
         img_color = Image.new("RGBA", (size, size), bg_color)
         img_color.paste(resize_pic, (0, 0), resize_pic)
@@ -552,7 +668,7 @@ async def draw_pic_with_ring(
         img.paste(resize_pic, (0, 0), mask)
 
     if is_ring:
-        ring = ring_pic.resize((size, size))
+        ring = get_asset(TEXT_PATH / "ring.png", (size, size))
         img.paste(ring, (0, 0), ring)
 
     return img
@@ -602,28 +718,56 @@ async def get_color_bg(
         img.paste(color_img, (0, 0), mask)
     elif not without_mask:
         color_mask = Image.new("RGBA", (based_w, based_h), color)
-        enka_mask = Image.open(TEXT_PATH / "bg_mask.png").resize((based_w, based_h))
+        enka_mask = get_asset(TEXT_PATH / "bg_mask.png", (based_w, based_h))
         img.paste(color_mask, (0, 0), enka_mask)
     return img
 
 
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class CustomizeImage:
     def __init__(self, bg_path: Path) -> None:
         self.bg_path = bg_path
 
+    async def get_image_async(self, image: Union[str, Image.Image, None], based_w: int, based_h: int) -> Image.Image:
+        """``get_image`` 的异步版本：URL 经共享连接池下载，解码与裁剪在线程中进行。"""
+        if isinstance(image, str) and image:
+            content = (await sget(image)).content
+            image = await asyncio.to_thread(lambda: Image.open(BytesIO(content)).convert("RGBA"))
+        return await asyncio.to_thread(self.get_image, image, based_w, based_h)
+
     def get_image(self, image: Union[str, Image.Image, None], based_w: int, based_h: int) -> Image.Image:
+        """获取裁剪到 ``based_w x based_h`` 的背景图。
+
+        ``image`` 为 URL 时同步下载；在事件循环中调用会在下载期间阻塞循环并记录警告，
+        异步代码请使用 ``get_image_async``。
+        """
+        if isinstance(image, str) and image and _in_event_loop():
+            logger.warning(t("log.image.sync_get_image_url_on_loop", url=image))
+
         # 获取背景图片
         if isinstance(image, Image.Image):
             edit_bg = image
         elif image:
-            edit_bg = Image.open(BytesIO(get(image).content)).convert("RGBA")
+            # 不缓存：随机图 API 等 URL 每次返回的内容不同
+            resp = sget_sync(image)
+            edit_bg = Image.open(BytesIO(resp.content)).convert("RGBA")
         else:
-            _lst = list(self.bg_path.iterdir())
-            if _lst:
-                path = random.choice(list(self.bg_path.iterdir()))
-            else:
-                path = random.choice(list(BG_PATH.iterdir()))
-            edit_bg = Image.open(path).convert("RGBA")
+            _lst = _list_dir(self.bg_path) or _list_dir(BG_PATH)
+            path = random.choice(_lst)
+            # 随机背景反复命中同几张图：缓存裁剪好的结果，返回副本供调用方修改
+            key = ("bg", path, path.stat().st_mtime_ns, based_w, based_h)
+            bg_img = _assets.get(key)
+            if bg_img is None:
+                bg_img = crop_center_img(Image.open(path).convert("RGBA"), based_w, based_h)
+                _assets.put(key, bg_img)
+            return bg_img.copy()
 
         # 确定图片的长宽
         bg_img = crop_center_img(edit_bg, based_w, based_h)
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Union
 from bs4 import BeautifulSoup, element
 from PIL import Image, ImageDraw
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.error_reply import get_error
 from gsuid_core.utils.fonts.fonts import core_font as cf
@@ -35,7 +35,7 @@ async def process_tag(
     space = 15
     _type = _data = None
 
-    logger.trace(t("log.image.gscore_processing_tag", p0=tag.name))
+    logger.trace(lt("log.image.gscore_processing_tag", p0=tag.name))
 
     if tag.name == "img":
         img_url = tag.get("src")
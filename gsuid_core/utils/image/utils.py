@@ -1,16 +1,12 @@
-import os
-import time
-import asyncio
-import hashlib
 from io import BytesIO
-from pathlib import Path
 
 import httpx
 from PIL import Image
+from aiohttp import ClientTimeout
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
-from gsuid_core.data_store import get_res_path
+from gsuid_core.utils.disk_cache import get_disk_cache
 
 _SGET_CONNECT_TIMEOUT: float = 3.0
 _SGET_READ_TIMEOUT: float = 8.0
@@ -18,39 +14,27 @@ _SGET_WRITE_TIMEOUT: float = 3.0
 _SGET_POOL_TIMEOUT: float = 3.0
 _SGET_TOTAL_TIMEOUT: float = 12.0
 _SGET_CACHE_TTL: float = 172800.0  # 2 days
-
-_URL_CACHE_DIR: Path = get_res_path(["IMAGE_CACHE", "sget"])
-
-
-def _url_cache_path(url: str) -> Path:
-    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
-    return _URL_CACHE_DIR / f"{key}.bin"
-
-
-async def _read_cached(url: str) -> httpx.Response | None:
-    path = _url_cache_path(url)
-    if not path.exists():
-        return None
-    if time.time() - path.stat().st_mtime > _SGET_CACHE_TTL:
-        return None
-    content = await asyncio.to_thread(path.read_bytes)
-    request = httpx.Request("GET", url)
-    return httpx.Response(200, content=content, request=request)
-
-
-async def _write_cache(url: str, content: bytes) -> None:
-    path = _url_cache_path(url)
-    tmp_path = path.with_suffix(".tmp")
-    _ = await asyncio.to_thread(tmp_path.write_bytes, content)
-    await asyncio.to_thread(os.replace, tmp_path, path)
+# 图片/头像下载在共享连接池（utils/http_pool）中的 session 名与连接上限
+_SGET_POOL_NAME = "image"
+_SGET_POOL_LIMIT = 64
+# aiohttp 已解压响应体，转成 httpx.Response 时不能再带这些头，否则会被二次解码
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
 
 
 async def sget(url: str, use_cache: bool = False) -> httpx.Response:
     if use_cache:
-        cached = await _read_cached(url)
-        if cached is not None:
-            return cached
+        # 同一 URL 的并发请求只下载一次
+        content = await get_disk_cache().get_or_fetch(
+            f"sget:{url}",
+            lambda: _download(url),
+            _SGET_CACHE_TTL,
+        )
+        return httpx.Response(200, content=content, request=httpx.Request("GET", url))
+    return await _get(url)
 
+
+def sget_sync(url: str) -> httpx.Response:
+    """同步下载，会阻塞调用线程；异步代码请使用 ``sget``。"""
     logger.info(t("log.image.sget_content_download_url", url=url))
     timeout = httpx.Timeout(
         connect=_SGET_CONNECT_TIMEOUT,
@@ -58,16 +42,43 @@ async def sget(url: str, use_cache: bool = False) -> httpx.Response:
         write=_SGET_WRITE_TIMEOUT,
         pool=_SGET_POOL_TIMEOUT,
     )
-    async with asyncio.timeout(_SGET_TOTAL_TIMEOUT):
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-        ) as client:
-            resp = await client.get(url=url)
-            _ = resp.raise_for_status()
-            if use_cache:
-                await _write_cache(url, resp.content)
-            return resp
+    resp = httpx.get(url, timeout=timeout, follow_redirects=True)
+    _ = resp.raise_for_status()
+    return resp
+
+
+async def fetch(url: str) -> httpx.Response:
+    """经共享连接池下载 ``url``，不检查状态码；返回的 ``httpx.Response`` 已读完响应体。"""
+    # 本模块会被 segment 间接导入，http_pool 依赖 server，不能在模块级导入
+    from gsuid_core.utils.http_pool import get_session
+
+    session = get_session(
+        _SGET_POOL_NAME,
+        limit=_SGET_POOL_LIMIT,
+        # 与原先的 httpx 客户端一致，图片 CDN 走 HTTP(S)_PROXY 环境变量
+        trust_env=True,
+        timeout=ClientTimeout(
+            total=_SGET_TOTAL_TIMEOUT,
+            connect=_SGET_CONNECT_TIMEOUT + _SGET_POOL_TIMEOUT,
+            sock_connect=_SGET_CONNECT_TIMEOUT,
+            sock_read=_SGET_READ_TIMEOUT,
+        ),
+    )
+    async with session.get(url) as resp:
+        content = await resp.read()
+        headers = [(k, v) for k, v in resp.headers.items() if k.lower() not in _HOP_HEADERS]
+        return httpx.Response(resp.status, headers=headers, content=content, request=httpx.Request("GET", url))
+
+
+async def _download(url: str) -> bytes:
+    return (await _get(url)).content
+
+
+async def _get(url: str) -> httpx.Response:
+    logger.info(t("log.image.sget_content_download_url", url=url))
+    resp = await fetch(url)
+    _ = resp.raise_for_status()
+    return resp
 
 
 async def download_pic_to_image(url: str) -> Image.Image:
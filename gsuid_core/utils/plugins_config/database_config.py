@@ -68,4 +68,16 @@ DATABASE_CONIFG: Dict[str, GSC] = {
         1500,
         options=[1500, 3600, 7200, 14400, 28800],
     ),
+    "user_write_flush_interval": GsIntConfig(
+        "用户/群记录合并写入间隔(秒)",
+        "开启 buffered_user_writes 后, CoreUser/CoreGroup 写后队列的定时刷写间隔",
+        5,
+        options=[1, 5, 10, 30, 60],
+    ),
+    "user_write_max_pending": GsIntConfig(
+        "用户/群记录合并写入队列上限",
+        "写后队列积压达到该条数时立即刷写, 不再等待定时间隔",
+        500,
+        options=[100, 500, 1000, 5000],
+    ),
 }
@@ -1,6 +1,6 @@
 from typing import Dict
 
-from .models import GSC, GsIntConfig
+from .models import GSC, GsIntConfig, GsBoolConfig, GsListStrConfig
 
 PIC_GEN_CONIFG: Dict[str, GSC] = {
     "PicQuality": GsIntConfig(
@@ -9,4 +9,27 @@ PIC_GEN_CONIFG: Dict[str, GSC] = {
         85,
         100,
     ),
+    "PicAdaptiveEncode": GsBoolConfig(
+        "自适应图片编码",
+        "开启后按图片内容选择格式: 色彩较少的卡片用PNG, 照片类用JPEG(或WebP); 关闭则固定使用JPEG",
+        True,
+    ),
+    "PicMaxKB": GsIntConfig(
+        "发送图片大小上限(KB)",
+        "超出后自动降低质量或缩小尺寸, 0为不限制",
+        0,
+        102400,
+    ),
+    "PicMaxKBByBot": GsListStrConfig(
+        "各平台图片大小上限(KB)",
+        "按平台单独设置图片大小上限, 格式为 平台:KB, 如 qqgroup:2048, 优先于上一项",
+        [],
+        ["qqgroup:2048", "qqguild:2048", "telegram:5120", "discord:8192"],
+    ),
+    "PicWebPBots": GsListStrConfig(
+        "允许发送WebP的平台",
+        "这些平台的照片类图片使用体积更小的WebP格式, 请确认平台支持后再开启",
+        [],
+        ["telegram", "discord", "kook", "feishu"],
+    ),
 }
@@ -1,6 +1,6 @@
 from typing import Dict
 
-from .models import GSC, GsIntConfig, GsStrConfig, GsListStrConfig
+from .models import GSC, GsIntConfig, GsStrConfig, GsFloatConfig, GsListStrConfig
 
 SP_CONIFG: Dict[str, GSC] = {
     "HelpMode": GsStrConfig(
@@ -55,4 +55,105 @@ SP_CONIFG: Dict[str, GSC] = {
         25,
         500,
     ),
+    "SendConcurrency": GsIntConfig(
+        "允许发送并发数量",
+        "同一Bot同时向不同群/用户发送的数量上限, 同一目标始终按顺序发送",
+        8,
+        64,
+    ),
+    "HttpLimitPerHost": GsIntConfig(
+        "单个站点HTTP并发连接数",
+        "共享HTTP连接池中同一站点(如米游社)同时保持的连接数上限, 超出的请求排队复用空闲连接",
+        16,
+        256,
+    ),
+    "SendTargetInterval": GsFloatConfig(
+        "同目标发送间隔(秒)",
+        "同一群/用户连续两次发送之间的最小间隔, 0为不限制",
+        0.0,
+        0.0,
+        10.0,
+    ),
+    "SignConcurrency": GsIntConfig(
+        "自动签到并发数",
+        "每日自动签到时同时进行签到的账号(Cookie)数量, 同一Cookie下的UID始终依次签到",
+        4,
+        32,
+    ),
+    "SignRatePerMinute": GsFloatConfig(
+        "自动签到速率(次/分钟)",
+        "每日自动签到全局每分钟最多发起的签到数量",
+        6.0,
+        0.1,
+        120.0,
+    ),
+    "SignJitter": GsFloatConfig(
+        "自动签到随机延迟(秒)",
+        "每个账号签到前额外等待 0~该值 秒的随机时间",
+        10.0,
+        0.0,
+        600.0,
+    ),
+    "BroadcastConcurrency": GsIntConfig(
+        "广播推送并发数",
+        "广播推送(如签到结果)同时发送的目标数量上限, 同一目标的多条消息依次发送",
+        8,
+        64,
+    ),
+    "BroadcastBotRate": GsFloatConfig(
+        "广播推送单Bot速率(条/秒)",
+        "广播推送时每个连接的Bot每秒最多发送的消息数",
+        2.0,
+        0.1,
+        100.0,
+    ),
+    "BroadcastPlatformRate": GsFloatConfig(
+        "广播推送单平台速率(条/秒)",
+        "广播推送时同一平台(如onebot/qqgroup)每秒最多发送的消息数",
+        5.0,
+        0.1,
+        100.0,
+    ),
+    "BroadcastMaxRetry": GsIntConfig(
+        "广播推送失败重试次数",
+        "单个目标推送失败后的最大重试次数, 重试间隔按5秒起逐次翻倍",
+        3,
+        10,
+    ),
+    "CacheMaxMB": GsIntConfig(
+        "图片/下载缓存上限(MB)",
+        "sget下载缓存与gs_cache图片缓存共用的磁盘空间上限, 超出后按淘汰策略删除旧文件, 重启后生效",
+        1024,
+        102400,
+    ),
+    "CacheEvictPolicy": GsStrConfig(
+        "缓存淘汰策略",
+        "LRU: 优先删除最久未使用的; LFU: 优先删除使用次数最少的, 重启后生效",
+        "LRU",
+        ["LRU", "LFU"],
+    ),
+    "ResourceMemoryMB": GsIntConfig(
+        "临时资源内存上限(MB)",
+        "收到的图片/语音等临时资源在内存中的占用上限, 超出后将较久未用的大文件暂存到磁盘",
+        128,
+        4096,
+    ),
+    "RenderCacheMB": GsIntConfig(
+        "HTML渲染结果缓存上限(MB)",
+        "相同内容与参数的HTML/Markdown/文本渲染结果会直接复用, 此为内存中缓存的总大小上限",
+        64,
+        1024,
+    ),
+    "RenderWorkers": GsIntConfig(
+        "HTML渲染并发数",
+        "同时进行的HTML/Markdown/文本渲染数量, 超出的请求排队等待, 重启后生效",
+        2,
+        16,
+    ),
+    "RenderWorkerMode": GsStrConfig(
+        "HTML渲染工作方式",
+        "thread: 在线程中渲染; process: 在独立子进程中渲染, 大图渲染不影响主进程响应但占用更多内存, 重启后生效",
+        "thread",
+        ["thread", "process"],
+    ),
 }
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import aiohttp
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import _DefHook, core_start_def
 from gsuid_core.utils.plugins_config.gs_config import core_plugins_config
@@ -373,13 +373,13 @@ async def set_proxy_all_plugins(proxy: Optional[str] = None) -> List[str]:
 async def refresh_list() -> List[str]:
     refresh_list = []
     async with aiohttp.ClientSession() as session:
-        logger.trace(t("log.plugin.plugins_lib", plugins_lib=plugins_lib))
+        logger.trace(lt("log.plugin.plugins_lib", plugins_lib=plugins_lib))
         async with session.get(plugins_lib) as resp:
             _plugins_list: Dict[str, Dict[str, Dict[str, str]]] = await resp.json()
             for i in _plugins_list["plugins"]:
                 if i.lower() not in plugins_list:
                     refresh_list.append(i)
-                    logger.debug(t("log.plugin.event_info", i=i))
+                    logger.debug(lt("log.plugin.event_info", i=i))
                 plugins_list[i.lower()] = _plugins_list["plugins"][i]
     return refresh_list
 
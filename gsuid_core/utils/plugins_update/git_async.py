@@ -17,7 +17,7 @@ import subprocess
 from typing import Optional
 from pathlib import Path
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 
 # git 命令默认超时时间（秒）
@@ -146,7 +146,7 @@ async def run_git(repo_path: Path, *args: str, timeout: int = GIT_TIMEOUT) -> tu
         logger.success(t("log.plugin.git_async_command_succeeded_cmd_ok", cmd_str=cmd_str, repo_path=repo_path))
         if stdout_str:
             logger.debug(
-                t(
+                lt(
                     "log.git_async.stdout_event",
                     stdout=f"{stdout_str[:200]}{'...' if len(stdout_str) > 200 else ''}",
                 )
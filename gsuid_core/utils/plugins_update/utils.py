@@ -2,7 +2,7 @@ from typing import List
 
 import psutil
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.plugins_config.gs_config import core_plugins_config
 
@@ -26,7 +26,7 @@ def check_start_tool(is_pip: bool = False):
     command_chain = get_command_chain()
     command_chain = [command.lower() for command in command_chain]
     command_chain_str = " ".join(command_chain)
-    logger.debug(t("log.plugin.command_chain_start", command_chain=command_chain))
+    logger.debug(lt("log.plugin.command_chain_start", command_chain=command_chain))
 
     PDM = "pdm"
     POETRY = "poetry"
@@ -66,5 +66,5 @@ def check_start_tool(is_pip: bool = False):
     else:
         command = OTHER
 
-    logger.debug(t("log.plugin.command_start", command=command))
+    logger.debug(lt("log.plugin.command_start", command=command))
     return command
@@ -1,14 +1,37 @@
 import time
 import uuid
 import asyncio
-from typing import Dict, Union, Optional
+import hashlib
+from io import BytesIO
+from typing import Set, Dict, Union, Optional
+from pathlib import Path
+from collections import OrderedDict
 
 from PIL import Image
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_start, on_core_shutdown
+from gsuid_core.data_store import get_res_path
 from gsuid_core.utils.image.image_tools import change_ev_image_to_bytes
+from gsuid_core.utils.plugins_config.gs_config import sp_config
+
+SPILL_PATH = get_res_path(["GsCore", "rm_spill"])
+# 小于该大小的数据（URL、小图）不溢出到磁盘
+SPILL_MIN_BYTES = 16 * 1024
+
+
+class _Blob:
+    """按内容去重后的一份数据；``data`` 为 None 表示已溢出到磁盘 ``path``。"""
+
+    __slots__ = ("data", "size", "refs", "path", "spilling")
+
+    def __init__(self, data: Union[str, bytes], size: int) -> None:
+        self.data: Optional[Union[str, bytes]] = data
+        self.size = size
+        self.refs = 0
+        self.path: Optional[Path] = None
+        self.spilling = False
 
 
 class ResourceManager:
@@ -16,8 +39,13 @@ class ResourceManager:
 
     管理临时资源（图片等）的注册和获取，支持 TTL 自动清理。
 
+    同样内容只保存一份（按内容哈希去重，转发 200 次的表情包只占一份内存）；
+    内存中的数据超过 ``ResourceMemoryMB`` 时，把最久未用、不小于 ``SPILL_MIN_BYTES``
+    的数据溢出到 ``SPILL_PATH``，``get`` 时再透明读回。
+
     Attributes:
-        _store: 资源存储 {resource_id: (data, created_at)}
+        _store: 资源存储 {resource_id: (内容哈希, created_at)}
+        _blobs: 去重后的数据 {内容哈希: _Blob}，按最近使用排序
         _ttl_seconds: 资源存活时间（秒），超过此时间未使用的资源将被自动清理
         _cleanup_interval: 清理检查间隔（秒）
     """
@@ -27,8 +55,33 @@ class ResourceManager:
     _cleanup_task: Optional[asyncio.Task] = None
     _cleanup_running: bool = False
 
-    def __init__(self) -> None:
-        self._store: Dict[str, tuple[Union[str, bytes], float]] = {}
+    def __init__(self, spill_path: Path = SPILL_PATH) -> None:
+        self._store: Dict[str, tuple[str, float]] = {}
+        self._blobs: "OrderedDict[str, _Blob]" = OrderedDict()
+        self._spill_path = spill_path
+        self._spill_tasks: Set[asyncio.Task] = set()
+        self.memory_bytes = 0
+        self.spilled_bytes = 0
+        # 所有存活资源的数据量之和（不去重），与实际占用之比即去重率
+        self.logical_bytes = 0
+        self.spill_count = 0
+        self.rehydrate_count = 0
+
+    def _put(self, prefix: str, data: Union[str, bytes]) -> str:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        blob = self._blobs.get(digest)
+        if blob is None:
+            blob = self._blobs[digest] = _Blob(data, len(raw))
+            self.memory_bytes += blob.size
+        self._blobs.move_to_end(digest)
+        blob.refs += 1
+        self.logical_bytes += blob.size
+
+        resource_id = f"{prefix}_{uuid.uuid4().hex[:8]}"
+        self._store[resource_id] = (digest, time.time())
+        self._enforce_budget()
+        return resource_id
 
     def register(self, data: Union[str, bytes, Image.Image]) -> str:
         """存入二进制数据或者base64数据/URL，返回一个 ID
@@ -39,12 +92,11 @@ class ResourceManager:
         Returns:
             资源 ID（格式: img_xxxxxxxx）
         """
-        resource_id = f"img_{uuid.uuid4().hex[:8]}"
         if isinstance(data, Image.Image):
-            data = data.tobytes()
-
-        self._store[resource_id] = (data, time.time())
-        return resource_id
+            buffer = BytesIO()
+            data.save(buffer, format="PNG")
+            data = buffer.getvalue()
+        return self._put("img", data)
 
     def register_audio(self, data: Union[str, bytes]) -> str:
         """存入音频二进制数据或base64数据/URL，返回一个 ID
@@ -55,9 +107,7 @@ class ResourceManager:
         Returns:
             资源 ID（格式: aud_xxxxxxxx）
         """
-        resource_id = f"aud_{uuid.uuid4().hex[:8]}"
-        self._store[resource_id] = (data, time.time())
-        return resource_id
+        return self._put("aud", data)
 
     def register_video(self, data: Union[str, bytes]) -> str:
         """存入视频二进制数据或base64数据/URL，返回一个 ID
@@ -68,9 +118,7 @@ class ResourceManager:
         Returns:
             资源 ID（格式: vid_xxxxxxxx）
         """
-        resource_id = f"vid_{uuid.uuid4().hex[:8]}"
-        self._store[resource_id] = (data, time.time())
-        return resource_id
+        return self._put("vid", data)
 
     async def get(self, resource_id: str) -> bytes:
         """根据 ID 取回数据
@@ -89,7 +137,8 @@ class ResourceManager:
         if result is None:
             raise ValueError(t("找不到资源 ID: {resource_id}", resource_id=resource_id))
 
-        data, _ = result
+        digest, _ = result
+        data = await self._load(digest)
         if isinstance(data, str):
             try:
                 data = await change_ev_image_to_bytes(data)
@@ -98,11 +147,107 @@ class ResourceManager:
                 raise ValueError(t("资源ID: {resource_id} 数据转换失败: {e}", resource_id=resource_id, e=e))
         return data
 
+    async def _load(self, digest: str) -> Union[str, bytes]:
+        blob = self._blobs[digest]
+        self._blobs.move_to_end(digest)
+        if blob.data is not None:
+            return blob.data
+
+        # 已溢出到磁盘：读回内存
+        assert blob.path is not None
+        path = blob.path
+        raw = await asyncio.to_thread(path.read_bytes)
+        data: Union[str, bytes] = raw[1:].decode("utf-8") if raw[:1] == b"s" else raw[1:]
+        if blob.refs and blob.data is None and blob.path is path:
+            blob.data = data
+            blob.path = None
+            self.memory_bytes += blob.size
+            self.spilled_bytes -= blob.size
+            self.rehydrate_count += 1
+            path.unlink(missing_ok=True)
+            self._enforce_budget(keep=digest)
+        return data
+
+    def _enforce_budget(self, keep: Optional[str] = None) -> None:
+        budget = sp_config.get_config("ResourceMemoryMB").data * 1024 * 1024
+        pending = sum(b.size for b in self._blobs.values() if b.spilling)
+        over = self.memory_bytes - pending - budget
+        if over <= 0:
+            return
+        for digest, blob in self._blobs.items():
+            if over <= 0:
+                break
+            if digest == keep or blob.data is None or blob.spilling or blob.size < SPILL_MIN_BYTES:
+                continue
+            blob.spilling = True
+            over -= blob.size
+            # 文件名带随机后缀：同一内容被释放后又重新登记时，新旧两次溢出不会写同一个文件
+            path = self._spill_path / f"{digest}.{uuid.uuid4().hex[:8]}.bin"
+            data = blob.data
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._finish_spill(digest, blob, data, path, self._write_spill(path, data))
+                continue
+            task = loop.create_task(self._spill(digest, blob, data, path))
+            self._spill_tasks.add(task)
+            task.add_done_callback(self._spill_tasks.discard)
+
+    @staticmethod
+    def _write_spill(path: Path, data: Union[str, bytes]) -> bool:
+        """只做文件写入（在工作线程里执行，不碰任何共享状态）。"""
+        raw = b"s" + data.encode("utf-8") if isinstance(data, str) else b"b" + data
+        try:
+            path.write_bytes(raw)
+            return True
+        except OSError as e:
+            logger.warning(t("log.resourcemanager.spill_fail", e=e))
+            path.unlink(missing_ok=True)
+            return False
+
+    async def _spill(self, digest: str, blob: _Blob, data: Union[str, bytes], path: Path) -> None:
+        written = False
+        try:
+            written = await asyncio.to_thread(self._write_spill, path, data)
+        finally:
+            self._finish_spill(digest, blob, data, path, written)
+
+    def _finish_spill(self, digest: str, blob: _Blob, data: Union[str, bytes], path: Path, written: bool) -> None:
+        """回到事件循环后才把数据换成磁盘路径并更新计数；写盘期间已被释放的数据丢弃溢出文件。"""
+        blob.spilling = False
+        if written and self._blobs.get(digest) is blob and blob.refs and blob.data is data:
+            blob.path = path
+            blob.data = None
+            self.memory_bytes -= blob.size
+            self.spilled_bytes += blob.size
+            self.spill_count += 1
+        elif written:
+            path.unlink(missing_ok=True)
+
+    def _release(self, digest: str) -> None:
+        blob = self._blobs.get(digest)
+        if blob is None:
+            return
+        blob.refs -= 1
+        self.logical_bytes -= blob.size
+        if blob.refs > 0:
+            return
+        del self._blobs[digest]
+        if blob.data is not None:
+            self.memory_bytes -= blob.size
+            blob.data = None
+        if blob.path is not None:
+            self.spilled_bytes -= blob.size
+            blob.path.unlink(missing_ok=True)
+            blob.path = None
+
     async def start_cleanup_loop(self) -> None:
         """启动定期清理任务"""
         if self._cleanup_running:
             return
 
+        # 上次进程溢出的文件已无资源引用
+        await asyncio.to_thread(self._clear_spill_dir)
         self._cleanup_running = True
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
         logger.info(
@@ -113,6 +258,12 @@ class ResourceManager:
             )
         )
 
+    def _clear_spill_dir(self) -> None:
+        live = {blob.path for blob in self._blobs.values() if blob.path is not None}
+        for file in self._spill_path.glob("*.bin"):
+            if file not in live:
+                file.unlink(missing_ok=True)
+
     async def stop_cleanup_loop(self) -> None:
         """停止定期清理任务"""
         self._cleanup_running = False
@@ -147,11 +298,12 @@ class ResourceManager:
         expired_ids = [rid for rid, (_, created_at) in self._store.items() if now - created_at > self._ttl_seconds]
 
         for rid in expired_ids:
-            del self._store[rid]
+            digest, _ = self._store.pop(rid)
+            self._release(digest)
 
         if expired_ids:
             logger.debug(
-                t("log.resourcemanager.cleaned_expired_resources_remaining", p0=len(expired_ids), p1=len(self._store))
+                lt("log.resourcemanager.cleaned_expired_resources_remaining", p0=len(expired_ids), p1=len(self._store))
             )
 
         return len(expired_ids)
@@ -161,6 +313,19 @@ class ResourceManager:
         """当前存储的资源数量"""
         return len(self._store)
 
+    def stats(self) -> Dict[str, float]:
+        """内存/溢出占用与去重情况。"""
+        unique = self.memory_bytes + self.spilled_bytes
+        return {
+            "resources": len(self._store),
+            "blobs": len(self._blobs),
+            "memory_bytes": self.memory_bytes,
+            "spilled_bytes": self.spilled_bytes,
+            "spill_count": self.spill_count,
+            "rehydrate_count": self.rehydrate_count,
+            "dedup_ratio": round(self.logical_bytes / unique, 3) if unique else 1.0,
+        }
+
 
 RM = ResourceManager()
 
@@ -1,16 +1,33 @@
+"""米游社每日签到。
+
+``daily_sign`` 把一天的自动签到当作一个可恢复的任务执行：
+
+- 每个待签 UID 在 ``GsSignRecord`` 里有一行断点，签到前后更新状态；
+- 令牌桶按 ``SignRatePerMinute`` 全局限速，每个账号再叠加 0~``SignJitter`` 秒的随机延迟；
+- 最多 ``SignConcurrency`` 个 Cookie 同时签到，同一 Cookie 下的多个 UID 依次进行；
+- 进程重启后由 ``resume_daily_sign`` 继续当天未完成的部分，完成后自行推送结果；
+- ``get_sign_progress`` 给出当天各游戏的进度与预计剩余时间。
+"""
+
+import time
 import random
 import asyncio
-from typing import Dict, List
+from typing import Any, Set, Dict, List, Tuple, Optional
+from datetime import date, timedelta
+from collections import deque
 from collections.abc import Sequence
 
 from gsuid_core.i18n import t
 from gsuid_core.logger import logger
+from gsuid_core.server import on_core_start
 from gsuid_core.segment import MessageSegment
 from gsuid_core.utils.api.mys_api import mys_api
 from gsuid_core.utils.error_reply import get_error
-from gsuid_core.utils.database.models import GsUser
+from gsuid_core.utils.token_bucket import TokenBucket
+from gsuid_core.utils.database.models import GsUser, GsSignRecord
 from gsuid_core.utils.boardcast.models import BoardCastMsg, BoardCastMsgDict
-from gsuid_core.utils.plugins_config.gs_config import pass_config
+from gsuid_core.utils.boardcast.send_msg import send_board_cast_msg
+from gsuid_core.utils.plugins_config.gs_config import sp_config, pass_config
 
 GAME_NAME_MAP = {
     "gs": "原神",
@@ -162,16 +179,15 @@ async def sign_in(uid: str, game_name: str = "gs") -> str:
     return im
 
 
-async def single_daily_sign(
+def _collect_result(
     bot_id: str,
     uid: str,
     gid: str,
     qid: str,
-    game_name: str,
+    im: str,
     private_msgs: Dict,
     group_msgs: Dict,
 ):
-    im = await sign_in(uid, game_name)
     if gid == "on":
         if qid not in private_msgs:
             private_msgs[qid] = []
@@ -185,7 +201,7 @@ async def single_daily_sign(
                 "failed": 0,
                 "push_message": [],
             }
-        if im.startswith(("签到失败", "网络有点忙", "OK", "ok")):
+        if _is_failed(im):
             group_msgs[gid]["failed"] += 1
             group_msgs[gid]["push_message"].extend(
                 [
@@ -199,54 +215,25 @@ async def single_daily_sign(
             group_msgs[gid]["success"] += 1
 
 
-async def daily_sign(game_name: str):
-    tasks = []
-    private_msgs = {}
-    group_msgs = {}
-    _user_list: Sequence[GsUser] = await GsUser.get_all_user()
-    uid_list = []
-    user_list: List[GsUser] = []
-    uid_col = GsUser.get_gameid_name(game_name)
-    switch_col = f"{game_name}_sign_switch" if game_name and game_name != "gs" else "sign_switch"
-    if not hasattr(GsUser, switch_col):
-        raise ValueError(f"GsUser 不存在签到开关字段 {switch_col!r} (game_name={game_name!r})")
+def _is_failed(im: str) -> bool:
+    # 失败文案带有游戏名前缀或 ❌ 标记，不能只看开头
+    return "签到失败" in im or im.startswith(("网络有点忙", "OK", "ok"))
 
-    for user in _user_list:
-        _uid = getattr(user, uid_col)
-        _switch = getattr(user, switch_col)
-        if _switch != "off" and not user.status and _uid:
-            uid_list.append(_uid)
-            user_list.append(user)
-
-    logger.info(t("log.sign.game_name_uid_list", game_name=game_name, uid_list=uid_list))
-    for user in user_list:
-        tasks.append(
-            single_daily_sign(
-                user.bot_id,
-                getattr(user, uid_col),
-                getattr(user, switch_col),
-                user.user_id,
-                game_name,
-                private_msgs,
-                group_msgs,
-            )
-        )
-        if len(tasks) >= 1:
-            await asyncio.gather(*tasks)
-            delay = 30 + random.randint(3, 35)
-            logger.info(
-                t(
-                    "log.sign.game_name_delay",
-                    game_name=game_name,
-                    p0=len(tasks),
-                    delay=delay,
-                )
-            )
-            tasks.clear()
-            await asyncio.sleep(delay)
-    await asyncio.gather(*tasks)
-    tasks.clear()
 
+async def single_daily_sign(
+    bot_id: str,
+    uid: str,
+    gid: str,
+    qid: str,
+    game_name: str,
+    private_msgs: Dict,
+    group_msgs: Dict,
+):
+    im = await sign_in(uid, game_name)
+    _collect_result(bot_id, uid, gid, qid, im, private_msgs, group_msgs)
+
+
+def _build_result(game_name: str, private_msgs: Dict, group_msgs: Dict) -> BoardCastMsgDict:
     # 转为广播消息
     private_msg_dict: Dict[str, List[BoardCastMsg]] = {}
     group_msg_dict: Dict[str, BoardCastMsg] = {}
@@ -279,10 +266,213 @@ async def daily_sign(game_name: str):
             "messages": messages,
         }
 
-    result: BoardCastMsgDict = {
+    return {
         "private_msg_dict": private_msg_dict,
         "group_msg_dict": group_msg_dict,
     }
 
+
+# 断点表只保留最近几天，够排查即可
+SIGN_RECORD_KEEP_DAYS = 7
+
+
+class SignJob:
+    """进程内一次签到任务（某天某游戏），同一游戏同时只有一个在跑。"""
+
+    def __init__(self, game_name: str, day: date) -> None:
+        self.game_name = game_name
+        self.day = day
+        self.started = time.monotonic()
+        self.finished = 0
+        self.remaining = 0
+        # 是否有 daily_sign 的调用方在等结果；没有则由恢复任务自己推送
+        self.claimed = False
+        self.task: Optional["asyncio.Task[BoardCastMsgDict]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def rate(self) -> float:
+        """本进程内实测的每分钟签到数，尚无完成时取配置值。"""
+        elapsed = time.monotonic() - self.started
+        if self.finished and elapsed > 0:
+            return self.finished / elapsed * 60
+        return sp_config.get_config("SignRatePerMinute").data
+
+
+_JOBS: Dict[str, SignJob] = {}
+_background: Set[asyncio.Task] = set()
+
+
+def _get_sign_users(game_name: str, users: Sequence[GsUser]) -> List[Tuple[GsUser, str, str]]:
+    uid_col = GsUser.get_gameid_name(game_name)
+    switch_col = f"{game_name}_sign_switch" if game_name and game_name != "gs" else "sign_switch"
+    if not hasattr(GsUser, switch_col):
+        raise ValueError(f"GsUser 不存在签到开关字段 {switch_col!r} (game_name={game_name!r})")
+
+    result = []
+    for user in users:
+        _uid = getattr(user, uid_col)
+        _switch = getattr(user, switch_col)
+        if _switch != "off" and not user.status and _uid:
+            result.append((user, _uid, _switch))
+    return result
+
+
+async def _sign_record(job: SignJob, record: GsSignRecord):
+    await GsSignRecord.set_state(record.id, "running", time.time())
+    try:
+        im = await sign_in(record.uid, job.game_name)
+    except Exception as e:
+        logger.warning(t("log.sign.game_name_uid_exception", game_name=job.game_name, uid=record.uid, e=e))
+        im = "签到失败!发生未知错误, 请稍后重试"
+    await GsSignRecord.set_state(record.id, "failed" if _is_failed(im) else "done", time.time(), im)
+    job.finished += 1
+    job.remaining -= 1
+
+
+async def _run_job(job: SignJob, retry_failed: bool) -> BoardCastMsgDict:
+    game_name = job.game_name
+    sign_users = _get_sign_users(game_name, await GsUser.get_all_user())
+    await GsSignRecord.delete_outdate(job.day - timedelta(days=SIGN_RECORD_KEEP_DAYS))
+
+    # 当天首次运行建立断点，之后再运行只补充新开启签到的 UID
+    await GsSignRecord.add_run_items(
+        job.day,
+        game_name,
+        [
+            {"uid": uid, "bot_id": user.bot_id, "user_id": user.user_id, "push_target": switch}
+            for user, uid, switch in sign_users
+        ],
+    )
+    # running 说明上次在签到途中退出；手动重跑时顺带重试失败的
+    await GsSignRecord.reset_state(job.day, game_name, ("running", "failed") if retry_failed else ("running",))
+
+    cookies = {uid: user.cookie or uid for user, uid, _ in sign_users}
+    by_cookie: Dict[str, List[GsSignRecord]] = {}
+    for record in await GsSignRecord.get_run(job.day, game_name):
+        if record.state != "pending":
+            continue
+        if record.uid not in cookies:
+            # 当天中途关闭了签到或 Cookie 失效
+            await GsSignRecord.set_state(record.id, "skipped", time.time())
+            continue
+        by_cookie.setdefault(cookies[record.uid], []).append(record)
+
+    groups = deque(by_cookie.values())
+    job.remaining = sum(len(group) for group in groups)
+    logger.info(
+        t(
+            "log.sign.game_name_uid_list",
+            game_name=game_name,
+            uid_list=[record.uid for group in groups for record in group],
+        )
+    )
+
+    pacer = TokenBucket(sp_config.get_config("SignRatePerMinute").data / 60)
+    jitter: float = sp_config.get_config("SignJitter").data
+
+    async def _worker():
+        while groups:
+            for record in groups.popleft():
+                await pacer.acquire()
+                if jitter > 0:
+                    await asyncio.sleep(random.uniform(0, jitter))
+                await _sign_record(job, record)
+
+    concurrency = max(1, sp_config.get_config("SignConcurrency").data)
+    await asyncio.gather(*(_worker() for _ in range(min(concurrency, len(groups)))))
+
+    private_msgs = {}
+    group_msgs = {}
+    for record in await GsSignRecord.get_run(job.day, game_name):
+        if record.message is None:
+            continue
+        _collect_result(
+            record.bot_id,
+            record.uid,
+            record.push_target,
+            record.user_id,
+            record.message,
+            private_msgs,
+            group_msgs,
+        )
+    result = _build_result(game_name, private_msgs, group_msgs)
     logger.info(result)
     return result
+
+
+def _start_job(game_name: str, retry_failed: bool) -> SignJob:
+    job = _JOBS.get(game_name)
+    if job is not None and job.running:
+        return job
+    job = _JOBS[game_name] = SignJob(game_name, date.today())
+    job.task = asyncio.create_task(_run_job(job, retry_failed))
+    return job
+
+
+async def daily_sign(game_name: str) -> BoardCastMsgDict:
+    """执行 ``game_name`` 当天的自动签到并返回待推送的结果。
+
+    当天已签完的 UID 不会重复签到，上次中断或失败的 UID 会重新签到；
+    同一游戏已有签到在进行时直接等待其结果。
+    """
+    _get_sign_users(game_name, [])
+    job = _start_job(game_name, retry_failed=True)
+    job.claimed = True
+    assert job.task is not None
+    return await asyncio.shield(job.task)
+
+
+async def _push_unclaimed(job: SignJob):
+    assert job.task is not None
+    try:
+        result = await asyncio.shield(job.task)
+    except Exception as e:
+        logger.warning(t("log.sign.game_name_resume_fail", game_name=job.game_name, e=e))
+        return
+    if not job.claimed:
+        await send_board_cast_msg(result)
+
+
+@on_core_start
+async def resume_daily_sign():
+    """继续当天因重启中断的自动签到。"""
+    try:
+        counts = await GsSignRecord.count_states(date.today())
+    except Exception as e:
+        logger.warning(t("log.sign.game_name_resume_fail", game_name="all", e=e))
+        return
+    for game_name, states in counts.items():
+        left = states.get("pending", 0) + states.get("running", 0)
+        if not left or game_name not in GAME_NAME_MAP:
+            continue
+        logger.info(t("log.sign.game_name_resume", game_name=game_name, p0=left))
+        task = asyncio.create_task(_push_unclaimed(_start_job(game_name, retry_failed=False)))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+
+async def get_sign_progress() -> List[Dict[str, Any]]:
+    """当天各游戏的签到进度；正在进行的任务附带实测速率与预计剩余秒数。"""
+    progress = []
+    for game_name, states in (await GsSignRecord.count_states(date.today())).items():
+        left = states.get("pending", 0) + states.get("running", 0)
+        job = _JOBS.get(game_name)
+        running = job is not None and job.running
+        rate = job.rate() if job is not None and running else None
+        progress.append(
+            {
+                "game_name": game_name,
+                "total": sum(states.values()),
+                "done": states.get("done", 0),
+                "failed": states.get("failed", 0),
+                "skipped": states.get("skipped", 0),
+                "left": left,
+                "running": running,
+                "rate_per_minute": round(rate, 2) if rate else None,
+                "eta_seconds": round(left / rate * 60) if rate else None,
+            }
+        )
+    return progress
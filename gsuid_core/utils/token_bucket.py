@@ -0,0 +1,27 @@
+import time
+import asyncio
+
+
+class TokenBucket:
+    """令牌桶限速：平均每秒放行 ``rate`` 个，最多积攒 ``burst`` 个。
+
+    等待方按到达顺序依次拿令牌。
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -5,7 +5,7 @@ from typing import Dict
 
 from aiohttp.client import ClientSession, ClientTimeout
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.plugins_config.gs_config import pic_upload_config
 
@@ -35,7 +35,7 @@ class CUSTOM:
             ) as resp:
                 logger.info(t("log.upload.custom_upload_event"))
                 raw_data = await resp.json()
-                logger.debug(t("log.upload.custom_response", response=raw_data))
+                logger.debug(lt("log.upload.custom_response", response=raw_data))
                 if raw_data and "image_info_array" in raw_data[0]:
                     data = raw_data[0]["image_info_array"]
                     if is_auto_delete:
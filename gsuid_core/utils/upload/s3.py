@@ -4,7 +4,7 @@ from io import BytesIO
 import aioboto3
 import aioboto3.session
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.plugins_config.gs_config import pic_upload_config
 
@@ -55,8 +55,8 @@ class S3:
                 asyncio.create_task(self.delete(key))
 
         path = f"{END_POINT}/{self.bucket_id}/{key}"
-        logger.debug(t("log.upload.s3_upload_path_load", path=path))
-        logger.debug(t("log.upload.s3_upload_url_load", url=url))
+        logger.debug(lt("log.upload.s3_upload_path_load", path=path))
+        logger.debug(lt("log.upload.s3_upload_url_load", url=url))
 
         return url
 
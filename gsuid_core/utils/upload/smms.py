@@ -4,7 +4,7 @@ from io import BytesIO
 from aiohttp import ClientTimeout
 from aiohttp.client import ClientSession
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.utils.plugins_config.gs_config import pic_upload_config
 
@@ -32,7 +32,7 @@ class SMMS:
             ) as resp:
                 logger.info(t("log.upload.sm_ms_upload_deletion"))
                 raw_data = await resp.json()
-                logger.debug(t("log.upload.smms_delete_response", response=raw_data))
+                logger.debug(lt("log.upload.smms_delete_response", response=raw_data))
 
     async def upload(self, file_name: str, files: BytesIO):
         async with ClientSession() as client:
@@ -45,7 +45,7 @@ class SMMS:
             ) as resp:
                 logger.info(t("log.upload.sm_ms_upload_event"))
                 raw_data = await resp.json()
-                logger.debug(t("log.upload.smms_upload_response", response=raw_data))
+                logger.debug(lt("log.upload.smms_upload_response", response=raw_data))
                 if raw_data["success"]:
                     data = raw_data["data"]
                     if is_auto_delete:
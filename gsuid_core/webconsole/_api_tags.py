@@ -31,6 +31,7 @@ LOGS: _Tag = [f"{_SYS}/系统/日志"]
 SCHEDULER: _Tag = [f"{_SYS}/系统/调度器"]
 TRACE: _Tag = [f"{_SYS}/系统/链路追踪"]
 STATE_STORE: _Tag = [f"{_SYS}/系统/状态存储"]
+METRICS: _Tag = [f"{_SYS}/系统/运行指标"]
 
 # ─────────────────────────── 插件 ───────────────────────────
 PLUGINS: _Tag = [f"{_SYS}/插件/插件管理"]
@@ -3,6 +3,7 @@ Backup APIs
 提供备份管理相关的 RESTful APIs
 """
 
+import asyncio
 from typing import Any, Dict
 from pathlib import Path
 from datetime import datetime
@@ -15,6 +16,7 @@ from gsuid_core.utils.path_safety import PathEscapeError, safe_join, confine_to_
 from gsuid_core.utils.secret_mask import looks_masked
 from gsuid_core.webconsole.app_app import app
 from gsuid_core.webconsole.web_api import require_admin, require_admin_header
+from gsuid_core.utils.backup.snapshot import load_snapshot, list_snapshots, verify_snapshot
 from gsuid_core.utils.backup.backup_core import backup_config, copy_and_rebase_paths
 
 from ._api_tags import BACKUP
@@ -63,13 +65,68 @@ async def create_backup(request: Request, _user: Dict[str, Any] = Depends(requir
         status: 0成功，1失败
         msg: 操作结果信息
     """
-    retcode = copy_and_rebase_paths(None, "NowFile")
+    retcode = await asyncio.to_thread(copy_and_rebase_paths, None, "NowFile")
     if retcode != 0:
         return {"status": 1, "msg": "备份创建失败"}
 
     return {"status": 0, "msg": "备份创建成功"}
 
 
+@app.get("/api/backup/snapshots", summary="获取增量快照列表", tags=BACKUP)
+async def get_backup_snapshots(request: Request, _user: Dict[str, Any] = Depends(require_admin)):
+    """
+    获取所有增量快照
+
+    Args:
+        request: FastAPI 请求对象
+        _user: 认证用户信息
+
+    Returns:
+        status: 0成功
+        data: 快照列表，每项包含 id、created、files、size、newBytes、reused
+    """
+    snapshots = await asyncio.to_thread(list_snapshots)
+    data = [
+        {
+            "id": s.id,
+            "created": datetime.fromtimestamp(s.created).isoformat(),
+            "files": len(s.files),
+            "size": sum(e.size for e in s.files.values()),
+            "newBytes": s.new_bytes,
+            "reused": s.reused,
+        }
+        for s in reversed(snapshots)
+    ]
+    return {"status": 0, "msg": "ok", "data": data}
+
+
+@app.post("/api/backup/snapshots/{snapshot_id}/verify", summary="完整校验增量快照", tags=BACKUP)
+async def verify_backup_snapshot(request: Request, snapshot_id: str, _user: Dict[str, Any] = Depends(require_admin)):
+    """
+    解压快照引用的全部对象核对哈希，数据库副本额外执行完整性检查
+
+    Args:
+        request: FastAPI 请求对象
+        snapshot_id: 快照 ID
+        _user: 认证用户信息
+
+    Returns:
+        status: 0通过，1失败
+        data: 发现的问题列表
+    """
+    if not is_safe_filename(snapshot_id):
+        return {"status": 1, "msg": "非法快照ID"}
+    try:
+        snapshot = await asyncio.to_thread(load_snapshot, snapshot_id)
+    except FileNotFoundError:
+        return {"status": 1, "msg": "快照未找到"}
+
+    errors = await asyncio.to_thread(verify_snapshot, snapshot, True)
+    if errors:
+        return {"status": 1, "msg": "快照校验失败", "data": errors}
+    return {"status": 0, "msg": "快照校验通过", "data": []}
+
+
 @app.delete("/api/backup/{file_id}", summary="删除备份文件", tags=BACKUP)
 async def delete_backup(request: Request, file_id: str, _user: Dict[str, Any] = Depends(require_admin)):
     """
@@ -12,7 +12,12 @@ from fastapi import Depends, Request
 from gsuid_core.i18n import t
 from gsuid_core.webconsole.app_app import app
 from gsuid_core.webconsole.web_api import TEMP_DICT, require_auth
-from gsuid_core.utils.database.global_val_models import DataType, CoreDataSummary, CoreDataAnalysis
+from gsuid_core.utils.database.global_val_models import (
+    DataType,
+    CoreDataSketch,
+    CoreDataSummary,
+    CoreDataAnalysis,
+)
 
 from ._api_tags import DASHBOARD
 
@@ -289,6 +294,50 @@ async def get_daily_command_counts(
         return {"status": 0, "msg": "ok", "data": data}
 
 
+@app.get("/api/dashboard/commands/top", summary="近 N 天高频命令排行", tags=DASHBOARD)
+async def get_top_commands(
+    request: Request,
+    days: int = 30,
+    limit: int = 20,
+    bot_id: str = "all",
+    _user: Dict[str, Any] = Depends(require_auth),
+):
+    """近 N 天（含今天）调用最多的命令。
+
+    由每日指令 Top-K 摘要（``CoreDataSketch.commands``）合并得出，不扫描明细表。
+
+    Query:
+    - ``days``: 回溯天数，默认 30，夹取到 [1, 366]
+    - ``limit``: 返回条数，默认 20，夹取到 [1, 100]
+    - ``bot_id``: ``all`` 或 ``bot_self_id:bot_id``
+
+    ``data`` 为 ``{total, error, commands: [{command, count}]}``；``total`` 为区间内命令总数，
+    ``error`` 为单条 ``count`` 可能偏高的上限（摘要容量内为 0）。
+    """
+    days = max(1, min(int(days or 30), 366))
+    limit = max(1, min(int(limit or 20), 100))
+    _bot_id = None
+    _bot_self_id = None
+    if bot_id and bot_id != "all" and ":" in bot_id:
+        _bot_self_id, _bot_id = bot_id.split(":", 1)
+
+    try:
+        today = datetime.now().date()
+        top = await CoreDataSketch.get_top_commands(
+            today - timedelta(days=days - 1),
+            today,
+            _bot_id,
+            _bot_self_id,
+        )
+        commands = [{"command": simplify_regex_command(k), "count": v} for k, v in top.most_common(limit)]
+        return {"status": 0, "msg": "ok", "data": {"total": top.total, "error": top.error, "commands": commands}}
+    except Exception as e:
+        from gsuid_core.logger import logger
+
+        logger.exception(t("log.webconsole.fetch_top_commands", error=e))
+        return {"status": 0, "msg": "ok", "data": {"total": 0, "error": 0, "commands": []}}
+
+
 @app.get("/api/dashboard/daily/commands", summary="每日命令使用统计", tags=DASHBOARD)
 async def get_daily_commands(
     request: Request, date: str, bot_id: str = "all", _user: Dict[str, Any] = Depends(require_auth)
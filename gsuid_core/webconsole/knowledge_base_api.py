@@ -89,6 +89,7 @@ async def get_knowledge_base_list(
     source: str = "all",
     page: int = 1,
     doc_id: Optional[str] = None,
+    keyword: Optional[str] = None,
     _: Dict[str, Any] = Depends(require_auth),
 ) -> Dict[str, Any]:
     """
@@ -99,14 +100,15 @@ async def get_knowledge_base_list(
         limit: 每页数量，默认20
         source: 来源过滤，默认"all"表示所有知识，"plugin"只查插件添加的，"manual"只查手动添加的
         page: 页码，从1开始，例如page=2表示第二页（offset=20）
-        doc_id: 可选，仅列出某篇文档的分片（仅对 source=manual 生效）
+        doc_id: 可选，仅列出某篇文档的分片（插件知识的 doc_id 为插件名）
+        keyword: 可选，按标题/正文/标签子串过滤
 
     Returns:
         status: 0成功，1失败
         data: 包含知识列表、总数和分页信息
 
     Note:
-        source=manual 走 SQL 真值源原生分页（offset 为 O(1)）；plugin/all 仍走 Qdrant scroll。
+        全部来源都走本地知识清单（SQL）原生分页与关键词过滤，不触碰向量库。
     """
     # 如果指定了page参数，计算offset
     if page > 1:
@@ -117,6 +119,7 @@ async def get_knowledge_base_list(
         limit=limit,
         source_filter=source,
         doc_id=doc_id,
+        keyword=keyword,
     )
 
     # 添加page信息到返回结果
@@ -0,0 +1,367 @@
+"""
+WebConsole 日志索引
+
+- 增量尾随：按文件记录已索引的字节偏移，每次只解析新追加的完整行；文件被截断/重建时整日重建
+- 解析结果写入 data/logs/log_index.db（SQLite），日期/级别/trace_id 走普通索引，
+  内容搜索走 FTS5 trigram 全文索引（不足 3 个字符的关键词退化为 LIKE）
+- 按「日期 + 小时 + 级别」预聚合计数，统计接口无需扫描日志
+- 支持游标分页：``date:line`` 形式的游标，翻页代价只与每页条数有关
+- 日志文件被清理后，对应日期的索引在下次同步时一并删除
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Tuple, Iterable, Optional
+from pathlib import Path
+
+from msgspec import json as msgjson
+
+from gsuid_core.logger import LOG_PATH
+
+LOG_INDEX_PATH = LOG_PATH / "log_index.db"
+
+# 原始日志级别 -> 控制台展示级别，未列出的级别按 info 处理
+LEVEL_MAPPING: Dict[str, str] = {
+    "info": "info",
+    "warning": "warn",
+    "warn": "warn",
+    "error": "error",
+    "debug": "debug",
+    "critical": "error",
+    "fatal": "error",
+}
+STAT_LEVELS = ("info", "warn", "error", "debug")
+
+# 每批写入的行数
+INSERT_BATCH = 5000
+# FTS5 trigram 分词要求关键词至少 3 个字符
+FTS_MIN_CHARS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    lines INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    level TEXT NOT NULL,
+    trace_id TEXT,
+    message TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS logs_date_line ON logs (date, line);
+CREATE INDEX IF NOT EXISTS logs_level_date_line ON logs (level, date, line);
+CREATE INDEX IF NOT EXISTS logs_trace ON logs (trace_id, date, line) WHERE trace_id IS NOT NULL;
+CREATE TABLE IF NOT EXISTS hourly (
+    date TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, hour, level)
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5(
+    message, content='logs', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS logs_ai AFTER INSERT ON logs BEGIN
+    INSERT INTO logs_fts (rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS logs_ad AFTER DELETE ON logs BEGIN
+    INSERT INTO logs_fts (logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+END;
+"""
+
+
+# 查询结果行：id / date / line / ts / level / trace_id / message
+IndexedLog = Dict[str, Any]
+
+
+def map_level(raw: str) -> str:
+    return LEVEL_MAPPING.get(raw.lower(), "info")
+
+
+def _parse_line(raw: bytes) -> Tuple[str, str, Optional[str], str]:
+    """解析一行 JSON 日志，返回 ``(时间, 级别, trace_id, 内容)``；损坏的行按原文记为 info。"""
+    try:
+        ev = msgjson.decode(raw)
+        message = ev.get("event", "")
+        if not isinstance(message, str):
+            message = json.dumps(message, ensure_ascii=False)
+        return str(ev.get("timestamp", "")), map_level(str(ev.get("level", "info"))), ev.get("trace_id"), message
+    except Exception:
+        return "", "info", None, raw.decode("utf-8", "replace").rstrip("\r\n")
+
+
+def _hour(ts: str) -> int:
+    # 时间格式为 "MM-DD HH:MM:SS"
+    try:
+        return int(ts[6:8])
+    except ValueError:
+        return 0
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Tuple[str, int]]:
+    if not cursor:
+        return None
+    date, _, line = cursor.rpartition(":")
+    if not date or not line.isdigit():
+        return None
+    return date, int(line)
+
+
+class LogIndex:
+    def __init__(self, db_path: Path = LOG_INDEX_PATH, log_path: Path = LOG_PATH):
+        self.db_path = db_path
+        self.log_path = log_path
+        self.has_fts = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                # 旧版 SQLite 不支持 trigram 分词，搜索退化为 LIKE
+                self.has_fts = False
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------------- 索引 ----------------
+
+    def _drop_date(self, conn: sqlite3.Connection, date: str) -> None:
+        conn.execute("DELETE FROM logs WHERE date = ?", (date,))
+        conn.execute("DELETE FROM hourly WHERE date = ?", (date,))
+        conn.execute("DELETE FROM files WHERE name = ?", (date,))
+
+    def _index_file(self, conn: sqlite3.Connection, path: Path) -> int:
+        date = path.stem
+        row = conn.execute("SELECT offset, lines FROM files WHERE name = ?", (date,)).fetchone()
+        offset, line_no = (row["offset"], row["lines"]) if row else (0, 0)
+        size = path.stat().st_size
+        if size < offset:
+            # 文件被截断或重建，整日重建索引
+            self._drop_date(conn, date)
+            offset, line_no = 0, 0
+        if size == offset:
+            return 0
+
+        added = 0
+        hourly: Dict[Tuple[int, str], int] = {}
+        batch: List[Tuple[str, int, str, str, Optional[str], str]] = []
+
+        def _flush():
+            conn.executemany(
+                "INSERT INTO logs (date, line, ts, level, trace_id, message) VALUES (?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                # 只索引完整的行，正在写入的半行留到下次
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                if not raw.strip():
+                    continue
+                line_no += 1
+                ts, level, trace_id, message = _parse_line(raw)
+                batch.append((date, line_no, ts, level, trace_id, message))
+                key = (_hour(ts), level)
+                hourly[key] = hourly.get(key, 0) + 1
+                added += 1
+                if len(batch) >= INSERT_BATCH:
+                    _flush()
+        if batch:
+            _flush()
+
+        conn.executemany(
+            "INSERT INTO hourly (date, hour, level, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (date, hour, level) DO UPDATE SET count = count + excluded.count",
+            [(date, hour, level, count) for (hour, level), count in hourly.items()],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO files (name, offset, lines) VALUES (?, ?, ?)",
+            (date, offset, line_no),
+        )
+        return added
+
+    def sync(self, dates: Optional[Iterable[str]] = None) -> int:
+        """把日志文件新追加的内容写入索引，返回新增的条数；``dates`` 为空时同步全部日志文件。"""
+        with self._lock:
+            conn = self._db()
+            with conn:
+                known = [r["name"] for r in conn.execute("SELECT name FROM files")]
+                for date in known:
+                    if not (self.log_path / f"{date}.log").exists():
+                        self._drop_date(conn, date)
+
+            if dates is None:
+                paths = sorted(self.log_path.glob("*.log"))
+            else:
+                paths = [self.log_path / f"{d}.log" for d in dates]
+
+            added = 0
+            for path in paths:
+                if not path.is_file():
+                    continue
+                with conn:
+                    added += self._index_file(conn, path)
+            return added
+
+    # ---------------- 查询 ----------------
+
+    def _where(
+        self,
+        start: str,
+        end: str,
+        level: Optional[str],
+        search: Optional[str],
+        trace_id: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses = ["date BETWEEN ? AND ?"]
+        params: List[Any] = [start, end]
+        if level:
+            clauses.append("level = ?")
+            params.append(level)
+        if trace_id:
+            clauses.append("trace_id = ?")
+            params.append(trace_id)
+        if search:
+            if self.has_fts and len(search) >= FTS_MIN_CHARS:
+                clauses.append("id IN (SELECT rowid FROM logs_fts WHERE logs_fts MATCH ?)")
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                clauses.append("message LIKE ? ESCAPE '\\'")
+                escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+        return " AND ".join(clauses), params
+
+    def query(
+        self,
+        start: str,
+        end: str,
+        level: Optional[str] = None,
+        search: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[IndexedLog], Optional[str]]:
+        """按 (date, line) 顺序返回一页日志与下一页的游标（没有更多时为 None）。"""
+        where, params = self._where(start, end, level, search, trace_id)
+        after = parse_cursor(cursor)
+        if after is not None:
+            where += " AND (date, line) > (?, ?)"
+            params.extend(after)
+            offset = 0
+        sql = (
+            "SELECT id, date, line, ts, level, trace_id, message FROM logs "
+            f"WHERE {where} ORDER BY date, line LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._db().execute(sql, (*params, limit + 1, max(offset, 0))).fetchall()
+        items = [dict(r) for r in rows[:limit]]
+        next_cursor = f"{items[-1]['date']}:{items[-1]['line']}" if len(rows) > limit else None
+        return items, next_cursor
+
+    def count(
+        self,
+        start: str,
+        end: str,
+        level: Optional[str] = None,
+        search: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> int:
+        with self._lock:
+            conn = self._db()
+            if not search and not trace_id:
+                # 不含文本条件时直接用预聚合的小时计数
+                sql = "SELECT COALESCE(SUM(count), 0) FROM hourly WHERE date BETWEEN ? AND ?"
+                params: List[Any] = [start, end]
+                if level:
+                    sql += " AND level = ?"
+                    params.append(level)
+                return conn.execute(sql, params).fetchone()[0]
+            where, params = self._where(start, end, level, search, trace_id)
+            return conn.execute(f"SELECT COUNT(*) FROM logs WHERE {where}", params).fetchone()[0]
+
+    def level_counts(self, start: str, end: str) -> Dict[str, int]:
+        counts = {level: 0 for level in STAT_LEVELS}
+        with self._lock:
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT level, SUM(count) AS n FROM hourly WHERE date BETWEEN ? AND ? GROUP BY level",
+                    (start, end),
+                )
+                .fetchall()
+            )
+        for r in rows:
+            counts[r["level"]] = r["n"]
+        return counts
+
+    def hourly(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """按日期 + 小时返回各级别计数。"""
+        with self._lock:
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT date, hour, level, count FROM hourly WHERE date BETWEEN ? AND ? ORDER BY date, hour",
+                    (start, end),
+                )
+                .fetchall()
+            )
+        buckets: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for r in rows:
+            bucket = buckets.setdefault(
+                (r["date"], r["hour"]),
+                {"date": r["date"], "hour": r["hour"], **{level: 0 for level in STAT_LEVELS}},
+            )
+            bucket[r["level"]] = bucket.get(r["level"], 0) + r["count"]
+        return list(buckets.values())
+
+    def context(
+        self, date: str, line: int, before: int, after: int
+    ) -> Tuple[Optional[IndexedLog], List[IndexedLog], List[IndexedLog], int]:
+        """返回 ``(目标行, 之前的行, 之后的行, 当日总行数)``。"""
+        with self._lock:
+            conn = self._db()
+            rows = conn.execute(
+                "SELECT id, date, line, ts, level, trace_id, message FROM logs "
+                "WHERE date = ? AND line BETWEEN ? AND ? ORDER BY line",
+                (date, line - before, line + after),
+            ).fetchall()
+            total = conn.execute("SELECT lines FROM files WHERE name = ?", (date,)).fetchone()
+        items = [dict(r) for r in rows]
+        target = next((r for r in items if r["line"] == line), None)
+        return (
+            target,
+            [r for r in items if r["line"] < line],
+            [r for r in items if r["line"] > line],
+            total[0] if total else 0,
+        )
+
+
+log_index = LogIndex()
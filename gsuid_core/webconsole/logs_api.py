@@ -4,24 +4,19 @@ Logs APIs
 """
 
 import json
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import asyncio
+from typing import Any, Dict, List, Tuple, Optional
 
 from fastapi import Body, Query, Depends, Request
 from pydantic import Field, BaseModel
 from fastapi.responses import StreamingResponse
 
-from gsuid_core.logger import (
-    LOG_PATH,
-    LogEntry,
-    HistoryLogData,
-    read_log,
-    get_all_log_path,
-)
+from gsuid_core.logger import LOG_PATH, read_log, get_all_log_path
 from gsuid_core.data_store import LOGS_CONFIG_PATH
 from gsuid_core.utils.path_safety import PathEscapeError, parse_iso_date
 from gsuid_core.webconsole.app_app import app
 from gsuid_core.webconsole.web_api import require_auth
+from gsuid_core.webconsole.log_index import LEVEL_MAPPING, IndexedLog, log_index
 
 from ._api_tags import LOGS
 
@@ -106,6 +101,36 @@ def save_logs_config(config: Dict[str, Any]) -> bool:
         return False
 
 
+def _resolve_range(date: Optional[str], start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, str]:
+    """解析查询日期范围，返回 ``(起始日期, 结束日期)``；非法日期抛出 PathEscapeError"""
+    if start_date and end_date:
+        return (
+            parse_iso_date(start_date, default_today=False),
+            parse_iso_date(end_date, default_today=False),
+        )
+    day = parse_iso_date(date, default_today=True)
+    return day, day
+
+
+async def _sync_index(range_start: str, range_end: str) -> None:
+    """把范围内日志文件新追加的内容写入索引（只解析增量部分）"""
+    dates = [p.stem for p in get_all_log_path() if range_start <= p.stem <= range_end]
+    await asyncio.to_thread(log_index.sync, dates)
+
+
+def _format_log(row: IndexedLog) -> Dict[str, Any]:
+    return {
+        "log_id": row["line"],
+        "date": row["date"],
+        "timestamp": row["ts"],
+        "level": row["level"],
+        "source": "core",
+        "message": row["message"],
+        "details": None,
+        "trace_id": row["trace_id"],
+    }
+
+
 @app.get("/api/logs", summary="获取日志列表", tags=LOGS)
 async def get_logs(
     request: Request,
@@ -115,14 +140,17 @@ async def get_logs(
     level: Optional[str] = None,
     source: Optional[str] = None,
     search: Optional[str] = None,
+    trace_id: Optional[str] = None,
     page: int = 1,
     per_page: int = 50,
+    cursor: Optional[str] = None,
     _user: Dict[str, Any] = Depends(require_auth),
 ):
     """
     获取日志列表
 
-    支持按日期/日期范围、级别、来源、文本搜索过滤和分页。
+    支持按日期/日期范围、级别、来源、trace_id、文本搜索过滤和分页。
+    日志经增量索引查询，翻页代价只与每页条数有关；传 cursor 时使用游标分页（忽略 page）。
 
     Args:
         request: FastAPI 请求对象
@@ -132,126 +160,40 @@ async def get_logs(
         level: 日志级别筛选 (info/warn/error/debug)
         source: 来源筛选
         search: 文本搜索，匹配日志内容
+        trace_id: 只返回该 trace_id 的日志
         page: 页码，默认1
         per_page: 每页数量，默认50
+        cursor: 游标，取自上一页返回的 next_cursor
         _user: 认证用户信息
 
     Returns:
         status: 0成功，404日期不存在
-        data: 包含 count、rows、page、per_page 的分页对象
+        data: 包含 count、rows、page、per_page、next_cursor 的分页对象
     """
-    day: str
-    range_start: str | None = None
-    range_end: str | None = None
     try:
-        if start_date and end_date:
-            range_start = parse_iso_date(start_date, default_today=False)
-            range_end = parse_iso_date(end_date, default_today=False)
-            day = range_start
-        else:
-            day = parse_iso_date(date, default_today=True)
+        range_start, range_end = _resolve_range(date, start_date, end_date)
     except PathEscapeError:
         return {"status": 400, "msg": "非法日期", "data": None}
 
-    if range_start is not None and range_end is not None:
-        # Multi-date range search
-        all_log_files: list[LogEntry] = []
-        from datetime import timedelta
-
-        current_date = datetime.strptime(range_start, "%Y-%m-%d")
-        end_date_obj = datetime.strptime(range_end, "%Y-%m-%d")
-
-        while current_date <= end_date_obj:
-            date_str = current_date.strftime("%Y-%m-%d")
-            log_file_path = LOG_PATH / f"{date_str}.log"
-            if log_file_path.exists():
-                history_log_data = HistoryLogData()
-                logs = await history_log_data.get_parse_logs(log_file_path)
-                for log in logs:
-                    log["_date"] = date_str
-                all_log_files.extend(logs)
-            current_date += timedelta(days=1)
-
-        log_files = all_log_files
+    if range_start == range_end and not (LOG_PATH / f"{range_start}.log").exists():
+        return {"status": 404, "msg": "该日志不存在", "data": None}
+
+    page = max(page, 1)
+    per_page = max(per_page, 1)
+    start = (page - 1) * per_page if not cursor else 0
+    level = LEVEL_MAPPING.get(level, level) if level and level != "all" else None
+
+    # 日志目前只有 core 一个来源
+    if source and source not in ("all", "core"):
+        rows, next_cursor, total = [], None, 0
     else:
-        history_log_data = HistoryLogData()
-        log_file_path = LOG_PATH / f"{day}.log"
-        if not log_file_path.exists():
-            return {"status": 404, "msg": "该日志不存在", "data": None}
-        log_files = await history_log_data.get_parse_logs(log_file_path)
-        for log in log_files:
-            log["_date"] = day
-
-    # Filter by level
-    if level and level != "all":
-        level_mapping = {
-            "info": "info",
-            "warning": "warn",
-            "warn": "warn",
-            "error": "error",
-            "debug": "debug",
-            "critical": "error",
-            "fatal": "error",
-        }
-        filtered_logs = []
-        for log in log_files:
-            raw_level = log["日志等级"].lower()
-            mapped_level = level_mapping[raw_level] if raw_level in level_mapping else "info"
-            if mapped_level == level:
-                filtered_logs.append(log)
-        log_files = filtered_logs
-
-    # Filter by source
-    if source and source != "all":
-        log_files = [log for log in log_files if (log["来源"] if "来源" in log else "core") == source]
-
-    # Filter by search text
-    if search:
-        search_lower = search.lower()
-        filtered_logs = []
-        for log in log_files:
-            message = log["内容"]
-            if not isinstance(message, str):
-                message = json.dumps(message, ensure_ascii=False)
-            if search_lower in message.lower():
-                filtered_logs.append(log)
-        log_files = filtered_logs
-
-    total = len(log_files)
-    start = (page - 1) * per_page
-    end = start + per_page
-    log_page = log_files[start:end]
-
-    # Convert to frontend expected format
-    formatted_logs = []
-    level_mapping = {
-        "info": "info",
-        "warning": "warn",
-        "warn": "warn",
-        "error": "error",
-        "debug": "debug",
-        "critical": "error",
-        "fatal": "error",
-    }
-    for i, log in enumerate(log_page):
-        raw_level = log["日志等级"].lower()
-        level = level_mapping[raw_level] if raw_level in level_mapping else "info"
-        message = log["内容"]
-        if not isinstance(message, str):
-            message = json.dumps(message, ensure_ascii=False)
-        formatted_logs.append(
-            {
-                "id": start + i + 1,
-                "log_id": log["id"],
-                "date": log["_date"] if "_date" in log else "",
-                "timestamp": log["时间"],
-                "level": level,
-                "source": "core",
-                "message": message,
-                "details": None,
-            }
+        await _sync_index(range_start, range_end)
+        rows, next_cursor = await asyncio.to_thread(
+            log_index.query, range_start, range_end, level, search, trace_id, per_page, start, cursor
         )
+        total = await asyncio.to_thread(log_index.count, range_start, range_end, level, search, trace_id)
 
+    formatted_logs = [{"id": start + i + 1, **_format_log(row)} for i, row in enumerate(rows)]
     return {
         "status": 0,
         "msg": "ok",
@@ -260,6 +202,7 @@ async def get_logs(
             "rows": formatted_logs,
             "page": page,
             "per_page": per_page,
+            "next_cursor": next_cursor,
         },
     }
 
@@ -308,13 +251,15 @@ async def get_log_stats(
     level: Optional[str] = None,
     source: Optional[str] = None,
     search: Optional[str] = None,
+    trace_id: Optional[str] = None,
     per_page: int = 100,
     _user: Dict[str, Any] = Depends(require_auth),
 ):
     """
     获取日志统计信息
 
-    返回日志总数和页数统计，不返回具体日志内容。
+    返回日志总数、页数、各级别计数与按小时聚合的计数，不返回具体日志内容。
+    级别计数与小时计数来自索引中的预聚合表。
 
     Args:
         request: FastAPI 请求对象
@@ -324,6 +269,7 @@ async def get_log_stats(
         level: 日志级别筛选
         source: 来源筛选
         search: 文本搜索，匹配日志内容
+        trace_id: trace_id 筛选
         per_page: 每页数量
         _user: 认证用户信息
 
@@ -332,12 +278,7 @@ async def get_log_stats(
         data: 统计信息
     """
     try:
-        if start_date and end_date:
-            start_date = parse_iso_date(start_date, default_today=False)
-            end_date = parse_iso_date(end_date, default_today=False)
-            day = start_date
-        else:
-            day = parse_iso_date(date, default_today=True)
+        range_start, range_end = _resolve_range(date, start_date, end_date)
     except PathEscapeError:
         return {
             "status": 0,
@@ -345,98 +286,16 @@ async def get_log_stats(
             "data": {"total": 0, "total_pages": 0, "per_page": per_page},
         }
 
-    if start_date and end_date:
-        # Multi-date range search
-        all_log_files: list[LogEntry] = []
-        from datetime import timedelta
-
-        current_date = datetime.strptime(start_date, "%Y-%m-%d")
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-
-        while current_date <= end_date_obj:
-            date_str = current_date.strftime("%Y-%m-%d")
-            log_file_path = LOG_PATH / f"{date_str}.log"
-            if log_file_path.exists():
-                history_log_data = HistoryLogData()
-                logs = await history_log_data.get_parse_logs(log_file_path)
-                for log in logs:
-                    log["_date"] = date_str
-                all_log_files.extend(logs)
-            current_date += timedelta(days=1)
-
-        log_files = all_log_files
-    else:
-        try:
-            history_log_data = HistoryLogData()
-            log_files = await history_log_data.get_parse_logs(LOG_PATH / f"{day}.log")
-        except OSError:
-            log_files = []
-
     try:
-        level_mapping = {
-            "info": "info",
-            "warning": "warn",
-            "warn": "warn",
-            "error": "error",
-            "debug": "debug",
-            "critical": "error",
-            "fatal": "error",
-        }
+        await _sync_index(range_start, range_end)
+        counts = await asyncio.to_thread(log_index.level_counts, range_start, range_end)
+        hourly = await asyncio.to_thread(log_index.hourly, range_start, range_end)
 
-        # Calculate statistics by level for entire date
-        info_count = 0
-        warn_count = 0
-        error_count = 0
-        debug_count = 0
-
-        for log in log_files:
-            raw_level = log["日志等级"].lower()
-            mapped_level = level_mapping[raw_level] if raw_level in level_mapping else "info"
-            if mapped_level == "info":
-                info_count += 1
-            elif mapped_level == "warn":
-                warn_count += 1
-            elif mapped_level == "error":
-                error_count += 1
-            elif mapped_level == "debug":
-                debug_count += 1
-
-        # Filter by level
-        if level and level != "all":
-            level_mapping = {
-                "info": "info",
-                "warning": "warn",
-                "warn": "warn",
-                "error": "error",
-                "debug": "debug",
-                "critical": "error",
-                "fatal": "error",
-            }
-            filtered_logs = []
-            for log in log_files:
-                raw_level = log["日志等级"].lower()
-                mapped_level = level_mapping[raw_level] if raw_level in level_mapping else "info"
-                if mapped_level == level:
-                    filtered_logs.append(log)
-            log_files = filtered_logs
-
-        # Filter by source
-        if source and source != "all":
-            log_files = [log for log in log_files if (log["来源"] if "来源" in log else "core") == source]
-
-        # Filter by search text
-        if search:
-            search_lower = search.lower()
-            filtered_logs = []
-            for log in log_files:
-                message = log["内容"]
-                if not isinstance(message, str):
-                    message = json.dumps(message, ensure_ascii=False)
-                if search_lower in message.lower():
-                    filtered_logs.append(log)
-            log_files = filtered_logs
-
-        total = len(log_files)
+        if source and source not in ("all", "core"):
+            total = 0
+        else:
+            level = LEVEL_MAPPING.get(level, level) if level and level != "all" else None
+            total = await asyncio.to_thread(log_index.count, range_start, range_end, level, search, trace_id)
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
 
         return {
@@ -446,10 +305,11 @@ async def get_log_stats(
                 "total": total,
                 "total_pages": total_pages,
                 "per_page": per_page,
-                "info_count": info_count,
-                "warn_count": warn_count,
-                "error_count": error_count,
-                "debug_count": debug_count,
+                "info_count": counts["info"],
+                "warn_count": counts["warn"],
+                "error_count": counts["error"],
+                "debug_count": counts["debug"],
+                "hourly": hourly,
             },
         }
     except Exception:
@@ -504,52 +364,17 @@ async def get_log_context(
     if not log_file_path.exists():
         return {"status": 404, "msg": "该日期的日志不存在", "data": None}
 
-    history_log_data = HistoryLogData()
-    log_files = await history_log_data.get_parse_logs(log_file_path)
-
-    # 通过原始行号 (id) 查找目标日志
-    target_index = None
-    for i, log in enumerate(log_files):
-        if log["id"] == log_id:
-            target_index = i
-            break
-
-    if target_index is None:
+    await asyncio.to_thread(log_index.sync, [date])
+    target_log, before_logs, after_logs, total_in_date = await asyncio.to_thread(
+        log_index.context, date, log_id, before, after
+    )
+    if target_log is None:
         return {"status": 404, "msg": "未找到指定的日志条目", "data": None}
 
-    # 计算前后日志的切片范围
-    before_start = max(0, target_index - before)
-    after_end = min(len(log_files), target_index + after + 1)
-
-    before_logs = log_files[before_start:target_index]
-    after_logs = log_files[target_index + 1 : after_end]
-    target_log = log_files[target_index]
-
-    # 日志格式化辅助函数
-    level_mapping = {
-        "info": "info",
-        "warning": "warn",
-        "warn": "warn",
-        "error": "error",
-        "debug": "debug",
-        "critical": "error",
-        "fatal": "error",
-    }
-
-    def format_context_log(log: LogEntry) -> Dict[str, Any]:
-        raw_level = log["日志等级"].lower()
-        mapped_level = level_mapping[raw_level] if raw_level in level_mapping else "info"
-        message = log["内容"]
-        if not isinstance(message, str):
-            message = json.dumps(message, ensure_ascii=False)
-        return {
-            "log_id": log["id"],
-            "date": date,
-            "timestamp": log["时间"],
-            "level": mapped_level,
-            "source": "core",
-            "message": message,
-        }
+    def format_context_log(row: IndexedLog) -> Dict[str, Any]:
+        log = _format_log(row)
+        log.pop("trace_id")
+        return log
 
     return {
         "status": 0,
@@ -560,9 +385,9 @@ async def get_log_context(
             "after_logs": [format_context_log(log) for log in after_logs],
             "before_count": len(before_logs),
             "after_count": len(after_logs),
-            "total_in_date": len(log_files),
-            "has_more_before": before_start > 0,
-            "has_more_after": after_end < len(log_files),
+            "total_in_date": total_in_date,
+            "has_more_before": log_id - before > 1,
+            "has_more_after": log_id + after < total_in_date,
         },
     }
 
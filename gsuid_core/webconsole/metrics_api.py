@@ -0,0 +1,160 @@
+"""Prometheus 指标导出：``GET /metrics``。
+
+直方图 / 计数器由各模块经 ``gsuid_core.metrics`` 打点；这里另把已有模块的 stats
+字典注册为抓取时求值的 gauge。
+
+抓取方不走控制台登录：直连来源地址（``request.client.host``，不看可伪造的
+``X-Forwarded-For``）位于 ``TRUSTED_IPS``，或携带 ``Authorization: Bearer <WS_TOKEN>`` 时放行，否则 401。
+"""
+
+import secrets
+from typing import Dict, Callable, Optional
+
+from fastapi import Header, Request, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from gsuid_core.config import core_config
+from gsuid_core.metrics import Labels, register_gauge, render_metrics
+from gsuid_core.security_manager import TRUSTED_IPS
+from gsuid_core.webconsole.app_app import app
+
+from ._api_tags import METRICS
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _bot_inflight() -> float:
+    from gsuid_core.global_val import bot_traffic
+
+    return bot_traffic["req"]
+
+
+def _receive_depth() -> Dict[Labels, float]:
+    from gsuid_core.receive_pipeline import pipeline_stats
+
+    return {(name,): s["depth"] for name, s in pipeline_stats().items()}
+
+
+def _receive_dropped() -> Dict[Labels, float]:
+    from gsuid_core.receive_pipeline import pipeline_stats
+
+    return {(name,): s["dropped"] for name, s in pipeline_stats().items()}
+
+
+def _send_depth() -> Dict[Labels, float]:
+    from gsuid_core.gss import gss
+
+    return {(bot_id,): bot._sender.depth for bot_id, bot in list(gss.active_bot.items())}
+
+
+def _render_cache_bytes() -> float:
+    from gsuid_core.utils.html_render import render_stats
+
+    return render_stats()["cache_bytes"]
+
+
+def _encode_cache_bytes() -> float:
+    from gsuid_core.utils.image.encoder import encode_stats
+
+    return encode_stats()["cache_bytes"]
+
+
+def _embedding_cache_bytes() -> Dict[Labels, float]:
+    from gsuid_core.ai_core.rag.embedding.service import embedding_cache_stats
+
+    stats = embedding_cache_stats()
+    return {("memory",): stats["memory_bytes"], ("disk",): stats["disk_bytes"]}
+
+
+def _rm_bytes() -> Dict[Labels, float]:
+    from gsuid_core.utils.resource_manager import RM
+
+    stats = RM.stats()
+    return {("memory",): stats["memory_bytes"], ("spilled",): stats["spilled_bytes"]}
+
+
+def _rm_stat(key: str) -> Callable[[], float]:
+    def _get() -> float:
+        from gsuid_core.utils.resource_manager import RM
+
+        return RM.stats()[key]
+
+    return _get
+
+
+def _disk_cache_bytes() -> float:
+    from gsuid_core.utils.disk_cache import get_disk_cache
+
+    return get_disk_cache().stats()["bytes"]
+
+
+def _disk_cache_events() -> Dict[Labels, float]:
+    from gsuid_core.utils.disk_cache import get_disk_cache
+
+    stats = get_disk_cache().stats()
+    return {(event,): stats[event] for event in ("hits", "misses", "expired", "evictions")}
+
+
+def _user_write_stat(key: str) -> Callable[[], float]:
+    def _get() -> float:
+        from gsuid_core.utils.database.user_write_behind import user_write_behind
+
+        return user_write_behind.stats()[key]
+
+    return _get
+
+
+def _user_write_flush_ms() -> Dict[Labels, float]:
+    from gsuid_core.utils.database.user_write_behind import user_write_behind
+
+    stats = user_write_behind.stats()
+    return {(kind,): stats[f"{kind}_flush_ms"] for kind in ("last", "avg", "max")}
+
+
+def _plugin_import_seconds() -> Dict[Labels, float]:
+    from gsuid_core.server import _import_durations
+
+    return {(name,): duration for name, duration in _import_durations}
+
+
+register_gauge("gscore_handler_inflight", "正在执行的触发器任务数", _bot_inflight)
+register_gauge("gscore_receive_queue_depth", "WS 接收队列中待分发的帧数", _receive_depth, ("pipeline",))
+register_gauge("gscore_receive_dropped", "本次连接以来丢弃的帧数（含断开时未处理的）", _receive_dropped, ("pipeline",))
+register_gauge("gscore_send_queue_depth", "各 Bot 发送 lane 中待发送的帧数", _send_depth, ("bot_id",))
+register_gauge("gscore_render_cache_bytes", "html_render 结果缓存占用字节数", _render_cache_bytes)
+register_gauge("gscore_image_encode_cache_bytes", "图片编码结果缓存占用字节数", _encode_cache_bytes)
+register_gauge("gscore_embedding_cache_bytes", "嵌入向量缓存占用字节数", _embedding_cache_bytes, ("tier",))
+register_gauge("gscore_rm_bytes", "ResourceManager 持有的去重后字节数", _rm_bytes, ("tier",))
+register_gauge("gscore_rm_resources", "ResourceManager 当前资源数", _rm_stat("resources"))
+register_gauge("gscore_rm_spill_count", "ResourceManager 累计溢出到磁盘的次数", _rm_stat("spill_count"))
+register_gauge("gscore_rm_rehydrate_count", "ResourceManager 累计从磁盘读回的次数", _rm_stat("rehydrate_count"))
+register_gauge("gscore_rm_dedup_ratio", "ResourceManager 逻辑字节数 / 去重后字节数", _rm_stat("dedup_ratio"))
+register_gauge("gscore_disk_cache_bytes", "磁盘缓存占用字节数", _disk_cache_bytes)
+register_gauge("gscore_disk_cache_events", "磁盘缓存累计命中/未命中/过期/淘汰次数", _disk_cache_events, ("event",))
+register_gauge("gscore_user_write_queue_depth", "用户/群写后队列积压条数", _user_write_stat("depth"))
+register_gauge("gscore_user_write_flush_count", "用户/群写后队列累计刷写次数", _user_write_stat("flush_count"))
+register_gauge(
+    "gscore_user_write_flush_failures", "用户/群写后队列累计刷写失败次数", _user_write_stat("flush_failures")
+)
+register_gauge("gscore_user_write_flush_ms", "用户/群写后队列刷写耗时（毫秒）", _user_write_flush_ms, ("stat",))
+register_gauge("gscore_plugin_import_seconds", "插件上次加载时的导入耗时", _plugin_import_seconds, ("plugin",))
+
+
+def _authorized(request: Request, authorization: Optional[str]) -> bool:
+    client = request.client
+    if client is not None and client.host in TRUSTED_IPS:
+        return True
+    token: str = core_config.get_config("WS_TOKEN")
+    if not token or not authorization or not authorization.startswith("Bearer "):
+        return False
+    return secrets.compare_digest(authorization[7:], token)
+
+
+@app.get("/metrics", summary="Prometheus 指标", tags=METRICS, response_class=PlainTextResponse)
+async def get_metrics(
+    request: Request,
+    authorization: Optional[str] = Header(default=None),
+) -> PlainTextResponse:
+    if not _authorized(request, authorization):
+        raise HTTPException(status_code=401, detail="未授权")
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -171,3 +171,22 @@ async def resume_scheduler_job(request: Request, job_id: str, _user: Dict[str, A
         return {"status": 1, "msg": "任务不存在"}
 
     return {"status": 1, "msg": "调度器未启动"}
+
+
+@app.get("/api/scheduler/sign/progress", summary="每日签到进度", tags=SCHEDULER)
+async def get_daily_sign_progress(request: Request, _user: Dict[str, Any] = Depends(require_auth)):
+    """
+    获取当天自动签到进度
+
+    Args:
+        request: FastAPI 请求对象
+        _user: 认证用户信息
+
+    Returns:
+        status: 0成功
+        data: 各游戏的签到进度，每项包含 game_name、total、done、failed、skipped、left、
+            running、rate_per_minute、eta_seconds
+    """
+    from gsuid_core.utils.sign.sign import get_sign_progress
+
+    return {"status": 0, "msg": "ok", "data": await get_sign_progress()}
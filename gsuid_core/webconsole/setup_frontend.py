@@ -4,7 +4,7 @@ from pathlib import Path
 
 from fastapi.responses import FileResponse, HTMLResponse
 
-from gsuid_core.i18n import t
+from gsuid_core.i18n import t, lt
 from gsuid_core.logger import logger
 from gsuid_core.data_store import DIST_PATH, DIST_EX_PATH
 from gsuid_core.utils.path_safety import PathEscapeError, safe_join
@@ -54,7 +54,7 @@ def get_mime_type(file_path: Path) -> str:
     if mime_type is None:
         # 尝试使用 mimetypes 模块
         mime_type, _ = mimetypes.guess_type(str(file_path))
-        logger.debug(t("log.webconsole.mime_type_file_path", file_path=file_path, mime_type=mime_type))
+        logger.debug(lt("log.webconsole.mime_type_file_path", file_path=file_path, mime_type=mime_type))
 
     if mime_type is None:
         mime_type = "application/octet-stream"
@@ -120,6 +120,8 @@ def _import_webconsole_apis() -> None:
         system_api,
         history_api,
         message_api,
+        # Prometheus /metrics
+        metrics_api,
         plugins_api,
         version_api,
         database_api,
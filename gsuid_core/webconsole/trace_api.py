@@ -3,6 +3,7 @@ Trace APIs
 提供追踪日志相关的 RESTful APIs
 """
 
+import asyncio
 from typing import Any, Dict, Optional
 
 from fastapi import Depends
@@ -40,9 +41,9 @@ async def get_traces(
     except PathEscapeError:
         return {"status": 1, "msg": "非法日期", "data": []}
 
-    # 1. 先放 JSONL 记录（completed 数据更完整）
+    # 1. 先放 JSONL 记录（completed 数据更完整）；读取当天记录会等待写线程落盘，放到线程中执行
     merged: Dict[str, Dict[str, Any]] = {}
-    for record in list_traces_from_jsonl(date, limit):
+    for record in await asyncio.to_thread(list_traces_from_jsonl, date, limit):
         merged[record["trace_id"]] = record
 
     # 2. 内存 running 覆盖 JSONL（running 是最新实时状态）
@@ -82,7 +83,7 @@ async def get_trace_daily_counts(
     无命令记录、日历上不可点击。今天的计数实时可见（running 追踪已计入）。
     """
     days = max(1, min(days, 366))
-    return {"status": 0, "msg": "ok", "data": daily_trace_counts(days)}
+    return {"status": 0, "msg": "ok", "data": await asyncio.to_thread(daily_trace_counts, days)}
 
 
 @app.get("/api/traces/{trace_id}", summary="获取追踪详情", tags=TRACE)
@@ -121,9 +122,9 @@ async def get_trace_detail(
         }
 
     # 未命中内存：先查 JSONL 目录确认元数据，再从 daily log 提取日志
-    meta = get_trace_from_jsonl(trace_id, date)
+    meta = await asyncio.to_thread(get_trace_from_jsonl, trace_id, date)
     if meta is not None:
-        logs = get_trace_logs_from_daily_log(trace_id, date)
+        logs = await asyncio.to_thread(get_trace_logs_from_daily_log, trace_id, date)
         return {
             "status": 0,
             "msg": "ok",
@@ -0,0 +1,149 @@
+"""头像获取：共享连接池、批量并发下载、按用户与尺寸缓存解码结果。"""
+
+import asyncio
+from io import BytesIO
+
+import httpx
+import pytest
+from PIL import Image
+from aiohttp import web
+
+from gsuid_core.utils import http_pool
+from gsuid_core.utils.image import utils as image_utils, image_tools
+
+
+def _png(color) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (64, 48), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture()
+def fake_sget(monkeypatch):
+    monkeypatch.setattr(image_tools, "_avatars", image_tools.ImageLRU(image_tools.AVATAR_CACHE_BYTES))
+    calls = []
+    active = [0, 0]
+
+    async def _sget(url, use_cache=False):
+        calls.append(url)
+        active[0] += 1
+        active[1] = max(active[1], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        if "nk=404" in url:
+            raise httpx.HTTPStatusError("404", request=httpx.Request("GET", url), response=httpx.Response(404))
+        return httpx.Response(200, content=_png((len(url) % 255, 0, 0)), request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(image_tools, "sget", _sget)
+    return calls, active
+
+
+def test_leaderboard_batch_is_parallel_and_cached(fake_sget, monkeypatch):
+    calls, active = fake_sget
+    monkeypatch.setattr(image_tools, "AVATAR_CONCURRENCY", 8)
+    ids = [str(10000 + i) for i in range(50)] + ["404"]
+
+    async def _run():
+        first = await image_tools.get_avatars(ids, "onebot", size=32)
+        n = len(calls)
+        second = await image_tools.get_avatars(ids, "onebot", size=32)
+        return first, n, second
+
+    first, n, second = asyncio.run(_run())
+    assert n == 51 and 1 < active[1] <= 8
+    assert first[-1] is None and all(img is not None and img.size == (32, 32) for img in first[:-1])
+    # 命中缓存：不再下载（失败的除外），返回的是可修改的副本
+    assert len(calls) == 52
+    assert second[0] is not first[0] and second[0].tobytes() == first[0].tobytes()  # type: ignore
+
+
+def test_avatar_cache_keyed_by_size_and_expires(fake_sget, monkeypatch):
+    calls, _ = fake_sget
+
+    async def _run():
+        full = await image_tools.get_qq_avatar("123")
+        small = await image_tools.get_qq_avatar("123", size=20)
+        assert full is not None and full.size == (64, 48)
+        assert small is not None and small.size == (20, 20)
+        await image_tools.get_qq_avatar("123", size=20)
+        assert len(calls) == 2
+
+        monkeypatch.setattr(image_tools, "AVATAR_TTL", -1)
+        await image_tools.get_qq_avatar("456")
+        await image_tools.get_qq_avatar("456")
+        assert len(calls) == 4
+
+        assert await image_tools.get_avatars(["1"], "discord") == [None]
+
+    asyncio.run(_run())
+
+
+def test_avatar_cache_bounded_by_bytes(fake_sget, monkeypatch):
+    calls, _ = fake_sget
+    # 64x48 RGBA 一张 12KB，限额 50KB 最多留 4 张
+    monkeypatch.setattr(image_tools, "_avatars", image_tools.ImageLRU(50 * 1024))
+
+    async def _run():
+        for uid in ("1", "2", "3", "4", "5", "1"):
+            await image_tools.get_qq_avatar(uid)
+
+    asyncio.run(_run())
+    stats = image_tools._avatars.stats()
+    assert stats["items"] == 4 and stats["bytes"] <= 50 * 1024
+    # 最早的 "1" 已被挤出，再取需要重新下载
+    assert len(calls) == 6
+
+
+async def _serve(peers: set):
+    async def handler(request: web.Request):
+        assert request.transport is not None
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.Response(body=_png((0, 255, 0)), content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_downloads_share_http_pool():
+    async def _run():
+        peers: set = set()
+        runner, base = await _serve(peers)
+        try:
+            results = await asyncio.gather(*(image_utils.sget(f"{base}/a{i}.png") for i in range(20)))
+            pic = await image_tools.get_pic(f"{base}/b.png", (8, 8))
+            stats = http_pool.pool_stats()
+            assert http_pool.get_session("image").trust_env
+        finally:
+            await http_pool.close_sessions()
+            await runner.cleanup()
+        return results, pic, stats, peers
+
+    results, pic, stats, peers = asyncio.run(_run())
+    assert all(r.status_code == 200 and r.headers["content-type"] == "image/png" for r in results)
+    assert pic.size == (8, 8) and pic.getpixel((0, 0)) == (0, 255, 0, 255)
+    assert "image" in stats and len(peers) <= stats["image"]["limit_per_host"]
+
+
+def test_sync_get_image_still_downloads_on_loop(monkeypatch, tmp_path):
+    urls = []
+
+    def _sget_sync(url):
+        urls.append(url)
+        return httpx.Response(200, content=_png((0, 255, 0)), request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(image_tools, "sget_sync", _sget_sync)
+    Image.new("RGBA", (30, 30), (0, 0, 255, 255)).save(tmp_path / "bg.png")
+    ci = image_tools.CustomizeImage(tmp_path)
+
+    async def _run():
+        return ci.get_image("http://example.invalid/bg.png", 20, 20)
+
+    img = asyncio.run(_run())
+    assert urls == ["http://example.invalid/bg.png"]
+    assert img.size == (20, 20) and img.getpixel((0, 0)) == (0, 255, 0, 255)
@@ -0,0 +1,140 @@
+"""增量快照备份：内容寻址去重、SQLite 在线备份一致性、还原校验与过期清理。"""
+
+import os
+import sqlite3
+import zipfile
+import threading
+
+import pytest
+
+from gsuid_core.utils.backup import snapshot as snap, backup_core
+
+
+@pytest.fixture()
+def store(monkeypatch, tmp_path):
+    root = tmp_path / "backup" / "snapshots"
+    monkeypatch.setattr(snap, "SNAPSHOT_ROOT", root)
+    monkeypatch.setattr(snap, "OBJECT_PATH", root / "objects")
+    monkeypatch.setattr(snap, "MANIFEST_PATH", root / "manifests")
+    monkeypatch.setattr(snap, "backup_path", tmp_path / "backup")
+    data = tmp_path / "data"
+    (data / "plugin").mkdir(parents=True)
+    (data / "plugin" / "a.json").write_text("{}" * 1000)
+    (data / "plugin" / "b.json").write_text("{}" * 1000)
+    (data / "plugin" / "c.txt").write_text("hello")
+    return data
+
+
+def _make_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY, v TEXT)")
+    conn.executemany("INSERT INTO t (v) VALUES (?)", [("x" * 200,)] * rows)
+    conn.commit()
+    return conn
+
+
+def test_incremental_dedup_and_restore(store, tmp_path):
+    first = snap.create_snapshot([store / "plugin"], store)
+    # a.json 与 b.json 内容相同，只存一份
+    assert len(first.files) == 3 and len(first.new_hashes) == 2
+    assert snap.verify_snapshot(first) == []
+
+    (store / "plugin" / "c.txt").write_text("changed")
+    second = snap.create_snapshot([store / "plugin"], store)
+    assert second.reused == 2 and len(second.new_hashes) == 1
+    assert [s.id for s in snap.list_snapshots()] == [first.id, second.id]
+
+    out = tmp_path / "restore"
+    assert snap.restore_snapshot(second, out) == 3
+    assert (out / "plugin" / "c.txt").read_text() == "changed"
+
+    zip_path = snap.export_zip(first, tmp_path / "first.zip")
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("plugin/c.txt") == b"hello"
+
+
+def test_sqlite_backup_is_consistent_under_writes(store, monkeypatch):
+    db = store / "GsData.db"
+    conn = _make_db(db, 5000)
+    conn.close()
+    monkeypatch.setattr(snap, "SQLITE_PAGES_PER_STEP", 8)
+
+    stop = threading.Event()
+
+    def _writer():
+        writer = sqlite3.connect(db, timeout=30)
+        while not stop.is_set():
+            writer.execute("INSERT INTO t (v) VALUES ('y')")
+            writer.commit()
+        writer.close()
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    try:
+        result = snap.create_snapshot([db], store)
+    finally:
+        stop.set()
+        thread.join()
+
+    entry = result.files["GsData.db"]
+    assert entry.sqlite
+    assert snap.verify_snapshot(result, full=True) == []
+
+
+def test_verify_detects_corruption(store):
+    result = snap.create_snapshot([store / "plugin"], store)
+    obj = snap.object_path(result.files["plugin/c.txt"].hash)
+    obj.write_bytes(obj.read_bytes()[:-8] + b"\0" * 8)
+    assert snap.verify_snapshot(result, full=True)
+
+
+def test_prune_keeps_latest_and_collects_objects(store, monkeypatch):
+    old = snap.create_snapshot([store / "plugin"], store)
+    (store / "plugin" / "c.txt").write_text("v2")
+    (store / "plugin" / "a.json").unlink()
+    (store / "plugin" / "b.json").unlink()
+    latest = snap.create_snapshot([store / "plugin"], store)
+
+    monkeypatch.setattr(snap, "GC_GRACE_SECONDS", -60)
+    assert snap.prune_snapshots(-1) == 1
+    assert [s.id for s in snap.list_snapshots()] == [latest.id]
+    remaining = {p.name[:-3] for p in snap.OBJECT_PATH.glob("*/*.gz")}
+    assert remaining == {e.hash for e in latest.files.values()}
+    assert old.files["plugin/a.json"].hash not in remaining
+
+
+def test_reused_objects_skip_compression_and_survive_prune(store, monkeypatch):
+    first = snap.create_snapshot([store / "plugin"], store)
+    obj = snap.object_path(first.files["plugin/a.json"].hash)
+    os.utime(obj, (1, 1))
+
+    def _no_gzip(*args, **kwargs):
+        pytest.fail("命中已有对象时不应压缩")
+
+    monkeypatch.setattr(snap.gzip, "GzipFile", _no_gzip)
+
+    # 内容不变但 mtime 变化：哈希命中已有对象，不压缩，且刷新对象 mtime
+    (store / "plugin" / "a.json").write_text("{}" * 1000)
+    second = snap.create_snapshot([store / "plugin"], store)
+    assert second.new_hashes == [] and second.reused == 3
+    assert obj.stat().st_mtime > 1
+
+    # 旧快照已过期：复用中的对象仍在宽限期内，不会被回收
+    snap._manifest_file(first.id).unlink()
+    snap._manifest_file(second.id).unlink()
+    snap.prune_snapshots(-1)
+    assert obj.exists()
+
+
+def test_copy_and_rebase_paths_exports_zip(store, monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_core, "gs_data_path", store)
+    monkeypatch.setattr(backup_core, "backup_path", tmp_path / "backup")
+    assert backup_core.copy_and_rebase_paths([store / "plugin"]) == 0
+    assert not list((tmp_path / "backup").glob("*.zip"))
+
+    assert backup_core.copy_and_rebase_paths([store / "plugin"], "NowFile") == 0
+    (zip_path,) = (tmp_path / "backup").glob("NowFile-*.zip")
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == ["plugin/a.json", "plugin/b.json", "plugin/c.txt"]
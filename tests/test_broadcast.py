@@ -0,0 +1,219 @@
+"""广播推送：共享消息只转换一次、失败退避重试、中断后续推。"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gsuid_core.segment import MessageSegment
+from gsuid_core.utils.database import base_models
+from gsuid_core.utils.boardcast import send_msg
+from gsuid_core.utils.database.models import GsBroadcastTarget
+
+
+class _Config:
+    def __init__(self, **data):
+        self.data = data
+
+    def get_config(self, key):
+        return SimpleNamespace(data=self.data[key])
+
+
+class _FakeBot:
+    def __init__(self, fail_once=()):
+        self.sent = []
+        self.fail_once = set(fail_once)
+
+    async def target_send(
+        self, message, target_type, target_id, bot_id, bot_self_id, msg_id, wait_recall=False, delivered=None
+    ):
+        if target_id in self.fail_once:
+            self.fail_once.discard(target_id)
+            raise ConnectionError("boom")
+        await asyncio.sleep(0.001)
+        self.sent.append((target_type, target_id, bot_id, message))
+        written = asyncio.get_running_loop().create_future()
+        written.set_result(None)
+        delivered.append(written)
+        return []
+
+
+@pytest.fixture()
+def broadcast_env(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bc.db'}")
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda c: GsBroadcastTarget.metadata.create_all(c, tables=[GsBroadcastTarget.__table__])  # type: ignore
+            )
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(base_models, "sqlite_semaphore", asyncio.Semaphore(8), raising=False)
+    monkeypatch.setattr(send_msg, "BROADCAST_PATH", tmp_path)
+    monkeypatch.setattr(send_msg, "RETRY_BACKOFF", 0.01)
+    # 每个用例各自 asyncio.run，退避等待会把 Event 绑定到当次事件循环
+    monkeypatch.setattr(send_msg, "shutdown_event", asyncio.Event())
+    monkeypatch.setattr(send_msg, "_bot_buckets", {})
+    monkeypatch.setattr(send_msg, "_platform_buckets", {})
+    monkeypatch.setattr(
+        send_msg,
+        "sp_config",
+        _Config(BroadcastConcurrency=8, BroadcastBotRate=1000.0, BroadcastPlatformRate=1000.0, BroadcastMaxRetry=3),
+    )
+
+    converted = []
+
+    async def fake_convert(message, bot_id, bot_self_id):
+        converted.append(bot_id)
+        return list(message)
+
+    monkeypatch.setattr(send_msg, "convert_message", fake_convert)
+    yield SimpleNamespace(tmp_path=tmp_path, converted=converted)
+    asyncio.run(engine.dispose())
+
+
+def test_shared_payload_rendered_once_and_retried(broadcast_env, monkeypatch):
+    bot = _FakeBot(fail_once={"g2"})
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": bot})
+
+    notice = [MessageSegment.text("公告"), MessageSegment.image(b"\x89PNG")]
+    msgs = {
+        "private_msg_dict": {
+            "q1": [
+                {"bot_id": "onebot", "messages": [MessageSegment.text("1")]},
+                {"bot_id": "onebot", "messages": [MessageSegment.text("2")]},
+            ]
+        },
+        "group_msg_dict": {f"g{i}": {"bot_id": "onebot", "messages": notice} for i in range(30)},
+    }
+
+    async def _run():
+        job_id = await send_msg.send_board_cast_msg(msgs)  # type: ignore
+        assert await GsBroadcastTarget.count_states(job_id) == {"done": 32}
+        return job_id
+
+    job_id = asyncio.run(_run())
+
+    # 30 个群共用一份公告：只转换一次；私聊两条各一次
+    assert len(broadcast_env.converted) == 3
+    assert sorted(t for tt, t, _, _ in bot.sent if tt == "group") == sorted(f"g{i}" for i in range(30))
+    assert [m[0].data for tt, _, _, m in bot.sent if tt == "direct"] == ["1", "2"]
+    assert not (broadcast_env.tmp_path / f"{job_id}.msgpack").exists()
+
+
+def test_failed_target_gives_up_after_max_retry(broadcast_env, monkeypatch):
+    class _AlwaysFail(_FakeBot):
+        async def target_send(self, *args, **kwargs):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": _AlwaysFail()})
+
+    async def _run():
+        msgs = {"private_msg_dict": {}, "group_msg_dict": {"g1": {"bot_id": "onebot", "messages": ["x"]}}}
+        job_id = await send_msg.send_board_cast_msg(msgs)  # type: ignore
+        assert await GsBroadcastTarget.count_states(job_id) == {"failed": 1}
+
+    asyncio.run(_run())
+
+
+def test_resume_interrupted_broadcast(broadcast_env, monkeypatch):
+    bot = _FakeBot()
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": bot})
+    node = MessageSegment.node([MessageSegment.text("a"), MessageSegment.text("b")])
+    payloads = [[MessageSegment.text("hi"), node]]
+
+    async def _run():
+        # 模拟上次进程写好了任务但只推了一半
+        (broadcast_env.tmp_path / "job1.msgpack").write_bytes(send_msg._encode_payloads(payloads))
+        await GsBroadcastTarget.add_targets(
+            [
+                {
+                    "job_id": "job1",
+                    "seq": i,
+                    "target_type": "group",
+                    "target_id": f"g{i}",
+                    "bot_id": "onebot",
+                    "payload": 0,
+                    "created_at": 0,
+                }
+                for i in range(3)
+            ]
+        )
+        records = await GsBroadcastTarget.get_unfinished("job1")
+        await GsBroadcastTarget.set_state(records[0].id, "done", 1)
+
+        assert await GsBroadcastTarget.get_unfinished_jobs() == ["job1"]
+        await send_msg._resume(["job1"])
+        assert await GsBroadcastTarget.count_states("job1") == {"done": 3}
+
+    asyncio.run(_run())
+    assert [t for _, t, _, _ in bot.sent] == ["g1", "g2"]
+    message = bot.sent[0][3]
+    assert message[0].data == "hi"
+    assert message[1].type == "node" and [m.data for m in message[1].data] == ["a", "b"]
+
+
+def test_retry_only_resends_through_failed_bot(broadcast_env, monkeypatch):
+    ok, flaky = _FakeBot(), _FakeBot(fail_once={"g1"})
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": ok, "ws2": flaky})
+
+    async def _run():
+        msgs = {"private_msg_dict": {}, "group_msg_dict": {"g1": {"bot_id": "onebot", "messages": ["x"]}}}
+        job_id = await send_msg.send_board_cast_msg(msgs)  # type: ignore
+        assert await GsBroadcastTarget.count_states(job_id) == {"done": 1}
+
+    asyncio.run(_run())
+    # ws2 第一次失败后重试，只经 ws2 补发，ws1 不会重复发送
+    assert [t for _, t, _, _ in ok.sent] == ["g1"]
+    assert [t for _, t, _, _ in flaky.sent] == ["g1"]
+
+
+def test_enqueued_but_unwritten_frames_are_not_done(broadcast_env, monkeypatch):
+    class _Stuck(_FakeBot):
+        """第一次只入队、帧从未写出；第二次写出后并回执。"""
+
+        _supports_recall = True
+
+        async def target_send(self, *args, wait_recall=False, delivered=None):
+            self.sent.append(args[2])
+            written = asyncio.get_running_loop().create_future()
+            delivered.append(written)
+            if len(self.sent) == 1:
+                return []
+            written.set_result(None)
+            return ["mid-1"]
+
+    bot = _Stuck()
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": bot})
+    monkeypatch.setattr(send_msg, "ACK_TIMEOUT", 0.05)
+
+    async def _run():
+        msgs = {"private_msg_dict": {}, "group_msg_dict": {"g1": {"bot_id": "onebot", "messages": ["x"]}}}
+        job_id = await send_msg.send_board_cast_msg(msgs)  # type: ignore
+        assert await GsBroadcastTarget.count_states(job_id) == {"done": 1}
+
+    asyncio.run(_run())
+    assert bot.sent == ["g1", "g1"]
+
+
+def test_written_without_receipt_is_retried_on_receipt_capable_bot(broadcast_env, monkeypatch):
+    class _NoReceipt(_FakeBot):
+        _supports_recall = True
+
+        async def target_send(self, *args, wait_recall=False, delivered=None):
+            await super().target_send(*args, wait_recall=wait_recall, delivered=delivered)
+            return [] if len(self.sent) == 1 else ["mid-2"]
+
+    bot = _NoReceipt()
+    monkeypatch.setattr(send_msg.gss, "active_bot", {"ws1": bot})
+
+    async def _run():
+        msgs = {"private_msg_dict": {}, "group_msg_dict": {"g1": {"bot_id": "onebot", "messages": ["x"]}}}
+        job_id = await send_msg.send_board_cast_msg(msgs)  # type: ignore
+        assert await GsBroadcastTarget.count_states(job_id) == {"done": 1}
+
+    asyncio.run(_run())
+    assert [t for _, t, _, _ in bot.sent] == ["g1", "g1"]
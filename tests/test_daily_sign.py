@@ -0,0 +1,162 @@
+"""每日签到任务：断点续签、同 Cookie 串行、结果汇总与进度。"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gsuid_core.utils.sign import sign
+from gsuid_core.utils.database import base_models
+from gsuid_core.utils.database.models import GsUser, GsSignRecord
+
+
+class _Config:
+    def __init__(self, **data):
+        self.data = data
+
+    def get_config(self, key):
+        return SimpleNamespace(data=self.data[key])
+
+
+@pytest.fixture()
+def sign_db(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sign.db'}")
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda c: GsUser.metadata.create_all(c, tables=[GsUser.__table__, GsSignRecord.__table__])  # type: ignore
+            )
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(base_models, "sqlite_semaphore", asyncio.Semaphore(8), raising=False)
+    monkeypatch.setattr(
+        sign,
+        "sp_config",
+        _Config(SignConcurrency=4, SignRatePerMinute=60000.0, SignJitter=0.0),
+    )
+    monkeypatch.setattr(sign, "_JOBS", {})
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+async def _add_users():
+    # u1/u2 同一个 Cookie，u3 私聊推送
+    for qid, uid, cookie, switch in [
+        ("q1", "100000001", "ck-a", "g1"),
+        ("q2", "100000002", "ck-a", "g1"),
+        ("q3", "100000003", "ck-b", "on"),
+        ("q4", "100000004", "ck-c", "off"),
+    ]:
+        await GsUser.full_insert_data(
+            bot_id="onebot",
+            user_id=qid,
+            cookie=cookie,
+            uid=uid,
+            sign_switch=switch,
+        )
+
+
+def test_daily_sign_serializes_cookie_and_summarizes(sign_db, monkeypatch):
+    cookie_of = {"100000001": "ck-a", "100000002": "ck-a", "100000003": "ck-b"}
+    active = set()
+    calls = []
+
+    async def fake_sign_in(uid, game_name="gs"):
+        assert cookie_of[uid] not in active
+        active.add(cookie_of[uid])
+        calls.append(uid)
+        await asyncio.sleep(0.01)
+        active.discard(cookie_of[uid])
+        return "签到失败!测试" if uid == "100000002" else f"✅{uid}签到成功"
+
+    monkeypatch.setattr(sign, "sign_in", fake_sign_in)
+
+    async def _run():
+        await _add_users()
+        result = await sign.daily_sign("gs")
+        assert sorted(calls) == ["100000001", "100000002", "100000003"]
+
+        assert list(result["private_msg_dict"]) == ["q3"]
+        group = result["group_msg_dict"]["g1"]
+        assert "共签到成功1人，共签到失败1人" in group["messages"][0].data
+
+        progress = {p["game_name"]: p for p in await sign.get_sign_progress()}
+        assert progress["gs"]["done"] == 2 and progress["gs"]["failed"] == 1 and progress["gs"]["left"] == 0
+
+        # 再次运行只重试失败的 UID
+        calls.clear()
+        await sign.daily_sign("gs")
+        assert calls == ["100000002"]
+
+    asyncio.run(_run())
+
+
+def test_daily_sign_resumes_after_interruption(sign_db, monkeypatch):
+    calls = []
+
+    async def _run():
+        gate = asyncio.Event()
+
+        async def fake_sign_in(uid, game_name="gs"):
+            calls.append(uid)
+            if uid == "100000003":
+                await gate.wait()
+            return f"✅{uid}签到成功"
+
+        monkeypatch.setattr(sign, "sign_in", fake_sign_in)
+        await _add_users()
+
+        # 模拟签到途中进程退出
+        job = sign._start_job("gs", retry_failed=False)
+        while "100000003" not in calls:
+            await asyncio.sleep(0.01)
+        assert job.task is not None
+        job.task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job.task
+
+        progress = (await sign.get_sign_progress())[0]
+        assert progress["left"] >= 1 and not progress["running"]
+
+        gate.set()
+        done_before = {r.uid for r in await GsSignRecord.get_run(sign.date.today(), "gs") if r.state == "done"}
+        calls.clear()
+        pushed = []
+
+        async def fake_push(result):
+            pushed.append(result)
+
+        monkeypatch.setattr(sign, "send_board_cast_msg", fake_push)
+        await sign.resume_daily_sign()
+        await asyncio.gather(*sign._background)
+
+        assert "100000003" in calls and not done_before & set(calls)
+        assert len(pushed) == 1 and list(pushed[0]["private_msg_dict"]) == ["q3"]
+        assert (await sign.get_sign_progress())[0]["left"] == 0
+
+    asyncio.run(_run())
+
+
+def test_sign_record_marks_retcode_error_failed(sign_db, monkeypatch):
+    async def fake_sign_info(uid, game_name="gs"):
+        return -1
+
+    monkeypatch.setattr(sign.mys_api, "get_sign_info", fake_sign_info)
+
+    async def _run():
+        day = sign.date.today()
+        await GsSignRecord.add_run_items(
+            day, "gs", [{"uid": "100000001", "bot_id": "onebot", "user_id": "q1", "push_target": "g1"}]
+        )
+        (record,) = await GsSignRecord.get_run(day, "gs")
+        job = sign.SignJob("gs", day)
+        await sign._sign_record(job, record)
+
+        (record,) = await GsSignRecord.get_run(day, "gs")
+        assert record.message is not None and record.message.startswith("[gs] 签到失败")
+        assert record.state == "failed"
+
+    asyncio.run(_run())
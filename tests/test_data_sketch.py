@@ -0,0 +1,183 @@
+"""活跃度草图：HyperLogLog / Top-K 的精度与合并，落库后由草图算出 30 日看板指标。"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gsuid_core import global_val as gv
+from gsuid_core.utils.sketch import TopK, HyperLogLog, union_count
+from gsuid_core.utils.database import base_models
+from gsuid_core.utils.database.global_val_models import (
+    DataType,
+    CoreDataSketch,
+    CoreDataSummary,
+    CoreDataAnalysis,
+)
+
+
+@pytest.fixture()
+def sketch_db(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sketch.db'}")
+    tables = [CoreDataSketch.__table__, CoreDataSummary.__table__, CoreDataAnalysis.__table__]
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: CoreDataSketch.metadata.create_all(c, tables=tables))  # type: ignore
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(base_models, "sqlite_semaphore", asyncio.Semaphore(8), raising=False)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def test_hyperloglog_estimate_merge_and_roundtrip():
+    a = HyperLogLog.of(f"u{i}" for i in range(20000))
+    b = HyperLogLog.of(f"u{i}" for i in range(10000, 30000))
+    assert abs(a.count() - 20000) / 20000 < 0.05
+    assert abs(union_count(a, b) - 30000) / 30000 < 0.05
+    # 小基数走线性计数，几乎精确；重复添加不改变估计
+    small = HyperLogLog.of(["1", "2", "3", "3", "2"])
+    assert len(small) == 3
+
+    restored = HyperLogLog.from_bytes(a.to_bytes())
+    assert restored.registers == a.registers
+    assert len(a.to_bytes()) < len(a.registers)
+    assert HyperLogLog.from_bytes(b"").is_empty() and HyperLogLog().to_bytes() == b""
+    with pytest.raises(ValueError):
+        a.update(HyperLogLog(p=10))
+
+
+def test_topk_keeps_heavy_hitters_and_exact_total():
+    day1 = TopK.of({"查询": 50, "签到": 30, "帮助": 1}, capacity=2)
+    assert day1.counts == {"查询": 50, "签到": 30} and day1.total == 81 and day1.error == 1
+
+    day2 = TopK(capacity=2)
+    for key in ["签到"] * 40 + ["抽卡"] * 5:
+        day2.add(key)
+    merged = TopK.from_bytes(day1.to_bytes()).update(day2)
+    assert merged.most_common() == [("签到", 70), ("查询", 50)]
+    assert merged.total == 126
+    assert merged.error >= 5
+
+
+def _save_day(day: date, users, groups, bot_self_id="b1"):
+    local_val = {
+        "receive": 1,
+        "send": 1,
+        "command": 1,
+        "image": 0,
+        "user_count": 0,
+        "group_count": 0,
+        "user": {u: {"查询": 2} for u in users},
+        "group": {g: {"查询": 2} for g in groups},
+    }
+    return gv._save_global_val_to_database(local_val, "onebot", bot_self_id, day)  # type: ignore
+
+
+def test_dashboard_metrics_from_sketches(sketch_db):
+    today = date.today()
+
+    async def _run():
+        # 30 天前到 8 天前活跃的 u0..u9；最近 7 天只有 u0..u3 + 另一个 Bot 上的 u4
+        for offset in range(8, 31):
+            await _save_day(today - timedelta(days=offset), [f"u{i}" for i in range(10)], ["g1", "g2"])
+        for offset in range(1, 8):
+            await _save_day(today - timedelta(days=offset), ["u0", "u1", "u2", "u3"], ["g1"])
+        await _save_day(today - timedelta(days=3), ["u4"], [], bot_self_id="b2")
+        await _save_day(today, ["u0", "n1", "n2"], ["g1", "g9"])
+
+        all_bots = await CoreDataAnalysis.calculate_dashboard_metrics()
+        one_bot = await CoreDataAnalysis.calculate_dashboard_metrics("onebot", "b1")
+        top = await CoreDataSketch.get_top_commands(today - timedelta(days=1), today, "onebot", "b1")
+        return all_bots, one_bot, top
+
+    all_bots, one_bot, top = asyncio.run(_run())
+
+    assert all_bots["MAU"] == "10" and all_bots["MAG"] == "2"
+    assert all_bots["NewUser"] == "2" and all_bots["NewGroup"] == "1"
+    # 流失：u5..u9 共 5 人 / 10；g2 / 2
+    assert all_bots["OutUser"] == "50.00%" and all_bots["OutGroup"] == "50.00%"
+    # 日均：23 天 × 10 人 + 6 天 × 4 人 + 1 天 × 5 人，共 30 天
+    assert all_bots["DAU"] == f"{(23 * 10 + 6 * 4 + 5) / 30:.2f}"
+    assert one_bot["OutUser"] == "60.00%"
+    assert top.most_common() == [("查询", 14)] and top.total == 14
+
+
+def test_backfill_builds_missing_sketches(sketch_db):
+    yesterday = date.today() - timedelta(days=1)
+
+    async def _run():
+        await CoreDataSummary.batch_insert_data_with_update(
+            [CoreDataSummary(date=yesterday, bot_id="onebot", bot_self_id="b1")],
+            ["receive"],
+            ["date", "bot_id", "bot_self_id"],
+        )
+        await CoreDataAnalysis.batch_insert_data_with_update(
+            [
+                CoreDataAnalysis(
+                    data_type=data_type,
+                    target_id=target,
+                    command_name="帮助",
+                    command_count=3,
+                    date=yesterday,
+                    bot_id="onebot",
+                    bot_self_id="b1",
+                )
+                for data_type, target in [(DataType.USER, "u1"), (DataType.USER, "u2"), (DataType.GROUP, "g1")]
+            ],
+            ["command_count"],
+            ["data_type", "target_id", "date", "command_name", "bot_id", "bot_self_id"],
+        )
+        await gv.backfill_data_sketches()
+        await gv.backfill_data_sketches()
+        sketches = await CoreDataSketch.get_daily_sketches(yesterday, yesterday)
+        top = await CoreDataSketch.get_top_commands(yesterday, yesterday)
+        rows = await CoreDataSketch.select_rows(date=yesterday)
+        return sketches, top, rows
+
+    sketches, top, rows = asyncio.run(_run())
+    users, groups = sketches[yesterday]
+    assert (len(users), len(groups)) == (2, 1)
+    assert top.most_common() == [("帮助", 6)]
+    assert len(rows or []) == 1
+
+
+def test_in_memory_analysis_is_exact():
+    def _day(users, groups):
+        return {"receive": 1, "send": 1, "user": {u: {"查询": 1} for u in users}, "group": {g: {} for g in groups}}
+
+    # 大基数下 HyperLogLog 会有误差，内存中的明细必须给出精确值
+    base = [f"u{i}" for i in range(5000)]
+    data = {"2026-01-30": _day(base + ["new"], ["g1"])}
+    for day in range(1, 8):
+        data[f"2026-01-{30 - day:02d}"] = _day(base[: 4000 + day], ["g1", "g2"])
+    data["2026-01-01"] = _day(base + ["gone"], ["g3"])
+
+    result = asyncio.run(gv.get_global_analysis(data))  # type: ignore[arg-type]
+    assert result["MAU"] == "5002" and result["NewUser"] == "1"
+    assert result["DAU"] == f"{sum(4000 + d for d in range(1, 8)) / 7:.2f}"
+    assert result["MAG"] == "3" and result["NewGroup"] == "0"
+    assert result["OutUser"] == f"{(5002 - 5001) / 5002 * 100:.2f}%"
+
+
+def test_save_writes_analysis_rows_in_batches(sketch_db, monkeypatch):
+    monkeypatch.setattr(gv, "ANALYSIS_BATCH_SIZE", 7)
+    batches = []
+    upsert = CoreDataAnalysis.batch_insert_data_with_update
+
+    async def _spy(datas, *args, **kwargs):
+        batches.append(len(datas))
+        return await upsert(datas, *args, **kwargs)
+
+    monkeypatch.setattr(CoreDataAnalysis, "batch_insert_data_with_update", _spy)
+    today = date.today()
+
+    async def _run():
+        await _save_day(today, [f"u{i}" for i in range(20)], ["g1", "g2"])
+        return await CoreDataAnalysis.select_rows(date=today)
+
+    rows = asyncio.run(_run())
+    assert batches == [7, 7, 7, 1] and len(rows or []) == 22
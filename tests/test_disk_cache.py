@@ -0,0 +1,158 @@
+"""有预算的磁盘缓存与 gs_cache：淘汰、索引重载、过期、single-flight。"""
+
+import time
+import asyncio
+
+import pytest
+
+from gsuid_core.utils import cache as gs_cache_mod, disk_cache as disk_cache_mod
+from gsuid_core.utils.disk_cache import DiskCache
+
+
+def test_lru_eviction_and_index_reload(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path, max_bytes=1000)
+    for i in range(4):
+        cache.put_sync(f"k{i}", b"x" * 300)
+    # 超出预算后淘汰到 90% 以下：最久未用的 k0 先走
+    assert cache.get_path("k0") is None
+    assert cache.stats()["evictions"] == 1 and cache.total_bytes == 900
+
+    assert cache.get_path("k1") is not None
+    cache.put_sync("k4", b"y" * 300)
+    # k1 刚访问过，k2 成为最久未用
+    assert cache.get_path("k2") is None and cache.get_path("k1") is not None
+    cache.save_index()
+    assert len(list(tmp_path.glob("*.bin"))) == 3
+
+    # 重启读索引，不遍历目录
+    monkeypatch.setattr(DiskCache, "_scan_dir", lambda self: pytest.fail("walked cache dir"))
+    reloaded = DiskCache(tmp_path, max_bytes=1000)
+    assert reloaded.total_bytes == 900
+    assert reloaded._read("k4") == b"y" * 300
+
+
+def test_lfu_and_expiry(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=1000, policy="LFU")
+    cache.put_sync("hot", b"a" * 300)
+    cache.put_sync("cold", b"b" * 300)
+    cache.put_sync("short", b"c" * 10, ttl=0.01)
+    for _ in range(3):
+        assert cache.get_path("hot") is not None
+    time.sleep(0.02)
+    assert cache.get_path("short") is None
+    assert cache.stats()["expired"] == 1
+
+    cache.put_sync("new", b"d" * 300)
+    cache.put_sync("new2", b"e" * 300)
+    assert cache.get_path("cold") is None and cache.get_path("hot") is not None
+
+
+def test_index_missing_adopts_existing_files(tmp_path):
+    (tmp_path / ("ab" * 32 + ".bin")).write_bytes(b"legacy")
+    (tmp_path / "half.tmp").write_bytes(b"partial")
+    cache = DiskCache(tmp_path, max_bytes=1000)
+    assert cache.total_bytes == 6 and not (tmp_path / "half.tmp").exists()
+
+
+def test_get_or_fetch_single_flight(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=10_000)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"payload"
+
+    async def _run():
+        results = await asyncio.gather(*(cache.get_or_fetch("url", fetch) for _ in range(10)))
+        assert results == [b"payload"] * 10
+        assert await cache.get_or_fetch("url", fetch) == b"payload"
+
+        async def boom():
+            raise ValueError("down")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_fetch("bad", boom)
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(_run())
+    assert len(calls) == 1
+
+
+def test_get_or_fetch_survives_leader_cancel(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=10_000)
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return b"payload"
+
+    async def _run():
+        leader = asyncio.create_task(cache.get_or_fetch("url", fetch))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(cache.get_or_fetch("url", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == b"payload"
+        assert cache.get_path("url") is not None
+
+    asyncio.run(_run())
+
+
+def test_gs_cache_survives_leader_cancel(tmp_path, monkeypatch):
+    monkeypatch.setattr(gs_cache_mod, "_MEMORY", gs_cache_mod.OrderedDict())
+    calls = []
+
+    @gs_cache_mod.gs_cache(60)
+    async def slow(uid):
+        calls.append(uid)
+        await asyncio.sleep(0.05)
+        return {"uid": uid}
+
+    async def _run():
+        leader = asyncio.create_task(slow("1"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(slow("1"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == {"uid": "1"}
+
+    asyncio.run(_run())
+    assert calls == ["1"]
+
+
+def test_gs_cache_shares_inflight_and_caches_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache_mod, "_disk_cache", DiskCache(tmp_path, max_bytes=10_000))
+    monkeypatch.setattr(gs_cache_mod, "_MEMORY", gs_cache_mod.OrderedDict())
+    calls = []
+
+    @gs_cache_mod.gs_cache(60)
+    async def fetch_info(uid):
+        calls.append(uid)
+        await asyncio.sleep(0.02)
+        return {"uid": uid}
+
+    @gs_cache_mod.gs_cache(60)
+    async def draw(uid):
+        calls.append(f"draw{uid}")
+        return b"\x89PNG-image"
+
+    @gs_cache_mod.gs_cache(0.01)
+    def short(uid):
+        calls.append(f"short{uid}")
+        return uid
+
+    async def _run():
+        results = await asyncio.gather(*(fetch_info("1") for _ in range(5)))
+        assert results == [{"uid": "1"}] * 5
+        assert await draw("1") == b"\x89PNG-image"
+        assert await draw("1") == "base64://iVBORy1pbWFnZQ=="
+
+    asyncio.run(_run())
+    assert short("1") == "1" and short("1") == "1"
+    time.sleep(0.02)
+    short("1")
+    assert calls == ["1", "draw1", "short1", "short1"]
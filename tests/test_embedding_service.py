@@ -0,0 +1,124 @@
+"""嵌入服务：并发单条请求合批、同文本去重、两级缓存（重启后磁盘命中）与失败传播。"""
+
+import asyncio
+
+from gsuid_core import metrics
+from gsuid_core.ai_core.rag.embedding.base import EmbeddingProvider
+from gsuid_core.ai_core.rag.embedding.service import EmbeddingCache, EmbeddingService, cache_key
+
+
+class _FakeProvider(EmbeddingProvider):
+    def __init__(self, model_name: str = "fake-v1", dim: int = 4) -> None:
+        self._model_name = model_name
+        self._dim = dim
+        self.calls: list = []
+        self.fail = False
+
+    @property
+    def dimension(self) -> int:
+        return self._dim
+
+    def _vec(self, text: str) -> list:
+        return [float(len(text)), float(ord(text[0])), 0.5, -1.0][: self._dim]
+
+    def embed_sync(self, texts: list) -> list:
+        self.calls.append(list(texts))
+        return [self._vec(text) for text in texts]
+
+    async def embed(self, texts: list) -> list:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("upstream 500")
+        self.calls.append(list(texts))
+        return [self._vec(text) for text in texts]
+
+
+def test_concurrent_singles_are_coalesced_and_cached(tmp_path):
+    inner = _FakeProvider()
+    service = EmbeddingService(inner, EmbeddingCache(tmp_path / "emb.db", 1 << 20, 1 << 20), window=0.01)
+    hits_before = metrics.EMBEDDING_CACHE.value("hit")
+    waits_before = metrics.EMBEDDING_QUEUE_SECONDS.snapshot()[0][-1]
+
+    async def _run():
+        texts = ["你好", "天气", "你好", "persona"]
+        first = await asyncio.gather(*(service.embed_single(text) for text in texts))
+        again = await service.embed_single("  你好 ")
+        return first, again
+
+    first, again = asyncio.run(_run())
+    assert inner.calls == [["你好", "天气", "persona"]]
+    assert first[0] == first[2] == inner._vec("你好")
+    # 归一化后相同的文本直接命中内存缓存
+    assert again == first[0]
+    assert metrics.EMBEDDING_CACHE.value("hit") == hits_before + 2
+    assert metrics.EMBEDDING_QUEUE_SECONDS.snapshot()[0][-1] == waits_before + 3
+
+    # 模拟重启：新的内存层，从磁盘命中
+    restarted = EmbeddingService(_FakeProvider(), EmbeddingCache(tmp_path / "emb.db", 1 << 20, 1 << 20))
+    vectors = restarted.embed_sync(["天气", "新问题", "天气"])
+    assert restarted.inner.calls == [["新问题"]]  # type: ignore[attr-defined]
+    assert vectors[0] == vectors[2] == inner._vec("天气")
+
+    # 模型标识不同则不共享缓存
+    other = EmbeddingService(_FakeProvider("fake-v2"), EmbeddingCache(tmp_path / "emb.db", 1 << 20, 1 << 20))
+    other.embed_sync(["天气"])
+    assert other.inner.calls == [["天气"]]  # type: ignore[attr-defined]
+    assert cache_key("a", "x  y") == cache_key("a", "x y") != cache_key("b", "x y")
+
+
+def test_batch_failure_reaches_every_waiter_and_is_not_cached():
+    inner = _FakeProvider()
+    service = EmbeddingService(inner, EmbeddingCache(None, 1 << 20, 0), window=0.01)
+
+    async def _run():
+        inner.fail = True
+        results = await asyncio.gather(*(service.embed_single(t) for t in ["a", "b"]), return_exceptions=True)
+        inner.fail = False
+        return results, await service.embed_single("a")
+
+    results, retry = asyncio.run(_run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert retry == inner._vec("a") and inner.calls == [["a"]]
+
+
+def test_max_batch_flushes_immediately_and_caches_are_bounded(tmp_path):
+    inner = _FakeProvider()
+    service = EmbeddingService(inner, EmbeddingCache(None, 1 << 20, 0), window=60, max_batch=2)
+
+    async def _run():
+        return await asyncio.wait_for(asyncio.gather(service.embed_single("x"), service.embed_single("yy")), 5)
+
+    assert asyncio.run(_run()) == [inner._vec("x"), inner._vec("yy")]
+
+    cache = EmbeddingCache(tmp_path / "small.db", memory_bytes=32, disk_bytes=200)
+    cache.put_many([(f"k{i}", bytes(16)) for i in range(30)])
+    stats = cache.stats()
+    assert stats["memory_items"] == 2 and stats["memory_bytes"] <= 32
+    assert 0 < stats["disk_bytes"] <= 200
+    assert "k29" in cache.get_many(["k0", "k29"])
+    cache.close()
+
+
+def test_dimension_change_invalidates_entries(tmp_path):
+    cache = EmbeddingCache(tmp_path / "emb.db", 1 << 20, 1 << 20)
+    EmbeddingService(_FakeProvider(dim=4), cache).embed_sync(["同名模型"])
+    changed = _FakeProvider(dim=3)
+    assert EmbeddingService(changed, cache).embed_sync(["同名模型"]) == [changed._vec("同名模型")]
+    assert changed.calls == [["同名模型"]]
+
+
+def test_disk_accounting_and_memory_tier_not_blocked_by_db(tmp_path):
+    cache = EmbeddingCache(tmp_path / "acct.db", memory_bytes=1 << 20, disk_bytes=1 << 20)
+    cache.put_many([("a", bytes(16)), ("b", bytes(16))])
+    # 覆盖写同一键不重复计入磁盘占用
+    for _ in range(5):
+        cache.put_many([("a", bytes(16)), ("a", bytes(32))])
+    reopened = EmbeddingCache(tmp_path / "acct.db", 0, 1 << 20)
+    assert cache.stats()["disk_bytes"] == reopened.stats()["disk_bytes"] == 48
+    reopened.close()
+
+    # 磁盘层忙（持有 DB 锁）时，内存层照常命中
+    with cache._db_lock:
+        assert cache.get_memory("b") == bytes(16)
+        assert cache.get_many(["a"]) == {"a": bytes(32)}
+    cache.close()
@@ -0,0 +1,32 @@
+"""Event.fork：处理器视图独立改写触发器派生字段，容器与原事件共享。"""
+
+import asyncio
+
+from gsuid_core.models import Event, Message
+from gsuid_core.trigger import Trigger
+
+
+async def _noop(bot, ev): ...
+
+
+def _event(text: str) -> Event:
+    ev = Event("OneBot", "123", "m", "group", "999", "456", {"nickname": "x"}, 6)
+    ev.raw_text = ev.text = text
+    ev.content = [Message("text", text), Message("image", "base64://AAAA")]
+    return ev
+
+
+def test_fork_isolates_trigger_fields_and_shares_content():
+    ev = _event("gs练度90")
+    cmd = ev.fork(task_id="a")
+    reg = ev.fork(task_id="b")
+    asyncio.run(Trigger("command", "练度", _noop, "gs").get_command(cmd))
+    asyncio.run(Trigger("regex", r"^练度(\d+)$", _noop, "gs").get_command(reg))
+
+    assert (cmd.command, cmd.text, cmd.task_id) == ("练度", "90", "a")
+    assert (reg.regex_group, reg.command, reg.task_id) == (("90",), "90", "b")
+    # 原事件不被处理器改写
+    assert (ev.command, ev.text, ev.regex_group, ev.task_id) == ("", "gs练度90", (), "")
+    # 容器不复制
+    assert cmd.content is ev.content and reg.sender is ev.sender
+    assert cmd == ev and hash(cmd) == hash(ev)
@@ -0,0 +1,123 @@
+"""HTML 渲染：结果缓存、相同渲染合并、工作池限并发。"""
+
+import time
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import gsuid_core.utils.html_render as html_render
+
+
+class _Config:
+    def __init__(self, **data):
+        self.data = data
+
+    def get_config(self, key):
+        return SimpleNamespace(data=self.data[key])
+
+
+@pytest.fixture()
+def render_env(monkeypatch):
+    monkeypatch.setattr(
+        html_render,
+        "sp_config",
+        _Config(RenderCacheMB=1, RenderWorkers=2, RenderWorkerMode="thread"),
+    )
+    monkeypatch.setattr(html_render, "_cache", html_render.OrderedDict())
+    monkeypatch.setattr(html_render, "_cache_bytes", 0)
+    monkeypatch.setattr(html_render, "_inflight", {})
+    monkeypatch.setattr(html_render, "_slots", html_render.WeakKeyDictionary())
+    monkeypatch.setattr(html_render, "_executor", None)
+    monkeypatch.setattr(html_render, "_shutdown_hooked", False)
+    monkeypatch.setattr(html_render, "_stats", {k: 0 for k in html_render._stats})
+    monkeypatch.setattr("gsuid_core.server.on_core_shutdown", lambda func: func)
+
+    calls = []
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def fake_render(html, **options):
+        with lock:
+            calls.append((html, options["max_width"]))
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return f"{html}@{options['max_width']}".encode()
+
+    monkeypatch.setattr(html_render, "_sync_render_html", fake_render)
+    yield SimpleNamespace(calls=calls, active=active)
+    if html_render._executor is not None:
+        html_render._executor.shutdown()
+
+
+def test_identical_renders_coalesce_and_hit_cache(render_env):
+    async def _run():
+        results = await asyncio.gather(*(html_render.render_html_to_bytes("<p>help</p>") for _ in range(30)))
+        assert set(results) == {b"<p>help</p>@800.0"}
+        assert await html_render.render_html_to_bytes("<p>help</p>") == b"<p>help</p>@800.0"
+        # 参数不同视为不同结果
+        assert await html_render.render_html_to_bytes("<p>help</p>", max_width=600) == b"<p>help</p>@600"
+
+    asyncio.run(_run())
+    assert render_env.calls == [("<p>help</p>", 800.0), ("<p>help</p>", 600)]
+    stats = html_render.render_stats()
+    assert stats["renders"] == 2 and stats["shared"] == 29 and stats["hits"] == 1
+    assert stats["cache_items"] == 2 and stats["waiting"] == 0 and stats["running"] == 0
+
+
+def test_worker_pool_bounds_concurrency(render_env):
+    async def _run():
+        tasks = [asyncio.create_task(html_render.render_html_to_bytes(f"<p>{i}</p>")) for i in range(8)]
+        await asyncio.sleep(0.005)
+        assert html_render.render_stats()["waiting"] == 6
+        await asyncio.gather(*tasks)
+
+    asyncio.run(_run())
+    assert len(render_env.calls) == 8
+    assert render_env.active[1] == 2
+    assert html_render.render_stats()["avg_render_seconds"] >= 0.02
+
+
+def test_cache_respects_byte_budget(render_env):
+    big = "x" * (200 * 1024)
+
+    async def _run():
+        for i in range(8):
+            await html_render.render_html_to_bytes(big + str(i))
+
+    asyncio.run(_run())
+    stats = html_render.render_stats()
+    assert stats["cache_bytes"] <= 1024 * 1024
+    assert 0 < stats["cache_items"] < 8
+
+
+def test_cancelled_leader_does_not_abort_coalesced_render(render_env):
+    async def _run():
+        leader = asyncio.create_task(html_render.render_html_to_bytes("<p>slow</p>"))
+        await asyncio.sleep(0.005)
+        follower = asyncio.create_task(html_render.render_html_to_bytes("<p>slow</p>"))
+        await asyncio.sleep(0.001)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == b"<p>slow</p>@800.0"
+
+    asyncio.run(_run())
+    assert render_env.calls == [("<p>slow</p>", 800.0)]
+
+
+def test_shutdown_hook_registered_once(render_env, monkeypatch):
+    hooks = []
+    monkeypatch.setattr("gsuid_core.server.on_core_shutdown", hooks.append)
+
+    async def _run():
+        await html_render.render_html_to_bytes("<p>a</p>")
+        await html_render.shutdown_render_pool()
+        await html_render.render_html_to_bytes("<p>b</p>")
+
+    asyncio.run(_run())
+    assert hooks == [html_render.shutdown_render_pool]
@@ -0,0 +1,76 @@
+"""延迟 i18n：lt() 与 t() 输出一致、被级别过滤的日志不渲染、模板缓存随 catalog 失效。"""
+
+import json
+
+import pytest
+
+from gsuid_core import i18n, logger as gs_logger
+from gsuid_core.i18n import LazyText, t, lt
+
+_BRACE_FIELD = i18n.re.compile(r"(?<!\{)\{([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class _Any:
+    """接受任意格式规格（``:.1f`` / ``:%Y-%m-%d`` …）的占位值。"""
+
+    def __format__(self, spec: str) -> str:
+        return f"<{spec}>"
+
+
+@pytest.fixture()
+def render_calls(monkeypatch):
+    calls = []
+    real = i18n._render
+
+    def _spy(key, lang, params):
+        calls.append(key)
+        return real(key, lang, params)
+
+    monkeypatch.setattr(i18n, "_render", _spy)
+    return calls
+
+
+def test_lazy_matches_eager_for_every_key(monkeypatch):
+    for lang in ("zh-cn", "en", "ja"):
+        for key, template in i18n._catalogs[lang].items():
+            params = {name: _Any() for name in _BRACE_FIELD.findall(template)}
+            assert str(lt(key, lang=lang, **params)) == t(key, lang=lang, **params), key
+    # 模板以占位符开头时 emoji 需在填充后判断
+    monkeypatch.setitem(i18n._catalogs["zh-cn"], "log.core.lazy_leading_field", "{x} 完成")
+    i18n._prepared.clear()
+    assert t("log.core.lazy_leading_field", lang="zh-cn", x="🎮 a") == "🎮 a 完成"
+    assert t("log.core.lazy_leading_field", lang="zh-cn", x="a") == f"{i18n.LOG_MODULE_EMOJI['core']} a 完成"
+    i18n._prepared.clear()
+
+
+def test_filtered_levels_are_never_rendered(monkeypatch, render_calls):
+    monkeypatch.setattr(gs_logger, "log_history", gs_logger.deque(maxlen=gs_logger.LOG_HISTORY_MAXLEN))
+    monkeypatch.setattr(gs_logger, "_log_subscribers", set())
+
+    gs_logger.logger.trace(lt("log.handler.same_msg_cd", user_id="u1"))
+    assert render_calls == []
+    assert not gs_logger.log_history
+
+    # 真正输出的日志在 handler 侧渲染，且多个 handler 只渲染一次
+    gs_logger.logger.warning(lt("log.handler.same_msg_cd", user_id="u2"))
+    assert render_calls == ["log.handler.same_msg_cd"]
+    assert "u2" in gs_logger.log_history[-1].gevent
+
+
+def test_prepared_cache_follows_plugin_locales(tmp_path):
+    key = "log.lazyplugin.hello"
+    lang_dir = tmp_path / "locales" / "zh-cn"
+    lang_dir.mkdir(parents=True)
+    (lang_dir / "logs.json").write_text(json.dumps({key: "你好 {name}"}), encoding="utf-8")
+    try:
+        assert t(key, lang="zh-cn", name="a").endswith(key)
+        i18n.register_plugin_locales("LazyPlugin", tmp_path / "locales")
+        assert t(key, lang="zh-cn", name="a").endswith("你好 a")
+
+        (lang_dir / "logs.json").write_text(json.dumps({key: "再见 {name}"}), encoding="utf-8")
+        i18n.register_plugin_locales("LazyPlugin", tmp_path / "locales", reload=True)
+        assert t(key, lang="zh-cn", name="b").endswith("再见 b")
+        assert isinstance(lt(key), LazyText) and lt(key, lang="zh-cn", name="c") == t(key, lang="zh-cn", name="c")
+    finally:
+        i18n.unregister_plugin_locales("LazyPlugin")
+    assert t(key, lang="zh-cn").endswith(key)
@@ -0,0 +1,159 @@
+"""出站图片编码：按内容选格式、平台字节预算、大图走进程池、编码结果缓存。"""
+
+import asyncio
+from io import BytesIO
+from types import SimpleNamespace
+from base64 import b64decode
+
+import pytest
+from PIL import Image, ImageDraw
+
+from gsuid_core import segment
+from gsuid_core.pool import to_thread
+from gsuid_core.models import Message
+from gsuid_core.utils.image import encoder
+
+
+class _Config:
+    def __init__(self, **data):
+        self.data = data
+
+    def get_config(self, key):
+        return SimpleNamespace(data=self.data[key])
+
+
+@pytest.fixture()
+def enc(monkeypatch):
+    config = _Config(
+        PicQuality=85,
+        PicAdaptiveEncode=True,
+        PicMaxKB=0,
+        PicMaxKBByBot=["qqgroup:40", "bad-entry"],
+        PicWebPBots=["telegram"],
+    )
+    monkeypatch.setattr(encoder, "pic_gen_config", config)
+    monkeypatch.setattr(encoder, "_cache", encoder.OrderedDict())
+    monkeypatch.setattr(encoder, "_cache_bytes", 0)
+    monkeypatch.setattr(encoder, "_stats", {"hits": 0, "misses": 0, "bytes_in": 0, "bytes_out": 0, "formats": {}})
+    return config
+
+
+def _card() -> Image.Image:
+    img = Image.new("RGBA", (600, 400), (245, 245, 250, 255))
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle((20, 20, 580, 380), 20, fill=(60, 90, 200))
+    draw.text((60, 60), "UID 100000001 签到成功", fill="white")
+    return img
+
+
+def _photo(size=(600, 600)) -> Image.Image:
+    return Image.effect_noise(size, 60).convert("RGB")
+
+
+def _fmt(data: bytes) -> str:
+    return Image.open(BytesIO(data)).format  # type: ignore
+
+
+def test_format_by_content_and_adapter(enc):
+    assert _fmt(encoder.encode_image_sync(_card())) == "PNG"
+    assert _fmt(encoder.encode_image_sync(_photo())) == "JPEG"
+
+    budget, webp = encoder.image_budget("telegram")
+    assert (budget, webp) == (0, True)
+    assert _fmt(encoder.encode_image_sync(_photo(), budget, webp)) == "WEBP"
+    assert encoder.image_budget("qqgroup") == (40 * 1024, False)
+
+    enc.data["PicAdaptiveEncode"] = False
+    assert _fmt(encoder.encode_image_sync(_card())) == "JPEG"
+
+
+def test_budget_and_cache(enc):
+    photo = _photo((900, 900))
+    data = encoder.encode_image_sync(photo, 40 * 1024)
+    assert len(data) <= 40 * 1024 and _fmt(data) == "JPEG"
+
+    assert encoder.encode_image_sync(photo.copy(), 40 * 1024) is data
+    stats = encoder.encode_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["cache_items"] == 1
+
+
+def test_large_canvas_uses_process_pool(enc, monkeypatch):
+    used = []
+
+    def fake_to_process(func):
+        used.append(func)
+        return to_thread(func)
+
+    monkeypatch.setattr(encoder, "to_process", fake_to_process)
+    monkeypatch.setattr(encoder, "LARGE_PIXELS", 500 * 500)
+
+    photo = _photo((600, 600))
+
+    async def _run():
+        small = await encoder.encode_image(_photo((200, 200)))
+        large = await encoder.encode_image(photo)
+        again = await encoder.encode_image(photo.copy())
+        return small, large, again
+
+    small, large, again = asyncio.run(_run())
+    # 大图只在进程池里编码一次，相同内容直接命中缓存
+    assert used == [encoder.encode_in_process]
+    assert _fmt(small) == _fmt(large) == "JPEG" and again is large
+
+
+def test_convert_message_honors_adapter_budget(enc, monkeypatch):
+    buffer = BytesIO()
+    _photo((900, 900)).save(buffer, format="PNG")
+    raw = buffer.getvalue()
+    assert len(raw) > 40 * 1024
+
+    async def fake_global_val(bot_id, bot_self_id):
+        return {"image": 0}
+
+    monkeypatch.setattr(segment, "get_global_val", fake_global_val)
+    monkeypatch.setattr(
+        segment, "send_pic_config", SimpleNamespace(get_config=lambda *_: SimpleNamespace(data="base64"))
+    )
+    monkeypatch.setattr(segment, "image_budget", encoder.image_budget)
+
+    async def _run(bot_id):
+        return await segment._convert_message_to_image(Message(type="image", data=raw), bot_id, "")
+
+    limited = asyncio.run(_run("qqgroup"))[0].data
+    assert len(b64decode(limited[9:])) <= 40 * 1024
+
+    unlimited = asyncio.run(_run("onebot"))[0].data
+    assert b64decode(unlimited[9:]) == raw
+
+
+def test_first_encode_uses_target_budget(enc, monkeypatch):
+    from gsuid_core.utils.image import convert
+
+    monkeypatch.setattr(convert, "image_budget", encoder.image_budget)
+    photo = _photo((900, 900))
+
+    async def _run():
+        webp = await convert.convert_img(photo, bot_id="telegram")
+        limited = await convert.convert_img(photo, bot_id="qqgroup")
+        return webp, limited
+
+    webp, limited = asyncio.run(_run())
+    assert _fmt(webp) == "WEBP"
+    assert _fmt(limited) == "JPEG" and len(limited) <= 40 * 1024
+
+    async def fake_global_val(bot_id, bot_self_id):
+        return {"image": 0}
+
+    async def no_refit(*args):
+        raise AssertionError("已按预算编码的图片不应再次压缩")
+
+    monkeypatch.setattr(segment, "is_text2pic", True)
+    monkeypatch.setattr(segment, "fit_image_bytes", no_refit)
+    monkeypatch.setattr(segment, "get_global_val", fake_global_val)
+    monkeypatch.setattr(
+        segment, "send_pic_config", SimpleNamespace(get_config=lambda *_: SimpleNamespace(data="base64"))
+    )
+    monkeypatch.setattr(segment, "image_budget", lambda bot_id: (1, False))
+
+    msgs = asyncio.run(segment._convert_message_to_image(Message(type="text", data="你好"), "qqgroup", ""))
+    assert msgs[0].type == "image"
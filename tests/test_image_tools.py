@@ -0,0 +1,66 @@
+"""绘图基础函数：查表/缓存实现与旧实现输出一致，素材缓存有上限并跟随文件变化。"""
+
+import asyncio
+
+import pytest
+from PIL import Image, ImageChops
+
+from gsuid_core.utils.image import image_tools
+from benchmarks.bench_image_tools import (
+    legacy_tint_image,
+    legacy_get_color_bg,
+    legacy_shift_image_hue,
+    legacy_draw_pic_with_ring,
+)
+
+
+@pytest.fixture()
+def pic():
+    img = Image.effect_mandelbrot((160, 120), (-2, -1, 1, 1), 64).convert("RGB")
+    img = Image.merge("RGBA", (*img.split(), Image.linear_gradient("L").resize((160, 120))))
+    return img
+
+
+def _same(a: Image.Image, b: Image.Image) -> bool:
+    return a.mode == b.mode and a.size == b.size and ImageChops.difference(a, b).getbbox() is None
+
+
+def test_shift_image_hue_matches_legacy(pic):
+    for angle in (0, 30, 200):
+        assert _same(asyncio.run(image_tools.shift_image_hue(pic, angle)), legacy_shift_image_hue(pic, angle))
+
+
+def test_tint_and_ring_match_legacy(pic):
+    assert _same(image_tools.tint_image(pic, (10, 200, 30)), legacy_tint_image(pic, (10, 200, 30)))
+    for _ in range(2):
+        assert _same(asyncio.run(image_tools.draw_pic_with_ring(pic, 120)), legacy_draw_pic_with_ring(pic, 120))
+
+
+def test_color_bg_matches_legacy_and_is_not_shared():
+    color = (90, 120, 160)
+    expected = legacy_get_color_bg(170, 380, color)
+    first = asyncio.run(image_tools.get_color_bg(170, 380, image_tools.BG_PATH, color=color))
+    second = asyncio.run(image_tools.get_color_bg(170, 380, image_tools.BG_PATH, color=color))
+    assert _same(first, expected) and _same(second, expected)
+    # 缓存的背景不能被调用方的修改污染
+    first.paste((0, 0, 0, 255), (0, 0, 170, 380))
+    assert _same(asyncio.run(image_tools.get_color_bg(170, 380, image_tools.BG_PATH, color=color)), expected)
+
+
+def test_asset_cache_bounded_and_follows_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(image_tools, "_assets", image_tools.ImageLRU(400 * 1024))
+
+    for size in range(100, 200, 10):
+        image_tools.get_asset(image_tools.TEXT_PATH / "mask.png", (size, size))
+    stats = image_tools.asset_cache_stats()
+    assert 0 < stats["items"] < 10 and stats["bytes"] <= 400 * 1024
+
+    bg_dir = tmp_path / "bg"
+    bg_dir.mkdir()
+    Image.new("RGBA", (50, 50), (255, 0, 0, 255)).save(bg_dir / "a.png")
+    ci = image_tools.CustomizeImage(bg_dir)
+    assert ci.get_image(None, 20, 20).getpixel((0, 0)) == (255, 0, 0, 255)
+
+    (bg_dir / "a.png").unlink()
+    Image.new("RGBA", (50, 50), (0, 0, 255, 255)).save(bg_dir / "b.png")
+    assert ci.get_image(None, 20, 20).getpixel((0, 0)) == (0, 0, 255, 255)
@@ -0,0 +1,174 @@
+"""知识库本地清单：启动同步只比对清单（不 scroll 向量库）、点数或点 ID 漂移时重建、列表分页与关键词过滤走 SQL。"""
+
+import asyncio
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import gsuid_core.ai_core.rag.base as rag_base
+import gsuid_core.ai_core.database.models as ai_models
+from gsuid_core.ai_core.rag import knowledge
+from gsuid_core.utils.database import base_models
+from gsuid_core.ai_core.rag.base import KNOWLEDGE_COLLECTION_NAME, get_point_id, calculate_hash
+from gsuid_core.ai_core.database.models import AIKnowledgeChunk
+
+DIM = 4
+
+
+class _FakeEmbedding:
+    def __init__(self) -> None:
+        self.texts: list = []
+
+    async def aembed(self, texts: list) -> list:
+        self.texts.extend(texts)
+        return [[float(len(t)), 1.0, 0.5, 0.25] for t in texts]
+
+
+class _CountingClient(AsyncQdrantClient):
+    scrolls = 0
+
+    async def scroll(self, *args, **kwargs):
+        self.scrolls += 1
+        return await super().scroll(*args, **kwargs)
+
+
+class _Config:
+    data = True
+
+
+def _entity(idx: int, content: str = "正文") -> dict:
+    return {
+        "id": f"kp{idx}",
+        "plugin": "demo" if idx < 20 else "other",
+        "title": f"条目{idx}",
+        "content": f"{content}{idx}",
+        "tags": ["演示"],
+        "entity": f"实体{idx}",
+    }
+
+
+@pytest.fixture()
+def kb_env(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'kb.db'}")
+
+    async def _create():
+        async with engine.begin() as conn:
+            tables = [AIKnowledgeChunk.__table__]
+            await conn.run_sync(lambda c: AIKnowledgeChunk.metadata.create_all(c, tables=tables))  # type: ignore
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(ai_models, "_knowledge_table_ensured", True)
+
+    embedding = _FakeEmbedding()
+    monkeypatch.setattr(rag_base, "embedding_model", embedding)
+    monkeypatch.setattr(knowledge, "_sparse_embed_batch_async", lambda texts: _no_sparse(texts))
+    monkeypatch.setattr(knowledge, "_ENTITIES", [])
+    from gsuid_core.ai_core.configs.ai_config import ai_config
+
+    monkeypatch.setattr(ai_config, "get_config", lambda key: _Config())
+    yield embedding
+    asyncio.run(engine.dispose())
+
+
+async def _no_sparse(texts: list) -> list:
+    return [None] * len(texts)
+
+
+async def _qdrant(monkeypatch) -> _CountingClient:
+    client = _CountingClient(location=":memory:")
+    await client.create_collection(
+        KNOWLEDGE_COLLECTION_NAME,
+        vectors_config=knowledge._knowledge_vectors_config(DIM),
+        sparse_vectors_config=knowledge._knowledge_sparse_config(),
+    )
+    monkeypatch.setattr(rag_base, "client", client)
+    return client
+
+
+def _legacy_point(entity: dict) -> PointStruct:
+    payload = dict(entity, _hash=calculate_hash(dict(entity)), source="plugin")
+    return PointStruct(id=get_point_id(entity["id"]), vector={"dense": [1.0, 0.0, 0.0, 0.0]}, payload=payload)
+
+
+def test_sync_diffs_manifest_without_scrolling(kb_env, monkeypatch):
+    embedding = kb_env
+    entities = [_entity(i) for i in range(25)]
+
+    async def _run():
+        client = await _qdrant(monkeypatch)
+        # 升级前的库：向量已在、清单为空（含一条已下线的插件知识）
+        await client.upsert(
+            KNOWLEDGE_COLLECTION_NAME, [_legacy_point(e) for e in entities[:24]] + [_legacy_point(_entity(99))]
+        )
+        knowledge._ENTITIES[:] = entities
+
+        await knowledge.sync_knowledge()
+        first = (list(embedding.texts), client.scrolls, (await client.count(KNOWLEDGE_COLLECTION_NAME)).count)
+
+        # 清单与向量库一致：只改一条，且不再 scroll
+        embedding.texts.clear()
+        scrolls = client.scrolls
+        knowledge._ENTITIES[3] = _entity(3, "新正文")
+        await knowledge.sync_knowledge()
+        second = (list(embedding.texts), client.scrolls - scrolls)
+
+        # 向量库被外部清掉一个点：点数不符 → 一次 scroll 重建清单并补嵌
+        embedding.texts.clear()
+        await client.delete(KNOWLEDGE_COLLECTION_NAME, [get_point_id("kp7")])
+        await knowledge.sync_knowledge()
+        third = list(embedding.texts)
+
+        # 点数不变的漂移：丢一个点、又多出一个无关点 → retrieve 发现清单中的点缺失，重建并补嵌
+        embedding.texts.clear()
+        await client.delete(KNOWLEDGE_COLLECTION_NAME, [get_point_id("kp9")])
+        await client.upsert(KNOWLEDGE_COLLECTION_NAME, [_legacy_point(_entity(98))])
+        await knowledge.sync_knowledge()
+        fourth = list(embedding.texts)
+        stray = await client.retrieve(KNOWLEDGE_COLLECTION_NAME, [get_point_id("kp98")])
+        assert not stray and (await client.count(KNOWLEDGE_COLLECTION_NAME)).count == 25
+        return first, second, third, fourth, await AIKnowledgeChunk.manifest("plugin")
+
+    first, second, third, fourth, manifest = asyncio.run(_run())
+    texts, scrolls, count = first
+    assert len(texts) == 1 and "条目24" in texts[0]
+    assert scrolls >= 1 and count == 25
+    assert second[0] == [knowledge.build_knowledge_text(_entity(3, "新正文"))] and second[1] == 0  # type: ignore[arg-type]
+    assert len(third) == 1 and "条目7" in third[0]
+    assert len(fourth) == 1 and "条目9" in fourth[0]
+    assert sorted(manifest) == sorted(e["id"] for e in entities)
+    assert manifest["kp3"] == (calculate_hash(_entity(3, "新正文")), get_point_id("kp3"))
+
+
+def test_list_is_served_from_manifest(kb_env, monkeypatch):
+    entities = [_entity(i) for i in range(25)]
+
+    async def _run():
+        client = await _qdrant(monkeypatch)
+        knowledge._ENTITIES[:] = entities
+        await knowledge.sync_knowledge()
+        await AIKnowledgeChunk.upsert_many(
+            [AIKnowledgeChunk(id="m1", doc_id="m1", title="手动 100%", content="手写笔记", source="manual")]
+        )
+        scrolls = client.scrolls
+        pages = [
+            await knowledge.get_manual_knowledge_list(offset=0, limit=10, source_filter="plugin"),
+            await knowledge.get_manual_knowledge_list(offset=20, limit=10, source_filter="plugin"),
+            await knowledge.get_manual_knowledge_list(source_filter="all", keyword="条目2"),
+            await knowledge.get_manual_knowledge_list(source_filter="all", keyword="100%"),
+            await knowledge.get_manual_knowledge_list(source_filter="plugin", doc_id="other"),
+        ]
+        return pages, await knowledge.get_manual_knowledge_detail("kp21"), client.scrolls - scrolls
+
+    (first, last, kw, literal, by_plugin), detail, scrolls = asyncio.run(_run())
+    assert scrolls == 0
+    assert first["total"] == 25 and len(first["list"]) == 10 and first["next_offset"] == 10
+    assert len(last["list"]) == 5 and last["next_offset"] is None
+    # 插件行按注册表还原完整条目（含扩展字段）
+    assert first["list"][0]["entity"].startswith("实体") and first["list"][0]["source"] == "plugin"
+    assert {r["id"] for r in kw["list"]} == {"kp2"} | {f"kp{i}" for i in range(20, 25)}
+    assert [r["id"] for r in literal["list"]] == ["m1"]
+    assert by_plugin["total"] == 5
+    assert detail is not None and detail["entity"] == "实体21" and detail["_hash"] == calculate_hash(_entity(21))
@@ -0,0 +1,69 @@
+"""压测工具的确定性与回复关联：同一 seed 同一负载序列，回复按 msg_id 归属。"""
+
+import asyncio
+
+import pytest
+from msgspec import json as msgjson
+
+from gsuid_core.models import MessageSend
+from benchmarks.loadgen import Workload, FakeAdapter, compare, parse_mix, _percentile, use_scratch_database
+from gsuid_core.utils.database import base_models
+
+
+def test_parse_mix():
+    assert parse_mix("command=3, image") == {"command": 3.0, "image": 1.0}
+    with pytest.raises(Exception):
+        parse_mix("unknown=1")
+
+
+def test_workload_is_reproducible():
+    mix = parse_mix("command=1,keyword=1,regex=1,nomatch=1,image=1")
+    a = Workload(mix, users=10, groups=3, images=2, image_kb=1, seed=7)
+    b = Workload(mix, users=10, groups=3, images=2, image_kb=1, seed=7)
+    seq_a = [a.next() for _ in range(50)]
+    seq_b = [b.next() for _ in range(50)]
+    assert [(k, m.msg_id, m.group_id, m.user_id) for k, m in seq_a] == [
+        (k, m.msg_id, m.group_id, m.user_id) for k, m in seq_b
+    ]
+    assert {k for k, _ in seq_a} == set(mix)
+    image = next(m for k, m in seq_a if k == "image")
+    assert [c.type for c in image.content] == ["text", "image", "image"]
+
+
+def test_fake_adapter_correlates_by_msg_id():
+    async def _run():
+        adapter = FakeAdapter()
+        adapter.expect("lg-1", "command", 0.0)
+        adapter.expect("lg-2", "regex", 0.0)
+        # 乱序回复、多帧回复与无 msg_id 的日志帧
+        await adapter.send_bytes(msgjson.encode(MessageSend(msg_id="lg-2")))
+        await adapter.send_bytes(msgjson.encode(MessageSend(msg_id="lg-2")))
+        await adapter.send_bytes(msgjson.encode(MessageSend()))
+        assert list(adapter.pending) == ["lg-1"]
+        assert len(adapter.latency["regex"]) == 1 and adapter.frames == 3
+
+    asyncio.run(_run())
+
+
+def test_percentile_and_compare():
+    values = [float(i) for i in range(1, 101)]
+    assert _percentile(values, 50) == 50.0
+    assert _percentile(values, 99) == 99.0
+    assert _percentile([], 99) == 0.0
+
+    base = {"triggers": {"command": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 40.0}}, "throughput": {"reply_rps": 100}}
+    cur = {"triggers": {"command": {"p50_ms": 11.0, "p95_ms": 20.0, "p99_ms": 80.0}}, "throughput": {"reply_rps": 50}}
+    lines = compare(base, cur)
+    assert any("p99_ms" in line and "+100.0%" in line for line in lines)
+    assert any("reply_rps" in line and "-50.0%" in line for line in lines)
+
+
+def test_scratch_database_never_points_at_production(monkeypatch, tmp_path):
+    for name in ("_db_type", "sync_url", "base_url", "db_url"):
+        monkeypatch.setattr(base_models, name, getattr(base_models, name, ""))
+    explicit = use_scratch_database(str(tmp_path / "sub" / "lg.db"))
+    assert base_models.db_url == str(explicit) and explicit.parent.is_dir()
+    scratch = use_scratch_database(None)
+    assert base_models._db_type == "sqlite" and base_models.db_url == str(scratch)
+    assert scratch != base_models.DB_PATH and scratch.parent.name.startswith("gscore-loadgen-")
+    scratch.parent.rmdir()
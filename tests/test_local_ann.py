@@ -0,0 +1,189 @@
+"""本地 ANN：IVF + int8 索引的召回 / scope 预过滤 / 增删，及 LocalAnnQdrantClient 与原生本地 Qdrant 结果一致。"""
+
+import asyncio
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Range,
+    Filter,
+    Fusion,
+    Distance,
+    MatchAny,
+    Prefetch,
+    FusionQuery,
+    PointStruct,
+    PointIdsList,
+    SparseVector,
+    VectorParams,
+    FieldCondition,
+    HasIdCondition,
+    SparseVectorParams,
+)
+
+from gsuid_core.ai_core.rag import local_ann
+from gsuid_core.ai_core.rag.local_ann import IVFIndex, LocalAnnQdrantClient
+
+
+def _corpus(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(64, dim))
+    return (centers[rng.integers(0, 64, n)] + 0.35 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def _exact_top(vectors: np.ndarray, q: np.ndarray, k: int, rows=None) -> list:
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normed @ (q / np.linalg.norm(q))
+    if rows is not None:
+        mask = np.full(len(vectors), -np.inf)
+        mask[rows] = 0
+        scores = scores + mask
+    return np.argsort(-scores)[:k].tolist()
+
+
+def test_ivf_recall_prefilter_and_incremental_updates(monkeypatch):
+    vectors = _corpus(8000, 32)
+    scopes = [f"group:{i % 40}" for i in range(8000)]
+    index = IVFIndex.build(list(range(8000)), vectors, scopes)
+    assert index.trained and not index.needs_rebuild
+
+    queries = _corpus(50, 32, seed=1)
+    recall = np.mean([len({i for i, _ in index.search(q, 10)} & set(_exact_top(vectors, q, 10))) / 10 for q in queries])
+    assert recall >= 0.9
+
+    # scope 预过滤：只返回指定 scope，且小集合直接扫描，结果精确
+    in_scope = [i for i, s in enumerate(scopes) if s in ("group:3", "group:7")]
+    hits = index.search(queries[0], 10, scopes=["group:3", "group:7", "missing"])
+    assert [i for i, _ in hits] == _exact_top(vectors, queries[0], 10, rows=in_scope)
+    assert index.search(queries[0], 10, scopes=["missing"]) == []
+    # 命中行较多时在 IVF 探查中按掩码过滤
+    monkeypatch.setattr(local_ann, "FLAT_SCAN_ROWS", 100)
+    wide = [f"group:{i}" for i in range(20)]
+    masked = index.search(queries[0], 10, scopes=wide)
+    assert len(masked) == 10 and all(scopes[i] in wide for i, _ in masked)
+    monkeypatch.undo()
+
+    # 增量：删除 / 排除 / 覆盖写入
+    top = hits[0][0]
+    index.remove([top])
+    assert top not in {i for i, _ in index.search(queries[0], 10, scopes=["group:3", "group:7"])}
+    second = hits[1][0]
+    assert second not in {i for i, _ in index.search(queries[0], 10, scopes=["group:3"], exclude=[second])}
+    index.add(["new"], [queries[0]], ["group:99"])
+    assert index.search(queries[0], 1, scopes=["group:99"])[0][0] == "new"
+    index.add(["new"], [queries[1]], ["group:98"])
+    assert index.search(queries[0], 5, scopes=["group:99"]) == []
+    assert len(index) == 8000
+
+
+def test_untrained_index_and_rebuild_triggers():
+    index = IVFIndex.build([], np.empty((0, 8), dtype=np.float32), [])
+    assert not index.trained and index.search(np.ones(8), 3) == []
+    index.add(list(range(10)), np.eye(10, 8, dtype=np.float32) + 0.01, ["s"] * 10)
+    assert index.search(np.eye(8)[2], 1)[0][0] == 2
+    index.remove(list(range(10)))
+    assert len(index) == 0 and not index.needs_rebuild
+
+
+def _make_points(n: int, dim: int) -> tuple:
+    vectors = _corpus(n, dim, seed=2)
+    points = [
+        PointStruct(
+            id=i,
+            vector={"dense": vectors[i].tolist(), "sparse": SparseVector(indices=[i % 7, 10], values=[1.0, 0.5])},
+            payload={"scope_key": f"s{i % 5}", "content": f"c{i}", "valid_at_ts": float(i)},
+        )
+        for i in range(n)
+    ]
+    return vectors, points
+
+
+async def _setup(client: AsyncQdrantClient, points: list, dim: int) -> None:
+    await client.create_collection(
+        "mem",
+        vectors_config={"dense": VectorParams(size=dim, distance=Distance.COSINE)},
+        sparse_vectors_config={"sparse": SparseVectorParams()},
+    )
+    await client.upsert("mem", points)
+
+
+def test_client_matches_local_qdrant():
+    dim = 16
+    vectors, points = _make_points(600, dim)
+    q = _corpus(3, dim, seed=9)
+
+    async def _run():
+        plain = AsyncQdrantClient(location=":memory:")
+        ann = LocalAnnQdrantClient(location=":memory:")
+        await _setup(plain, points, dim)
+        await _setup(ann, points, dim)
+        scope = Filter(must=[FieldCondition(key="scope_key", match=MatchAny(any=["s1", "s3"]))])
+
+        # 首次查询：索引未就绪，原样走 Qdrant 并在后台构建
+        first = await ann.query_points("mem", query=q[0].tolist(), using="dense", query_filter=scope, limit=5)
+        index = await ann.build_ann_index("mem", "dense")
+        assert index is not None and len(index) == 600
+
+        results = []
+        for client in (plain, ann):
+            dense = await client.query_points(
+                "mem", query=q[0].tolist(), using="dense", query_filter=scope, limit=5, score_threshold=0.0
+            )
+            excluded = Filter(must=scope.must, must_not=[HasIdCondition(has_id=[p.id for p in dense.points[:2]])])
+            dense_excl = await client.query_points(
+                "mem", query=q[0].tolist(), using="dense", query_filter=excluded, limit=5, with_vectors=["dense"]
+            )
+            fused = await client.query_points(
+                "mem",
+                prefetch=[
+                    Prefetch(query=q[1].tolist(), using="dense", filter=scope, limit=10),
+                    Prefetch(query=SparseVector(indices=[3], values=[1.0]), using="sparse", filter=scope, limit=10),
+                ],
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=5,
+            )
+            ranged = await client.query_points(
+                "mem",
+                query=q[2].tolist(),
+                using="dense",
+                query_filter=Filter(must=[FieldCondition(key="valid_at_ts", range=Range(lte=50))]),
+                limit=3,
+            )
+            results.append((dense, dense_excl, fused, ranged))
+        await ann.delete("mem", PointIdsList(points=[results[1][0].points[0].id]))
+        after_delete = await ann.query_points("mem", query=q[0].tolist(), using="dense", query_filter=scope, limit=5)
+        return first, results, after_delete
+
+    first, (expected, got), after_delete = asyncio.run(_run())
+    assert [p.id for p in first.points] == [p.id for p in expected[0].points]
+    for exp, act in zip(expected, got):
+        assert [p.id for p in act.points] == [p.id for p in exp.points]
+        assert np.allclose([p.score for p in act.points], [p.score for p in exp.points], atol=1e-5)
+    assert all(p.payload and p.payload["scope_key"] in ("s1", "s3") for p in got[0].points)
+    assert got[1].points[0].vector is not None and "dense" in got[1].points[0].vector
+    assert [p.id for p in after_delete.points][:4] == [p.id for p in expected[0].points[1:]]
+
+
+def test_client_upsert_after_build_and_invalidation():
+    dim = 16
+    _vectors, points = _make_points(200, dim)
+    target = np.zeros(dim, dtype=np.float32)
+    target[0] = 1.0
+
+    async def _run():
+        client = LocalAnnQdrantClient(location=":memory:")
+        await _setup(client, points, dim)
+        await client.build_ann_index("mem", "dense")
+        await client.upsert(
+            "mem", [PointStruct(id=999, vector={"dense": target.tolist()}, payload={"scope_key": "fresh"})]
+        )
+        only_fresh = Filter(must=[FieldCondition(key="scope_key", match=MatchAny(any=["fresh"]))])
+        hit = await client.query_points("mem", query=target.tolist(), using="dense", query_filter=only_fresh)
+        await client.set_payload("mem", payload={"scope_key": "moved"}, points=[999])
+        assert ("mem", "dense") not in client._ann
+        fallback = await client.query_points("mem", query=target.tolist(), using="dense", query_filter=only_fresh)
+        return hit, fallback
+
+    hit, fallback = asyncio.run(_run())
+    assert [p.id for p in hit.points] == [999] and abs(hit.points[0].score - 1.0) < 1e-6
+    assert fallback.points == []
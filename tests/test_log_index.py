@@ -0,0 +1,106 @@
+"""日志索引：增量尾随、级别/trace_id/全文过滤、游标分页与按小时预聚合。"""
+
+import json
+
+import pytest
+
+from gsuid_core.webconsole.log_index import LogIndex
+
+
+def _line(i: int, level: str = "info", trace_id=None, hour: int = 4) -> str:
+    ev = {"event": f"消息 {i} payload-{i % 7}", "level": level, "timestamp": f"10-18 {hour:02d}:00:{i % 60:02d}"}
+    if trace_id:
+        ev["trace_id"] = trace_id
+    return json.dumps(ev, ensure_ascii=False) + "\n"
+
+
+@pytest.fixture()
+def index(tmp_path):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    idx = LogIndex(tmp_path / "index.db", logs)
+    yield idx, logs
+    idx.close()
+
+
+def test_incremental_tail_and_partial_line(index):
+    idx, logs = index
+    path = logs / "2026-10-18.log"
+    path.write_text("".join(_line(i) for i in range(1, 101)), encoding="utf-8")
+    assert idx.sync() == 100
+    assert idx.sync() == 0
+
+    # 正在写入的半行不入索引，补全后再追加
+    half = _line(101, "error")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(half[:20])
+    assert idx.sync() == 0
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(half[20:])
+    assert idx.sync() == 1
+
+    rows, _ = idx.query("2026-10-18", "2026-10-18", level="error")
+    assert [r["line"] for r in rows] == [101]
+
+    # 文件被截断重建时整日重建；文件被删除时索引一并清理
+    path.write_text(_line(1, "debug"), encoding="utf-8")
+    assert idx.sync() == 1
+    assert idx.count("2026-10-18", "2026-10-18") == 1
+    path.unlink()
+    idx.sync()
+    assert idx.count("2026-10-18", "2026-10-18") == 0
+
+
+def test_filters_cursor_and_stats(index):
+    idx, logs = index
+    (logs / "2026-10-17.log").write_text("".join(_line(i, "warning", hour=23) for i in range(1, 11)), encoding="utf-8")
+    (logs / "2026-10-18.log").write_text(
+        "".join(_line(i, "error" if i % 10 == 0 else "info", "abc" if i < 5 else None) for i in range(1, 201))
+        + "not json\n",
+        encoding="utf-8",
+    )
+    idx.sync()
+
+    assert idx.count("2026-10-17", "2026-10-18") == 211
+    assert idx.count("2026-10-18", "2026-10-18", level="error") == 20
+    assert idx.count("2026-10-17", "2026-10-18", trace_id="abc") == 4
+    # 全文检索（trigram）与短关键词的 LIKE 回退结果一致
+    assert idx.count("2026-10-18", "2026-10-18", search="PAYLOAD-3") == len([i for i in range(1, 201) if i % 7 == 3])
+    assert idx.count("2026-10-18", "2026-10-18", search="消息") == 200
+    assert idx.count("2026-10-18", "2026-10-18", search="not js") == 1
+
+    seen = []
+    cursor = None
+    while True:
+        rows, cursor = idx.query("2026-10-17", "2026-10-18", limit=32, cursor=cursor)
+        seen.extend((r["date"], r["line"]) for r in rows)
+        if cursor is None:
+            break
+    assert len(seen) == 211 and seen == sorted(seen) and seen[0] == ("2026-10-17", 1)
+
+    page, _ = idx.query("2026-10-17", "2026-10-18", limit=5, offset=10)
+    assert [(r["date"], r["line"]) for r in page] == seen[10:15]
+
+    assert idx.level_counts("2026-10-18", "2026-10-18") == {"info": 181, "warn": 0, "error": 20, "debug": 0}
+    hourly = idx.hourly("2026-10-17", "2026-10-18")
+    assert [(h["date"], h["hour"], h["warn"], h["info"]) for h in hourly] == [
+        ("2026-10-17", 23, 10, 0),
+        ("2026-10-18", 0, 0, 1),
+        ("2026-10-18", 4, 0, 180),
+    ]
+
+    target, before, after, total = idx.context("2026-10-18", 3, 5, 2)
+    assert target is not None and target["trace_id"] == "abc"
+    assert [r["line"] for r in before] == [1, 2] and [r["line"] for r in after] == [4, 5] and total == 201
+
+
+def test_format_log_keeps_response_shape(index):
+    from gsuid_core.webconsole.logs_api import _format_log
+
+    idx, logs = index
+    (logs / "2026-10-18.log").write_text(_line(1, trace_id="abc"), encoding="utf-8")
+    idx.sync()
+    rows, _ = idx.query("2026-10-18", "2026-10-18", limit=1)
+    row = _format_log(rows[0])
+    assert set(row) == {"log_id", "date", "timestamp", "level", "source", "message", "details", "trace_id"}
+    assert row["details"] is None and row["trace_id"] == "abc"
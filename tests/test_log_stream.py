@@ -0,0 +1,97 @@
+"""SSE 实时日志：写入方主动推送、跨线程唤醒、慢消费者丢弃并补发缺口提示、按序号续传。"""
+
+import json
+import asyncio
+import threading
+
+import pytest
+
+from gsuid_core import logger as gs_logger
+from gsuid_core.logger import LogRecord
+
+
+@pytest.fixture(autouse=True)
+def clean_history(monkeypatch):
+    monkeypatch.setattr(gs_logger, "log_history", gs_logger.deque(maxlen=gs_logger.LOG_HISTORY_MAXLEN))
+    monkeypatch.setattr(gs_logger, "log_history_chars", 0)
+    monkeypatch.setattr(gs_logger, "log_seq", 0)
+    monkeypatch.setattr(gs_logger, "_log_subscribers", set())
+
+
+def _push(n: int, level: str = "info", start: int = 0):
+    for i in range(start, start + n):
+        gs_logger._history_append(LogRecord(level=level, gevent=f"msg-{i}", timestamp="10-18 04:00:00"))
+
+
+def _parse(chunk: str):
+    ev_id = None
+    for line in chunk.splitlines():
+        if line.startswith("id: "):
+            ev_id = int(line[4:])
+        elif line.startswith("data: "):
+            return ev_id, json.loads(line[6:])
+    return ev_id, None
+
+
+async def _take(agen, n: int, timeout: float = 1.0):
+    return [_parse(await asyncio.wait_for(agen.__anext__(), timeout)) for _ in range(n)]
+
+
+def test_replay_then_push_without_polling():
+    async def _run():
+        _push(3)
+        agen = gs_logger.read_log(levels=["INFO"])
+        replay = await _take(agen, 3)
+        assert [ev_id for ev_id, _ in replay] == [0, 1, 2]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        _push(1, "debug", 3)
+        _push(1, "info", 4)
+        ((ev_id, data),) = await _take(agen, 1)
+        # 被级别过滤的 debug 不推送；新日志无需等轮询周期即可到达
+        assert ev_id == 4 and data["message"] == "msg-4"
+        assert loop.time() - start < 0.5
+
+        # 线程池里打的日志同样能唤醒
+        thread = threading.Thread(target=_push, args=(1, "info", 5))
+        thread.start()
+        thread.join()
+        ((ev_id, _),) = await _take(agen, 1)
+        assert ev_id == 5
+        await agen.aclose()
+        assert not gs_logger._log_subscribers
+
+    asyncio.run(_run())
+
+
+def test_slow_consumer_gets_gap_marker(monkeypatch):
+    monkeypatch.setattr(gs_logger, "SSE_SUBSCRIBER_BUFFER", 10)
+
+    async def _run():
+        agen = gs_logger.read_log()
+        first = asyncio.ensure_future(agen.__anext__())
+        await asyncio.sleep(0)
+        _push(25)
+        gap_id, gap = _parse(await asyncio.wait_for(first, 1))
+        assert gap_id is None and gap["message_type"] == "gap" and gap["dropped"] == 15
+        rest = await _take(agen, 10)
+        assert [ev_id for ev_id, _ in rest] == list(range(15, 25))
+        await agen.aclose()
+
+    asyncio.run(_run())
+
+
+def test_resume_from_last_event_id():
+    async def _run():
+        _push(5)
+        agen = gs_logger.read_log(last_event_id="2")
+        assert [ev_id for ev_id, _ in await _take(agen, 2)] == [3, 4]
+        await agen.aclose()
+
+        # 来自上个进程的大序号退回从最旧一条回放
+        agen = gs_logger.read_log(last_event_id="999")
+        assert [ev_id for ev_id, _ in await _take(agen, 5)] == [0, 1, 2, 3, 4]
+        await agen.aclose()
+
+    asyncio.run(_run())
@@ -28,6 +28,8 @@ _LOG_METHODS = {
     "exception",
     "log",
 }
+# t() 与其延迟版 lt() 都算接入 i18n
+_I18N_FUNCS = {"t", "lt"}
 _LOGGER_CHAIN_METHODS = {"bind", "new", "unbind", "opt", "patch", "contextualize"}
 _BRACE_FIELD_RE = re.compile(r"(?<!\{)\{([A-Za-z_][A-Za-z0-9_]*)(![rsa])?(?::([^{}]*))?\}(?!\})")
 _PRINTF_FIELD_RE = re.compile(
@@ -59,7 +61,7 @@ class _ScopeBuilder(ast.NodeVisitor):
     def __init__(self, own_i18n_t: bool = False) -> None:
         self.module_scope = _Scope()
         if own_i18n_t:
-            self.module_scope.i18n_names.add("t")
+            self.module_scope.i18n_names.update(_I18N_FUNCS)
         self.current = self.module_scope
         self.scopes: Dict[int, _Scope] = {}
 
@@ -136,7 +138,7 @@ class _ScopeBuilder(ast.NodeVisitor):
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         for item in node.names:
             bound = item.asname or item.name
-            if node.module == "gsuid_core.i18n" and item.name == "t":
+            if node.module == "gsuid_core.i18n" and item.name in _I18N_FUNCS:
                 self.current.i18n_names.add(bound)
             elif node.module == "gsuid_core.logger" and item.name == "logger":
                 self.current.logger_names.add(bound)
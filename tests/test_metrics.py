@@ -0,0 +1,128 @@
+"""运行指标：按线程分片的无锁直方图、Prometheus 文本导出、/metrics 访问控制与发送路径打点。"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from gsuid_core import metrics
+from gsuid_core.metrics import Counter, Histogram
+from gsuid_core.send_scheduler import SendScheduler
+
+
+def test_histogram_merges_thread_shards():
+    hist = Histogram("t_latency_seconds", "测试", ("kind",), buckets=(0.01, 0.1, 1.0))
+
+    def _observe(n: int) -> None:
+        for i in range(n):
+            hist.observe(0.05 if i % 2 else 0.005, "a")
+
+    threads = [threading.Thread(target=_observe, args=(1000,)) for _ in range(4)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    hist.observe(5.0, "a")
+    hist.observe(0.01, 'b"\n')
+
+    cumulative, total = hist.snapshot("a")
+    assert cumulative == [2000, 4000, 4000, 4001]
+    assert abs(total - (2000 * 0.05 + 2000 * 0.005 + 5.0)) < 1e-6
+    # 已退出线程的分片并入汇总，只剩主线程的分片
+    assert len(hist._shards) == 1 and hist._retired[("a",)][-1] > 0
+
+    lines = hist.render()
+    assert 't_latency_seconds_bucket{kind="a",le="0.1"} 4000' in lines
+    assert 't_latency_seconds_bucket{kind="a",le="+Inf"} 4001' in lines
+    assert 't_latency_seconds_count{kind="a"} 4001' in lines
+    # le 为上界（含）；标签值转义
+    assert 't_latency_seconds_bucket{kind="b\\"\\n",le="0.01"} 1' in lines
+
+
+def test_render_exposition_format(monkeypatch):
+    monkeypatch.setattr(metrics, "_registry", {})
+    hist = metrics.histogram("t_wait_seconds", "等待", buckets=(1.0,))
+    assert metrics.histogram("t_wait_seconds", "等待") is hist
+    count = metrics.counter("t_events", "事件数", ("type",))
+    count.inc("x")
+    count.inc("x", amount=2)
+    metrics.register_gauge("t_depth", "深度", lambda: {("q1",): 3}, ("queue",))
+    metrics.register_gauge("t_broken", "求值失败", lambda: 1 / 0)
+
+    text = metrics.render_metrics()
+    assert text.endswith("\n")
+    assert '# TYPE t_wait_seconds histogram\nt_wait_seconds_bucket{le="1"} 0' in text
+    assert '# TYPE t_events counter\nt_events_total{type="x"} 3' in text
+    assert 't_depth{queue="q1"} 3' in text
+    assert "t_broken" not in text
+    assert isinstance(count, Counter) and count.value("x") == 3
+
+
+def test_metrics_endpoint_access(monkeypatch):
+    from gsuid_core.webconsole import metrics_api
+
+    monkeypatch.setattr(metrics_api.core_config, "get_config", lambda key: "s3cret" if key == "WS_TOKEN" else [])
+
+    def _req(host: str, forwarded: str = ""):
+        return SimpleNamespace(client=SimpleNamespace(host=host), headers={"x-forwarded-for": forwarded})
+
+    assert metrics_api._authorized(_req("127.0.0.1"), None)
+    # 只看直连地址，伪造 X-Forwarded-For 无效
+    assert not metrics_api._authorized(_req("10.0.0.8", "127.0.0.1"), None)
+    assert not metrics_api._authorized(_req("10.0.0.8"), None)
+    assert not metrics_api._authorized(_req("10.0.0.8"), "Bearer wrong")
+    assert metrics_api._authorized(_req("10.0.0.8"), "Bearer s3cret")
+
+
+def test_cache_stats_exported_as_gauges(tmp_path, monkeypatch):
+    from gsuid_core.utils import disk_cache
+    from gsuid_core.webconsole import metrics_api  # noqa: F401
+    from gsuid_core.utils.resource_manager import RM
+
+    cache = disk_cache.DiskCache(tmp_path, max_bytes=10_000)
+    cache.put_sync("k", b"x" * 10)
+    cache.get_path("k")
+    monkeypatch.setattr(disk_cache, "_disk_cache", cache)
+
+    text = metrics.render_metrics()
+    assert f'gscore_rm_bytes{{tier="memory"}} {RM.stats()["memory_bytes"]}' in text
+    assert "gscore_rm_spill_count " in text and "gscore_rm_dedup_ratio " in text
+    assert "gscore_disk_cache_bytes 10" in text
+    assert 'gscore_disk_cache_events{event="hits"} 1' in text
+    assert "gscore_user_write_queue_depth " in text and 'gscore_user_write_flush_ms{stat="max"}' in text
+
+
+def test_shards_of_exited_threads_are_reclaimed():
+    count = Counter("t_reclaimed", "测试")
+    for _ in range(50):
+        th = threading.Thread(target=count.inc)
+        th.start()
+        th.join()
+    count.inc()
+    assert count.value() == 51
+    assert len(count._shards) == 1
+
+
+def test_send_scheduler_records_wait_and_duration():
+    wait_before = metrics.SEND_QUEUE_SECONDS.snapshot()[0][-1]
+    send_before = metrics.SEND_SECONDS.snapshot()[0][-1]
+    fail_before = metrics.SEND_FAILURES.value()
+
+    async def _ok():
+        await asyncio.sleep(0.01)
+
+    async def _fail():
+        raise RuntimeError("boom")
+
+    async def _run():
+        scheduler = SendScheduler(lambda: True)
+        scheduler.start()
+        scheduler.submit(("group", "1"), _ok())
+        scheduler.submit(("group", "1"), _fail())
+        while scheduler.depth or scheduler._tasks:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(_run())
+    assert metrics.SEND_QUEUE_SECONDS.snapshot()[0][-1] == wait_before + 2
+    counts, total = metrics.SEND_SECONDS.snapshot()
+    assert counts[-1] == send_before + 2 and total >= 0.01
+    assert metrics.SEND_FAILURES.value() == fail_before + 1
@@ -0,0 +1,103 @@
+"""米游社请求：共享连接池复用 keep-alive 连接；设备信息缓存写入即失效。"""
+
+import asyncio
+
+import pytest
+import aiohttp
+from aiohttp import web
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gsuid_core.utils import http_pool
+from gsuid_core.utils.database import base_models
+from gsuid_core.utils.database.models import GsUID, GsUser
+from gsuid_core.utils.api.mys.base_request import BaseMysApi
+from gsuid_core.utils.api.mys.device_cache import device_cache
+
+
+async def _serve(peers: set):
+    async def handler(request: web.Request):
+        assert request.transport is not None
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"retcode": 0, "data": {}})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_pooled_requests_reuse_connections():
+    async def _run():
+        peers: set = set()
+        runner, base = await _serve(peers)
+        try:
+            # 旧做法：每次请求一个新 session，一次请求一条连接
+            for _ in range(10):
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f"{base}/old") as resp:
+                        await resp.json()
+            assert len(peers) == 10
+
+            peers.clear()
+            api = BaseMysApi()
+            results = await asyncio.gather(*(api._mys_request(f"{base}/new") for _ in range(50)))
+            assert all(r == {"retcode": 0, "data": {}} for r in results)
+            for _ in range(20):
+                assert await api._mys_request(f"{base}/new") == {"retcode": 0, "data": {}}
+            # 70 次请求只占用不超过 limit_per_host 条连接
+            assert len(peers) <= http_pool.get_session("mys").connector.limit_per_host  # type: ignore
+            assert http_pool.get_session("mys") is http_pool.get_session("mys")
+        finally:
+            await http_pool.close_sessions()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+@pytest.fixture()
+def user_db(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'mys.db'}")
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda c: GsUser.metadata.create_all(c, tables=[GsUser.__table__, GsUID.__table__])  # type: ignore
+            )
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(base_models, "sqlite_semaphore", asyncio.Semaphore(8), raising=False)
+    device_cache.invalidate()
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def test_device_profile_cached_and_invalidated_on_write(user_db):
+    async def _run():
+        await GsUser.full_insert_data(
+            bot_id="onebot",
+            user_id="10086",
+            cookie="ck",
+            uid="100000001",
+            device_id="dev-1",
+            fp="fp-1",
+            device_info="OnePlus/PHK110/OP2020L1/x",
+        )
+        api = BaseMysApi()
+
+        profile = await api.get_device_profile("100000001", "gs")
+        assert (profile.device_id, profile.fp) == ("dev-1", "fp-1")
+        misses = device_cache.misses
+        assert await api.get_user_device_id("100000001", "gs") == "dev-1"
+        assert await api.get_user_fp("100000001", "gs") == "fp-1"
+        assert device_cache.misses == misses
+
+        await GsUser.update_data_by_uid_without_bot_id("100000001", "gs", device_id="dev-2")
+        assert device_cache.stats()["size"] == 0
+        assert await api.get_user_device_id("100000001", "gs") == "dev-2"
+
+    asyncio.run(_run())
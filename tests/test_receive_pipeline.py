@@ -0,0 +1,146 @@
+"""WS 接收管线：同会话按序、跨会话并行，以及三种队列满背压策略。"""
+
+import asyncio
+
+from gsuid_core.models import MessageReceive
+from gsuid_core.receive_pipeline import ReceivePipeline, lane_key
+
+
+def _msg(group: str, seq: int, user_type: str = "group") -> MessageReceive:
+    return MessageReceive(
+        bot_id="onebot",
+        bot_self_id="10000",
+        msg_id=str(seq),
+        user_type=user_type,  # type: ignore
+        group_id=group,
+        user_id=f"u{seq}",
+    )
+
+
+def test_lane_key_granularity():
+    assert lane_key(_msg("g1", 1)) == lane_key(_msg("g1", 2))
+    assert lane_key(_msg("g1", 1)) != lane_key(_msg("g2", 1))
+    assert lane_key(_msg("g1", 1, "direct")) != lane_key(_msg("g1", 2, "direct"))
+
+
+def test_order_per_lane_and_parallel_across_lanes():
+    async def _run():
+        seen: dict = {}
+        active = 0
+        peak = 0
+
+        async def handler(msg: MessageReceive):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            seen.setdefault(msg.group_id, []).append(int(msg.msg_id))
+            active -= 1
+
+        p = ReceivePipeline("t", handler, workers=4, capacity=100)
+        p.start()
+        for i in range(20):
+            await p.submit(_msg(f"g{i % 4}", i))
+        for _ in range(200):
+            if p.dispatched == 20:
+                break
+            await asyncio.sleep(0.01)
+        await p.stop()
+
+        assert p.dispatched == 20
+        for group, order in seen.items():
+            assert order == sorted(order), group
+        assert peak == 4
+
+    asyncio.run(_run())
+
+
+def test_drop_and_oldest_policies():
+    async def _run():
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(msg: MessageReceive):
+            await gate.wait()
+            handled.append(int(msg.msg_id))
+
+        drop = ReceivePipeline("drop", handler, workers=1, capacity=2, policy="drop")
+        oldest = ReceivePipeline("oldest", handler, workers=1, capacity=2, policy="oldest")
+        for p in (drop, oldest):
+            # 不启动 worker，队列只进不出
+            results = [await p.submit(_msg("g", i)) for i in range(4)]
+            assert p.depth == 2 and p.dropped == 2
+            if p is drop:
+                assert results == [True, True, False, False]
+            else:
+                assert results == [True, True, True, True]
+
+        gate.set()
+        for p in (drop, oldest):
+            handled.clear()
+            p.start()
+            for _ in range(100):
+                if p.depth == 0 and len(handled) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            await p.stop()
+            assert handled == ([0, 1] if p is drop else [2, 3])
+
+    asyncio.run(_run())
+
+
+def test_block_policy_applies_backpressure():
+    async def _run():
+        gate = asyncio.Event()
+
+        async def handler(msg: MessageReceive):
+            await gate.wait()
+
+        p = ReceivePipeline("block", handler, workers=1, capacity=1, policy="block")
+        p.start()
+        await p.submit(_msg("g", 0))
+        await asyncio.sleep(0)
+        # 第一帧已被 worker 取走；第二帧占满队列，第三帧必须等待
+        await p.submit(_msg("g", 1))
+        blocked = asyncio.create_task(p.submit(_msg("g", 2)))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        gate.set()
+        assert await asyncio.wait_for(blocked, 1) is True
+        assert p.dropped == 0
+        await p.stop()
+
+    asyncio.run(_run())
+
+
+def test_stop_drains_accepted_frames():
+    async def _run():
+        handled = []
+
+        async def handler(msg: MessageReceive):
+            await asyncio.sleep(0.01)
+            handled.append(int(msg.msg_id))
+
+        p = ReceivePipeline("drain", handler, workers=2, capacity=100)
+        p.start()
+        for i in range(10):
+            await p.submit(_msg(f"g{i % 2}", i))
+        await p.stop(timeout=5)
+        assert sorted(handled) == list(range(10))
+        assert p.dispatched == 10 and p.dropped == 0
+
+        # 超时后仍未处理的帧计入 dropped
+        gate = asyncio.Event()
+
+        async def stuck(msg: MessageReceive):
+            await gate.wait()
+
+        p = ReceivePipeline("stuck", stuck, workers=1, capacity=100)
+        p.start()
+        for i in range(3):
+            await p.submit(_msg("g", i))
+        await p.stop(timeout=0.05)
+        assert p.dropped == 3 and p.depth == 0
+
+    asyncio.run(_run())
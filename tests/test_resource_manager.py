@@ -0,0 +1,107 @@
+"""临时资源管理：内容去重、超出内存预算溢出到磁盘、过期释放。"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gsuid_core.utils import resource_manager
+from gsuid_core.utils.resource_manager import ResourceManager
+
+
+class _Config:
+    def __init__(self, **data):
+        self.data = data
+
+    def get_config(self, key):
+        return SimpleNamespace(data=self.data[key])
+
+
+@pytest.fixture()
+def rm(monkeypatch, tmp_path):
+    monkeypatch.setattr(resource_manager, "sp_config", _Config(ResourceMemoryMB=1))
+    return ResourceManager(tmp_path)
+
+
+def test_same_content_stored_once(rm):
+    blob = b"x" * 1000
+    ids = [rm.register(blob) for _ in range(200)]
+    assert len(set(ids)) == 200
+
+    stats = rm.stats()
+    assert stats["resources"] == 200 and stats["blobs"] == 1
+    assert stats["memory_bytes"] == 1000 and stats["dedup_ratio"] == 200
+
+    assert asyncio.run(rm.get(ids[-1])) == blob
+
+
+def test_spill_over_budget_and_rehydrate(rm, tmp_path):
+    async def _run():
+        big = [bytes([i]) * (400 * 1024) for i in range(4)]
+        ids = [rm.register(data) for data in big]
+        small = rm.register(b"tiny")
+        await asyncio.gather(*rm._spill_tasks)
+
+        # 1MB 预算放不下 1.6MB：最旧的大文件被溢出，小文件不动
+        stats = rm.stats()
+        assert stats["memory_bytes"] <= 1024 * 1024
+        assert stats["spill_count"] == stats["blobs"] - 1 - 2
+        assert len(list(tmp_path.glob("*.bin"))) == stats["spill_count"]
+        assert rm._blobs[rm._store[small][0]].data == b"tiny"
+
+        assert await rm.get(ids[0]) == big[0]
+        await asyncio.gather(*rm._spill_tasks)
+        stats = rm.stats()
+        assert stats["rehydrate_count"] == 1
+        assert stats["memory_bytes"] <= 1024 * 1024
+        assert stats["memory_bytes"] + stats["spilled_bytes"] == 4 * 400 * 1024 + 4
+        for data, rid in zip(big, ids):
+            assert await rm.get(rid) == data
+
+    asyncio.run(_run())
+
+
+def test_expired_resources_release_blob(rm, tmp_path):
+    async def _run():
+        big = b"y" * (1100 * 1024)
+        first = rm.register(big)
+        second = rm.register(big)
+        await asyncio.gather(*rm._spill_tasks)
+        assert rm.stats()["spilled_bytes"] == len(big)
+
+        rm._store[first] = (rm._store[first][0], 0)
+        rm._cleanup_expired()
+        assert await rm.get(second) == big
+
+        rm._store[second] = (rm._store[second][0], 0)
+        rm._cleanup_expired()
+        await asyncio.gather(*rm._spill_tasks)
+
+    asyncio.run(_run())
+    stats = rm.stats()
+    assert stats["resources"] == 0 and stats["blobs"] == 0
+    assert stats["memory_bytes"] == 0 and stats["spilled_bytes"] == 0
+    assert not list(tmp_path.glob("*.bin"))
+    with pytest.raises(ValueError):
+        asyncio.run(rm.get("img_missing"))
+
+
+def test_release_during_spill_keeps_counters_and_leaves_no_file(rm, tmp_path):
+    async def _run():
+        big = b"z" * (1100 * 1024)
+        rid = rm.register(big)
+        assert rm._spill_tasks
+        # 写盘还在工作线程里时资源被释放，随后同一内容又被登记
+        rm._store[rid] = (rm._store[rid][0], 0)
+        rm._cleanup_expired()
+        again = rm.register(big)
+        await asyncio.gather(*rm._spill_tasks)
+        await asyncio.gather(*rm._spill_tasks)
+        return again
+
+    again = asyncio.run(_run())
+    stats = rm.stats()
+    assert stats["blobs"] == 1 and stats["memory_bytes"] + stats["spilled_bytes"] == 1100 * 1024
+    assert stats["memory_bytes"] >= 0 and stats["spill_count"] == 1
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+    assert asyncio.run(rm.get(again)) == b"z" * (1100 * 1024)
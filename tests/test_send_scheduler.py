@@ -0,0 +1,149 @@
+"""出站发送调度：同目标按序、跨目标不互相阻塞、断连挂起与重连续发；_Bot._process 无轮询退出。"""
+
+import asyncio
+
+from gsuid_core.bot import _Bot
+from gsuid_core.send_scheduler import SendScheduler
+
+
+async def _settle(cond, rounds: int = 200) -> None:
+    for _ in range(rounds):
+        if cond():
+            return
+        await asyncio.sleep(0.005)
+
+
+def test_order_per_target_and_slow_target_does_not_block_others():
+    async def _run():
+        sent = []
+        gate = asyncio.Event()
+
+        async def send(target: str, seq: int, slow: bool = False):
+            if slow:
+                await gate.wait()
+            sent.append((target, seq))
+
+        s = SendScheduler(lambda: True, concurrency=4)
+        s.start()
+        s.submit(("group", "slow"), send("slow", 0, slow=True))
+        s.submit(("group", "slow"), send("slow", 1))
+        for i in range(5):
+            s.submit(("group", "fast"), send("fast", i))
+        await _settle(lambda: len(sent) == 5)
+        # 慢目标的大图上传未完成，不影响其他目标；同目标后续帧仍在其后排队
+        assert sent == [("fast", i) for i in range(5)]
+
+        gate.set()
+        await _settle(lambda: len(sent) == 7)
+        assert sent[5:] == [("slow", 0), ("slow", 1)]
+        assert s.stats()["lanes"] == 0 and s.sent == 7
+        await s.stop()
+
+    asyncio.run(_run())
+
+
+def test_global_concurrency_cap():
+    async def _run():
+        active = peak = 0
+
+        async def send():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        s = SendScheduler(lambda: True, concurrency=2)
+        s.start()
+        for i in range(6):
+            s.submit(("group", str(i)), send())
+        await _settle(lambda: s.sent == 6)
+        assert s.sent == 6 and peak == 2
+        await s.stop()
+
+    asyncio.run(_run())
+
+
+def test_offline_holds_until_start_and_clear_drops():
+    async def _run():
+        connected = False
+        sent = []
+
+        async def send(seq: int):
+            sent.append(seq)
+
+        s = SendScheduler(lambda: connected, concurrency=2)
+        s.start()
+        s.submit(("direct", "u"), send(0))
+        await _settle(lambda: False, rounds=5)
+        assert sent == [] and s.depth == 1
+
+        # 断连 → 重连
+        await s.stop()
+        s.submit(("direct", "u"), send(1))
+        connected = True
+        s.start()
+        await _settle(lambda: len(sent) == 2)
+        assert sent == [0, 1]
+
+        await s.stop()
+        s.submit(("direct", "u"), send(2))
+        s.clear()
+        s.start()
+        await _settle(lambda: False, rounds=5)
+        assert sent == [0, 1] and s.depth == 0
+        await s.stop()
+
+    asyncio.run(_run())
+
+
+def test_process_exits_on_shutdown_without_polling():
+    async def _run():
+        bot = _Bot("test_send_scheduler")
+        stop = asyncio.Event()
+        task = asyncio.create_task(bot._process(stop))
+        await asyncio.sleep(0.01)
+        stop.set()
+        await asyncio.wait_for(task, 0.2)
+
+    asyncio.run(_run())
+
+
+def test_delivered_futures_resolve_on_write_not_enqueue():
+    from starlette.websockets import WebSocketState
+
+    class _WS:
+        application_state = WebSocketState.CONNECTED
+
+        def __init__(self) -> None:
+            self.gate = asyncio.Event()
+            self.frames = 0
+            self.fail = False
+
+        async def send_bytes(self, data: bytes) -> None:
+            await self.gate.wait()
+            if self.fail:
+                raise ConnectionError("reset")
+            self.frames += 1
+
+    async def _run():
+        ws = _WS()
+        bot = _Bot("test_delivered", ws)  # type: ignore
+        bot.start_send_worker()
+        written: list = []
+        await bot.target_send("hi", "group", "g1", "onebot", "", delivered=written)
+        await asyncio.sleep(0.01)
+        # 已入队但连接还没写出
+        assert len(written) == 1 and not written[0].done()
+        ws.gate.set()
+        await asyncio.wait_for(written[0], 1)
+        assert ws.frames == 1
+
+        ws.fail = True
+        failed: list = []
+        await bot.target_send("again", "group", "g1", "onebot", "", delivered=failed)
+        await asyncio.wait(failed, timeout=1)
+        assert isinstance(failed[0].exception(), ConnectionError)
+        await bot.stop_send_worker()
+
+    asyncio.run(_run())
@@ -0,0 +1,120 @@
+"""追踪归档：后台批量写入、按天分段压缩、trace_id 偏移索引。"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from gsuid_core import trace_archive as ta
+from gsuid_core.models import TraceContext
+
+
+@pytest.fixture()
+def archive(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta, "TRACE_JSONL_PATH", tmp_path / "traces")
+    monkeypatch.setattr(ta, "_index_cache", ta._IndexCache())
+    monkeypatch.setattr(ta, "_register_close", lambda: None)
+    writer = ta._TraceWriter()
+    monkeypatch.setattr(ta, "_writer", writer)
+    yield tmp_path / "traces"
+    writer.close()
+
+
+def _ctx(i: int) -> TraceContext:
+    return TraceContext(
+        trace_id=f"trace-{i:05d}",
+        short_id=f"{i:08d}",
+        command="签到",
+        user_id=f"u{i}",
+        group_id=None,
+        bot_id="onebot",
+        session_id=f"s{i}",
+        start_time=time.perf_counter(),
+        start_ts=1_700_000_000 + i,
+    )
+
+
+def test_batched_write_and_indexed_lookup(archive, monkeypatch):
+    monkeypatch.setattr(ta, "FLUSH_INTERVAL", 30)
+    for i in range(300):
+        ta.write_trace_meta(f"trace-{i:05d}", _ctx(i), status="running", log_count=0)
+    for i in range(0, 300, 2):
+        ta.write_trace_meta(f"trace-{i:05d}", _ctx(i), status="completed", log_count=3, duration_ms=12)
+    # 入队不落盘，由后台线程按间隔批量写出
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert not (archive / f"{today}.jsonl").exists()
+
+    record = ta.get_trace_from_jsonl("trace-00010")
+    assert record is not None and record["status"] == "completed" and record["duration_ms"] == 12
+    assert ta.get_trace_from_jsonl("trace-00011")["status"] == "running"  # type: ignore
+    assert ta.get_trace_from_jsonl("missing") is None
+
+    assert ta.count_traces_from_jsonl(today) == 300
+    listed = ta.list_traces_from_jsonl(today, limit=5)
+    assert [r["trace_id"] for r in listed] == [f"trace-{i:05d}" for i in range(299, 294, -1)]
+    assert (archive / f"{today}.jsonl.idx").stat().st_size == 450 * ta._ENTRY.size
+
+
+def test_rotation_compresses_old_segments(archive):
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    archive.mkdir(parents=True)
+    # 旧版遗留的无索引分段，且末行不完整
+    lines = [
+        json.dumps({"trace_id": f"old-{i}", "command": "c", "user_id": "u", "start_time": i, "log_count": 1})
+        for i in range(2000)
+    ]
+    (archive / f"{yesterday}.jsonl").write_text("\n".join(lines) + "\n" + '{"trace_id": "br', encoding="utf-8")
+    assert ta.get_trace_from_jsonl("old-5", yesterday)["start_time"] == 5  # type: ignore
+
+    ta.write_trace_meta("new-1", _ctx(1), status="running", log_count=0)
+    assert ta.flush_trace_archive()
+
+    gz = archive / f"{yesterday}.jsonl.gz"
+    assert gz.exists() and not (archive / f"{yesterday}.jsonl").exists()
+    assert gz.stat().st_size < len("\n".join(lines)) // 3
+    assert ta.get_trace_from_jsonl("old-1999", yesterday)["start_time"] == 1999  # type: ignore
+    assert ta.count_traces_from_jsonl(yesterday) == 2000
+    assert len(ta.list_traces_from_jsonl(yesterday, limit=10_000)) == 2000
+
+    # 轮转后才写出的前一天记录追加到压缩分段
+    ta._writer.submit(yesterday, {"trace_id": "late", "command": "c", "user_id": "u", "start_time": 0, "log_count": 0})
+    assert ta.flush_trace_archive()
+    assert ta.get_trace_from_jsonl("late", yesterday) is not None
+    assert ta.count_traces_from_jsonl(yesterday) == 2001
+
+
+def test_lookup_scans_data_the_index_has_not_caught_up_with(archive):
+    for i in range(3):
+        ta.write_trace_meta(f"trace-{i:05d}", _ctx(i), status="running", log_count=0)
+    assert ta.flush_trace_archive()
+    assert ta.get_trace_from_jsonl("trace-00001")["status"] == "running"  # type: ignore
+
+    # 模拟崩溃：数据已 fsync，索引追加未写出
+    today = datetime.now().strftime("%Y-%m-%d")
+    late = [
+        {"trace_id": "trace-00001", "command": "签到", "user_id": "u1", "start_time": 1, "status": "completed"},
+        {"trace_id": "lost", "command": "签到", "user_id": "u9", "start_time": 9, "status": "completed"},
+    ]
+    with open(archive / f"{today}.jsonl", "ab") as f:
+        f.write(b"".join(ta._dumps(r) for r in late))
+
+    assert ta.get_trace_from_jsonl("trace-00001")["status"] == "completed"  # type: ignore
+    assert ta.get_trace_from_jsonl("lost") is not None
+    assert ta.get_trace_from_jsonl("trace-00002")["status"] == "running"  # type: ignore
+
+
+def test_index_cache_is_bounded(archive, monkeypatch):
+    monkeypatch.setattr(ta, "_index_cache", ta._IndexCache(max_segments=2))
+    archive.mkdir(parents=True)
+    today = datetime.now().date()
+    for day in range(1, 6):
+        date_str = (today - timedelta(days=day)).strftime("%Y-%m-%d")
+        path = archive / f"{date_str}.jsonl"
+        path.write_bytes(b"".join(ta._dumps({"trace_id": f"{date_str}-{i}"}) for i in range(day)))
+        ta._rebuild_index(path)
+        assert ta.get_trace_from_jsonl(f"{date_str}-0", date_str) is not None
+
+    counts = ta.daily_trace_counts(7)
+    assert [c["count"] for c in counts] == [0, 5, 4, 3, 2, 1, 0]
+    assert len(ta._index_cache._cache) == 2
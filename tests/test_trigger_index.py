@@ -0,0 +1,122 @@
+"""分发索引必须与旧的线性 SV × Trigger 扫描逐条等价（候选集合与顺序）。"""
+
+import pytest
+
+from gsuid_core.sv import SL, SV, Plugins
+from gsuid_core.models import Event
+from gsuid_core.trigger_index import trigger_index, regex_literal_prefix
+
+
+def _make_sv(name: str, prefix, priority: int = 5) -> SV:
+    # 同 test_trigger_prefix_expansion：绕开 SV.__init__ 的调用栈推导
+    sv = SV.__new__(SV, name)
+    sv.name = name
+    sv.priority = priority
+    sv.enabled = True
+    sv.TL = {}
+    sv.plugins = Plugins(
+        name=name,
+        prefix=prefix,
+        force_prefix=[],
+        allow_empty_prefix=True,
+        force=True,
+    )
+    SL.lst[name] = sv
+    return sv
+
+
+@pytest.fixture()
+def svs():
+    a = _make_sv("TestIndexA", ["gs"], priority=3)
+    b = _make_sv("TestIndexB", [], priority=5)
+
+    async def _h(bot, ev): ...
+
+    a.on_fullmatch("帮助")(_h)
+    a.on_command(("查询", "查"))(_h)
+    a.on_prefix("抽卡")(_h)
+    a.on_suffix("面板")(_h)
+    a.on_keyword("原石")(_h)
+    a.on_regex(r"^练度(\d+)$")(_h)
+    a.on_regex(r"(?P<name>\w+)圣遗物")(_h)
+    b.on_keyword(("石", "原石统计"))(_h)
+    b.on_fullmatch("帮助", to_me=True)(_h)
+    b.on_suffix("")(_h)
+    b.on_message("watch")(_h)
+    b.on_file("json")(_h)
+    yield a, b
+    for name in ("TestIndexA", "TestIndexB"):
+        SL.lst.pop(name, None)
+        SL.plugins.pop(name, None)
+
+
+def _linear(ev: Event) -> list:
+    matched = []
+    for sv in SL.lst.values():
+        if not sv.enabled or not sv.plugins.enabled:
+            continue
+        for trigger_dict in sv.TL.values():
+            for trigger in trigger_dict.values():
+                if trigger.check_command(ev):
+                    matched.append(trigger)
+    return matched
+
+
+def _indexed(ev: Event) -> list:
+    return [trigger for trigger, _ in trigger_index.match(ev) if trigger.check_command(ev)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "gs帮助",
+        "帮助",
+        "gs查询 10001",
+        "查 10001",
+        "gs抽卡",
+        "gs抽卡记录",
+        "gs胡桃面板",
+        "面板",
+        "今天的原石统计",
+        "gs练度90",
+        "练度90",
+        "gs胡桃圣遗物",
+        "无关消息",
+        "",
+    ],
+)
+def test_index_matches_linear_scan(svs, text: str):
+    ev = Event("OneBot", "123", "m", "group", "999", "456", {}, 6)
+    ev.raw_text = text
+    assert _indexed(ev) == _linear(ev)
+    ev.is_tome = True
+    assert _indexed(ev) == _linear(ev)
+
+
+def test_file_and_disable_invalidate_index(svs):
+    a, b = svs
+    ev = Event("OneBot", "123", "m", "group", "999", "456", {}, 6)
+    ev.file_name = "uigf.json"
+    ev.file = "https://example.com/uigf.json"
+    assert any(t.type == "file" for t in _indexed(ev))
+
+    ev.raw_text = "gs帮助"
+    assert any(t.keyword == "帮助" for t, _ in trigger_index.match(ev))
+    # Plugins.set / SV.set 落盘后同样调用 SL.bump()，测试壳无配置文件故直接改属性
+    a.plugins.enabled = False
+    SL.bump()
+    try:
+        assert all(sv is not a for _, sv in trigger_index.match(ev))
+        assert _indexed(ev) == _linear(ev)
+    finally:
+        a.plugins.enabled = True
+        SL.bump()
+    assert any(sv is a for _, sv in trigger_index.match(ev))
+
+
+def test_regex_literal_prefix():
+    assert regex_literal_prefix(r"^练度(\d+)$") == "练度"
+    assert regex_literal_prefix(r"^abc?d") == "ab"
+    assert regex_literal_prefix(r"^ab+c") == "ab"
+    assert regex_literal_prefix(r"^a|b") == ""
+    assert regex_literal_prefix(r"abc") == ""
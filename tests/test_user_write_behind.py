@@ -0,0 +1,95 @@
+"""CoreUser/CoreGroup 写后队列：去重合并、批量落库语义与逐条 insert_user/insert_group 一致。"""
+
+import asyncio
+
+import pytest
+from sqlmodel import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gsuid_core.utils.database import base_models
+from gsuid_core.utils.database.models import CoreUser, CoreGroup
+from gsuid_core.utils.database.user_write_behind import UserWriteBehind
+
+
+@pytest.fixture()
+def memory_db(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wb.db'}")
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda c: CoreUser.metadata.create_all(c, tables=[CoreUser.__table__, CoreGroup.__table__])  # type: ignore
+            )
+
+    asyncio.run(_create())
+    monkeypatch.setattr(base_models, "async_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(base_models, "sqlite_semaphore", asyncio.Semaphore(8), raising=False)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+async def _rows(engine, model):
+    async with async_sessionmaker(engine)() as session:
+        return (await session.execute(select(model))).scalars().all()
+
+
+def test_coalesce_and_batch_flush(memory_db, monkeypatch):
+    maker = base_models.async_maker
+    sessions = []
+
+    def _counting_maker():
+        sessions.append(1)
+        return maker()
+
+    async def _run():
+        # 预置一个已存在的用户，验证走 UPDATE 而非重复插入
+        await CoreUser.insert_user("onebot", "u1", "g1", "老昵称", None)
+
+        wb = UserWriteBehind(flush_interval=3600, max_pending=10_000)
+        wb.add("onebot", "u1", "g1", "新昵称", None)
+        wb.add("onebot", "u1", "g1", None, "http://avatar")
+        wb.add("onebot", "u2", "g1", None, None)
+        wb.add("onebot", "u2", None, "私聊", None)
+        wb.add("onebot", "u3", "g2", "c", "d")
+        assert wb.depth == 4 + 2
+        assert wb.coalesced == 1
+        monkeypatch.setattr(base_models, "async_maker", _counting_maker)
+        await wb.close()
+        # 用户与群在同一个 session 里落库
+        assert len(sessions) == 1
+        assert wb.depth == 0
+        assert wb.stats()["flush_count"] == 1
+
+        users = {(u.user_id, u.group_id): (u.user_name, u.user_icon) for u in await _rows(memory_db, CoreUser)}
+        assert users == {
+            ("u1", "g1"): ("新昵称", "http://avatar"),
+            ("u2", "g1"): ("1", "1"),
+            ("u2", None): ("私聊", "1"),
+            ("u3", "g2"): ("c", "d"),
+        }
+        groups = sorted((g.bot_id, g.group_id) for g in await _rows(memory_db, CoreGroup))
+        assert groups == [("onebot", "g1"), ("onebot", "g2")]
+
+        # 再次刷写同样的数据：幂等，不产生重复行
+        wb2 = UserWriteBehind(flush_interval=3600, max_pending=10_000)
+        wb2.add("onebot", "u3", "g2", None, None)
+        await wb2.close()
+        assert len(await _rows(memory_db, CoreUser)) == 4
+        assert len(await _rows(memory_db, CoreGroup)) == 2
+
+    asyncio.run(_run())
+
+
+def test_size_trigger_wakes_flush(memory_db):
+    async def _run():
+        wb = UserWriteBehind(flush_interval=3600, max_pending=3)
+        for i in range(3):
+            wb.add("onebot", f"u{i}", None, None, None)
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if wb.flush_count:
+                break
+        assert wb.flush_count == 1 and wb.depth == 0
+        await wb.close()
+
+    asyncio.run(_run())